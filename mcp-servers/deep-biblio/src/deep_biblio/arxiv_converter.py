@@ -7,15 +7,39 @@ from typing import Any
 
 from loguru import logger
 
+try:
+    # Compiled index shared with deep-biblio-tools, when it's importable
+    from src.utils.csl_json_index import CSLJsonIndex
+except ImportError:
+    CSLJsonIndex = None
+
 
 class ZoteroCitationMatcher:
     """Match inline citations to Zotero library and generate BibTeX."""
 
     def __init__(self, zotero_json_path: str | Path):
-        """Initialize with Zotero CSL JSON export."""
+        """Initialize with Zotero CSL JSON export.
+
+        With deep-biblio-tools importable, entries are looked up in a
+        compiled index stored beside the export and decoded on demand.
+        Otherwise the export is loaded and indexed in memory.
+        """
         self.zotero_json_path = Path(zotero_json_path)
-        self.entries = self._load_zotero_json()
-        self._build_lookup_indices()
+        self.index = None
+        self._entries = None
+        if CSLJsonIndex is not None:
+            self.index = CSLJsonIndex(self.zotero_json_path)
+            logger.info(f"Using index of {len(self.index)} Zotero entries")
+        else:
+            self._entries = self._load_zotero_json()
+            self._build_lookup_indices()
+
+    @property
+    def entries(self) -> list[dict[str, Any]]:
+        """All entries of the export (decoded on first access)."""
+        if self._entries is None:
+            self._entries = list(self.index.iter_entries())
+        return self._entries
 
     def _load_zotero_json(self) -> list[dict[str, Any]]:
         """Load Zotero CSL JSON file."""
@@ -61,6 +85,18 @@ class ZoteroCitationMatcher:
             if url:
                 self.url_index[url] = entry
 
+    def _lookup(self, kind: str, key: str) -> dict | None:
+        """Find an entry by "doi", "arxiv", "url" or "author_year" key."""
+        if self.index is not None:
+            return self.index.get(kind, key)
+        indices = {
+            "doi": self.doi_index,
+            "arxiv": self.arxiv_index,
+            "url": self.url_index,
+            "author_year": self.author_index,
+        }
+        return indices[kind].get(key)
+
     def _extract_year(self, entry: dict) -> str | None:
         """Extract year from CSL JSON entry."""
         issued = entry.get("issued", {})
@@ -137,27 +173,25 @@ class ZoteroCitationMatcher:
         # Try DOI matching
         if "doi.org" in url:
             doi = url.split("doi.org/")[-1]
-            if doi.lower() in self.doi_index:
-                return self.doi_index[doi.lower()]
+            entry = self._lookup("doi", doi.lower())
+            if entry:
+                return entry
 
         # Try arXiv matching
         if "arxiv.org" in url:
             match = re.search(r"(\d{4}\.\d{4,5})", url)
             if match:
-                arxiv_id = match.group(1)
-                if arxiv_id in self.arxiv_index:
-                    return self.arxiv_index[arxiv_id]
+                entry = self._lookup("arxiv", match.group(1))
+                if entry:
+                    return entry
 
         # Try URL matching
-        if url in self.url_index:
-            return self.url_index[url]
+        entry = self._lookup("url", url)
+        if entry:
+            return entry
 
         # Try author + year matching
-        author_key = f"{author}{year}"
-        if author_key in self.author_index:
-            return self.author_index[author_key]
-
-        return None
+        return self._lookup("author_year", f"{author}{year}")
 
     def generate_bibtex_entry(self, entry: dict, cite_key: str) -> str:
         """Generate BibTeX entry from CSL JSON with permalink URLs."""
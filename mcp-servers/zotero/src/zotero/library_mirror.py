@@ -0,0 +1,341 @@
+"""
+Local mirror of a Zotero library.
+
+Keeps a SQLite copy of the library's items and syncs it incrementally
+using Zotero's library versions: one request checks the library version,
+and when it has moved, only the items changed since the last sync are
+fetched (in batches of up to 50 keys) and deleted items removed. Item,
+tag, collection, arXiv ID and DOI lookups are then answered locally.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+# Most item keys the API accepts in one itemKey request
+ITEM_KEY_BATCH = 50
+
+# Seconds between version checks against the Zotero API
+SYNC_INTERVAL = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    item_type TEXT,
+    parent TEXT,
+    date_modified TEXT,
+    trashed INTEGER NOT NULL DEFAULT 0,
+    arxiv_id TEXT,
+    doi TEXT,
+    item TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_arxiv_id ON items(arxiv_id);
+CREATE INDEX IF NOT EXISTS idx_items_doi ON items(doi);
+CREATE INDEX IF NOT EXISTS idx_items_parent ON items(parent);
+CREATE INDEX IF NOT EXISTS idx_items_modified ON items(date_modified);
+CREATE TABLE IF NOT EXISTS item_tags (
+    tag TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    PRIMARY KEY (tag, item_key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS item_collections (
+    collection TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    PRIMARY KEY (collection, item_key)
+) WITHOUT ROWID;
+"""
+
+
+def extract_arxiv_id(data: dict[str, Any]) -> str | None:
+    """Extract arXiv ID from Zotero item data."""
+    # Check extra field for arXiv ID
+    extra = data.get("extra") or ""
+    if "arXiv:" in extra:
+        match = re.search(r"arXiv:(\d+\.\d+)", extra)
+        if match:
+            return match.group(1)
+
+    # Check URL
+    url = data.get("url") or ""
+    if "arxiv.org" in url:
+        match = re.search(r"arxiv\.org/(?:abs|pdf)/(\d+\.\d+)", url)
+        if match:
+            return match.group(1)
+
+    # Check arXiv DataCite DOI
+    doi = data.get("DOI") or ""
+    match = re.search(r"10\.48550/arxiv\.(\d+\.\d+)", doi, re.IGNORECASE)
+    if match:
+        return match.group(1)
+
+    return None
+
+
+def normalize_doi(doi: str) -> str:
+    """Lowercase a DOI and strip resolver prefixes."""
+    doi = doi.strip().lower()
+    for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
+        if doi.startswith(prefix):
+            doi = doi[len(prefix) :]
+    return doi
+
+
+class LibraryMirror:
+    """SQLite mirror of a Zotero library, synced by library version."""
+
+    def __init__(
+        self,
+        zot: Any,
+        db_path: Path | str,
+        sync_interval: float = SYNC_INTERVAL,
+    ):
+        """
+        Initialize the mirror.
+
+        Args:
+            zot: pyzotero client for the library
+            db_path: Mirror database file
+            sync_interval: Seconds between version checks in ensure_synced
+        """
+        self.zot = zot
+        self.db_path = Path(db_path)
+        self.sync_interval = sync_interval
+        self._synced_at: float | None = None
+        self._local = threading.local()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Per-thread connection, reopened after a fork."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @property
+    def version(self) -> int:
+        """Library version of the last completed sync (0 if never synced)."""
+        row = (
+            self._get_connection()
+            .execute("SELECT value FROM meta WHERE key = 'version'")
+            .fetchone()
+        )
+        return int(row[0]) if row else 0
+
+    # Syncing
+
+    def ensure_synced(self) -> dict[str, int] | None:
+        """
+        Sync unless the last sync was less than sync_interval ago.
+
+        Returns:
+            Sync summary, or None if the mirror was fresh enough
+        """
+        if (
+            self._synced_at is not None
+            and time.monotonic() - self._synced_at < self.sync_interval
+        ):
+            return None
+        return self.sync()
+
+    def sync(self) -> dict[str, int]:
+        """
+        Bring the mirror up to the library's current version.
+
+        The version is read before fetching, so changes made while syncing
+        are picked up by the next sync. Each batch is committed as it
+        arrives and the version recorded last, so an interrupted sync
+        resumes from the previous version.
+
+        Returns:
+            Summary with the library version and updated/deleted counts
+        """
+        conn = self._get_connection()
+        since = self.version
+        version = int(self.zot.last_modified_version(limit=1))
+        updated = deleted = 0
+
+        if version != since:
+            changed = self.zot.item_versions(since=since, includeTrashed=1)
+            keys = list(changed)
+            for start in range(0, len(keys), ITEM_KEY_BATCH):
+                batch = self.zot.items(
+                    itemKey=",".join(keys[start : start + ITEM_KEY_BATCH]),
+                    includeTrashed=1,
+                    limit=ITEM_KEY_BATCH,
+                )
+                with conn:
+                    self._store_many(conn, batch)
+                updated += len(batch)
+
+            if since:
+                removed = self.zot.deleted(since=since).get("items", [])
+                with conn:
+                    for key in removed:
+                        deleted += self._remove(conn, key)
+
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) "
+                    "VALUES ('version', ?)",
+                    (str(version),),
+                )
+
+        self._synced_at = time.monotonic()
+        return {"version": version, "updated": updated, "deleted": deleted}
+
+    def store(self, items: Iterable[dict[str, Any]]) -> None:
+        """Add or update items fetched outside a sync."""
+        conn = self._get_connection()
+        with conn:
+            self._store_many(conn, items)
+
+    def _store_many(
+        self, conn: sqlite3.Connection, items: Iterable[dict[str, Any]]
+    ) -> None:
+        for item in items:
+            key = item["key"]
+            data = item.get("data", {})
+            self._remove(conn, key)
+            doi = data.get("DOI")
+            conn.execute(
+                "INSERT INTO items (key, version, item_type, parent, "
+                "date_modified, trashed, arxiv_id, doi, item) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    item.get("version", data.get("version", 0)),
+                    data.get("itemType"),
+                    data.get("parentItem"),
+                    data.get("dateModified"),
+                    1 if data.get("deleted") else 0,
+                    extract_arxiv_id(data),
+                    normalize_doi(doi) if doi else None,
+                    json.dumps(item, ensure_ascii=False),
+                ),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO item_tags (tag, item_key) VALUES (?, ?)",
+                [(tag["tag"], key) for tag in data.get("tags", [])],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO item_collections (collection, item_key) "
+                "VALUES (?, ?)",
+                [
+                    (collection, key)
+                    for collection in data.get("collections", [])
+                ],
+            )
+
+    @staticmethod
+    def _remove(conn: sqlite3.Connection, key: str) -> int:
+        conn.execute("DELETE FROM item_tags WHERE item_key = ?", (key,))
+        conn.execute("DELETE FROM item_collections WHERE item_key = ?", (key,))
+        return conn.execute("DELETE FROM items WHERE key = ?", (key,)).rowcount
+
+    # Lookups (trashed items are excluded)
+
+    def _select(
+        self, where: str, params: Iterable[Any]
+    ) -> list[dict[str, Any]]:
+        rows = (
+            self._get_connection()
+            .execute(
+                f"SELECT item FROM items WHERE trashed = 0 AND {where}",
+                tuple(params),
+            )
+            .fetchall()
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def item(self, key: str) -> dict[str, Any] | None:
+        """Item by its Zotero key."""
+        items = self._select("key = ?", [key])
+        return items[0] if items else None
+
+    def children(self, key: str) -> list[dict[str, Any]]:
+        """Attachments and notes of an item."""
+        return self._select("parent = ? ORDER BY key", [key])
+
+    def find_by_arxiv_id(self, arxiv_id: str) -> dict[str, Any] | None:
+        """Most recently modified item with the arXiv ID (version ignored)."""
+        match = re.search(r"\d+\.\d+", arxiv_id)
+        arxiv_id = match.group() if match else arxiv_id
+        items = self._select(
+            "arxiv_id = ? ORDER BY date_modified DESC LIMIT 1", [arxiv_id]
+        )
+        return items[0] if items else None
+
+    def find_by_doi(self, doi: str) -> dict[str, Any] | None:
+        """Most recently modified item with the DOI."""
+        items = self._select(
+            "doi = ? ORDER BY date_modified DESC LIMIT 1", [normalize_doi(doi)]
+        )
+        return items[0] if items else None
+
+    def items(
+        self,
+        collection_id: str | None = None,
+        tags: list[str] | None = None,
+        item_types: list[str] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Items matching all given filters, most recently modified first.
+
+        Args:
+            collection_id: Only items directly in this collection
+            tags: Only items with at least one of these tags
+            item_types: Only items of these types
+            limit: Max items to return
+
+        Returns:
+            Items in the Zotero API format
+        """
+        clauses = ["1"]
+        params: list[Any] = []
+        if collection_id:
+            clauses.append(
+                "key IN (SELECT item_key FROM item_collections "
+                "WHERE collection = ?)"
+            )
+            params.append(collection_id)
+        if tags:
+            clauses.append(
+                "key IN (SELECT item_key FROM item_tags "
+                f"WHERE tag IN ({', '.join('?' * len(tags))}))"
+            )
+            params.extend(tags)
+        if item_types:
+            clauses.append(f"item_type IN ({', '.join('?' * len(item_types))})")
+            params.extend(item_types)
+
+        where = " AND ".join(clauses) + " ORDER BY date_modified DESC, key"
+        if limit is not None:
+            where += " LIMIT ?"
+            params.append(limit)
+        return self._select(where, params)
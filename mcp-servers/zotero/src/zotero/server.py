@@ -9,9 +9,13 @@ Tools:
 - sync_metadata: Keep Zotero metadata synced with Chroma
 - trigger_conversion: Use deep-biblio-tools for PDF conversion
 - get_zotero_item: Retrieve item by ID
+
+Items are read from a local mirror of the library (see library_mirror),
+which is synced incrementally at most every ZOTERO_SYNC_INTERVAL seconds.
 """
 
 import os
+from pathlib import Path
 from typing import Any
 
 from mcp.server import Server
@@ -20,6 +24,11 @@ from mcp.types import TextContent, Tool
 from pydantic import BaseModel, Field
 from pyzotero import zotero
 
+from zotero.library_mirror import SYNC_INTERVAL, LibraryMirror, extract_arxiv_id
+
+# Item types returned by import_from_zotero
+PAPER_TYPES = ["journalArticle", "preprint"]
+
 
 class ImportFromZoteroArgs(BaseModel):
     """Arguments for import_from_zotero tool."""
@@ -73,6 +82,15 @@ class ZoteroServer:
 
         self.zot = zotero.Zotero(library_id, library_type, api_key)
 
+        mirror_path = os.getenv("ZOTERO_MIRROR_PATH") or (
+            Path.home()
+            / ".deep-biblio-cache"
+            / "zotero"
+            / f"{library_type}_{library_id}.db"
+        )
+        sync_interval = float(os.getenv("ZOTERO_SYNC_INTERVAL", SYNC_INTERVAL))
+        self.mirror = LibraryMirror(self.zot, mirror_path, sync_interval)
+
     async def import_from_zotero(
         self,
         collection_id: str | None = None,
@@ -90,28 +108,19 @@ class ZoteroServer:
         Returns:
             Import summary with paper metadata
         """
-        # Get items from Zotero
-        if collection_id:
-            items = self.zot.collection_items(collection_id, limit=limit)
-        else:
-            items = self.zot.items(limit=limit)
-
-        # Filter by tags if specified
-        if tags:
-            items = [
-                item
-                for item in items
-                if any(
-                    tag["tag"] in tags for tag in item["data"].get("tags", [])
-                )
-            ]
+        # Get papers from the local mirror, filtered before the limit
+        self.mirror.ensure_synced()
+        items = self.mirror.items(
+            collection_id=collection_id,
+            tags=tags,
+            item_types=PAPER_TYPES,
+            limit=limit,
+        )
 
         # Extract paper metadata
         papers = []
         for item in items:
             data = item["data"]
-            if data.get("itemType") not in ["journalArticle", "preprint"]:
-                continue
 
             # Extract metadata
             metadata = {
@@ -148,12 +157,12 @@ class ZoteroServer:
             Sync status
         """
         if direction == "zotero_to_chroma":
-            # Find item in Zotero by arxiv_id
-            items = self.zot.items(q=arxiv_id)
-            if not items:
+            # Find item in the local mirror by arxiv_id
+            self.mirror.ensure_synced()
+            item = self.mirror.find_by_arxiv_id(arxiv_id)
+            if not item:
                 return {"status": "not_found", "arxiv_id": arxiv_id}
 
-            item = items[0]
             data = item["data"]
 
             metadata = {
@@ -201,7 +210,8 @@ class ZoteroServer:
             Conversion status
         """
         # Check if PDF attachment exists
-        children = self.zot.children(zotero_item_id)
+        self.mirror.ensure_synced()
+        children = self.mirror.children(zotero_item_id)
         pdf_attachment = None
         for child in children:
             if child["data"].get("contentType") == "application/pdf":
@@ -240,7 +250,12 @@ class ZoteroServer:
         Returns:
             Item metadata
         """
-        item = self.zot.item(item_id)
+        self.mirror.ensure_synced()
+        item = self.mirror.item(item_id)
+        if item is None:
+            # Not mirrored yet; fetch it (raises if it does not exist)
+            item = self.zot.item(item_id)
+            self.mirror.store([item])
         data = item["data"]
 
         return {
@@ -280,25 +295,7 @@ class ZoteroServer:
 
     def _extract_arxiv_id(self, data: dict[str, Any]) -> str:
         """Extract arXiv ID from Zotero item."""
-        # Check extra field for arXiv ID
-        extra = data.get("extra", "")
-        if "arXiv:" in extra:
-            import re
-
-            match = re.search(r"arXiv:(\d+\.\d+)", extra)
-            if match:
-                return match.group(1)
-
-        # Check URL
-        url = data.get("url", "")
-        if "arxiv.org" in url:
-            import re
-
-            match = re.search(r"arxiv\.org/abs/(\d+\.\d+)", url)
-            if match:
-                return match.group(1)
-
-        return "N/A"
+        return extract_arxiv_id(data) or "N/A"
 
 
 async def main():
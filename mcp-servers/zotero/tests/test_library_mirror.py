@@ -0,0 +1,174 @@
+"""Tests for the local Zotero library mirror."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add server to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from zotero.library_mirror import LibraryMirror, extract_arxiv_id
+
+
+def make_item(key, version, item_type="journalArticle", **data):
+    """Item in the Zotero API format."""
+    data = {
+        "key": key,
+        "version": version,
+        "itemType": item_type,
+        "title": f"Title {key}",
+        "dateModified": f"2024-01-01T00:00:{version % 60:02d}Z",
+        "tags": [],
+        "collections": [],
+        **data,
+    }
+    return {"key": key, "version": version, "data": data}
+
+
+class FakeZotero:
+    """Library with pyzotero's sync methods, recording each API call."""
+
+    def __init__(self):
+        self.library = {}
+        self.removed = {}
+        self.version = 0
+        self.calls = []
+
+    def put(self, key, item_type="journalArticle", **data):
+        self.version += 1
+        self.library[key] = make_item(key, self.version, item_type, **data)
+
+    def delete(self, key):
+        self.version += 1
+        del self.library[key]
+        self.removed[key] = self.version
+
+    def last_modified_version(self, **kwargs):
+        self.calls.append(("last_modified_version", kwargs))
+        return self.version
+
+    def item_versions(self, since=0, **kwargs):
+        self.calls.append(("item_versions", since))
+        return {
+            key: item["version"]
+            for key, item in self.library.items()
+            if item["version"] > since
+        }
+
+    def items(self, itemKey, limit, **kwargs):  # noqa: N803
+        keys = itemKey.split(",")
+        assert len(keys) <= limit
+        self.calls.append(("items", len(keys)))
+        return [self.library[key] for key in keys if key in self.library]
+
+    def deleted(self, since):
+        self.calls.append(("deleted", since))
+        return {"items": [key for key, v in self.removed.items() if v > since]}
+
+
+@pytest.fixture
+def zot():
+    zot = FakeZotero()
+    for i in range(120):
+        zot.put(f"K{i:03d}")
+    return zot
+
+
+class TestSync:
+    """Test incremental syncing by library version."""
+
+    def test_initial_sync_fetches_in_batches(self, zot, tmp_path):
+        """Test the first sync pages through all items."""
+        mirror = LibraryMirror(zot, tmp_path / "mirror.db")
+
+        summary = mirror.sync()
+
+        assert summary == {"version": 120, "updated": 120, "deleted": 0}
+        assert [c for c in zot.calls if c[0] == "items"] == [
+            ("items", 50),
+            ("items", 50),
+            ("items", 20),
+        ]
+        assert mirror.version == 120
+        assert mirror.item("K007")["data"]["title"] == "Title K007"
+
+    def test_incremental_sync(self, zot, tmp_path):
+        """Test that only changes since the last version are fetched."""
+        mirror = LibraryMirror(zot, tmp_path / "mirror.db")
+        mirror.sync()
+        zot.put("K001", title="Renamed")
+        zot.put("NEW")
+        zot.delete("K002")
+        zot.calls.clear()
+
+        summary = mirror.sync()
+
+        assert summary == {"version": 123, "updated": 2, "deleted": 1}
+        assert zot.calls[1:] == [
+            ("item_versions", 120),
+            ("items", 2),
+            ("deleted", 120),
+        ]
+        assert mirror.item("K001")["data"]["title"] == "Renamed"
+        assert mirror.item("NEW") is not None
+        assert mirror.item("K002") is None
+
+    def test_unchanged_library_costs_one_request(self, zot, tmp_path):
+        """Test the version check and the sync interval."""
+        LibraryMirror(zot, tmp_path / "mirror.db").sync()
+        zot.calls.clear()
+
+        # A new process reuses the mirror on disk
+        mirror = LibraryMirror(zot, tmp_path / "mirror.db", sync_interval=60)
+        assert mirror.ensure_synced()["updated"] == 0
+        assert mirror.ensure_synced() is None
+        assert [name for name, _ in zot.calls] == ["last_modified_version"]
+
+
+class TestLookups:
+    """Test answering queries from the mirror."""
+
+    def test_filters_and_identifiers(self, tmp_path):
+        """Test tag, collection and type filters and ID lookups."""
+        zot = FakeZotero()
+        zot.put(
+            "A",
+            tags=[{"tag": "ml"}],
+            collections=["C1"],
+            extra="arXiv:2301.12345",
+        )
+        zot.put("B", "preprint", tags=[{"tag": "ml"}], DOI="10.1000/XYZ")
+        zot.put("C", "book", tags=[{"tag": "ml"}])
+        zot.put("D", tags=[{"tag": "ml"}], deleted=1)
+        zot.put(
+            "PDF", "attachment", parentItem="A", contentType="application/pdf"
+        )
+        mirror = LibraryMirror(zot, tmp_path / "mirror.db")
+        mirror.sync()
+
+        papers = mirror.items(
+            tags=["ml"], item_types=["journalArticle", "preprint"]
+        )
+        assert [item["key"] for item in papers] == ["B", "A"]
+        assert [item["key"] for item in mirror.items(collection_id="C1")] == [
+            "A"
+        ]
+        assert len(mirror.items(tags=["ml", "other"], limit=1)) == 1
+
+        assert mirror.find_by_arxiv_id("arXiv:2301.12345v2")["key"] == "A"
+        assert mirror.find_by_doi("https://doi.org/10.1000/xyz")["key"] == "B"
+        assert [item["key"] for item in mirror.children("A")] == ["PDF"]
+        assert mirror.item("D") is None
+
+    def test_extract_arxiv_id(self):
+        """Test the extra field, URL and DataCite DOI forms."""
+        assert extract_arxiv_id({"extra": "arXiv:2301.12345"}) == "2301.12345"
+        assert (
+            extract_arxiv_id({"url": "https://arxiv.org/pdf/2301.12345v2"})
+            == "2301.12345"
+        )
+        assert extract_arxiv_id({"DOI": "10.48550/arXiv.2301.12345"}) == (
+            "2301.12345"
+        )
+        assert extract_arxiv_id({"url": "https://example.com"}) is None
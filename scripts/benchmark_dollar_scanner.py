@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Benchmark currency dollar escaping: per-character loops vs dollar scanner.
+
+Generates pandoc-style LaTeX of the requested size (1 MB by default) whose
+paragraphs mix inline formulas, prices, escaped dollars and code listings.
+The baseline replays LatexBuilder's previous algorithm: a nested loop that
+pairs dollars into math regions, then a character-by-character pass over
+every line that escapes $ followed by a digit. Reports the time of both,
+and how many dollars they treat differently (math closers followed by a
+number and dollars inside listings, which the scanner leaves alone).
+
+Usage:
+    python scripts/benchmark_dollar_scanner.py --size-mb 1
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+import random
+import time
+
+from src.converters.md_to_latex.latex_builder import VERBATIM_ENVIRONMENTS
+from src.converters.md_to_latex.utils import DollarKind, escape_dollar_signs
+
+WORDS = (
+    "the model was trained on a large dataset and evaluated against "
+    "several baselines while results show that our approach improves "
+    "accuracy for real world deployment at a lower cost per unit"
+).split()
+
+FORMULAS = [
+    "$x_{i}$",
+    "$\\alpha + \\beta$",
+    "$\\pm$",
+    "$O(n \\log n)$",
+    "$\\mathbb{R}^{d}$",
+    "$\\approx$",
+]
+
+PRICES = ["$5", "$1,200", "$ 30", "$3.5M", "\\$40"]
+
+
+def make_corpus(size: int, rng: random.Random) -> str:
+    paragraphs = []
+    total = 0
+    while total < size:
+        if rng.random() < 0.05:
+            paragraph = (
+                "\\begin{lstlisting}\n"
+                f"echo $HOME ${rng.randint(1, 9)}\n"
+                "\\end{lstlisting}"
+            )
+        else:
+            words = []
+            for _ in range(rng.randint(30, 80)):
+                kind = rng.random()
+                if kind < 0.15:
+                    words.append(rng.choice(FORMULAS))
+                elif kind < 0.2:
+                    words.append(rng.choice(PRICES))
+                else:
+                    words.append(rng.choice(WORDS))
+            paragraph = " ".join(words) + "."
+        paragraphs.append(paragraph)
+        total += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def legacy_escape(content: str) -> str:
+    """The previous algorithm from LatexBuilder.process_pandoc_output."""
+    math_regions = []
+    i = 0
+    while i < len(content):
+        if content[i] == "$" and (i == 0 or content[i - 1] != "\\"):
+            j = i + 1
+            while j < len(content):
+                if content[j] == "$" and content[j - 1] != "\\":
+                    math_regions.append((i, j + 1))
+                    i = j
+                    break
+                j += 1
+        i += 1
+
+    new_lines = []
+    for line in content.split("\n"):
+        if line.strip().startswith(
+            "\\begin{verbatim}"
+        ) or line.strip().startswith("\\begin{lstlisting}"):
+            new_lines.append(line)
+            continue
+        i = 0
+        new_line = []
+        while i < len(line):
+            if line[i] == "$" and (i == 0 or line[i - 1] != "\\"):
+                if (i + 1 < len(line) and line[i + 1].isdigit()) or (
+                    i + 2 < len(line)
+                    and line[i + 1] == " "
+                    and line[i + 2].isdigit()
+                ):
+                    new_line.append("\\$")
+                else:
+                    new_line.append(line[i])
+            else:
+                new_line.append(line[i])
+            i += 1
+        new_lines.append("".join(new_line))
+    return "\n".join(new_lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = make_corpus(
+        int(args.size_mb * 1024 * 1024), random.Random(args.seed)
+    )
+
+    def best_of(escape):
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            result = escape()
+            best = min(best, time.perf_counter() - started)
+        return best, result
+
+    legacy_time, legacy = best_of(lambda: legacy_escape(corpus))
+    scanner_time, scanned = best_of(
+        lambda: escape_dollar_signs(
+            corpus, {DollarKind.CURRENCY}, VERBATIM_ENVIRONMENTS
+        )
+    )
+
+    size_mb = len(corpus.encode("utf-8")) / (1024 * 1024)
+    print(f"Corpus: {size_mb:.2f} MB, {corpus.count('$')} dollar signs")
+    print(
+        f"Per-character loops: {legacy_time:.3f}s "
+        f"({size_mb / legacy_time:.1f} MB/s)"
+    )
+    print(
+        f"Dollar scanner: {scanner_time:.3f}s "
+        f"({size_mb / scanner_time:.1f} MB/s)"
+    )
+    print(f"Speedup: {legacy_time / max(scanner_time, 1e-9):.1f}x")
+    print(
+        f"Escaped: {legacy.count(chr(92) + '$')} before, "
+        f"{scanned.count(chr(92) + '$')} now"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,11 @@ import xml.etree.ElementTree as ET
 from datetime import datetime
 from xml.etree.ElementTree import XMLParser
 
+from ..utils.reference_index import (
+    LOCAL_MATCH_THRESHOLD,
+    ReferenceIndex,
+    get_reference_index,
+)
 from .base import APIClient
 
 
@@ -21,15 +26,24 @@ class ArXivClient(APIClient):
         "arxiv": "http://arxiv.org/schemas/atom",
     }
 
-    def __init__(self, delay: float = 0.5):
+    def __init__(
+        self,
+        delay: float = 0.5,
+        reference_index: ReferenceIndex | None = None,
+    ):
         """
         Initialize arXiv client.
 
         Args:
             delay: Delay between requests in seconds (be nice to arXiv)
+            reference_index: Local index answering lookups before the API
+                (defaults to the process-wide index)
         """
         super().__init__(delay=delay)
         self.logger = logging.getLogger(__name__)
+        if reference_index is None:
+            reference_index = get_reference_index()
+        self.reference_index = reference_index
 
     def get_by_id(self, arxiv_id: str) -> dict[str, any] | None:
         """
@@ -55,6 +69,13 @@ class ArXivClient(APIClient):
             if v_pos > 0 and arxiv_id[v_pos + 1 :].isdigit():
                 arxiv_id = arxiv_id[:v_pos]
 
+        if self.reference_index is not None:
+            record = self.reference_index.get_by_arxiv_id(
+                arxiv_id, source="arxiv"
+            )
+            if record:
+                return record
+
         params = {"id_list": arxiv_id, "max_results": 1}
 
         try:
@@ -64,6 +85,7 @@ class ArXivClient(APIClient):
             if response and response.text:
                 entries = self._parse_arxiv_response(response.text)
                 if entries:
+                    self._remember(entries[:1])
                     return entries[0]
         except Exception as e:
             self.logger.error(f"Error fetching arXiv ID {arxiv_id}: {e}")
@@ -84,6 +106,17 @@ class ArXivClient(APIClient):
         Returns:
             List of parsed paper data
         """
+        if self.reference_index is not None:
+            local = self.reference_index.search_by_title(
+                title,
+                author=author,
+                limit=limit,
+                min_similarity=LOCAL_MATCH_THRESHOLD,
+                source="arxiv",
+            )
+            if local:
+                return local
+
         # Build search query
         query_parts = [f'ti:"{title}"']
         if author:
@@ -101,12 +134,23 @@ class ArXivClient(APIClient):
                 self.BASE_URL, params=params, json_response=False
             )
             if response and response.text:
-                return self._parse_arxiv_response(response.text)
+                entries = self._parse_arxiv_response(response.text)
+                self._remember(entries)
+                return entries
         except Exception as e:
             self.logger.error(f"Error searching arXiv for '{title}': {e}")
 
         return []
 
+    def _remember(self, entries: list[dict[str, any]]) -> None:
+        """Add API results to the reference index."""
+        if self.reference_index is None:
+            return
+        try:
+            self.reference_index.add_many(entries, source="arxiv")
+        except Exception as e:
+            self.logger.debug(f"Could not update reference index: {e}")
+
     def _parse_arxiv_response(self, xml_text: str) -> list[dict[str, any]]:
         """Parse arXiv XML response into standard format."""
         try:
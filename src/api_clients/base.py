@@ -1,11 +1,12 @@
 """Base API client for external services."""
 
-import time
 from abc import ABC
 from typing import Any
 
 import requests
 
+from ..utils.rate_limiter import get_rate_limiter
+
 
 class RateLimitError(Exception):
     """Exception raised when rate limit is exceeded."""
@@ -16,28 +17,38 @@ class RateLimitError(Exception):
 class APIClient(ABC):
     """Base class for API clients with rate limiting and common functionality."""
 
+    # Retries after a 429 / Retry-After response before giving up
+    max_rate_limit_retries = 2
+
     def __init__(self, delay: float = 0.5):
         """
         Initialize API client.
 
         Args:
-            delay: Delay between requests in seconds
+            delay: Delay between requests to the same host in seconds
         """
         self.delay = delay
         self.session = requests.Session()
-        self._last_request_time = 0
+        # Shared with every other client in the process, so several client
+        # instances (or worker threads) never exceed the per-host rate
+        self.rate_limiter = get_rate_limiter()
 
     def _rate_limited_request(self, request_func, *args, **kwargs):
-        """Make a rate-limited request."""
-        # Ensure we don't make requests too quickly
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < self.delay:
-            time.sleep(self.delay - time_since_last)
+        """
+        Make a rate-limited request.
 
-        self._last_request_time = time.time()
-        return request_func(*args, **kwargs)
+        The first positional argument (or the ``url`` keyword) is the URL
+        whose host is throttled. Rate-limit responses pause the host for the
+        server's Retry-After and the request is retried.
+        """
+        url = args[0] if args else kwargs.get("url", "")
+
+        for _ in range(self.max_rate_limit_retries + 1):
+            self.rate_limiter.wait(url, delay=self.delay)
+            response = request_func(*args, **kwargs)
+            if not self.rate_limiter.update_from_response(url, response):
+                break
+        return response
 
     def _make_request(
         self,
@@ -3,6 +3,11 @@
 import logging
 from urllib.parse import quote
 
+from ..utils.reference_index import (
+    LOCAL_MATCH_THRESHOLD,
+    ReferenceIndex,
+    get_reference_index,
+)
 from .base import APIClient
 
 
@@ -11,16 +16,26 @@ class CrossRefClient(APIClient):
 
     BASE_URL = "https://api.crossref.org"
 
-    def __init__(self, email: str | None = None, delay: float = 0.5):
+    def __init__(
+        self,
+        email: str | None = None,
+        delay: float = 0.5,
+        reference_index: ReferenceIndex | None = None,
+    ):
         """
         Initialize CrossRef client.
 
         Args:
             email: Email for polite use of API (gets better rate limits)
             delay: Delay between requests in seconds
+            reference_index: Local index answering lookups before the API
+                (defaults to the process-wide index)
         """
         super().__init__(delay=delay)
         self.logger = logging.getLogger(__name__)
+        if reference_index is None:
+            reference_index = get_reference_index()
+        self.reference_index = reference_index
 
         # Set user agent with email for polite use
         if email:
@@ -52,12 +67,19 @@ class CrossRefClient(APIClient):
         if doi.startswith("http://doi.org/"):
             doi = doi[15:]
 
+        if self.reference_index is not None:
+            record = self.reference_index.get_by_doi(doi, source="crossref")
+            if record:
+                return record
+
         url = f"{self.BASE_URL}/works/{quote(doi, safe='')}"
 
         try:
             data = self._make_request(url)
             if data and "message" in data:
-                return self._parse_work(data["message"])
+                result = self._parse_work(data["message"])
+                self._remember([result])
+                return result
         except Exception as e:
             self.logger.error(f"Error fetching DOI {doi}: {e}")
 
@@ -77,6 +99,17 @@ class CrossRefClient(APIClient):
         Returns:
             List of parsed citation data
         """
+        if self.reference_index is not None:
+            local = self.reference_index.search_by_title(
+                title,
+                author=author,
+                limit=limit,
+                min_similarity=LOCAL_MATCH_THRESHOLD,
+                source="crossref",
+            )
+            if local:
+                return local
+
         params = {
             "query.title": title,
             "rows": limit,
@@ -91,14 +124,25 @@ class CrossRefClient(APIClient):
         try:
             data = self._make_request(url, params=params)
             if data and "message" in data and "items" in data["message"]:
-                return [
+                results = [
                     self._parse_work(item) for item in data["message"]["items"]
                 ]
+                self._remember(results)
+                return results
         except Exception as e:
             self.logger.error(f"Error searching title '{title}': {e}")
 
         return []
 
+    def _remember(self, results: list[dict[str, any]]) -> None:
+        """Add API results to the reference index."""
+        if self.reference_index is None:
+            return
+        try:
+            self.reference_index.add_many(results, source="crossref")
+        except Exception as e:
+            self.logger.debug(f"Could not update reference index: {e}")
+
     def get_bibtex(self, doi: str) -> str | None:
         """
         Get BibTeX entry directly from CrossRef.
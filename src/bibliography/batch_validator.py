@@ -1,6 +1,7 @@
 """Enhanced bibliography validator with batch API processing."""
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 from ..api_clients.arxiv import ArXivClient
@@ -9,10 +10,25 @@ from ..utils.api_clients.batch_processor import (
     BatchArXivProcessor,
     BatchDOIProcessor,
 )
+from ..utils.similarity import PROFILE_CACHE_SIZE
 from .core import Bibliography, BibliographyEntry
 from .validator import BibliographyValidator
 
 
+@lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def _strip_punctuation(text: str) -> str:
+    """Lowercase and drop everything but letters, digits and whitespace
+
+    Unlike similarity.normalize_text, punctuation is removed rather than
+    turned into a space, so "Pre-training" stays one word.
+    """
+    chars = []
+    for char in text:
+        if char.isalnum() or char.isspace():
+            chars.append(char.lower())
+    return "".join(chars).strip()
+
+
 class BatchBibliographyValidator(BibliographyValidator):
     """Bibliography validator with batch API processing for improved performance."""
 
@@ -298,22 +314,9 @@ class BatchBibliographyValidator(BibliographyValidator):
         Returns:
             True if strings are similar enough
         """
-        # Simple implementation - could use more sophisticated matching
-        # Remove punctuation and extra spaces without regex
-        # import re  # Banned
-
-        # Keep only alphanumeric and whitespace characters
-        clean1_chars = []
-        for char in str1:
-            if char.isalnum() or char.isspace():
-                clean1_chars.append(char.lower())
-        clean1 = "".join(clean1_chars).strip()
-
-        clean2_chars = []
-        for char in str2:
-            if char.isalnum() or char.isspace():
-                clean2_chars.append(char.lower())
-        clean2 = "".join(clean2_chars).strip()
+        # Cleaned forms are cached, so repeated titles cost nothing
+        clean1 = _strip_punctuation(str1)
+        clean2 = _strip_punctuation(str2)
 
         # Check if one contains the other (common for subtitles)
         if clean1 in clean2 or clean2 in clean1:
@@ -3,8 +3,7 @@
 import logging
 
 # import re  # Banned - using string methods instead
-from difflib import SequenceMatcher
-
+from ..utils.similarity import normalize_text, similarity
 from .models import CitationData, DataSource, ValidationIssue
 
 
@@ -368,11 +367,14 @@ class HallucinationDetector:
             )
 
         # Check for completely different authors (likely hallucination)
-        similarity = SequenceMatcher(
-            None, original_authors.lower(), validated_author_str.lower()
-        ).ratio()
+        score = similarity(
+            original_authors.lower(),
+            validated_author_str.lower(),
+            normalize=False,
+            cutoff=0.3,
+        )
 
-        if similarity < 0.3:  # Very low similarity
+        if score < 0.3:  # Very low similarity
             issues.append(
                 ValidationIssue(
                     field="author",
@@ -382,7 +384,7 @@ class HallucinationDetector:
                     actual=original_authors,
                 )
             )
-        elif similarity < 0.7:  # Moderate similarity
+        elif score < 0.7:  # Moderate similarity
             issues.append(
                 ValidationIssue(
                     field="author",
@@ -407,15 +409,10 @@ class HallucinationDetector:
         if not original_title or not validated_title:
             return issues
 
-        # Normalize for comparison
-        orig_normalized = self._normalize_text(original_title)
-        valid_normalized = self._normalize_text(validated_title)
+        # Compares normalized forms
+        score = similarity(original_title, validated_title, cutoff=0.5)
 
-        similarity = SequenceMatcher(
-            None, orig_normalized, valid_normalized
-        ).ratio()
-
-        if similarity < 0.5:  # Significantly different
+        if score < 0.5:  # Significantly different
             issues.append(
                 ValidationIssue(
                     field="title",
@@ -425,7 +422,7 @@ class HallucinationDetector:
                     actual=original_title,
                 )
             )
-        elif similarity < 0.8:  # Somewhat different
+        elif score < 0.8:  # Somewhat different
             issues.append(
                 ValidationIssue(
                     field="title",
@@ -487,15 +484,10 @@ class HallucinationDetector:
         if not original_journal or not validated_journal:
             return issues
 
-        # Normalize for comparison
-        orig_normalized = self._normalize_text(original_journal)
-        valid_normalized = self._normalize_text(validated_journal)
-
-        similarity = SequenceMatcher(
-            None, orig_normalized, valid_normalized
-        ).ratio()
+        # Compares normalized forms
+        score = similarity(original_journal, validated_journal, cutoff=0.5)
 
-        if similarity < 0.5:  # Very different
+        if score < 0.5:  # Very different
             issues.append(
                 ValidationIssue(
                     field="journal",
@@ -510,18 +502,7 @@ class HallucinationDetector:
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
-        # Remove punctuation, lowercase, collapse whitespace without regex
-        chars = []
-        for char in text.lower():
-            if char.isalnum() or char.isspace() or char == "_":
-                chars.append(char)
-            else:
-                chars.append(" ")
-
-        text = "".join(chars)
-        # Collapse whitespace
-        text = " ".join(text.split())
-        return text
+        return normalize_text(text)
 
     def get_hallucination_score(self, issues: list[ValidationIssue]) -> float:
         """
@@ -3,6 +3,11 @@
 import logging
 
 from ..api_clients.base import APIClient
+from ..utils.reference_index import (
+    LOCAL_MATCH_THRESHOLD,
+    ReferenceIndex,
+    get_reference_index,
+)
 from .models import AuthorData, CitationData, DataSource
 
 
@@ -15,9 +20,17 @@ class DeterministicValidator:
         arxiv_client: APIClient | None = None,
         pubmed_client: APIClient | None = None,
         semantic_scholar_client: APIClient | None = None,
+        reference_index: ReferenceIndex | None = None,
     ):
-        """Initialize validator with API clients."""
+        """Initialize validator with API clients.
+
+        The reference index (by default the process-wide one) resolves
+        titles of citations without identifiers to a DOI or arXiv ID.
+        """
         self.logger = logging.getLogger(__name__)
+        if reference_index is None:
+            reference_index = get_reference_index()
+        self.reference_index = reference_index
 
         # API clients will be injected or created
         self.crossref_client = crossref_client
@@ -44,7 +57,8 @@ class DeterministicValidator:
         2. ArXiv ID lookup
         3. PubMed ID lookup
         4. Semantic Scholar lookup
-        5. Title/author fuzzy matching (with warnings)
+        5. Title/author lookup in the local reference index
+        6. Fuzzy matching (with warnings)
 
         Args:
             raw_data: Raw citation data to validate
@@ -92,7 +106,15 @@ class DeterministicValidator:
                     if validated:
                         break
 
-        # 5. Fuzzy matching as last resort
+        # 5. Resolve the title to an identifier locally
+        if (
+            not validated
+            and raw_data.get("title")
+            and self.reference_index is not None
+        ):
+            validated = self._validate_via_reference_index(citation, raw_data)
+
+        # 6. Fuzzy matching as last resort
         if not validated and raw_data.get("title"):
             self._validate_via_fuzzy_match(citation, raw_data, strict)
 
@@ -274,6 +296,45 @@ class DeterministicValidator:
         # Placeholder for now
         return False
 
+    def _validate_via_reference_index(
+        self, citation: CitationData, raw_data: dict[str, any]
+    ) -> bool:
+        """Find the citation's identifier by title in the reference index."""
+        first_author = (raw_data.get("author") or "").split(" and ")[0]
+        matches = self.reference_index.search_by_title(
+            raw_data["title"],
+            author=first_author or None,
+            limit=1,
+            min_similarity=LOCAL_MATCH_THRESHOLD,
+        )
+        if not matches:
+            return False
+
+        match = matches[0]
+        source = {
+            "crossref": DataSource.CROSSREF,
+            "arxiv": DataSource.ARXIV,
+        }.get(match.get("source"), DataSource.USER_PROVIDED)
+        citation.add_validation_step(
+            action="resolve_title",
+            source=source,
+            success=True,
+            message="Resolved title via local reference index",
+            data={
+                "doi": match.get("doi"),
+                "arxiv_id": match.get("arxiv_id"),
+                "match_score": match.get("match_score"),
+            },
+        )
+
+        if match.get("doi") and self.crossref_client:
+            if self._validate_via_doi(citation, match["doi"]):
+                return True
+        if match.get("arxiv_id") and self.arxiv_client:
+            if self._validate_via_arxiv(citation, match["arxiv_id"]):
+                return True
+        return False
+
     def _validate_via_fuzzy_match(
         self, citation: CitationData, raw_data: dict[str, any], strict: bool
     ) -> None:
@@ -17,6 +17,7 @@ from .bibliography import (
 )
 from .bibliography.validator import LLMCitationValidator
 from .converters.md_to_latex.converter import MarkdownToLatexConverter
+from .utils.reference_index import ReferenceIndex
 
 
 @click.group()
@@ -374,5 +375,99 @@ def md2latex(input_file: Path, output: Path | None):
         sys.exit(1)
 
 
+@cli.group()
+def index():
+    """Local reference index for offline DOI/title lookups."""
+    pass
+
+
+@index.command()
+@click.option(
+    "--db",
+    type=click.Path(path_type=Path),
+    help="Index database (default: ~/.deep-biblio-cache/reference_index.db)",
+)
+@click.option(
+    "--crossref-dump",
+    type=click.Path(exists=True, path_type=Path),
+    help="CrossRef metadata snapshot (file or directory)",
+)
+@click.option(
+    "--arxiv-dump",
+    type=click.Path(exists=True, path_type=Path),
+    help="arXiv metadata snapshot (JSON lines)",
+)
+@click.option(
+    "--caches/--no-caches",
+    default=True,
+    help="Import the BibTeX cache and cached API responses",
+)
+def build(
+    db: Path | None,
+    crossref_dump: Path | None,
+    arxiv_dump: Path | None,
+    caches: bool,
+):
+    """Build or extend the reference index."""
+    from .utils.cache import BiblioCache
+    from .utils.http_cache import get_http_cache
+
+    reference_index = ReferenceIndex(db)
+
+    if caches:
+        cache = BiblioCache(auto_backup=False)
+        try:
+            count = reference_index.import_biblio_cache(cache)
+        finally:
+            cache.close()
+        click.echo(f"BibTeX cache: {count} records")
+
+        http_cache = get_http_cache()
+        if http_cache is not None:
+            count = reference_index.import_http_cache(http_cache)
+            click.echo(f"HTTP cache: {count} records")
+
+    if crossref_dump:
+        count = reference_index.import_crossref_dump(crossref_dump)
+        click.echo(f"CrossRef dump: {count} records")
+    if arxiv_dump:
+        count = reference_index.import_arxiv_dump(arxiv_dump)
+        click.echo(f"arXiv dump: {count} records")
+
+    stats = reference_index.get_stats()
+    click.echo(f"Index {stats['db_path']} has {stats['total_records']} records")
+
+
+@index.command()
+@click.argument("query")
+@click.option("--db", type=click.Path(path_type=Path), help="Index database")
+@click.option("--author", help="Author surname to narrow title matches")
+@click.option("-n", "--limit", default=5, help="Maximum number of matches")
+def lookup(query: str, db: Path | None, author: str | None, limit: int):
+    """Look up a DOI, arXiv ID or title in the reference index."""
+    reference_index = ReferenceIndex(db)
+
+    record = reference_index.get_by_doi(query) if "10." in query else None
+    if record is None:
+        record = reference_index.get_by_arxiv_id(query)
+    records = (
+        [record]
+        if record
+        else reference_index.search_by_title(query, author, limit=limit)
+    )
+
+    if not records:
+        click.echo("No match in the reference index")
+        sys.exit(1)
+    for record in records:
+        score = record.get("match_score")
+        prefix = f"[{score:.2f}] " if score is not None else ""
+        identifier = record.get("doi") or record.get("arxiv_id")
+        click.echo(
+            f"{prefix}{record.get('title')} ({record.get('year')}) "
+            f"{identifier} [{record.get('source')}]"
+        )
+
+
 if __name__ == "__main__":
     cli()
@@ -135,7 +135,19 @@ def from_markdown(
 @click.option(
     "--simple", is_flag=True, help="Use simple conversion for Markdown files"
 )
-def batch(files: tuple[Path, ...], output_dir: Path | None, simple: bool):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of pandoc workers shared by the batch (default: CPUs, max 4)",
+)
+def batch(
+    files: tuple[Path, ...],
+    output_dir: Path | None,
+    simple: bool,
+    jobs: int | None,
+):
     """Convert multiple files to LyX format."""
     tex_files = []
     md_files = []
@@ -164,7 +176,9 @@ def batch(files: tuple[Path, ...], output_dir: Path | None, simple: bool):
     if md_files:
         md_converter = MarkdownToLyxConverter(output_dir=output_dir)
         click.echo(f"\nConverting {len(md_files)} Markdown files...")
-        results = md_converter.batch_convert(md_files, simple=simple)
+        results = md_converter.batch_convert(
+            md_files, simple=simple, max_workers=jobs
+        )
         for md_file, lyx_file in results.items():
             if lyx_file:
                 click.echo(f"  [OK] {md_file} -> {lyx_file}")
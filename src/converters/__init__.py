@@ -1,6 +1,7 @@
 """Converter modules for deep-biblio-tools."""
 
 from src.converters.md_to_latex.converter import MarkdownToLatexConverter
+from src.converters.pandoc_pool import PandocPool
 from src.converters.to_lyx.md_to_lyx import MarkdownToLyxConverter
 from src.converters.to_lyx.tex_to_lyx import TexToLyxConverter
 
@@ -8,4 +9,5 @@ __all__ = [
     "MarkdownToLatexConverter",
     "TexToLyxConverter",
     "MarkdownToLyxConverter",
+    "PandocPool",
 ]
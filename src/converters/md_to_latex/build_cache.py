@@ -0,0 +1,92 @@
+"""Content-addressed build cache for incremental markdown to LaTeX conversion."""
+
+# Standard library imports
+import logging
+from pathlib import Path
+
+# Local imports
+from src.converters.md_to_latex.utils import compute_text_hash
+from src.utils.storage import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+class BuildCache:
+    """Stores intermediate conversion results keyed by content hash.
+
+    Each pipeline stage (e.g. "pandoc", "postprocess") keeps its outputs in
+    its own subdirectory, one file per hash. A stage's key must cover every
+    input that affects its output, so a hit can be reused as-is.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize the build cache.
+
+        Args:
+            cache_dir: Directory holding the cached stage outputs
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from all inputs of a stage."""
+        return compute_text_hash(*parts)
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.cache_dir / stage / f"{key}.tex"
+
+    def get(self, stage: str, key: str) -> str | None:
+        """Get a cached stage output.
+
+        Args:
+            stage: Pipeline stage name
+            key: Content hash of the stage inputs
+
+        Returns:
+            Cached output or None on a miss
+        """
+        try:
+            text = self._path(stage, key).read_text(encoding="utf-8")
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return text
+
+    def put(self, stage: str, key: str, text: str) -> None:
+        """Store a stage output.
+
+        Writes go through a temporary file and a rename, so a concurrent
+        or interrupted build never sees a partial entry.
+        """
+        path = self._path(stage, key)
+        try:
+            atomic_write(path, text)
+        except OSError as e:
+            logger.warning(f"Failed to write build cache entry {path}: {e}")
+
+    def prune(self, stage: str, keep: set[str]) -> int:
+        """Remove entries of a stage that the current build didn't use.
+
+        Args:
+            stage: Pipeline stage name
+            keep: Keys to keep
+
+        Returns:
+            Number of entries removed
+        """
+        stage_dir = self.cache_dir / stage
+        if not stage_dir.is_dir():
+            return 0
+
+        removed = 0
+        for path in stage_dir.glob("*.tex"):
+            if path.stem not in keep:
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.debug(f"Failed to remove {path}: {e}")
+        return removed
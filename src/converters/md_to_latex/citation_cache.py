@@ -90,27 +90,109 @@ class CitationCache:
 
             row = cursor.fetchone()
             if row:
-                # Convert SQLite row to dictionary
-                citation_data = dict(row)
-
-                # Parse JSON metadata if present
-                if citation_data.get("metadata_json"):
-                    try:
-                        citation_data["metadata"] = json.loads(
-                            citation_data["metadata_json"]
-                        )
-                    except json.JSONDecodeError:
-                        pass
-
-                # Remove the JSON string field
-                citation_data.pop("metadata_json", None)
-
                 logger.debug(f"Cache hit for URL: {url}")
-                return citation_data
+                return self._row_to_dict(row)
 
             logger.debug(f"Cache miss for URL: {url}")
             return None
 
+    def get_many(self, urls: list[str]) -> dict[str, dict[str, Any]]:
+        """Get citation metadata for many URLs with one query.
+
+        Args:
+            urls: URLs of the citations
+
+        Returns:
+            Dictionary mapping each cached (non-expired) URL to its metadata.
+            URLs that are missing or expired are absent from the result.
+        """
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        results = self._get_many_by_column("url", unique_urls)
+
+        logger.debug(
+            f"Bulk cache lookup: {len(results)}/{len(unique_urls)} URLs hit"
+        )
+        return results
+
+    def get_many_by_doi(self, dois: list[str]) -> dict[str, dict[str, Any]]:
+        """Get citation metadata for many DOIs with one query.
+
+        Args:
+            dois: DOIs of the citations
+
+        Returns:
+            Dictionary mapping each cached (non-expired) DOI to the most
+            recently fetched metadata for it
+        """
+        unique_dois = list(dict.fromkeys(doi for doi in dois if doi))
+        results = self._get_many_by_column("doi", unique_dois)
+
+        logger.debug(
+            f"Bulk cache lookup: {len(results)}/{len(unique_dois)} DOIs hit"
+        )
+        return results
+
+    def _get_many_by_column(
+        self, column: str, keys: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Look up rows whose column matches any of the keys.
+
+        The keys are loaded into a temporary table and joined against the
+        indexed column, so a whole document resolves in a single query
+        regardless of SQLite's limit on statement parameters.
+
+        Args:
+            column: Indexed column to match ("url" or "doi")
+            keys: Values to look up
+
+        Returns:
+            Dictionary mapping each matched key to its newest row
+        """
+        results: dict[str, dict[str, Any]] = {}
+        if not keys:
+            return results
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.execute("CREATE TEMP TABLE lookup_keys (key TEXT PRIMARY KEY)")
+            conn.executemany(
+                "INSERT OR IGNORE INTO lookup_keys (key) VALUES (?)",
+                ((key,) for key in keys),
+            )
+            # Oldest first, so the newest row for a key wins below
+            cursor = conn.execute(
+                f"""
+                SELECT citations.* FROM citations
+                JOIN lookup_keys ON citations.{column} = lookup_keys.key
+                WHERE datetime(fetched_at) > datetime('now', '-' || ? || ' days')
+                ORDER BY fetched_at
+            """,
+                (self.cache_ttl_days,),
+            )
+            for row in cursor:
+                results[row[column]] = self._row_to_dict(row)
+        finally:
+            conn.close()
+
+        return results
+
+    def _row_to_dict(self, row: sqlite3.Row) -> dict[str, Any]:
+        """Convert a citations row into a metadata dictionary."""
+        citation_data = dict(row)
+
+        # Parse JSON metadata if present
+        if citation_data.get("metadata_json"):
+            try:
+                citation_data["metadata"] = json.loads(
+                    citation_data["metadata_json"]
+                )
+            except json.JSONDecodeError:
+                pass
+
+        citation_data.pop("metadata_json", None)
+        return citation_data
+
     def get_by_doi(self, doi: str) -> dict[str, Any] | None:
         """Get citation metadata by DOI.
 
@@ -135,21 +217,8 @@ class CitationCache:
 
             row = cursor.fetchone()
             if row:
-                citation_data = dict(row)
-
-                # Parse JSON metadata if present
-                if citation_data.get("metadata_json"):
-                    try:
-                        citation_data["metadata"] = json.loads(
-                            citation_data["metadata_json"]
-                        )
-                    except json.JSONDecodeError:
-                        pass
-
-                citation_data.pop("metadata_json", None)
-
                 logger.debug(f"Cache hit for DOI: {doi}")
-                return citation_data
+                return self._row_to_dict(row)
 
             logger.debug(f"Cache miss for DOI: {doi}")
             return None
@@ -3,6 +3,8 @@
 # Standard library imports
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
@@ -25,9 +27,37 @@ from src.converters.md_to_latex.utils import (
     sanitize_latex,
 )
 from src.converters.md_to_latex.zotero_integration import ZoteroClient
+from src.utils.http_cache import get_http_session, serves_locally
+from src.utils.identifiers import CanonicalId, canonical_id
+from src.utils.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent requests per metadata backend during prefetch.
+# arXiv asks clients to keep request rates low, CrossRef and ordinary
+# web pages tolerate more parallelism.
+DEFAULT_BACKEND_CONCURRENCY = {
+    "crossref": 8,
+    "arxiv": 2,
+    "web": 8,
+}
+
+
+def _throttled_get(
+    url: str, session: requests.Session | None = None, **kwargs
+) -> requests.Response:
+    """GET a URL through the process-wide per-host rate limiter."""
+    if session is not None and serves_locally(session, url):
+        return session.get(url, **kwargs)
+
+    limiter = get_rate_limiter()
+    # No extra delay of our own: only host limits (e.g. arXiv) and
+    # Retry-After backoffs apply, prefetch concurrency does the rest
+    limiter.wait(url, delay=0.0)
+    response = (session or requests).get(url, **kwargs)
+    limiter.update_from_response(url, response)
+    return response
+
 
 class Citation:
     """Represents a single citation."""
@@ -55,6 +85,7 @@ class Citation:
         self.abstract = ""  # Store abstract for arXiv papers
         self.arxiv_category = ""  # Store arXiv category
         self.use_better_bibtex = use_better_bibtex
+        self.metadata_fetched = False  # Set once metadata has been resolved
 
         # Generate key - will be regenerated after title is available if using Better BibTeX
         self.key = key or generate_citation_key(
@@ -207,6 +238,11 @@ class CitationManager:
         use_better_bibtex_keys: bool = True,
     ):
         self.citations: dict[str, Citation] = {}
+        # Citations of this run by the work they cite, so aliases of a work
+        # (another DOI form, a versioned arXiv PDF...) share one citation,
+        # and other URLs through which a citation was cited
+        self._works: dict[CanonicalId, Citation] = {}
+        self._alias_urls: dict[str, Citation] = {}
         self.cache_dir = cache_dir
         self.use_cache = use_cache
         self.use_better_bibtex_keys = use_better_bibtex_keys
@@ -215,6 +251,10 @@ class CitationManager:
             CitationCache(cache_dir=self.cache_dir) if use_cache else None
         )
         self.prefer_arxiv = prefer_arxiv  # Option to prefer arXiv metadata
+        # Raw web pages go through the on-disk HTTP cache
+        self.http_session = get_http_session()
+        # Guards the citation key registry while metadata is fetched in threads
+        self._registry_lock = threading.RLock()
 
         # Initialize Zotero client if configured
         self.zotero_client = None
@@ -233,26 +273,12 @@ class CitationManager:
         if not self.cache:
             return None
         cache_data = self.cache.get(url)
+        if not cache_data:
+            # The same work may be cached under another URL form
+            doi = extract_doi_from_url(url)
+            cache_data = self.cache.get_by_doi(doi) if doi else None
         if cache_data:
-            # Create Citation object from cached data
-            citation = Citation(
-                authors=cache_data.get("authors", ""),
-                year=cache_data.get("year", ""),
-                url=url,
-                use_better_bibtex=self.use_better_bibtex_keys,
-            )
-            citation.title = cache_data.get("title", "")
-            citation.journal = cache_data.get("journal", "")
-            citation.volume = cache_data.get("volume", "")
-            citation.pages = cache_data.get("pages", "")
-            citation.doi = cache_data.get("doi", "")
-            citation.bibtex_type = cache_data.get("bibtex_type", "misc")
-            citation.raw_bibtex = cache_data.get("raw_bibtex")
-            citation.issue = cache_data.get("issue", "")
-            citation.full_authors = cache_data.get("full_authors", "")
-            citation.abstract = cache_data.get("abstract", "")
-            citation.arxiv_category = cache_data.get("arxiv_category", "")
-            return citation
+            return self._citation_from_cache_data(url, cache_data)
         return None
         if self.cache_file.exists():
             try:
@@ -262,6 +288,27 @@ class CitationManager:
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(f"Failed to load citation cache: {e}")
 
+    def _citation_from_cache_data(self, url: str, cache_data: dict) -> Citation:
+        """Create a Citation object from a cache row."""
+        citation = Citation(
+            authors=cache_data.get("authors", ""),
+            year=cache_data.get("year", ""),
+            url=url,
+            use_better_bibtex=self.use_better_bibtex_keys,
+        )
+        citation.title = cache_data.get("title", "")
+        citation.journal = cache_data.get("journal", "")
+        citation.volume = cache_data.get("volume", "")
+        citation.pages = cache_data.get("pages", "")
+        citation.doi = cache_data.get("doi", "")
+        citation.bibtex_type = cache_data.get("bibtex_type", "misc")
+        citation.raw_bibtex = cache_data.get("raw_bibtex")
+        citation.issue = cache_data.get("issue", "")
+        citation.full_authors = cache_data.get("full_authors", "")
+        citation.abstract = cache_data.get("abstract", "")
+        citation.arxiv_category = cache_data.get("arxiv_category", "")
+        return citation
+
     def _save_to_cache(
         self, citation: Citation, source: str = "unknown"
     ) -> None:
@@ -291,8 +338,7 @@ class CitationManager:
         extractor = UnifiedCitationExtractor()
 
         citations_found = []
-        seen_urls = {}  # Track citations by URL to avoid duplicates
-        seen_dois = {}  # Track citations by DOI to avoid duplicates
+        found_ids: set[int] = set()
 
         # Extract all citations using AST (includes orphan citations)
         all_citations = extractor.extract_citations_from_markdown(content)
@@ -304,35 +350,35 @@ class CitationManager:
             authors = cit_data["authors"] or "Unknown"
             year = cit_data["year"] or str(datetime.now().year)
 
-            # Skip if we've already processed this URL
-            if url and url in seen_urls:
-                continue
-
             # For orphan citations without URL, create a placeholder
             if not url and cit_data.get("is_orphan"):
                 # Try to find a URL by searching for the authors/year combination
                 # This is a fallback for cases like "[IBISWorld], 2023"
                 url = f"#orphan-{authors.lower().replace(' ', '-')}-{year}"
 
-            self._add_citation(
-                authors, year, url, citations_found, seen_urls, seen_dois
-            )
+            # Reuse the citation of a work seen earlier in this run, even
+            # if it was cited through another URL. Citations without a URL
+            # cite no known work and are never merged.
+            work = canonical_id(url)
+            citation = self._works.get(work) if work is not None else None
+            if citation is None:
+                citation = self._add_citation(authors, year, url)
+                if work is not None:
+                    self._works[work] = citation
+            elif url != citation.url:
+                self._alias_urls.setdefault(url, citation)
+
+            if id(citation) not in found_ids:
+                found_ids.add(id(citation))
+                citations_found.append(citation)
 
         logger.info(
             f"Extracted {len(citations_found)} unique citations from content"
         )
         return citations_found
 
-    def _add_citation(
-        self,
-        authors: str,
-        year: str,
-        url: str,
-        citations_found: list,
-        seen_urls: dict,
-        seen_dois: dict,
-    ):
-        """Helper to add a citation with deduplication."""
+    def _add_citation(self, authors: str, year: str, url: str) -> Citation:
+        """Register a new citation under a unique key."""
         # Clean up authors
         # Remove embedded links without regex
         while "]" in authors and "(" in authors:
@@ -361,11 +407,6 @@ class CitationManager:
         if not authors:
             authors = "Unknown"
 
-        # Extract DOI if present
-        doi = extract_doi_from_url(url)
-        if doi and doi in seen_dois:
-            return  # Already have this DOI
-
         # Generate citation key (simple version first, will regenerate with title later)
         base_key = generate_citation_key(
             authors, year, "", use_better_bibtex=False
@@ -385,34 +426,198 @@ class CitationManager:
             key,
             use_better_bibtex=self.use_better_bibtex_keys,
         )
-        citations_found.append(citation)
         self.citations[key] = citation
-
-        # Track this citation
-        seen_urls[url] = key
-        if doi:
-            seen_dois[doi] = key
+        return citation
 
     def fetch_citation_metadata(self, citation: Citation) -> None:
         """Fetch additional metadata for a citation."""
         # Check SQLite cache first
         cached_citation = self._load_from_cache(citation.url)
         if cached_citation:
-            # Update citation with cached data
-            citation.title = cached_citation.title
-            citation.journal = cached_citation.journal
-            citation.volume = cached_citation.volume
-            citation.pages = cached_citation.pages
-            citation.doi = cached_citation.doi or citation.doi
-            citation.bibtex_type = cached_citation.bibtex_type
-            citation.raw_bibtex = cached_citation.raw_bibtex
-            citation.issue = cached_citation.issue
-            citation.full_authors = cached_citation.full_authors
-            citation.abstract = cached_citation.abstract
-            citation.arxiv_category = cached_citation.arxiv_category
-            logger.debug(f"Loaded citation from cache: {citation.url}")
+            self._apply_cached_citation(citation, cached_citation)
+            return
+
+        self._fetch_remote_metadata(citation)
+
+    def _apply_cached_citation(
+        self, citation: Citation, cached_citation: Citation
+    ) -> None:
+        """Update a citation with data loaded from the cache."""
+        citation.title = cached_citation.title
+        citation.journal = cached_citation.journal
+        citation.volume = cached_citation.volume
+        citation.pages = cached_citation.pages
+        citation.doi = cached_citation.doi or citation.doi
+        citation.bibtex_type = cached_citation.bibtex_type
+        citation.raw_bibtex = cached_citation.raw_bibtex
+        citation.issue = cached_citation.issue
+        citation.full_authors = cached_citation.full_authors
+        citation.abstract = cached_citation.abstract
+        citation.arxiv_category = cached_citation.arxiv_category
+        citation.metadata_fetched = True
+        logger.debug(f"Loaded citation from cache: {citation.url}")
+
+    def prefetch_metadata(
+        self,
+        citations: list[Citation],
+        backend_concurrency: dict[str, int] | None = None,
+        show_progress: bool = False,
+    ) -> dict[str, int]:
+        """Resolve metadata for many citations at once.
+
+        Citations of the same work (by canonical DOI, arXiv ID, PMID or
+        normalized URL) are resolved once and share the result. Cache hits
+        are resolved with a single bulk query. The remaining
+        citations are grouped by the backend that will serve them (CrossRef,
+        arXiv or the web page itself) and fetched concurrently, with each
+        backend limited to its own number of parallel requests.
+
+        Args:
+            citations: Citations to resolve
+            backend_concurrency: Per-backend worker caps, overriding
+                DEFAULT_BACKEND_CONCURRENCY
+            show_progress: Whether to show a progress bar for remote fetches
+
+        Returns:
+            Dictionary with the number of cache hits, of citations fetched
+            from each backend and of aliases filled from another citation
+        """
+        stats = {"cached": 0}
+
+        # Resolve each cited work once: other citations of the same work
+        # copy the metadata of the first one afterwards
+        groups: dict[CanonicalId, list[Citation]] = {}
+        for citation in citations:
+            if not citation.metadata_fetched:
+                work = canonical_id(citation.url) or CanonicalId(
+                    "citation", str(id(citation))
+                )
+                groups.setdefault(work, []).append(citation)
+        pending = [group[0] for group in groups.values()]
+        aliases = {
+            id(group[0]): group[1:] for group in groups.values() if group[1:]
+        }
+        self._resolve_pending(
+            pending, stats, backend_concurrency, show_progress
+        )
+
+        for citation in pending:
+            if not citation.metadata_fetched:
+                continue
+            for alias in aliases.get(id(citation), []):
+                self._apply_cached_citation(alias, citation)
+                stats["aliases"] = stats.get("aliases", 0) + 1
+        return stats
+
+    def _resolve_pending(
+        self,
+        pending: list[Citation],
+        stats: dict[str, int],
+        backend_concurrency: dict[str, int] | None,
+        show_progress: bool,
+    ) -> None:
+        """Resolve citations from the cache, then the remote backends."""
+        # Stage 1: bulk queries for everything already in the cache, by URL
+        # and then by DOI for works cached under another URL form
+        cached_rows = {}
+        cached_dois = {}
+        if self.cache:
+            cached_rows = self.cache.get_many([c.url for c in pending])
+            cached_dois = self.cache.get_many_by_doi(
+                [c.doi for c in pending if c.url not in cached_rows]
+            )
+        misses = []
+        for citation in pending:
+            cache_data = cached_rows.get(citation.url) or (
+                cached_dois.get(citation.doi) if citation.doi else None
+            )
+            if cache_data:
+                self._apply_cached_citation(
+                    citation,
+                    self._citation_from_cache_data(citation.url, cache_data),
+                )
+                stats["cached"] += 1
+            else:
+                misses.append(citation)
+
+        if not misses:
             return
 
+        # Stage 2: group misses by backend
+        by_backend: dict[str, list[Citation]] = {}
+        for citation in misses:
+            backend = self._get_metadata_backend(citation)
+            by_backend.setdefault(backend, []).append(citation)
+            stats[backend] = stats.get(backend, 0) + 1
+
+        logger.info(
+            f"Prefetching metadata: {stats['cached']} cached, "
+            + ", ".join(
+                f"{len(items)} {backend}"
+                for backend, items in by_backend.items()
+            )
+        )
+
+        # Stage 3: fetch all backends concurrently, each with its own cap
+        concurrency = dict(DEFAULT_BACKEND_CONCURRENCY)
+        if backend_concurrency:
+            concurrency.update(backend_concurrency)
+
+        executors = {
+            backend: ThreadPoolExecutor(
+                max_workers=max(
+                    1, min(concurrency.get(backend, 1), len(items))
+                ),
+                thread_name_prefix=f"prefetch-{backend}",
+            )
+            for backend, items in by_backend.items()
+        }
+        progress = (
+            tqdm(
+                total=len(misses),
+                desc="Fetching citation metadata",
+                unit="citations",
+                leave=False,
+            )
+            if show_progress
+            else None
+        )
+        try:
+            futures = {
+                executors[backend].submit(
+                    self._fetch_remote_metadata, citation
+                ): citation
+                for backend, items in by_backend.items()
+                for citation in items
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    citation = futures[future]
+                    logger.warning(
+                        f"Failed to fetch metadata for {citation.url}: {e}"
+                    )
+                if progress is not None:
+                    progress.update(1)
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True)
+            if progress is not None:
+                progress.close()
+
+    def _get_metadata_backend(self, citation: Citation) -> str:
+        """Name the backend that _fetch_remote_metadata will use."""
+        if "arxiv.org" in citation.url and (
+            self.prefer_arxiv or not citation.doi
+        ):
+            return "arxiv"
+        if citation.doi:
+            return "crossref"
+        return "web"
+
+    def _fetch_remote_metadata(self, citation: Citation) -> None:
+        """Fetch metadata from Zotero or the online APIs (no cache lookup)."""
         # Try Zotero first if available (usually has the best metadata)
         if self.zotero_client:
             logger.debug(
@@ -448,6 +653,7 @@ class CitationManager:
                         f"Fetched metadata from Zotero for DOI: {citation.doi}"
                     )
                     # Save to cache
+                    citation.metadata_fetched = True
                     self._save_to_cache(citation, "zotero")
                     return
 
@@ -490,6 +696,7 @@ class CitationManager:
                             f"Fetched metadata from Zotero for arXiv: {arxiv_id_match.group(1)}"
                         )
                         # Save to cache
+                        citation.metadata_fetched = True
                         self._save_to_cache(citation, "zotero")
                         return
 
@@ -539,22 +746,24 @@ class CitationManager:
 
         # Regenerate citation key with title if using Better BibTeX
         if self.use_better_bibtex_keys and citation.title:
-            # Find the current registry key for this citation object
-            current_registry_key = None
-            for key, stored_citation in self.citations.items():
-                if stored_citation is citation:  # Same object reference
-                    current_registry_key = key
-                    break
+            with self._registry_lock:
+                # Find the current registry key for this citation object
+                current_registry_key = None
+                for key, stored_citation in self.citations.items():
+                    if stored_citation is citation:  # Same object reference
+                        current_registry_key = key
+                        break
 
-            # Generate new key
-            new_key = citation.regenerate_key_with_title()
+                # Generate new key
+                new_key = citation.regenerate_key_with_title()
 
-            # Update the citation registry if key changed and we found the current key
-            if current_registry_key and current_registry_key != new_key:
-                self.citations[new_key] = self.citations.pop(
-                    current_registry_key
-                )
+                # Update the citation registry if key changed and we found the current key
+                if current_registry_key and current_registry_key != new_key:
+                    self.citations[new_key] = self.citations.pop(
+                        current_registry_key
+                    )
 
+        citation.metadata_fetched = True
         self._save_to_cache(citation, source)
 
     def get_cache_stats(self) -> dict:
@@ -578,7 +787,7 @@ class CitationManager:
                 "User-Agent": "deep-biblio-tools/1.0 (https://github.com/petteriTeikari/deep-biblio-tools)"
             }
 
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _throttled_get(url, headers=headers, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 work = data.get("message", {})
@@ -841,7 +1050,7 @@ class CitationManager:
             # arXiv API endpoint
             url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
 
-            response = requests.get(url, timeout=10)
+            response = _throttled_get(url, timeout=10)
             if response.status_code == 200:
                 # Parse XML response properly
                 content = response.text
@@ -959,7 +1168,12 @@ class CitationManager:
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
-            response = requests.get(citation.url, headers=headers, timeout=10)
+            response = _throttled_get(
+                citation.url,
+                session=self.http_session,
+                headers=headers,
+                timeout=10,
+            )
             if response.status_code != 200:
                 logger.warning(
                     f"Failed to fetch {citation.url}: HTTP {response.status_code}"
@@ -1159,65 +1373,93 @@ class CitationManager:
 
     def replace_citations_in_text(self, content: str) -> str:
         """Replace markdown citations with LaTeX cite commands."""
-        # Create a list of replacements to make
-        replacements = []
-
-        # For each citation we've stored, find it in the content and prepare replacement
+        # Map each stored URL to its key (first citation wins on duplicates)
+        url_to_key: dict[str, str] = {}
         for key, citation in self.citations.items():
             if not citation.url.startswith("#orphan-"):
-                # Regular citation with URL - create the markdown pattern
-                # We need to find [some text](exact_url)
-                # Since we have the exact URL, we can be precise
-                search_pattern = f"]({citation.url})"
-
-                # Find all occurrences of this URL pattern
-                pos = 0
-                while True:
-                    pos = content.find(search_pattern, pos)
-                    if pos == -1:
-                        break
-
-                    # Find the opening bracket by going backwards
-                    bracket_pos = pos - 1
-                    depth = 0
-                    while bracket_pos >= 0:
-                        if content[bracket_pos] == "]":
-                            depth += 1
-                        elif content[bracket_pos] == "[":
-                            if depth == 0:
-                                # Found the matching opening bracket
-                                replacements.append(
-                                    {
-                                        "start": bracket_pos,
-                                        "end": pos + len(search_pattern),
-                                        "replacement": f"\\citep{{{citation.key}}}",
-                                    }
-                                )
-                                break
-                            else:
-                                depth -= 1
-                        bracket_pos -= 1
-
-                    pos += len(search_pattern)
+                url_to_key.setdefault(citation.url, key)
             else:
                 # Orphan citation - these are trickier
                 # For now, log them
                 logger.info(
                     f"Orphan citation to be handled manually: {citation.authors} ({citation.year})"
                 )
+        # Other URLs of the same works cite them too (keys may have been
+        # regenerated since extraction, so look them up now)
+        for url, citation in self._alias_urls.items():
+            url_to_key.setdefault(url, citation.key)
+
+        if not url_to_key:
+            return content
+
+        # Find all [text](url) spans in one scan, then build the output
+        # with a single join instead of re-slicing the document per match
+        parts = []
+        cursor = 0
+        for start, end, key in self._find_citation_links(content, url_to_key):
+            if start < cursor:
+                # Nested inside a link that was already replaced
+                continue
+            parts.append(content[cursor:start])
+            parts.append(f"\\citep{{{key}}}")
+            cursor = end
+        parts.append(content[cursor:])
 
-        # Sort replacements by position (descending) to avoid position shifts
-        replacements.sort(key=lambda x: x["start"], reverse=True)
+        return "".join(parts)
 
-        # Apply replacements
-        for repl in replacements:
-            content = (
-                content[: repl["start"]]
-                + repl["replacement"]
-                + content[repl["end"] :]
-            )
+    def _find_citation_links(
+        self, content: str, url_to_key: dict[str, str]
+    ) -> list[tuple[int, int, str]]:
+        """Locate markdown links whose target is a known citation URL.
+
+        Brackets are matched with a stack while scanning forward, so each
+        character is visited once no matter how many citations there are.
+
+        Args:
+            content: Markdown text
+            url_to_key: Citation URLs mapped to their keys
+
+        Returns:
+            (start, end, key) spans sorted by start position
+        """
+        # URLs containing ")" can't be cut at the first closing paren
+        paren_urls = [url for url in url_to_key if ")" in url]
+
+        links = []
+        open_brackets: list[int] = []
+        pos = 0
+        next_open = content.find("[")
+        next_close = content.find("]")
+        while next_close != -1:
+            if next_open != -1 and next_open < next_close:
+                open_brackets.append(next_open)
+                pos = next_open + 1
+                next_open = content.find("[", pos)
+                continue
+
+            pos = next_close + 1
+            opening = open_brackets.pop() if open_brackets else None
+            if opening is not None and content.startswith("(", pos):
+                url_start = pos + 1
+                url_end = content.find(")", url_start)
+                url = content[url_start:url_end] if url_end != -1 else None
+                if url not in url_to_key:
+                    url = next(
+                        (
+                            u
+                            for u in paren_urls
+                            if content.startswith(u + ")", url_start)
+                        ),
+                        None,
+                    )
+                if url is not None:
+                    end = url_start + len(url) + 1
+                    links.append((opening, end, url_to_key[url]))
+
+            next_close = content.find("]", pos)
 
-        return content
+        links.sort()
+        return links
 
     def generate_bibtex_file(
         self, output_path: Path, show_progress: bool = False
@@ -1246,7 +1488,8 @@ class CitationManager:
                 )
 
             # Fetch metadata if not already done
-            self.fetch_citation_metadata(citation)
+            if not citation.metadata_fetched:
+                self.fetch_citation_metadata(citation)
             bibtex_entries.append(citation.to_bibtex())
 
         # Cache is now saved automatically after each citation fetch
@@ -2,7 +2,6 @@
 
 # Standard library imports
 import hashlib
-import json
 import logging
 import os
 import shutil
@@ -18,6 +17,8 @@ from markdown_it import MarkdownIt
 from tqdm import tqdm
 
 # Local imports
+from src.converters.md_to_latex import post_processing
+from src.converters.md_to_latex.build_cache import BuildCache
 from src.converters.md_to_latex.citation_manager import CitationManager
 from src.converters.md_to_latex.concept_boxes import (
     ConceptBoxConverter,
@@ -26,20 +27,52 @@ from src.converters.md_to_latex.concept_boxes import (
 from src.converters.md_to_latex.latex_builder import LatexBuilder
 from src.converters.md_to_latex.post_processing import post_process_latex_file
 from src.converters.md_to_latex.utils import (
+    DollarKind,
     clean_markdown_headings,
+    compute_file_hash,
+    compute_text_hash,
     convert_html_entities,
     ensure_directory,
+    escape_dollar_signs,
     extract_abstract_from_markdown,
     extract_doi_from_url,
     extract_title_from_markdown,
     generate_citation_key,
+    split_markdown_sections,
 )
+from src.utils.csl_json_index import CSLJsonIndex
+from src.utils.identifiers import canonical_id
 
 if TYPE_CHECKING:
-    pass
+    from src.converters.pandoc_pool import PandocPool
 
 logger = logging.getLogger(__name__)
 
+# Pandoc settings for the markdown -> LaTeX step
+PANDOC_INPUT_FORMAT = "markdown+tex_math_dollars+raw_tex+pipe_tables"
+PANDOC_EXTRA_ARGS = [
+    "--wrap=preserve",
+    "--columns=80",
+    "--listings",  # Use listings for code blocks
+    "--no-highlight",  # Disable syntax highlighting
+    "-V",
+    "documentclass=article",
+    "-V",
+    "geometry:margin=1in",
+    "-V",
+    "tables=true",  # Enable table support
+]
+
+# Dollar signs escaped in the markdown (all but those already escaped)
+UNESCAPED_DOLLARS = frozenset(DollarKind) - {DollarKind.ESCAPED}
+
+# Raw LaTeX paragraph separating sections converted in one pandoc call
+SECTION_BREAK_MARKER = "\\mdtolatexsectionbreak"
+
+# Directory (inside the output directory) holding the build cache, with one
+# subdirectory per source document
+BUILD_CACHE_DIRNAME = ".md2latex-cache"
+
 
 class MarkdownToLatexConverter:
     """Converts markdown documents to LaTeX format with citation and concept box support."""
@@ -63,6 +96,8 @@ class MarkdownToLatexConverter:
         use_cache: bool = True,
         use_better_bibtex_keys: bool = True,
         font_size: str = "11pt",
+        use_build_cache: bool = True,
+        pandoc_pool: "PandocPool | None" = None,
     ):
         """Initialize the converter.
 
@@ -80,6 +115,10 @@ class MarkdownToLatexConverter:
             use_cache: Whether to use SQLite cache for citation metadata (default True)
             use_better_bibtex_keys: Whether to use Better BibTeX key format (default True)
             font_size: Font size for document (default '11pt', can be '10pt' for arXiv)
+            use_build_cache: Whether to reuse pandoc output of unchanged
+                sections and unchanged post-processing results (default True)
+            pandoc_pool: Shared pool of pandoc workers for batch runs; without
+                one, every pandoc call starts its own process
         """
         self.output_dir = (
             output_dir  # Will be set relative to input file if None
@@ -95,10 +134,15 @@ class MarkdownToLatexConverter:
         self.zotero_json_path = (
             Path(zotero_json_path) if zotero_json_path else None
         )
+        # Compiled index of the Zotero JSON, opened on first use
+        self._zotero_index: CSLJsonIndex | None = None
         self.bibliography_style = bibliography_style
         self.use_cache = use_cache
         self.use_better_bibtex_keys = use_better_bibtex_keys
         self.font_size = font_size
+        self.use_build_cache = use_build_cache
+        self.pandoc_pool = pandoc_pool
+        self._pandoc_version: str | None = None
 
         # Initialize components
         self.citation_manager = CitationManager(
@@ -160,46 +204,35 @@ class MarkdownToLatexConverter:
             )
             return 0, len(citations)
 
-        # Load Zotero JSON
-        with open(self.zotero_json_path, encoding="utf-8") as f:
-            zotero_entries = json.load(f)
+        # Entries are looked up in a compiled index of the export and
+        # decoded one at a time, instead of loading the whole file
+        if self._zotero_index is None:
+            self._zotero_index = CSLJsonIndex(self.zotero_json_path)
+        index = self._zotero_index
 
         logger.info(
-            f"Loaded {len(zotero_entries)} entries from {self.zotero_json_path}"
+            f"Using index of {len(index)} entries from {self.zotero_json_path}"
         )
 
-        # Build lookup indices
-        url_index = {}
-        doi_index = {}
-        for entry in zotero_entries:
-            url = entry.get("URL", "")
-            if url:
-                url_index[url] = entry
-
-            doi = entry.get("DOI", "")
-            if doi:
-                doi_index[doi.lower()] = entry
-
         # Match citations
         matched = 0
         for citation in citations:
             # Try URL match first
-            if citation.url in url_index:
-                self._populate_citation_from_csl_json(
-                    citation, url_index[citation.url]
-                )
-                matched += 1
-                continue
+            entry = index.get("url", citation.url)
 
             # Try DOI match
+            if entry is None:
+                doi = extract_doi_from_url(citation.url)
+                entry = index.find_by_doi(doi) if doi else None
 
-            doi = extract_doi_from_url(citation.url)
-            if doi and doi.lower() in doi_index:
-                self._populate_citation_from_csl_json(
-                    citation, doi_index[doi.lower()]
-                )
+            # Try another URL form of the same work (e.g. arXiv abs/pdf)
+            work = canonical_id(citation.url)
+            if entry is None and work is not None:
+                entry = index.get("work", str(work))
+
+            if entry is not None:
+                self._populate_citation_from_csl_json(citation, entry)
                 matched += 1
-                continue
 
         return matched, len(citations) - matched
 
@@ -622,8 +655,8 @@ class MarkdownToLatexConverter:
                     f"Fetching metadata for {len(citations)} citations"
                 )
 
-            for citation in citations:
-                self.citation_manager.fetch_citation_metadata(citation)
+            prefetch_stats = self.citation_manager.prefetch_metadata(citations)
+            logger.info(f"Citation metadata prefetch: {prefetch_stats}")
 
             if verbose:
                 pbar.set_description(f"Processing {len(citations)} citations")
@@ -652,25 +685,17 @@ class MarkdownToLatexConverter:
             # Step 5: Convert to LaTeX using pandoc
             if verbose:
                 pbar.set_description("Converting with pandoc")
-            try:
-                latex_content = pypandoc.convert_text(
-                    content,
-                    "latex",
-                    format="markdown+tex_math_dollars+raw_tex+pipe_tables",
-                    extra_args=[
-                        "--standalone",
-                        "--wrap=preserve",
-                        "--columns=80",
-                        "--listings",  # Use listings for code blocks
-                        "--no-highlight",  # Disable syntax highlighting
-                        "-V",
-                        "documentclass=article",
-                        "-V",
-                        "geometry:margin=1in",
-                        "-V",
-                        "tables=true",  # Enable table support
-                    ],
+            build_cache = (
+                BuildCache(
+                    self.output_dir
+                    / BUILD_CACHE_DIRNAME
+                    / self._build_cache_scope(markdown_file)
                 )
+                if self.use_build_cache
+                else None
+            )
+            try:
+                latex_content = self._convert_with_pandoc(content, build_cache)
             except (RuntimeError, OSError, ValueError) as e:
                 logger.error(f"Pandoc conversion failed: {e}")
                 raise
@@ -769,13 +794,11 @@ class MarkdownToLatexConverter:
             if verbose:
                 pbar.set_description("Writing output files")
             output_tex = self.output_dir / f"{output_name}.tex"
-            with open(output_tex, "w", encoding="utf-8") as f:
-                f.write(final_latex)
 
             # Step 7a: Post-process LaTeX file to fix common issues
             if verbose:
                 pbar.set_description("Post-processing LaTeX")
-            post_process_latex_file(output_tex)
+            self._write_post_processed(output_tex, final_latex, build_cache)
             logger.info("Applied post-processing fixes to LaTeX file")
 
             # Write BibTeX file
@@ -846,6 +869,188 @@ class MarkdownToLatexConverter:
             logger.error(f"Conversion failed: {e}")
             raise
 
+    def _get_pandoc_version(self) -> str | None:
+        """Get the installed pandoc version, or None if pandoc is missing."""
+        if self._pandoc_version is None:
+            try:
+                self._pandoc_version = pypandoc.get_pandoc_version()
+            except (OSError, RuntimeError) as e:
+                logger.debug(f"Pandoc version unavailable: {e}")
+                return None
+        return self._pandoc_version
+
+    @staticmethod
+    def _build_cache_scope(markdown_file: Path) -> str:
+        """Build cache subdirectory of one source document.
+
+        Each build prunes the entries it didn't use, so documents sharing
+        an output directory must not share cache entries.
+        """
+        source = str(markdown_file.resolve())
+        return f"{markdown_file.stem}-{compute_text_hash(source)[:16]}"
+
+    def _convert_with_pandoc(
+        self, content: str, build_cache: BuildCache | None
+    ) -> str:
+        """Convert prepared markdown to LaTeX, reusing unchanged sections.
+
+        With a build cache, the document is split at headings and only
+        sections whose markdown changed since the last build go through
+        pandoc (in a single call); the rest come from the cache. The result
+        is wrapped in a document environment like pandoc's standalone output
+        so LatexBuilder.process_pandoc_output handles both the same way.
+
+        Args:
+            content: Markdown ready for pandoc
+            build_cache: Cache for pandoc fragments, or None to disable
+
+        Returns:
+            LaTeX produced by pandoc
+        """
+        pandoc_version = self._get_pandoc_version() if build_cache else None
+        if build_cache is None or pandoc_version is None:
+            return self._run_pandoc(
+                content, ["--standalone", *PANDOC_EXTRA_ARGS]
+            )
+
+        if self._can_split_sections(content):
+            sections = split_markdown_sections(content)
+        else:
+            sections = [content]
+
+        keys = [
+            build_cache.make_key(
+                pandoc_version, PANDOC_INPUT_FORMAT, *PANDOC_EXTRA_ARGS, section
+            )
+            for section in sections
+        ]
+        fragments: dict[str, str | None] = {}
+        for key in keys:
+            if key not in fragments:
+                fragments[key] = build_cache.get("pandoc", key)
+
+        # Convert every changed section with one pandoc call
+        missing = {
+            key: section
+            for key, section in zip(keys, sections, strict=True)
+            if fragments[key] is None
+        }
+        if missing:
+            converted = self._convert_sections(list(missing.values()))
+            for key, fragment in zip(missing, converted, strict=True):
+                fragments[key] = fragment
+                build_cache.put("pandoc", key, fragment)
+        build_cache.prune("pandoc", set(keys))
+
+        logger.info(
+            f"Pandoc: converted {len(missing)} of {len(fragments)} sections, "
+            f"reused {len(fragments) - len(missing)} from build cache"
+        )
+
+        body = "\n\n".join(fragments[key].strip("\n") for key in keys)
+        return f"\\begin{{document}}\n{body}\n\\end{{document}}\n"
+
+    def _convert_sections(self, sections: list[str]) -> list[str]:
+        """Convert markdown sections to LaTeX body fragments in one call.
+
+        Sections are joined with raw LaTeX marker paragraphs, which pandoc
+        passes through untouched, and the output is split on them again.
+        """
+        if len(sections) == 1:
+            return [self._convert_fragment(sections[0])]
+
+        joined = "".join(
+            f"{section.rstrip()}\n\n{SECTION_BREAK_MARKER}{{{i}}}\n\n"
+            for i, section in enumerate(sections[:-1])
+        )
+        output = self._convert_fragment(joined + sections[-1])
+
+        fragments = []
+        rest = output
+        for i in range(len(sections) - 1):
+            before, marker, rest = rest.partition(
+                f"{SECTION_BREAK_MARKER}{{{i}}}"
+            )
+            if not marker:
+                # A section swallowed its marker (e.g. an unclosed code
+                # fence), convert the sections one by one instead
+                logger.debug("Section markers lost, converting separately")
+                return [self._convert_fragment(s) for s in sections]
+            fragments.append(before.strip("\n"))
+        fragments.append(rest.strip("\n"))
+        return fragments
+
+    def _convert_fragment(self, content: str) -> str:
+        """Convert markdown to a LaTeX body fragment (no preamble)."""
+        return self._run_pandoc(content, PANDOC_EXTRA_ARGS)
+
+    def _run_pandoc(self, content: str, extra_args: list[str]) -> str:
+        """Run pandoc on markdown, through the shared pool if there is one."""
+        if self.pandoc_pool is not None:
+            return self.pandoc_pool.convert_text(
+                content,
+                "latex",
+                format=PANDOC_INPUT_FORMAT,
+                extra_args=extra_args,
+            )
+        return pypandoc.convert_text(
+            content,
+            "latex",
+            format=PANDOC_INPUT_FORMAT,
+            extra_args=extra_args,
+        )
+
+    def _can_split_sections(self, content: str) -> bool:
+        """Check whether sections can be converted independently.
+
+        Footnotes, link reference definitions and YAML metadata can refer
+        across sections, and duplicate headings get identifiers that depend
+        on the rest of the document; such documents are converted whole.
+        """
+        if content.startswith("---"):
+            return False
+
+        headings = set()
+        for line in content.splitlines():
+            stripped = line.lstrip()
+            if stripped.startswith("[") and "]:" in stripped:
+                return False
+            if line.startswith("#"):
+                heading = line.strip("# \t")
+                if heading in headings:
+                    return False
+                headings.add(heading)
+        return True
+
+    def _write_post_processed(
+        self, output_tex: Path, final_latex: str, build_cache: BuildCache | None
+    ) -> None:
+        """Write the LaTeX file and post-process it, reusing a cached result.
+
+        The cache key covers the LaTeX before post-processing and the
+        post-processing code itself.
+        """
+        if build_cache is None:
+            output_tex.write_text(final_latex, encoding="utf-8")
+            post_process_latex_file(output_tex)
+            return
+
+        key = build_cache.make_key(
+            compute_file_hash(Path(post_processing.__file__)), final_latex
+        )
+        cached = build_cache.get("postprocess", key)
+        if cached is not None:
+            output_tex.write_text(cached, encoding="utf-8")
+            logger.info("Post-processing unchanged, reused cached result")
+            return
+
+        output_tex.write_text(final_latex, encoding="utf-8")
+        post_process_latex_file(output_tex)
+        build_cache.put(
+            "postprocess", key, output_tex.read_text(encoding="utf-8")
+        )
+        build_cache.prune("postprocess", {key})
+
     def _escape_currency_dollars(self, content: str) -> str:
         """Escape dollar signs that represent currency, not math mode.
 
@@ -870,13 +1075,9 @@ class MarkdownToLatexConverter:
         for symbol, latex_cmd in replacements.items():
             content = content.replace(symbol, latex_cmd)
 
-        # Replace all dollar signs with escaped versions
-        # We'll use a temporary placeholder to avoid double-escaping
-        content = content.replace(r"\$", "ESCAPED_DOLLAR_PLACEHOLDER")
-        content = content.replace("$", r"\$")
-        content = content.replace("ESCAPED_DOLLAR_PLACEHOLDER", r"\$")
-
-        return content
+        # Escape every dollar sign that is not already escaped, whether it
+        # reads as currency or math, since $ never means math here
+        return escape_dollar_signs(content, UNESCAPED_DOLLARS)
 
     def _mark_horizontal_rule_boxes(self, content: str) -> str:
         """Mark content from 'Technical Concept Box' to next '---' with special markers."""
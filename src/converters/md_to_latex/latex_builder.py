@@ -6,10 +6,17 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
-from src.converters.md_to_latex.utils import clean_pandoc_output
+from src.converters.md_to_latex.utils import (
+    DollarKind,
+    clean_pandoc_output,
+    escape_dollar_signs,
+)
 
 logger = logging.getLogger(__name__)
 
+# Environments whose dollar signs are never escaped
+VERBATIM_ENVIRONMENTS = ("verbatim", "lstlisting")
+
 
 class LatexBuilder:
     """Builds LaTeX documents with proper structure and formatting."""
@@ -494,121 +501,13 @@ class LatexBuilder:
         # IMPORTANT: Pandoc already escapes dollar signs in the markdown,
         # so we should NOT escape them again!
 
-        def is_pandoc_generated_math(text):
-            """Check if this is math mode generated by clean_pandoc_output from unicode."""
-            # These are the LaTeX commands that clean_pandoc_output creates
-            pandoc_math_commands = [
-                r"\\approx",
-                r"\\pm",
-                r"\\times",
-                r"\\div",
-                r"\\geq",
-                r"\\leq",
-                r"\\neq",
-                r"\\in",
-                r"\\notin",
-                r"\\cup",
-                r"\\cap",
-                r"\\subset",
-                r"\\supset",
-                r"\\emptyset",
-                r"\\infty",
-                r"\\pi",
-                r"\\sigma",
-                r"\\mu",
-                r"\\lambda",
-                r"\\alpha",
-                r"\\beta",
-                r"\\gamma",
-                r"\\delta",
-                r"\\epsilon",
-                r"\\theta",
-                r"\\kappa",
-                r"\^\s*\\circ",
-            ]
-            return any(cmd in text for cmd in pandoc_math_commands)
-
-        # We don't need to escape dollar signs because pandoc already does it
-        # We just need to ensure math mode created by clean_pandoc_output stays intact
-
         # However, pandoc sometimes misses dollar signs in certain contexts (like lists)
-        # So we need to escape any unescaped dollar signs that look like currency
-        # Pattern: $ followed by digits, optionally with commas, K/M/B suffix, and +/-
-        # BUT: avoid matching if we're already inside math mode (between $ signs)
-
-        # First, let's find all math mode regions to protect them
-        math_regions = []
-        i = 0
-        while i < len(content):
-            if content[i] == "$" and (i == 0 or content[i - 1] != "\\"):
-                # Found start of math mode
-                j = i + 1
-                while j < len(content):
-                    if content[j] == "$" and content[j - 1] != "\\":
-                        # Found end of math mode
-                        math_regions.append((i, j + 1))
-                        i = j
-                        break
-                    j += 1
-            i += 1
-
-        def is_in_math_mode(pos):
-            """Check if position is inside a math mode region."""
-            for start, end in math_regions:
-                if start <= pos < end:
-                    return True
-            return False
-
-        # Final step: escape any remaining unescaped dollar signs that look like currency
-        # This catches cases that pandoc misses in certain contexts
-        # Match: $ followed by digits, with optional commas, K/M/B suffix, and +/-
-        # But only if not already escaped (no preceding backslash)
-
-        # Split content into lines to handle line-by-line
-        lines = content.split("\n")
-        new_lines = []
-
-        for line in lines:
-            # Skip if line is in a verbatim environment
-            if line.strip().startswith(
-                "\\begin{verbatim}"
-            ) or line.strip().startswith("\\begin{lstlisting}"):
-                new_lines.append(line)
-                continue
-
-            # Look for unescaped currency patterns
-            # Find all dollar signs and check if they're followed by numbers
-            i = 0
-            new_line = []
-            while i < len(line):
-                if line[i] == "$" and (i == 0 or line[i - 1] != "\\"):
-                    # Found unescaped dollar sign, check if it's followed by a number
-                    if i + 1 < len(line) and line[i + 1].isdigit():
-                        # This looks like currency
-                        # Check if we're in verbatim environment (already handled above)
-                        new_line.append("\\$")
-                        i += 1
-                    else:
-                        # Check for currency patterns like "$ 50" with space
-                        if (
-                            i + 2 < len(line)
-                            and line[i + 1] == " "
-                            and line[i + 2].isdigit()
-                        ):
-                            new_line.append("\\$")
-                            i += 1
-                        else:
-                            new_line.append(line[i])
-                            i += 1
-                else:
-                    new_line.append(line[i])
-                    i += 1
-
-            line = "".join(new_line)
-
-            new_lines.append(line)
-
-        content = "\n".join(new_lines)
+        # So we escape any unescaped dollar sign that looks like currency
+        # ($ followed by a digit, or a space and a digit), leaving math mode
+        # and verbatim environments intact
+        content = escape_dollar_signs(
+            content, {DollarKind.CURRENCY}, VERBATIM_ENVIRONMENTS
+        )
 
         return content.strip()
 
@@ -1,12 +1,55 @@
 """Post-processing module for cleaning up LaTeX output after pandoc conversion."""
 
 import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 
 # import re  # Banned - using string methods instead
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+NESTED_EMPHASIS = "\\emph{\\emph{"
+TABLE_BEGINS = ("\\begin{tabular}", "\\begin{longtable}")
+
+
+def _find_group_end(text: str, start: int) -> int:
+    """Index just past the brace closing a group opened before start.
+
+    Returns:
+        The index, or -1 if the group is not closed
+    """
+    depth = 1
+    pos = start
+    while depth:
+        close = text.find("}", pos)
+        if close == -1:
+            return -1
+        opening = text.find("{", pos, close)
+        if opening == -1:
+            depth -= 1
+            pos = close + 1
+        else:
+            depth += 1
+            pos = opening + 1
+    return pos
+
+
+@dataclass(frozen=True)
+class PostProcessingRule:
+    """A fix applied to the whole document."""
+
+    name: str
+    apply: Callable[[str], str]
+    # Substrings at least one of which must occur for the fix to change
+    # anything; a rule without triggers always runs
+    triggers: tuple[str, ...] = ()
+
+    def applies_to(self, content: str) -> bool:
+        """Whether the content may contain something this rule fixes."""
+        return not self.triggers or any(t in content for t in self.triggers)
+
 
 class LatexPostProcessor:
     """Clean up common issues in LaTeX files generated by pandoc."""
@@ -14,6 +57,81 @@ class LatexPostProcessor:
     def __init__(self):
         """Initialize the post-processor."""
         self.fixes_applied = []
+        self.rule_timings: dict[str, float] = {}
+        self.rules: list[PostProcessingRule] = []
+
+        # Rules run in registration order
+        self.register_rule(
+            "passthrough_commands",
+            self._fix_passthrough_commands,
+            ("\\passthrough",),
+        )
+        self.register_rule(
+            "table_alignment", self._fix_table_alignment_issues, TABLE_BEGINS
+        )
+        self.register_rule(
+            "strut_commands", self._fix_strut_commands, ("\\strut",)
+        )
+        self.register_rule(
+            "empty_captions", self._fix_empty_captions, ("\\caption{",)
+        )
+        self.register_rule(
+            "nested_emphasis", self._fix_nested_emphasis, (NESTED_EMPHASIS,)
+        )
+        self.register_rule(
+            "href_in_tables", self._fix_href_in_tables, ("\\href{",)
+        )
+        self.register_rule(
+            "href_citations", self._fix_href_citations, ("\\href{",)
+        )
+        self.register_rule(
+            "concept_boxes",
+            self._convert_horizontal_rules_to_boxes,
+            ("CONCEPTBOXSTART\\{",),
+        )
+        self.register_rule(
+            "excessive_line_breaks", self._clean_excessive_line_breaks
+        )
+
+    def register_rule(
+        self,
+        name: str,
+        apply: Callable[[str], str],
+        triggers: tuple[str, ...] = (),
+    ) -> None:
+        """Add a fix to run after the registered ones.
+
+        Args:
+            name: Rule name used in the timing log
+            apply: Function from document text to fixed text
+            triggers: Substrings without which the rule changes nothing
+        """
+        self.rules.append(PostProcessingRule(name, apply, triggers))
+
+    def process(self, content: str) -> str:
+        """Apply all rules to LaTeX text.
+
+        Rules whose triggers do not occur in the text are skipped. The time
+        spent in each rule is kept in rule_timings and logged.
+
+        Args:
+            content: LaTeX document text
+
+        Returns:
+            The fixed text
+        """
+        for rule in self.rules:
+            if not rule.applies_to(content):
+                logger.debug(f"  {rule.name}: skipped")
+                continue
+            started = time.perf_counter()
+            content = rule.apply(content)
+            elapsed = time.perf_counter() - started
+            self.rule_timings[rule.name] = (
+                self.rule_timings.get(rule.name, 0.0) + elapsed
+            )
+            logger.debug(f"  {rule.name}: {elapsed * 1000:.1f} ms")
+        return content
 
     def process_file(self, latex_file: Path) -> None:
         """Process a LaTeX file and apply all cleaning routines.
@@ -28,15 +146,7 @@ class LatexPostProcessor:
         original_content = content
 
         # Apply all fixes
-        content = self._fix_passthrough_commands(content)
-        content = self._fix_table_alignment_issues(content)
-        content = self._fix_strut_commands(content)
-        content = self._fix_empty_captions(content)
-        content = self._fix_nested_emphasis(content)
-        content = self._fix_href_in_tables(content)
-        content = self._fix_href_citations(content)
-        content = self._convert_horizontal_rules_to_boxes(content)
-        content = self._clean_excessive_line_breaks(content)
+        content = self.process(content)
 
         # Write back if changes were made
         if content != original_content:
@@ -54,86 +164,58 @@ class LatexPostProcessor:
 
         Converts \passthrough{\lstinline!...!} to \texttt{...}
         """
-        # Find and replace passthrough commands without regex
+        # Find and replace passthrough commands without regex, copying the
+        # text between matches as whole segments
         result = []
         i = 0
-
-        while i < len(content):
-            if content[i : i + 12] == "\\passthrough":
-                # Found passthrough, check if it's the pattern we want
+        length = len(content)
+
+        while True:
+            pos = content.find("\\passthrough", i)
+            if pos == -1:
+                break
+            result.append(content[i:pos])
+
+            # Check if it's the pattern we want
+            if (
+                pos + 23 < length
+                and content[pos + 12] == "{"
+                and content[pos + 13 : pos + 23] == "\\lstinline"
+            ):
+                # Look for delimiter after \lstinline
+                j = pos + 23
+                end_pos = -1
+                # Handle both \! and ! patterns
+                if content.startswith("\\!", j):
+                    # \! pattern - find the closing \!
+                    content_start = j + 2
+                    k = content.find("\\!", content_start)
+                    if k != -1:
+                        end_pos = k + 2
+                elif content[j] == "!":
+                    # Regular ! pattern - find the closing !
+                    content_start = j + 1
+                    k = content.find("!", content_start)
+                    if k != -1:
+                        end_pos = k + 1
+
+                # Check for } after the closing delimiter
                 if (
-                    i + 23 < len(content)
-                    and content[i + 12 : i + 13] == "{"
-                    and content[i + 13 : i + 23] == "\\lstinline"
+                    end_pos != -1
+                    and end_pos < length
+                    and content[end_pos] == "}"
                 ):
-                    # Look for delimiter after \lstinline
-                    j = i + 23
-                    # Handle both \! and ! patterns
-                    if (
-                        j + 1 < len(content)
-                        and content[j] == "\\"
-                        and content[j + 1] == "!"
-                    ):
-                        # \! pattern - start after \!
-                        content_start = j + 2
-                        # Find the closing \!
-                        k = content_start
-                        while k + 1 < len(content):
-                            if content[k] == "\\" and content[k + 1] == "!":
-                                break
-                            k += 1
-
-                        if (
-                            k + 1 < len(content)
-                            and content[k] == "\\"
-                            and content[k + 1] == "!"
-                        ):
-                            # Extract the content between \! ... \!
-                            inner_content = content[content_start:k]
-
-                            # Skip the closing \! and check for }
-                            end_pos = k + 2
-                            if (
-                                end_pos < len(content)
-                                and content[end_pos] == "}"
-                            ):
-                                result.append(f"\\texttt{{{inner_content}}}")
-                                self.fixes_applied.append(
-                                    "Fixed passthrough command"
-                                )
-                                i = end_pos + 1
-                                continue
-
-                    elif j < len(content) and content[j] == "!":
-                        # Regular ! pattern - start after !
-                        content_start = j + 1
-                        # Find the closing !
-                        k = content_start
-                        while k < len(content):
-                            if content[k] == "!":
-                                break
-                            k += 1
-
-                        if k < len(content) and content[k] == "!":
-                            # Extract the content between ! ... !
-                            inner_content = content[content_start:k]
-
-                            # Skip the closing ! and check for }
-                            end_pos = k + 1
-                            if (
-                                end_pos < len(content)
-                                and content[end_pos] == "}"
-                            ):
-                                result.append(f"\\texttt{{{inner_content}}}")
-                                self.fixes_applied.append(
-                                    "Fixed passthrough command"
-                                )
-                                i = end_pos + 1
-                                continue
+                    inner_content = content[content_start:k]
+                    result.append(f"\\texttt{{{inner_content}}}")
+                    self.fixes_applied.append("Fixed passthrough command")
+                    i = end_pos + 1
+                    continue
 
-            result.append(content[i])
-            i += 1
+            # Not a passthrough we handle: keep the backslash, scan on
+            result.append("\\")
+            i = pos + 1
 
+        result.append(content[i:])
         return "".join(result)
 
     def _fix_table_alignment_issues(self, content: str) -> str:
@@ -355,40 +437,39 @@ class LatexPostProcessor:
 
     def _fix_nested_emphasis(self, content: str) -> str:
         """Fix nested emphasis commands that might cause issues."""
-        # Fix \emph{\emph{...}} -> \emph{...}
-        while "\\emph{\\emph{" in content:
-            pos = content.find("\\emph{\\emph{")
-            if pos != -1:
-                # Find the matching braces
-                start = pos + 12  # After \emph{\emph{
-                brace_count = 1
-                i = start
-
-                while i < len(content) and brace_count > 0:
-                    if content[i] == "{":
-                        brace_count += 1
-                    elif content[i] == "}":
-                        brace_count -= 1
-                    i += 1
-
-                if brace_count == 0:
-                    # Found the inner content
-                    inner_content = content[start : i - 1]
-                    # Skip the next }
-                    if i < len(content) and content[i] == "}":
-                        i += 1
+        # Fix \emph{\emph{...}} -> \emph{...}, left to right. A match
+        # and its groups never extend past the fixed span, so the span is
+        # fixed on its own (for deeper nesting) and the scan moves on.
+        result = []
+        i = 0
 
-                    # Replace with single \emph
-                    content = (
-                        content[:pos]
-                        + f"\\emph{{{inner_content}}}"
-                        + content[i:]
-                    )
-                    self.fixes_applied.append("Fixed nested emphasis")
-                else:
-                    break
+        while True:
+            pos = content.find(NESTED_EMPHASIS, i)
+            if pos == -1:
+                break
+
+            # Find the matching brace of the inner \emph
+            start = pos + 12  # After \emph{\emph{
+            end = _find_group_end(content, start)
+            if end == -1:
+                break
+
+            # Found the inner content
+            inner_content = content[start : end - 1]
+            # Skip the next }
+            if end < len(content) and content[end] == "}":
+                end += 1
+
+            # Replace with single \emph
+            self.fixes_applied.append("Fixed nested emphasis")
+            result.append(content[i:pos])
+            result.append(
+                self._fix_nested_emphasis(f"\\emph{{{inner_content}}}")
+            )
+            i = end
 
-        return content
+        result.append(content[i:])
+        return "".join(result)
 
     def _fix_href_in_tables(self, content: str) -> str:
         """Fix long hrefs in tables that might cause overfull hboxes."""
@@ -500,82 +581,66 @@ class LatexPostProcessor:
         result = []
         i = 0
 
-        while i < len(content):
-            if content[i : i + 6] == "\\href{":
-                # Check if URL is academic
-                url_start = i + 6
-                brace_count = 1
-                j = url_start
-
-                # Find end of URL
-                while j < len(content) and brace_count > 0:
-                    if content[j] == "{":
-                        brace_count += 1
-                    elif content[j] == "}":
-                        brace_count -= 1
-                    j += 1
-
-                if brace_count == 0:
-                    url = content[url_start : j - 1]
-
-                    # Check if academic URL
-                    is_academic = any(
-                        domain in url for domain in academic_domains
-                    )
-
-                    if is_academic and j < len(content) and content[j] == "{":
-                        # Get the link text
-                        text_start = j + 1
-                        brace_count = 1
-                        k = text_start
-
-                        while k < len(content) and brace_count > 0:
-                            if content[k] == "{":
-                                brace_count += 1
-                            elif content[k] == "}":
-                                brace_count -= 1
-                            k += 1
+        while True:
+            pos = content.find("\\href{", i)
+            if pos == -1:
+                break
+            result.append(content[i:pos])
+
+            # Find end of URL
+            url_start = pos + 6
+            j = _find_group_end(content, url_start)
+            if j != -1:
+                url = content[url_start : j - 1]
+
+                # Check if academic URL
+                is_academic = any(domain in url for domain in academic_domains)
+
+                if is_academic and j < len(content) and content[j] == "{":
+                    # Get the link text
+                    text_start = j + 1
+                    k = _find_group_end(content, text_start)
+
+                    if k != -1:
+                        text = content[text_start : k - 1]
+                        citation_key = self._href_citation_key(text)
+                        if citation_key:
+                            result.append(f"\\citep{{{citation_key}}}")
+                            self.fixes_applied.append(
+                                f"Converted href citation to citep: {text}"
+                            )
+                            i = k
+                            continue
 
-                        if brace_count == 0:
-                            text = content[text_start : k - 1]
-
-                            # Check if text looks like "Author Year"
-                            words = text.split()
-                            if len(words) >= 2:
-                                # Check if last word is a year
-                                last_word = words[-1]
-                                if len(last_word) == 4 and last_word.isdigit():
-                                    year = last_word
-                                    if year.startswith(("19", "20")):
-                                        # Extract author
-                                        author_parts = words[:-1]
-                                        if (
-                                            author_parts
-                                            and author_parts[0][0].isupper()
-                                        ):
-                                            # Create citation key
-                                            author_key = (
-                                                author_parts[0]
-                                                .lower()
-                                                .replace("et", "")
-                                                .replace("al.", "etal")
-                                            )
-                                            citation_key = f"{author_key}{year}"
-
-                                            result.append(
-                                                f"\\citep{{{citation_key}}}"
-                                            )
-                                            self.fixes_applied.append(
-                                                f"Converted href citation to citep: {text}"
-                                            )
-                                            i = k
-                                            continue
-
-            result.append(content[i])
-            i += 1
+            # Not a citation: keep the backslash, scan on
+            result.append("\\")
+            i = pos + 1
 
+        result.append(content[i:])
         return "".join(result)
 
+    def _href_citation_key(self, text: str) -> str | None:
+        """Citation key for link text that looks like "Author Year"."""
+        words = text.split()
+        if len(words) >= 2:
+            # Check if last word is a year
+            last_word = words[-1]
+            if len(last_word) == 4 and last_word.isdigit():
+                year = last_word
+                if year.startswith(("19", "20")):
+                    # Extract author
+                    author_parts = words[:-1]
+                    if author_parts and author_parts[0][0].isupper():
+                        # Create citation key
+                        author_key = (
+                            author_parts[0]
+                            .lower()
+                            .replace("et", "")
+                            .replace("al.", "etal")
+                        )
+                        return f"{author_key}{year}"
+        return None
+
     def _clean_excessive_line_breaks(self, content: str) -> str:
         """Clean up excessive line breaks that might cause formatting issues."""
         # Replace more than 3 consecutive empty lines with 2
@@ -666,65 +731,54 @@ class LatexPostProcessor:
 
         return content
 
-    def _convert_horizontal_rules_to_boxes(self, content: str) -> str:
-        """Convert marked concept boxes to tcolorbox environments."""
-        # Find concept box markers
-        box_count = 0
-        result = []
-        i = 0
-
-        while i < len(content):
-            # Look for CONCEPTBOXSTART pattern
-            if content[i:].startswith("CONCEPTBOXSTART\\{"):
-                # Find title
-                title_start = i + 17  # After CONCEPTBOXSTART\{
-                title_end = content.find("\\}CONCEPTBOXSTART", title_start)
-
-                if title_end != -1:
-                    title = content[title_start:title_end]
-
-                    # Find content end
-                    content_start = title_end + 17  # After \}CONCEPTBOXSTART
-                    content_end = content.find("CONCEPTBOXEND", content_start)
-
-                    if content_end != -1:
-                        box_content = content[content_start:content_end].strip()
-
-                        # Clean up content
-                        box_content = box_content.replace(
-                            "\\textbackslash{}", "\\"
-                        )
-                        box_content = box_content.replace("\\{", "{")
-                        box_content = box_content.replace("\\}", "}")
-
-                        # Remove lines that are just the title repeated
-                        lines = box_content.split("\n")
-                        cleaned_lines = []
-                        for line in lines:
-                            # Skip lines that are just the title or "Technical Concept Box: title"
-                            line_strip = line.strip()
-                            if line_strip and not (
-                                line_strip == f"\\textbf{{{title}}}"
-                                or line_strip
-                                == f"\\emph{{Technical Concept Box: {title}}}"
-                                or line_strip
-                                == f"Technical Concept Box: {title}"
-                                or line_strip
-                                == f"*Technical Concept Box: {title}*"
-                                or line_strip
-                                == f"**Technical Concept Box: {title}**"
-                            ):
-                                cleaned_lines.append(line)
-
-                        box_content = "\n".join(cleaned_lines).strip()
-
-                        # Check if content should be itemized
-                        box_content = self._itemize_if_needed(box_content)
-
-                        box_count += 1
+    def _concept_box(self, content: str, pos: int) -> tuple[str, int] | None:
+        """Build the tcolorbox for a concept box marked at pos.
 
-                        # Create the tcolorbox
-                        tcolorbox = f"""\\begin{{tcolorbox}}[
+        Returns:
+            The tcolorbox and the index after its end marker, or None if
+            the markers are not closed
+        """
+        # Find title
+        title_start = pos + 17  # After CONCEPTBOXSTART\{
+        title_end = content.find("\\}CONCEPTBOXSTART", title_start)
+        if title_end == -1:
+            return None
+        title = content[title_start:title_end]
+
+        # Find content end
+        content_start = title_end + 17  # After \}CONCEPTBOXSTART
+        content_end = content.find("CONCEPTBOXEND", content_start)
+        if content_end == -1:
+            return None
+        box_content = content[content_start:content_end].strip()
+
+        # Clean up content
+        box_content = box_content.replace("\\textbackslash{}", "\\")
+        box_content = box_content.replace("\\{", "{")
+        box_content = box_content.replace("\\}", "}")
+
+        # Remove lines that are just the title repeated
+        lines = box_content.split("\n")
+        cleaned_lines = []
+        for line in lines:
+            # Skip lines that are just the title or "Technical Concept Box: title"
+            line_strip = line.strip()
+            if line_strip and not (
+                line_strip == f"\\textbf{{{title}}}"
+                or line_strip == f"\\emph{{Technical Concept Box: {title}}}"
+                or line_strip == f"Technical Concept Box: {title}"
+                or line_strip == f"*Technical Concept Box: {title}*"
+                or line_strip == f"**Technical Concept Box: {title}**"
+            ):
+                cleaned_lines.append(line)
+
+        box_content = "\n".join(cleaned_lines).strip()
+
+        # Check if content should be itemized
+        box_content = self._itemize_if_needed(box_content)
+
+        # Create the tcolorbox
+        tcolorbox = f"""\\begin{{tcolorbox}}[
     colback={{rgb,255:red,218;green,224;blue,232}},
     colframe={{rgb,255:red,180;green,190;blue,200}},
     title={{\\textbf{{{title}}}}},
@@ -740,13 +794,35 @@ class LatexPostProcessor:
 {box_content}
 \\end{{tcolorbox}}"""
 
-                        result.append(tcolorbox)
-                        i = content_end + 13  # After CONCEPTBOXEND
-                        continue
+        return tcolorbox, content_end + 13  # After CONCEPTBOXEND
 
-            result.append(content[i])
-            i += 1
+    def _convert_horizontal_rules_to_boxes(self, content: str) -> str:
+        """Convert marked concept boxes to tcolorbox environments."""
+        # Find concept box markers, copying the text between them as whole
+        # segments
+        box_count = 0
+        result = []
+        i = 0
+
+        while True:
+            # Look for CONCEPTBOXSTART pattern
+            pos = content.find("CONCEPTBOXSTART\\{", i)
+            if pos == -1:
+                break
+            result.append(content[i:pos])
+
+            box = self._concept_box(content, pos)
+            if box is None:
+                # Unterminated marker: keep it and scan on
+                result.append(content[pos])
+                i = pos + 1
+                continue
+
+            tcolorbox, i = box
+            result.append(tcolorbox)
+            box_count += 1
 
+        result.append(content[i:])
         content = "".join(result)
 
         if box_count > 0:
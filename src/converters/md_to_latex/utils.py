@@ -5,6 +5,8 @@ import hashlib
 import html
 import logging
 import tempfile
+from collections.abc import Collection
+from enum import Enum
 from pathlib import Path
 
 # import re  # Banned - using string methods instead
@@ -508,6 +510,56 @@ def compute_file_hash(file_path: Path) -> str:
     return sha256_hash.hexdigest()
 
 
+def compute_text_hash(*parts: str) -> str:
+    """Compute SHA256 hash of one or more strings.
+
+    Parts are length-prefixed so ("ab", "c") and ("a", "bc") differ.
+    """
+    sha256_hash = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        sha256_hash.update(f"{len(data)}:".encode())
+        sha256_hash.update(data)
+    return sha256_hash.hexdigest()
+
+
+def split_markdown_sections(content: str) -> list[str]:
+    """Split markdown into chunks that each start at an ATX heading.
+
+    Headings inside fenced code blocks are ignored. Joining the chunks
+    gives back the original content exactly.
+
+    Args:
+        content: Markdown text
+
+    Returns:
+        List of chunks; the first one holds any text before the first heading
+    """
+    sections = []
+    current: list[str] = []
+    fence = None
+
+    for line in content.splitlines(keepends=True):
+        stripped = line.lstrip()
+        if fence is not None:
+            if stripped.startswith(fence):
+                fence = None
+        elif stripped.startswith("```") or stripped.startswith("~~~"):
+            fence = stripped[:3]
+        elif line.startswith("#") and current:
+            # ATX heading: 1-6 hashes followed by a space or line end
+            level = len(line) - len(line.lstrip("#"))
+            rest = line[level:]
+            if level <= 6 and (not rest.strip() or rest[0] in " \t"):
+                sections.append("".join(current))
+                current = []
+        current.append(line)
+
+    if current:
+        sections.append("".join(current))
+    return sections
+
+
 def parse_citation_text(
     citation: str,
 ) -> tuple[str | None, str | None, str | None]:
@@ -549,6 +601,147 @@ def parse_citation_text(
     return None, None, None
 
 
+class DollarKind(Enum):
+    """Role of a dollar sign found by scan_dollar_signs."""
+
+    ESCAPED = "escaped"  # \$
+    CURRENCY = "currency"  # $5, $ 50
+    MATH_OPEN = "math_open"
+    MATH_CLOSE = "math_close"
+    UNPAIRED = "unpaired"  # Neither currency nor part of a math pair
+    VERBATIM = "verbatim"  # Inside a skipped environment
+
+
+def _environment_spans(
+    text: str, environments: Collection[str]
+) -> list[tuple[int, int]]:
+    """Sorted (start, end) spans of the given LaTeX environments."""
+    spans = []
+    for name in environments:
+        begin = f"\\begin{{{name}}}"
+        end = f"\\end{{{name}}}"
+        pos = text.find(begin)
+        while pos != -1:
+            close = text.find(end, pos + len(begin))
+            if close == -1:
+                spans.append((pos, len(text)))
+                break
+            spans.append((pos, close + len(end)))
+            pos = text.find(begin, close + len(end))
+    return sorted(spans)
+
+
+def scan_dollar_signs(
+    text: str, verbatim_environments: Collection[str] = ()
+) -> list[tuple[int, DollarKind]]:
+    """Classify every dollar sign in one left-to-right pass.
+
+    Inline math follows pandoc's tex_math_dollars rules: the opening $
+    is followed by a non-space character, the closing $ is preceded by
+    one and not followed by a digit, and math does not span a blank
+    line. A $ followed by a digit (or a space and a digit) that does not
+    close math is currency, so "$20 and $30" is never math.
+
+    Args:
+        text: LaTeX or markdown text
+        verbatim_environments: LaTeX environments whose dollars are left
+            unclassified (reported as VERBATIM)
+
+    Returns:
+        (position, kind) for each $ in order of position
+    """
+    verbatim = _environment_spans(text, verbatim_environments)
+    span = 0
+    tokens: list[tuple[int, DollarKind]] = []
+    open_token = None  # Index of the pending MATH_OPEN in tokens
+    checked = 0  # Text before here has no blank line after the opener
+    length = len(text)
+
+    pos = text.find("$")
+    while pos != -1:
+        while span < len(verbatim) and verbatim[span][1] <= pos:
+            span += 1
+        if span < len(verbatim) and verbatim[span][0] <= pos:
+            tokens.append((pos, DollarKind.VERBATIM))
+            pos = text.find("$", pos + 1)
+            continue
+
+        # A blank line ends any math left open
+        if open_token is not None:
+            if text.find("\n\n", max(checked - 1, 0), pos) != -1:
+                tokens[open_token] = (
+                    tokens[open_token][0],
+                    DollarKind.UNPAIRED,
+                )
+                open_token = None
+            checked = pos
+
+        backslash = pos
+        while backslash > 0 and text[backslash - 1] == "\\":
+            backslash -= 1
+        after = text[pos + 1] if pos + 1 < length else ""
+
+        if (pos - backslash) % 2:
+            kind = DollarKind.ESCAPED
+        elif (
+            open_token is not None
+            and not text[pos - 1].isspace()
+            and not after.isdigit()
+        ):
+            kind = DollarKind.MATH_CLOSE
+            open_token = None
+        elif after.isdigit() or (
+            after == " " and pos + 2 < length and text[pos + 2].isdigit()
+        ):
+            kind = DollarKind.CURRENCY
+        elif after and not after.isspace():
+            if open_token is not None:
+                tokens[open_token] = (
+                    tokens[open_token][0],
+                    DollarKind.UNPAIRED,
+                )
+            kind = DollarKind.MATH_OPEN
+            open_token = len(tokens)
+            checked = pos
+        else:
+            kind = DollarKind.UNPAIRED
+
+        tokens.append((pos, kind))
+        pos = text.find("$", pos + 1)
+
+    if open_token is not None:
+        tokens[open_token] = (tokens[open_token][0], DollarKind.UNPAIRED)
+    return tokens
+
+
+def escape_dollar_signs(
+    text: str,
+    kinds: Collection[DollarKind],
+    verbatim_environments: Collection[str] = (),
+) -> str:
+    """Escape the dollar signs of the given kinds as \\$.
+
+    Args:
+        text: LaTeX or markdown text
+        kinds: Kinds of dollar sign to escape
+        verbatim_environments: Passed to scan_dollar_signs
+
+    Returns:
+        Text with those dollar signs escaped
+    """
+    parts = []
+    last = 0
+    for pos, kind in scan_dollar_signs(text, verbatim_environments):
+        if kind in kinds:
+            parts.append(text[last:pos])
+            parts.append("\\$")
+            last = pos + 1
+    if not parts:
+        return text
+    parts.append(text[last:])
+    return "".join(parts)
+
+
 def clean_pandoc_output(latex_content: str) -> str:
     """Clean up common pandoc artifacts from LaTeX output."""
     # DIAGNOSTIC: Log input state
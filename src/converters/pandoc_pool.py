@@ -0,0 +1,404 @@
+"""Pool of long-running pandoc processes for batch conversions.
+
+pypandoc starts a new pandoc process for every call, and the Haskell runtime
+startup is a fixed cost paid per document. PandocPool instead keeps up to
+``max_workers`` ``pandoc server`` processes alive (pandoc >= 2.18) and sends
+documents to them over HTTP, several documents per request via the /batch
+endpoint. When server mode isn't available (older pandoc, pandoc built
+without the server, or command-line options the server can't express), it
+falls back to pypandoc with the same bound on concurrent processes.
+
+Example:
+    with PandocPool(max_workers=4) as pool:
+        outputs = pool.convert_many(texts, "latex", format="markdown")
+"""
+
+# Standard library imports
+import logging
+import os
+import queue
+import shutil
+import socket
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# Third-party imports
+import pypandoc
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for a freshly started server to answer
+SERVER_STARTUP_TIMEOUT = 10.0
+
+
+def _args_to_server_options(
+    extra_args: list[str] | None,
+) -> dict[str, Any] | None:
+    """Translate pandoc command-line options to server JSON options.
+
+    Args:
+        extra_args: Options as passed to pypandoc
+
+    Returns:
+        Options for the server API, or None if an option has no
+        server equivalent (the caller then runs the pandoc CLI)
+    """
+    options: dict[str, Any] = {}
+    variables: dict[str, str] = {}
+
+    args = list(extra_args or [])
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ("-s", "--standalone"):
+            options["standalone"] = True
+        elif arg == "--listings":
+            options["listings"] = True
+        elif arg == "--no-highlight":
+            options["highlight-style"] = None
+        elif arg.startswith("--wrap="):
+            options["wrap"] = arg.split("=", 1)[1]
+        elif arg.startswith("--columns="):
+            value = arg.split("=", 1)[1]
+            if not value.isdigit():
+                return None
+            options["columns"] = int(value)
+        elif arg in ("-V", "--variable") or arg.startswith("--variable="):
+            if arg.startswith("--variable="):
+                assignment = arg.split("=", 1)[1]
+            elif i + 1 < len(args):
+                i += 1
+                assignment = args[i]
+            else:
+                return None
+            # Like pandoc, split at the first ':' or '='
+            cut = min(
+                (
+                    p
+                    for p in (assignment.find(":"), assignment.find("="))
+                    if p > 0
+                ),
+                default=-1,
+            )
+            if cut < 0:
+                variables[assignment] = "true"
+            else:
+                variables[assignment[:cut]] = assignment[cut + 1 :]
+        else:
+            return None
+        i += 1
+
+    if variables:
+        options["variables"] = variables
+    return options
+
+
+def _find_free_port() -> int:
+    """Ask the OS for a free local TCP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+class _PandocServer:
+    """One ``pandoc server`` process listening on a local port."""
+
+    def __init__(self, timeout: float):
+        self.port = _find_free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.process = subprocess.Popen(
+            [
+                "pandoc",
+                "server",
+                "--port",
+                str(self.port),
+                "--timeout",
+                str(max(1, int(timeout))),
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def wait_ready(self, session: requests.Session) -> bool:
+        """Wait until the server answers, False if it never does."""
+        deadline = time.monotonic() + SERVER_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                return False
+            try:
+                session.get(f"{self.url}/version", timeout=1.0)
+                return True
+            except requests.RequestException:
+                time.sleep(0.05)
+        return False
+
+    def stop(self) -> None:
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+class PandocPool:
+    """Bounded pool of pandoc workers shared by many conversions."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        timeout: float = 120.0,
+        use_server: bool = True,
+    ):
+        """Initialize the pool. Servers are started on first use.
+
+        Args:
+            max_workers: Maximum number of concurrent pandoc processes
+                (defaults to the CPU count, at most 4)
+            timeout: Seconds a single conversion may take
+            use_server: Whether to try pandoc's server mode at all
+        """
+        self.max_workers = max(1, max_workers or min(4, os.cpu_count() or 1))
+        self.timeout = timeout
+        self._server_available: bool | None = None if use_server else False
+        self._servers: list[_PandocServer] = []
+        self._can_grow = True
+        self._idle: queue.Queue[_PandocServer] = queue.Queue()
+        self._lock = threading.Lock()
+        self._cli_slots = threading.BoundedSemaphore(self.max_workers)
+        self._session = requests.Session()
+
+    def __enter__(self) -> "PandocPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop all pandoc server processes."""
+        with self._lock:
+            servers, self._servers = self._servers, []
+        for server in servers:
+            server.stop()
+        self._idle = queue.Queue()
+        self._session.close()
+
+    def convert_text(
+        self,
+        text: str,
+        to: str,
+        format: str = "markdown",
+        extra_args: list[str] | None = None,
+    ) -> str:
+        """Convert one document, like pypandoc.convert_text.
+
+        Raises:
+            RuntimeError: If pandoc reports an error
+        """
+        result = self.convert_many(
+            [text], to, format, extra_args, return_exceptions=True
+        )[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def convert_many(
+        self,
+        texts: list[str],
+        to: str,
+        format: str = "markdown",
+        extra_args: list[str] | None = None,
+        return_exceptions: bool = False,
+    ) -> list[str | RuntimeError]:
+        """Convert several documents with the same options.
+
+        Documents are split into one chunk per worker and each chunk goes
+        to a server in a single request.
+
+        Args:
+            texts: Source documents
+            to: Output format
+            format: Input format
+            extra_args: pandoc command-line options
+            return_exceptions: Return the exception of a failed document in
+                its place instead of raising it
+
+        Returns:
+            Converted documents in input order
+
+        Raises:
+            RuntimeError: If a conversion fails and return_exceptions is False
+        """
+        if not texts:
+            return []
+
+        options = _args_to_server_options(extra_args)
+        if options is not None and self._ensure_server():
+            params = [
+                {**options, "text": text, "from": format, "to": to}
+                for text in texts
+            ]
+            size = -(-len(params) // self.max_workers)
+            chunks = [params[i : i + size] for i in range(0, len(params), size)]
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                chunk_results = list(executor.map(self._convert_chunk, chunks))
+            results = [result for chunk in chunk_results for result in chunk]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(texts))
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda text: self._convert_cli(
+                            text, to, format, extra_args
+                        ),
+                        texts,
+                    )
+                )
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    def _ensure_server(self) -> bool:
+        """Check once whether pandoc's server mode works here."""
+        with self._lock:
+            if self._server_available is None:
+                if shutil.which("pandoc") is None:
+                    self._server_available = False
+                else:
+                    server = self._start_server()
+                    self._server_available = server is not None
+                    if server is not None:
+                        self._idle.put(server)
+                if not self._server_available:
+                    logger.info(
+                        "pandoc server mode unavailable, running one pandoc "
+                        "process per document"
+                    )
+            return self._server_available
+
+    def _start_server(self) -> _PandocServer | None:
+        """Start a server process (caller holds the lock)."""
+        try:
+            server = _PandocServer(self.timeout)
+        except OSError as e:
+            logger.debug(f"Failed to start pandoc server: {e}")
+            return None
+        if not server.wait_ready(self._session):
+            server.stop()
+            return None
+        self._servers.append(server)
+        logger.debug(f"Started pandoc server on port {server.port}")
+        return server
+
+    def _acquire(self) -> _PandocServer | None:
+        """Take an idle server, starting one while below max_workers."""
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                if self._can_grow and len(self._servers) < self.max_workers:
+                    server = self._start_server()
+                    if server is not None:
+                        return server
+                    self._can_grow = False
+                if not self._servers:
+                    return None
+            try:
+                return self._idle.get(timeout=1.0)
+            except queue.Empty:
+                # Re-check in case the busy servers died meanwhile
+                continue
+
+    def _release(self, server: _PandocServer) -> None:
+        if server.process.poll() is None:
+            self._idle.put(server)
+            return
+        with self._lock:
+            if server in self._servers:
+                self._servers.remove(server)
+
+    def _convert_chunk(
+        self, params: list[dict[str, Any]]
+    ) -> list[str | RuntimeError]:
+        """Convert a chunk of documents with one /batch request."""
+        server = self._acquire()
+        if server is None:
+            return [self._convert_params_cli(p) for p in params]
+
+        try:
+            response = self._session.post(
+                f"{server.url}/batch",
+                json=params,
+                headers={"Accept": "application/json"},
+                timeout=self.timeout * len(params),
+            )
+        except requests.RequestException as e:
+            logger.warning(f"pandoc server request failed: {e}")
+            server.stop()
+            return [self._convert_params_cli(p) for p in params]
+        finally:
+            self._release(server)
+
+        if response.status_code == 200:
+            return [
+                self._decode_output(result["output"], result.get("base64"))
+                for result in response.json()
+            ]
+        if len(params) == 1:
+            return [RuntimeError(f"Pandoc conversion failed: {response.text}")]
+        # One document broke the batch, find out which
+        return [result for p in params for result in self._convert_chunk([p])]
+
+    @staticmethod
+    def _decode_output(output: str, is_base64: bool | None) -> str:
+        if is_base64:
+            raise RuntimeError("Binary pandoc output is not supported")
+        # Match the CLI, which ends its output with a newline
+        return output if output.endswith("\n") else output + "\n"
+
+    def _convert_params_cli(self, params: dict[str, Any]) -> str | RuntimeError:
+        """Convert one server request with the pandoc CLI instead."""
+        extra_args = []
+        if params.get("standalone"):
+            extra_args.append("--standalone")
+        if params.get("listings"):
+            extra_args.append("--listings")
+        if "highlight-style" in params:
+            extra_args.append("--no-highlight")
+        if "wrap" in params:
+            extra_args.append(f"--wrap={params['wrap']}")
+        if "columns" in params:
+            extra_args.append(f"--columns={params['columns']}")
+        for key, value in params.get("variables", {}).items():
+            extra_args.extend(["-V", f"{key}={value}"])
+        return self._convert_cli(
+            params["text"], params["to"], params["from"], extra_args
+        )
+
+    def _convert_cli(
+        self,
+        text: str,
+        to: str,
+        format: str,
+        extra_args: list[str] | None,
+    ) -> str | RuntimeError:
+        """Convert with a pandoc process of its own (bounded)."""
+        with self._cli_slots:
+            try:
+                output: str = pypandoc.convert_text(
+                    text, to, format=format, extra_args=extra_args or []
+                )
+                return output
+            except (OSError, RuntimeError) as e:
+                return RuntimeError(f"Pandoc conversion failed: {e}")
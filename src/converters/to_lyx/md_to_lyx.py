@@ -6,19 +6,27 @@ import tempfile
 from pathlib import Path
 
 from src.converters.md_to_latex.converter import MarkdownToLatexConverter
+from src.converters.pandoc_pool import PandocPool
 from src.converters.to_lyx.tex_to_lyx import TexToLyxConverter
 
 
 class MarkdownToLyxConverter:
     """Convert Markdown files to LyX format via LaTeX."""
 
-    def __init__(self, output_dir: Path | None = None):
+    def __init__(
+        self,
+        output_dir: Path | None = None,
+        pandoc_pool: PandocPool | None = None,
+    ):
         """Initialize the converter.
 
         Args:
             output_dir: Directory for output files (defaults to temp directory)
+            pandoc_pool: Shared pool of pandoc workers (batch_convert creates
+                one for its run if not given)
         """
         self.output_dir = output_dir or Path(tempfile.mkdtemp())
+        self.pandoc_pool = pandoc_pool
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Check dependencies
@@ -46,6 +54,12 @@ class MarkdownToLyxConverter:
         if output_file is None:
             output_file = self.output_dir / f"{md_file.stem}.lyx"
 
+        if self.pandoc_pool is not None:
+            latex = self.pandoc_pool.convert_text(
+                md_file.read_text(encoding="utf-8"), "latex", format="markdown"
+            )
+            return self._latex_to_lyx(latex, output_file)
+
         # Try direct pandoc to LyX conversion (if supported)
         cmd = [
             "pandoc",
@@ -60,21 +74,28 @@ class MarkdownToLyxConverter:
 
         try:
             subprocess.run(cmd, capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Conversion failed: {e.stderr}")
+
+        return self._tex_file_to_lyx(output_file)
 
+    def _latex_to_lyx(self, latex: str, output_file: Path) -> Path:
+        """Write pandoc's LaTeX output next to output_file and convert it."""
+        output_file.with_suffix(".tex").write_text(latex, encoding="utf-8")
+        return self._tex_file_to_lyx(output_file)
+
+    def _tex_file_to_lyx(self, output_file: Path) -> Path:
+        """Convert the intermediate .tex file of output_file to LyX."""
+        try:
             # Convert LaTeX to LyX
             tex_converter = TexToLyxConverter(self.output_dir)
-            lyx_file = tex_converter.convert(
+            return tex_converter.convert(
                 output_file.with_suffix(".tex"), output_file
             )
-
+        finally:
             # Clean up temporary LaTeX file
             output_file.with_suffix(".tex").unlink(missing_ok=True)
 
-            return lyx_file
-
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Conversion failed: {e.stderr}")
-
     def convert_advanced(
         self,
         md_file: Path,
@@ -83,6 +104,7 @@ class MarkdownToLyxConverter:
         process_concept_boxes: bool = True,
         two_column: bool = False,
         arxiv_ready: bool = False,
+        pandoc_pool: PandocPool | None = None,
     ) -> Path:
         """Advanced conversion using our Markdown to LaTeX converter first.
 
@@ -95,6 +117,8 @@ class MarkdownToLyxConverter:
             process_concept_boxes: Convert concept boxes
             two_column: Use two-column layout
             arxiv_ready: Make arXiv-ready output
+            pandoc_pool: Pool of pandoc workers (defaults to the
+                converter's own)
 
         Returns:
             Path to the generated LyX file
@@ -111,6 +135,7 @@ class MarkdownToLyxConverter:
                 output_dir=temp_path,
                 two_column=two_column,
                 arxiv_ready=arxiv_ready,
+                pandoc_pool=pandoc_pool or self.pandoc_pool,
             )
 
             # Convert to LaTeX
@@ -140,29 +165,78 @@ class MarkdownToLyxConverter:
             return lyx_file
 
     def batch_convert(
-        self, md_files: list[Path], simple: bool = False
-    ) -> dict[Path, Path]:
+        self,
+        md_files: list[Path],
+        simple: bool = False,
+        max_workers: int | None = None,
+    ) -> dict[Path, Path | None]:
         """Convert multiple Markdown files to LyX.
 
+        All files share one pool of pandoc workers, so the batch doesn't
+        start a pandoc process per document. In simple mode the whole batch
+        goes through pandoc at once before tex2lyx runs on each file.
+
         Args:
             md_files: List of Markdown files to convert
             simple: Use simple conversion (faster but less features)
+            max_workers: Maximum number of pandoc workers (only used when
+                the converter has no pool of its own)
 
         Returns:
-            Dictionary mapping input files to output files
+            Dictionary mapping input files to output files (None for
+            files that failed)
         """
-        results = {}
+        pool = self.pandoc_pool or PandocPool(max_workers=max_workers)
 
+        try:
+            if simple:
+                return self._batch_convert_simple(md_files, pool)
+
+            results: dict[Path, Path | None] = {}
+            for md_file in md_files:
+                try:
+                    lyx_file = self.convert_advanced(md_file, pandoc_pool=pool)
+                    results[md_file] = lyx_file
+                    print(f"Converted {md_file} -> {lyx_file}")
+                except Exception as e:
+                    print(f"Failed to convert {md_file}: {e}")
+                    results[md_file] = None
+            return results
+        finally:
+            if pool is not self.pandoc_pool:
+                pool.close()
+
+    def _batch_convert_simple(
+        self, md_files: list[Path], pool: PandocPool
+    ) -> dict[Path, Path | None]:
+        """Simple conversion of many files with one batched pandoc run."""
+        results: dict[Path, Path | None] = {}
+        texts: dict[Path, str] = {}
         for md_file in md_files:
             try:
-                if simple:
-                    lyx_file = self.convert_simple(md_file)
-                else:
-                    lyx_file = self.convert_advanced(md_file)
+                texts[md_file] = md_file.read_text(encoding="utf-8")
+            except OSError as e:
+                print(f"Failed to convert {md_file}: {e}")
+                results[md_file] = None
+
+        latex_outputs = pool.convert_many(
+            list(texts.values()),
+            "latex",
+            format="markdown",
+            return_exceptions=True,
+        )
+
+        for md_file, latex in zip(texts, latex_outputs, strict=True):
+            try:
+                if isinstance(latex, Exception):
+                    raise latex
+                lyx_file = self._latex_to_lyx(
+                    latex, self.output_dir / f"{md_file.stem}.lyx"
+                )
                 results[md_file] = lyx_file
                 print(f"Converted {md_file} -> {lyx_file}")
             except Exception as e:
                 print(f"Failed to convert {md_file}: {e}")
                 results[md_file] = None
 
-        return results
+        return {md_file: results[md_file] for md_file in md_files}
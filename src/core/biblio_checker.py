@@ -16,14 +16,20 @@ Usage: python biblio_checker.py [markdown_file_or_directory]
 import argparse
 import json
 import logging
+import multiprocessing
 import os
 
 # import re  # Banned - using string methods instead
 import sys
-import tempfile
 import time
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any
 from urllib.parse import urljoin, urlparse
 
 # Third-party imports
@@ -34,13 +40,22 @@ from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 # Local imports
-from ..parsers import MarkdownParser
+from ..parsers import MarkdownDocument, MarkdownParser
 from ..utils.abbreviation_checker import AbbreviationChecker
 from ..utils.cache import BiblioCache
 from ..utils.citation_style_fixer import CitationStyleFixer
 from ..utils.content_classifier import ContentClassifier
+from ..utils.http_cache import (
+    OfflineCacheMiss,
+    configure_http_cache,
+    get_http_session,
+    serves_locally,
+)
+from ..utils.identifiers import CanonicalId, canonical_id, group_by_canonical_id
 from ..utils.mdpi_workaround import MDPIWorkaround
+from ..utils.page_fetcher import PageFetcher
 from ..utils.pdf_parser import PDFParser, is_pdf_url
+from ..utils.rate_limiter import get_rate_limiter, get_request_host
 from ..utils.researchgate_workaround import ResearchGateWorkaround
 
 
@@ -99,12 +114,29 @@ class BiblioChecker:
         delay: float = 1.0,
         use_cache: bool = True,
         cache_ttl_days: int = 30,
+        max_workers: int = 1,
+        log_file: str | Path | None = "biblio_checker.log",
     ):
         self.verbose = verbose
+        # Debug log written next to the run (None disables it)
+        self.log_file = log_file
         self.delay = delay
         self.use_cache = use_cache
+        self.cache_ttl_days = cache_ttl_days
+        # Number of citations resolved concurrently (1 = sequential)
+        self.max_workers = max(1, max_workers)
+        # BibTeX extractions of this run by cited work, so that aliases of
+        # a work (DOI forms, arXiv abs/pdf/versions, ...) are fetched once
+        self._work_extractions: dict[
+            CanonicalId, tuple[BibtexEntry | None, list[str], float]
+        ] = {}
         self.setup_logging()
 
+        # Politeness delay is applied per host, so different publishers
+        # can be fetched in parallel while each host still gets its delay.
+        # The limiter is process-wide so other clients share the same budget.
+        self.rate_limiter = get_rate_limiter()
+
         # Initialize cache
         if self.use_cache:
             self.cache = BiblioCache(cache_ttl_days=cache_ttl_days)
@@ -117,14 +149,21 @@ class BiblioChecker:
         }
 
         # Session for connection reuse
-        self.session = requests.Session()
+        self.session = get_http_session()
         self.session.headers.update(self.headers)
 
         # Initialize utility modules
         self.pdf_parser = PDFParser()
         self.researchgate_workaround = ResearchGateWorkaround(delay=delay)
         self.mdpi_workaround = MDPIWorkaround(delay=delay)
-        self.content_classifier = ContentClassifier()
+        # Classification and extraction share downloaded pages and their
+        # parsed soup, so each URL is fetched and parsed once
+        self.page_fetcher = PageFetcher(
+            session=self.session,
+            rate_limiter=self.rate_limiter,
+            delay=self.delay,
+        )
+        self.content_classifier = ContentClassifier(fetcher=self.page_fetcher)
         self.markdown_parser = MarkdownParser()
 
         # Academic domain patterns
@@ -155,40 +194,52 @@ class BiblioChecker:
         """Set up logging configuration"""
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-        # File handler
-        file_handler = logging.FileHandler("biblio_checker.log")
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(logging.Formatter(log_format))
-
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(
             logging.INFO if self.verbose else logging.WARNING
         )
         console_handler.setFormatter(logging.Formatter(log_format))
+        handlers: list[logging.Handler] = [console_handler]
+
+        # File handler
+        if self.log_file is not None:
+            file_handler = logging.FileHandler(self.log_file, delay=True)
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(logging.Formatter(log_format))
+            handlers.append(file_handler)
 
         # Configure root logger
-        logging.basicConfig(
-            level=logging.DEBUG, handlers=[file_handler, console_handler]
-        )
+        logging.basicConfig(level=logging.DEBUG, handlers=handlers)
 
         self.logger = logging.getLogger(__name__)
 
     def extract_citations_from_markdown(self, file_path: str) -> list[Citation]:
         """Extract citations from a markdown file using AST parser"""
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                content = f.read()
+        except Exception as e:
+            self.logger.error(f"Error reading file {file_path}: {e}")
+            return []
+
+        return self.extract_citations_from_document(
+            self.markdown_parser.parse(content), file_path
+        )
+
+    def extract_citations_from_document(
+        self, document: MarkdownDocument, file_path: str
+    ) -> list[Citation]:
+        """Extract citations from an already parsed markdown document"""
         self.logger.info(f"Extracting citations from {file_path}")
 
         citations = []
+        content = document.raw_text
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
+            lines = document.lines
 
-            # Use the new Markdown parser to extract links
-            links = self.markdown_parser.extract_links(content)
-            lines = content.split("\n")
-
-            for link_info in links:
+            for link_info in document.links:
                 url = link_info["href"]
 
                 # Only process academic URLs
@@ -237,22 +288,20 @@ class BiblioChecker:
             self.logger.error(f"Error processing file {file_path}: {e}")
             # Fallback to regex if parser fails
             self.logger.warning("Falling back to regex extraction")
-            return self._extract_citations_from_markdown_regex(file_path)
+            return self._extract_citations_from_text_regex(content, file_path)
 
         self.logger.info(f"Found {len(citations)} citations in {file_path}")
         return citations
 
-    def _extract_citations_from_markdown_regex(
-        self, file_path: str
+    def _extract_citations_from_text_regex(
+        self, content: str, file_path: str
     ) -> list[Citation]:
         """Legacy regex-based citation extraction as fallback"""
         self.logger.info(f"Using regex extraction for {file_path}")
         citations = []
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-                lines = content.split("\n")
+            lines = content.split("\n")
 
             # Pattern for markdown links: [text](url)
             # Simple link extraction as fallback, not AST parsing
@@ -324,7 +373,7 @@ class BiblioChecker:
                 current_pos += len(line) + 1  # +1 for newline
 
         except Exception as e:
-            self.logger.error(f"Error reading file {file_path}: {e}")
+            self.logger.error(f"Error processing file {file_path}: {e}")
 
         self.logger.info(f"Found {len(citations)} citations in {file_path}")
         return citations
@@ -352,6 +401,20 @@ class BiblioChecker:
         except Exception:
             return False
 
+    def _throttled_get(
+        self, url: str, max_retries: int = 2, **kwargs
+    ) -> requests.Response:
+        """GET a URL through the shared per-host limiter, retrying on 429"""
+        if serves_locally(self.session, url, kwargs.get("headers")):
+            return self.session.get(url, **kwargs)
+
+        for _ in range(max_retries + 1):
+            self.rate_limiter.wait(url, delay=self.delay)
+            response = self.session.get(url, **kwargs)
+            if not self.rate_limiter.update_from_response(url, response):
+                break
+        return response
+
     def extract_bibtex_from_url(
         self, url: str
     ) -> tuple[BibtexEntry | None, list[str], float]:
@@ -467,14 +530,12 @@ class BiblioChecker:
                 tags.append("#LAY")
 
         try:
-            # Add delay to be respectful
-            time.sleep(self.delay)
-
-            # Try to fetch the page
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
+            # Get the page (throttled per host), usually already fetched
+            # for classification above
+            page = self.page_fetcher.fetch(url, timeout=15)
+            page.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = page.soup
 
             # Try various extraction methods
             bibtex_entry = None
@@ -520,8 +581,8 @@ class BiblioChecker:
             self.logger.error(f"Error fetching URL {url}: {e}")
             tags.append("FETCH_ERROR")
 
-            # Cache error result
-            if self.cache:
+            # Cache error result (an offline replay proves nothing)
+            if self.cache and not isinstance(e, OfflineCacheMiss):
                 self.cache.put(
                     url=url, error_message=f"Request error: {str(e)}"
                 )
@@ -575,7 +636,7 @@ class BiblioChecker:
                     "User-Agent": self.headers["User-Agent"],
                 }
 
-                response = self.session.get(
+                response = self._throttled_get(
                     doi_url, headers=headers, timeout=10
                 )
                 response.raise_for_status()
@@ -606,7 +667,7 @@ class BiblioChecker:
                 try:
                     # Construct absolute URL
                     bibtex_url = urljoin(url, href)
-                    response = self.session.get(bibtex_url, timeout=10)
+                    response = self._throttled_get(bibtex_url, timeout=10)
                     response.raise_for_status()
 
                     if response.text.strip():
@@ -756,7 +817,7 @@ class BiblioChecker:
             # arXiv provides export links
             export_url = f"https://arxiv.org/bibtex/{arxiv_id}"
 
-            response = self.session.get(export_url, timeout=10)
+            response = self._throttled_get(export_url, timeout=10)
             response.raise_for_status()
 
             if response.text.strip():
@@ -1076,14 +1137,61 @@ class BiblioChecker:
             f"Validating citation: {citation.text} -> {citation.url}"
         )
 
-        errors = []
-        warnings = []
-
         # Extract BibTeX
-        bibtex_entry, tags, confidence = self.extract_bibtex_from_url(
+        bibtex_entry, tags, confidence = self._extract_bibtex_for_work(
             citation.url
         )
 
+        return self._build_validation_result(
+            citation, bibtex_entry, tags, confidence
+        )
+
+    def _extract_bibtex_for_work(
+        self, url: str
+    ) -> tuple[BibtexEntry | None, list[str], float]:
+        """Extract BibTeX once per cited work, reusing it for its aliases"""
+        work = canonical_id(url) or CanonicalId("url", url)
+        if work in self._work_extractions:
+            self.logger.debug(f"Reusing extraction of {work} for {url}")
+        else:
+            self._work_extractions[work] = self.extract_bibtex_from_url(url)
+        bibtex_entry, tags, confidence = self._work_extractions[work]
+        return bibtex_entry, list(tags), confidence
+
+    def _plan_work_fetches(
+        self, urls: list[str]
+    ) -> tuple[dict[str, CanonicalId], list[str]]:
+        """Map URLs to their works and pick one URL per unresolved work
+
+        Returns:
+            Tuple of (work of each URL, URLs to fetch)
+        """
+        groups = group_by_canonical_id(urls)
+        work_of = {url: work for work, group in groups.items() for url in group}
+        to_fetch = [
+            group[0]
+            for work, group in groups.items()
+            if work not in self._work_extractions
+        ]
+        aliases = len(work_of) - len(groups)
+        if aliases:
+            self.logger.info(
+                f"{aliases} of {len(work_of)} unique URLs are aliases of "
+                f"another cited work and won't be fetched separately"
+            )
+        return work_of, to_fetch
+
+    def _build_validation_result(
+        self,
+        citation: Citation,
+        bibtex_entry: BibtexEntry | None,
+        tags: list[str],
+        confidence: float,
+    ) -> ValidationResult:
+        """Compare a citation against its extracted BibTeX entry"""
+        errors = []
+        warnings = []
+
         if not bibtex_entry:
             errors.append("Failed to extract bibliographic information")
             return ValidationResult(
@@ -1138,6 +1246,110 @@ class BiblioChecker:
             confidence=confidence,
         )
 
+    def validate_citations(
+        self, citations: list[Citation], pbar=None
+    ) -> list[ValidationResult]:
+        """
+        Validate citations, resolving their URLs concurrently if enabled.
+
+        Each cited work is fetched once, through the first of its URLs, and
+        the result is shared with its aliases. With max_workers > 1 the URLs are
+        resolved in a thread pool, interleaved by host so that workers are not
+        all stuck behind the politeness delay of a single publisher. Results
+        are always returned in document order.
+        """
+        if self.max_workers <= 1 or len(citations) <= 1:
+            results = []
+            for citation in citations:
+                domain = self._extract_domain(citation.url)
+                if pbar is not None:
+                    pbar.set_postfix_str(f"Fetching: {domain}")
+
+                result = self.validate_citation(citation, pbar=pbar)
+                results.append(result)
+
+                if pbar is not None:
+                    pbar.set_postfix_str(
+                        self._format_progress_status(result, domain)
+                    )
+                    pbar.update(1)
+            return results
+
+        # Resolve every cited work once
+        work_of, to_fetch = self._plan_work_fetches([c.url for c in citations])
+        citation_counts: dict[CanonicalId, int] = {}
+        for citation in citations:
+            work = work_of[citation.url]
+            citation_counts[work] = citation_counts.get(work, 0) + 1
+
+        if pbar is not None:
+            # Works resolved earlier in the run need no fetch
+            pending = {work_of[url] for url in to_fetch}
+            pbar.update(
+                sum(
+                    count
+                    for work, count in citation_counts.items()
+                    if work not in pending
+                )
+            )
+
+        workers = max(1, min(self.max_workers, len(to_fetch)))
+        self.logger.info(
+            f"Resolving {len(to_fetch)} cited works with {workers} workers"
+        )
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_url = {
+                executor.submit(self.extract_bibtex_from_url, url): url
+                for url in self._interleave_by_domain(to_fetch)
+            }
+
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                work = work_of[url]
+                try:
+                    self._work_extractions[work] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Unexpected error resolving {url}: {e}")
+                    self._work_extractions[work] = (None, ["PARSE_ERROR"], 0.0)
+
+                if pbar is not None:
+                    bibtex_entry, tags, _ = self._work_extractions[work]
+                    domain = self._extract_domain(url)
+                    status = "[CACHED]" if "CACHE" in tags else ""
+                    outcome = "OK" if bibtex_entry else "FAILED"
+                    pbar.set_postfix_str(f"{outcome}{status} {domain}")
+                    pbar.update(citation_counts[work])
+
+        # Build results in document order so output stays deterministic
+        results = []
+        for citation in citations:
+            bibtex_entry, tags, confidence = self._work_extractions[
+                work_of[citation.url]
+            ]
+            results.append(
+                self._build_validation_result(
+                    citation, bibtex_entry, list(tags), confidence
+                )
+            )
+        return results
+
+    def _interleave_by_domain(self, urls: list[str]) -> list[str]:
+        """Order URLs round-robin across hosts, keeping order within a host"""
+        by_host: dict[str, list[str]] = {}
+        for url in urls:
+            by_host.setdefault(get_request_host(url), []).append(url)
+
+        ordered = []
+        queues = list(by_host.values())
+        depth = 0
+        while len(ordered) < len(urls):
+            for queue in queues:
+                if depth < len(queue):
+                    ordered.append(queue[depth])
+            depth += 1
+        return ordered
+
     def _preprocess_markdown(self, content: str) -> str:
         """
         Preprocess markdown content to fix common formatting issues.
@@ -1291,34 +1503,11 @@ class BiblioChecker:
         """Process a markdown file and return corrected content"""
         self.logger.info(f"Processing file: {file_path}")
 
-        # Read original content
-        with open(file_path, encoding="utf-8") as f:
-            original_content = f.read()
-
-        # Apply preprocessing to fix common markdown issues
-        preprocessed_content = self._preprocess_markdown(original_content)
-
-        # Temporarily write preprocessed content for citation extraction
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".md", delete=False, encoding="utf-8"
-        ) as temp_file:
-            temp_file.write(preprocessed_content)
-            temp_path = temp_file.name
-
-        try:
-            # Pass 1: Extract all citations from preprocessed content
-            citations = self.extract_citations_from_markdown(temp_path)
-            self.logger.info(f"Found {len(citations)} citations in {file_path}")
-
-            if not citations:
-                return preprocessed_content, []
-        finally:
-            # Clean up temp file
-            os.unlink(temp_path)
+        preprocessed_content, citations = self._prepare_markdown_file(file_path)
+        if not citations:
+            return preprocessed_content, []
 
         # Pass 2: Validate each citation with progress tracking
-        results = []
-
         if show_progress and len(citations) > 1:
             # Use tqdm progress bar for multiple citations
             with tqdm(
@@ -1328,26 +1517,34 @@ class BiblioChecker:
                 bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}] {postfix}",
                 dynamic_ncols=True,
             ) as pbar:
-                for i, citation in enumerate(citations):
-                    # Update progress bar description with current URL
-                    domain = self._extract_domain(citation.url)
-                    pbar.set_postfix_str(f"Fetching: {domain}")
-
-                    result = self.validate_citation(citation, pbar=pbar)
-                    results.append(result)
-
-                    # Update progress bar with detailed result status
-                    status = self._format_progress_status(result, domain)
-                    pbar.set_postfix_str(status)
-                    pbar.update(1)
+                results = self.validate_citations(citations, pbar=pbar)
         else:
             # No progress bar for single citation or when disabled
-            for citation in citations:
-                result = self.validate_citation(citation)
-                results.append(result)
+            results = self.validate_citations(citations)
 
-        # Apply corrections to preprocessed content (in reverse order to maintain positions)
-        corrected_content = preprocessed_content
+        return self._apply_corrections(preprocessed_content, results), results
+
+    def _prepare_markdown_file(
+        self, file_path: str
+    ) -> tuple[str, list[Citation]]:
+        """Read and preprocess a file and extract its citations (pass 1)"""
+        # Read original content
+        with open(file_path, encoding="utf-8") as f:
+            original_content = f.read()
+
+        # Apply preprocessing to fix common markdown issues
+        preprocessed_content = self._preprocess_markdown(original_content)
+
+        # Parse the preprocessed text once and extract citations from it
+        document = self.markdown_parser.parse(preprocessed_content)
+        citations = self.extract_citations_from_document(document, file_path)
+        return preprocessed_content, citations
+
+    def _apply_corrections(
+        self, content: str, results: list[ValidationResult]
+    ) -> str:
+        """Apply corrected citations to content (in reverse order to maintain positions)"""
+        corrected_content = content
         for result in reversed(results):
             if result.corrected_text and result.corrected_url:
                 old_link = f"[{result.citation.text}]({result.citation.url})"
@@ -1359,8 +1556,7 @@ class BiblioChecker:
                 corrected_content = corrected_content.replace(
                     old_link, new_link
                 )
-
-        return corrected_content, results
+        return corrected_content
 
     def _clean_citation_text(self, citation_text: str) -> str:
         """
@@ -1547,8 +1743,70 @@ class BiblioChecker:
             print("   verification against the actual publication source!")
             print("=" * 80 + "\n")
 
-    def process_files(self, paths: list[str]):
-        """Process multiple files or directories"""
+    def process_files(
+        self,
+        paths: list[str],
+        jobs: int = 1,
+        summary_path: str | None = None,
+        start_method: str = "spawn",
+    ) -> dict[str, Any]:
+        """
+        Process multiple files or directories.
+
+        With jobs > 1 the files are processed by a pool of worker processes
+        sharing the same cache. Citations of all files are extracted first
+        and every distinct URL is resolved once for the whole run. URLs are
+        handed out grouped by host, and all workers draw from the parent's
+        per-host rate limiter (held in a multiprocessing manager), so the
+        politeness delays also hold for hosts reached indirectly, such as
+        doi.org redirects, export.arxiv.org and api.crossref.org.
+
+        Args:
+            paths: Markdown files or directories to process
+            jobs: Number of worker processes (1 = process files one by one)
+            summary_path: Optional path for the aggregate JSON summary
+            start_method: multiprocessing start method of the workers, which
+                create checkers of the same class as this one
+
+        Returns:
+            Aggregate summary of the run
+        """
+        files_to_process = self._find_markdown_files(paths)
+        self.logger.info(
+            f"Found {len(files_to_process)} markdown files to process"
+        )
+
+        if jobs > 1 and len(files_to_process) > 1:
+            file_summaries = self._process_files_parallel(
+                files_to_process, jobs, start_method
+            )
+        else:
+            file_summaries = []
+            for file_path in files_to_process:
+                try:
+                    corrected_content, results = self.process_markdown_file(
+                        file_path
+                    )
+                    file_summaries.append(
+                        self._write_file_outputs(
+                            file_path, corrected_content, results
+                        )
+                    )
+                except Exception as e:
+                    self.logger.error(f"Error processing {file_path}: {e}")
+                    print(f"Error processing {file_path}: {e}")
+                    file_summaries.append({"file": file_path, "error": str(e)})
+
+        summary = self._build_run_summary(file_summaries)
+        self._print_run_summary(summary)
+        if summary_path:
+            with open(summary_path, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
+            self.logger.info(f"Saved summary file: {summary_path}")
+        return summary
+
+    def _find_markdown_files(self, paths: list[str]) -> list[str]:
+        """Collect markdown files from files and directories"""
         files_to_process = []
 
         for path in paths:
@@ -1562,40 +1820,285 @@ class BiblioChecker:
                         if file.endswith(".md"):
                             files_to_process.append(os.path.join(root, file))
 
-        self.logger.info(
-            f"Found {len(files_to_process)} markdown files to process"
-        )
+        return files_to_process
 
-        for file_path in files_to_process:
-            try:
-                # Process file
-                corrected_content, results = self.process_markdown_file(
-                    file_path
-                )
+    def _write_file_outputs(
+        self,
+        file_path: str,
+        corrected_content: str,
+        results: list[ValidationResult],
+    ) -> dict[str, Any]:
+        """Save the corrected file and its log, print its summary"""
+        # Save corrected file
+        corrected_path = self.save_corrected_file(file_path, corrected_content)
+
+        # Save log
+        log_path = Path(file_path).with_suffix(".json")
+        self.save_log(results, str(log_path))
+
+        # Print summary
+        errors = sum(1 for r in results if r.errors)
+        warnings = sum(1 for r in results if r.warnings)
+        print(f"\nProcessed: {file_path}")
+        print(f"  Citations found: {len(results)}")
+        print(f"  Errors: {errors}")
+        print(f"  Warnings: {warnings}")
+        print(f"  Corrected file: {corrected_path}")
+        print(f"  Log file: {log_path}")
+
+        # Print prominent author verification report
+        self._print_author_verification_report(results)
+
+        return {
+            "file": file_path,
+            "citations": len(results),
+            "errors": errors,
+            "warnings": warnings,
+            "author_errors": sum(
+                1
+                for r in results
+                if any("AUTHOR VERIFICATION FAILED" in e for e in r.errors)
+            ),
+            "cached": sum(1 for r in results if "CACHE" in r.tags),
+            "urls": sorted({r.citation.url for r in results}),
+            "log_file": str(log_path),
+        }
 
-                # Save corrected file
-                corrected_path = self.save_corrected_file(
-                    file_path, corrected_content
-                )
+    def _process_files_parallel(
+        self, files_to_process: list[str], jobs: int, start_method: str
+    ) -> list[dict[str, Any]]:
+        """Process files with worker processes, resolving each URL once"""
+        # Workers open the cache themselves; don't start them mid-backup
+        if self.cache:
+            self.cache.wait_for_backup()
 
-                # Save log
-                log_path = Path(file_path).with_suffix(".json")
-                self.save_log(results, str(log_path))
+        # Spawned, not forked: this process already runs threads
+        ctx = multiprocessing.get_context(start_method)
+        with (
+            ctx.Manager() as manager,
+            self.rate_limiter.share(manager) as rate_limit_state,
+        ):
+            return self._run_worker_pool(
+                files_to_process, jobs, ctx, rate_limit_state
+            )
 
-                # Print summary
-                print(f"\nProcessed: {file_path}")
-                print(f"  Citations found: {len(results)}")
-                print(f"  Errors: {sum(1 for r in results if r.errors)}")
-                print(f"  Warnings: {sum(1 for r in results if r.warnings)}")
-                print(f"  Corrected file: {corrected_path}")
-                print(f"  Log file: {log_path}")
+    def _run_worker_pool(
+        self,
+        files_to_process: list[str],
+        jobs: int,
+        ctx: multiprocessing.context.BaseContext,
+        rate_limit_state: tuple[Any, Any],
+    ) -> list[dict[str, Any]]:
+        """Extract, resolve and validate files in a worker pool"""
+        worker_options = {
+            # Workers build the same (sub)class of checker
+            "checker_class": type(self),
+            "verbose": self.verbose,
+            "delay": self.delay,
+            "use_cache": self.use_cache,
+            "cache_ttl_days": self.cache_ttl_days,
+            "log_file": self.log_file,
+        }
+        prepared: dict[str, tuple[str, list[Citation]]] = {}
+        file_summaries = []
+
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(worker_options, rate_limit_state),
+        ) as executor:
+            # Pass 1: extract citations of all files
+            future_to_file = {
+                executor.submit(_prepare_file_in_worker, file_path): file_path
+                for file_path in files_to_process
+            }
+            for future in tqdm(
+                as_completed(future_to_file),
+                total=len(future_to_file),
+                desc="Extracting citations",
+                unit="file",
+            ):
+                file_path = future_to_file[future]
+                try:
+                    prepared[file_path] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error processing {file_path}: {e}")
+                    print(f"Error processing {file_path}: {e}")
+                    file_summaries.append({"file": file_path, "error": str(e)})
+
+            # Pass 2: resolve every cited work of the run once
+            all_citations = [
+                citation
+                for _, citations in prepared.values()
+                for citation in citations
+            ]
+            work_of, to_fetch = self._plan_work_fetches(
+                [c.url for c in all_citations]
+            )
+            self.logger.info(
+                f"Resolving {len(to_fetch)} cited works from "
+                f"{len(all_citations)} citations in {len(prepared)} files "
+                f"with {jobs} processes"
+            )
 
-                # Print prominent author verification report
-                self._print_author_verification_report(results)
+            future_to_urls = {
+                executor.submit(_resolve_urls_in_worker, host_urls): host_urls
+                for host_urls in self._group_urls_by_host(to_fetch)
+            }
+            with tqdm(
+                total=len(to_fetch), desc="Resolving URLs", unit="url"
+            ) as pbar:
+                for future in as_completed(future_to_urls):
+                    host_urls = future_to_urls[future]
+                    try:
+                        for url, extraction in future.result().items():
+                            self._work_extractions[work_of[url]] = extraction
+                    except Exception as e:
+                        self.logger.error(
+                            f"Worker failed resolving {len(host_urls)} URLs: {e}"
+                        )
+                        for url in host_urls:
+                            self._work_extractions[work_of[url]] = (
+                                None,
+                                ["PARSE_ERROR"],
+                                0.0,
+                            )
+                    pbar.update(len(host_urls))
 
+        # Pass 3: validate and write the outputs of each file
+        for file_path in files_to_process:
+            if file_path not in prepared:
+                continue
+            content, citations = prepared[file_path]
+            try:
+                results = []
+                for citation in citations:
+                    bibtex_entry, tags, confidence = self._work_extractions[
+                        work_of[citation.url]
+                    ]
+                    results.append(
+                        self._build_validation_result(
+                            citation, bibtex_entry, list(tags), confidence
+                        )
+                    )
+                file_summaries.append(
+                    self._write_file_outputs(
+                        file_path,
+                        self._apply_corrections(content, results),
+                        results,
+                    )
+                )
             except Exception as e:
                 self.logger.error(f"Error processing {file_path}: {e}")
                 print(f"Error processing {file_path}: {e}")
+                file_summaries.append({"file": file_path, "error": str(e)})
+
+        return file_summaries
+
+    def _group_urls_by_host(self, urls: list[str]) -> list[list[str]]:
+        """Group URLs by host, largest group first"""
+        by_host: dict[str, list[str]] = {}
+        for url in urls:
+            by_host.setdefault(get_request_host(url), []).append(url)
+        return sorted(by_host.values(), key=len, reverse=True)
+
+    def _build_run_summary(
+        self, file_summaries: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Aggregate the per-file summaries of a run"""
+        processed = [s for s in file_summaries if "error" not in s]
+        unique_urls = {url for s in processed for url in s["urls"]}
+        return {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "files_processed": len(processed),
+            "files_failed": len(file_summaries) - len(processed),
+            "total_citations": sum(s["citations"] for s in processed),
+            "unique_urls": len(unique_urls),
+            "errors": sum(s["errors"] for s in processed),
+            "warnings": sum(s["warnings"] for s in processed),
+            "author_errors": sum(s["author_errors"] for s in processed),
+            "cached": sum(s["cached"] for s in processed),
+            "files": [
+                {k: v for k, v in s.items() if k != "urls"}
+                for s in sorted(file_summaries, key=lambda s: s["file"])
+            ],
+        }
+
+    def _print_run_summary(self, summary: dict[str, Any]) -> None:
+        """Print the aggregate summary of a multi-file run"""
+        if summary["files_processed"] + summary["files_failed"] <= 1:
+            return
+
+        print("\n" + "=" * 80)
+        print("SUMMARY")
+        print("=" * 80)
+        print(f"  Files processed: {summary['files_processed']}")
+        if summary["files_failed"]:
+            print(f"  Files failed: {summary['files_failed']}")
+        print(f"  Citations found: {summary['total_citations']}")
+        print(f"  Unique URLs: {summary['unique_urls']}")
+        print(f"  Errors: {summary['errors']}")
+        print(f"  Warnings: {summary['warnings']}")
+        print(f"  Author verification failures: {summary['author_errors']}")
+
+        files_with_errors = [
+            s for s in summary["files"] if s.get("error") or s.get("errors")
+        ]
+        if files_with_errors:
+            print("\nFiles needing attention:")
+            for s in files_with_errors:
+                detail = s.get("error") or f"{s['errors']} error(s)"
+                print(f"  {s['file']}: {detail}")
+        print("=" * 80 + "\n")
+
+
+# Checker of a worker process in BiblioChecker.process_files(jobs > 1)
+_worker_checker: BiblioChecker | None = None
+
+
+def _init_worker(
+    options: dict[str, Any], rate_limit_state: tuple[Any, Any]
+) -> None:
+    """Create the checker of a worker process"""
+    global _worker_checker
+    # Every HTTP client of the worker shares the parent's host buckets
+    get_rate_limiter().use_shared_state(rate_limit_state)
+    checker_class: type[BiblioChecker] = options.pop("checker_class")
+    use_cache = options.pop("use_cache")
+    checker = checker_class(use_cache=False, **options)
+    if use_cache:
+        # The parent process owns automatic backups
+        checker.cache = BiblioCache(
+            cache_ttl_days=options["cache_ttl_days"], auto_backup=False
+        )
+    _worker_checker = checker
+
+
+def _get_worker_checker() -> BiblioChecker:
+    """Get the checker _init_worker created for this process"""
+    assert _worker_checker is not None, "worker process not initialized"
+    return _worker_checker
+
+
+def _prepare_file_in_worker(file_path: str) -> tuple[str, list[Citation]]:
+    """Extract the citations of one file in a worker process"""
+    return _get_worker_checker()._prepare_markdown_file(file_path)
+
+
+def _resolve_urls_in_worker(
+    urls: list[str],
+) -> dict[str, tuple[BibtexEntry | None, list[str], float]]:
+    """Resolve the URLs of one host in a worker process"""
+    checker = _get_worker_checker()
+    extractions: dict[str, tuple[BibtexEntry | None, list[str], float]] = {}
+    for url in urls:
+        try:
+            extractions[url] = checker.extract_bibtex_from_url(url)
+        except Exception as e:
+            checker.logger.error(f"Unexpected error resolving {url}: {e}")
+            extractions[url] = (None, ["PARSE_ERROR"], 0.0)
+    return extractions
 
 
 def main():
@@ -1614,16 +2117,52 @@ def main():
         "--delay",
         type=float,
         default=1.0,
-        help="Delay between requests in seconds (default: 1.0)",
+        help="Delay between requests to the same host in seconds (default: 1.0)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of citations to resolve concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for multiple files (default: 1)",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Replay cached HTTP responses only, never use the network",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract BibTeX instead of reusing cached results",
+    )
+    parser.add_argument(
+        "--summary",
+        help="Write an aggregate JSON summary of all files to this path",
     )
 
     args = parser.parse_args()
 
+    if args.offline:
+        configure_http_cache(offline=True)
+
     # Create checker instance
-    checker = BiblioChecker(verbose=args.verbose, delay=args.delay)
+    checker = BiblioChecker(
+        verbose=args.verbose,
+        delay=args.delay,
+        use_cache=not args.no_cache,
+        max_workers=args.workers,
+    )
 
     # Process files
-    checker.process_files(args.paths)
+    checker.process_files(args.paths, jobs=args.jobs, summary_path=args.summary)
 
 
 if __name__ == "__main__":
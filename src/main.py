@@ -18,7 +18,7 @@ from .core.biblio_checker import BiblioChecker
     "--output-dir",
     "-o",
     type=click.Path(path_type=Path),
-    help="Output directory for corrected files",
+    help="Output directory for corrected files (single-file input)",
 )
 @click.option(
     "--log-level",
@@ -53,6 +53,27 @@ from .core.biblio_checker import BiblioChecker
     is_flag=True,
     help="Disable local cache, force fresh network requests",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of citations to resolve concurrently (per-host delay still applies)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes for a directory of files",
+)
+@click.option(
+    "--summary",
+    type=click.Path(path_type=Path),
+    help="Write an aggregate JSON summary of a directory run to this path",
+)
 def main(
     input_path,
     output_dir,
@@ -62,15 +83,20 @@ def main(
     check_citations,
     no_progress,
     no_cache,
+    workers,
+    jobs,
+    summary,
 ):
     """
     Validate and correct bibliographic entries in Markdown files.
 
     INPUT_PATH can be a single Markdown file or a directory containing Markdown files.
+    A directory is processed like the biblio_checker CLI: corrected files and
+    JSON logs are written next to each input file.
     """
     logging.basicConfig(level=getattr(logging, log_level))
 
-    checker = BiblioChecker(use_cache=not no_cache)
+    checker = BiblioChecker(use_cache=not no_cache, max_workers=workers)
 
     if input_path.is_file():
         files = [input_path]
@@ -83,6 +109,14 @@ def main(
 
     click.echo(f"Processing {len(files)} file(s)...")
 
+    if input_path.is_dir() and not dry_run:
+        checker.process_files(
+            [str(input_path)],
+            jobs=jobs,
+            summary_path=str(summary) if summary else None,
+        )
+        return
+
     for file_path in files:
         click.echo(f"\nProcessing: {file_path}")
 
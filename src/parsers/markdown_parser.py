@@ -1,6 +1,9 @@
 """Markdown parser using markdown-it-py."""
 
 import logging
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 from markdown_it import MarkdownIt
@@ -10,6 +13,145 @@ from .base import ParsedDocument, ParsedNode, StructuredParser
 
 logger = logging.getLogger(__name__)
 
+# Map markdown-it token types to our node types
+TOKEN_TYPES = {
+    "heading_open": "heading",
+    "paragraph_open": "paragraph",
+    "link_open": "link",
+    "image": "image",
+    "code_inline": "code_inline",
+    "fence": "code_block",
+    "code_block": "code_block",
+    "blockquote_open": "blockquote",
+    "list_item_open": "list_item",
+    "bullet_list_open": "bullet_list",
+    "ordered_list_open": "ordered_list",
+    "text": "text",
+    "inline": "inline",
+    "softbreak": "softbreak",
+    "hardbreak": "hardbreak",
+}
+
+# (line_no, start_pos, end_pos) of the source lines a node came from
+Span = tuple[int, int, int]
+
+
+def line_offsets(text: str) -> list[int]:
+    """Offset of the start of each line, plus one past the end of the text."""
+    offsets = [0]
+    pos = text.find("\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = text.find("\n", pos + 1)
+    offsets.append(len(text) + 1)
+    return offsets
+
+
+def flatten_nodes(nodes: list[ParsedNode]) -> list[ParsedNode]:
+    """Flatten nested nodes in document order."""
+    result = []
+    for node in nodes:
+        result.append(node)
+        result.extend(flatten_nodes(node.children))
+    return result
+
+
+def text_content(node: ParsedNode) -> str:
+    """Text of a node and its children."""
+    text = node.content if node.type in ("text", "code_inline") else ""
+    for child in node.children:
+        text += text_content(child)
+    return text
+
+
+@dataclass
+class MarkdownDocument(ParsedDocument):
+    """
+    A Markdown document parsed once and shared by its consumers.
+
+    Holds the token stream and line offsets alongside the node tree; the
+    flattened nodes, link, heading, code block and image tables and the
+    lines are built on first use and kept.
+    """
+
+    tokens: list[Token] = field(default_factory=list)
+    line_offsets: list[int] = field(default_factory=lambda: [0, 1])
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Lines of the text, without line endings."""
+        return self.raw_text.split("\n")
+
+    def line_at(self, pos: int) -> int:
+        """1-based line number of a text offset."""
+        return bisect_right(self.line_offsets, pos)
+
+    @cached_property
+    def flat_nodes(self) -> list[ParsedNode]:
+        """All nodes in document order."""
+        return flatten_nodes(self.nodes)
+
+    @cached_property
+    def links(self) -> list[dict[str, Any]]:
+        """Links with their text, target and position."""
+        return [
+            {
+                "text": text_content(node).strip(),
+                "href": node.metadata.get("href", ""),
+                "title": node.metadata.get("title", ""),
+                "position": (node.start_pos, node.end_pos),
+                "line": node.line_no,
+                "column": node.col_no,
+            }
+            for node in self.flat_nodes
+            if node.type == "link"
+        ]
+
+    @cached_property
+    def headings(self) -> list[dict[str, Any]]:
+        """Headings with their level, text and position."""
+        return [
+            {
+                "level": node.metadata.get("level", 1),
+                "text": text_content(node).strip(),
+                "position": (node.start_pos, node.end_pos),
+                "line": node.line_no,
+                "column": node.col_no,
+            }
+            for node in self.flat_nodes
+            if node.type == "heading"
+        ]
+
+    @cached_property
+    def code_blocks(self) -> list[dict[str, Any]]:
+        """Fenced and indented code blocks."""
+        return [
+            {
+                "language": node.metadata.get("language", ""),
+                "content": node.content,
+                "position": (node.start_pos, node.end_pos),
+                "line": node.line_no,
+                "column": node.col_no,
+            }
+            for node in self.flat_nodes
+            if node.type == "code_block"
+        ]
+
+    @cached_property
+    def images(self) -> list[dict[str, Any]]:
+        """Images with their source and alt text."""
+        return [
+            {
+                "src": node.metadata.get("src", ""),
+                "alt": node.metadata.get("alt", ""),
+                "position": (node.start_pos, node.end_pos),
+                "line": node.line_no,
+                "column": node.col_no,
+            }
+            for node in self.flat_nodes
+            if node.type == "image"
+        ]
+
 
 class MarkdownParser(StructuredParser):
     """Parser for Markdown documents using markdown-it-py."""
@@ -20,41 +162,49 @@ class MarkdownParser(StructuredParser):
         # Enable additional features
         self.md.enable(["table", "strikethrough"])
 
-    def parse(self, text: str) -> ParsedDocument:
-        """Parse Markdown text into structured document."""
+    def parse(self, text: str) -> MarkdownDocument:
+        """
+        Parse Markdown text into structured document.
+
+        Parse once and pass the document to every consumer; its link,
+        heading, code block and image tables are built on first use.
+        """
+        offsets = line_offsets(text)
         try:
             tokens = self.md.parse(text)
         except Exception as e:
             logger.error(f"Markdown parsing error: {e}")
-            return ParsedDocument(
-                raw_text=text, nodes=[], metadata={"parse_error": str(e)}
+            return MarkdownDocument(
+                raw_text=text,
+                nodes=[],
+                metadata={"parse_error": str(e)},
+                line_offsets=offsets,
             )
 
         # Convert tokens to ParsedNodes recursively
-        nodes = self._process_tokens(tokens, text)
+        nodes = self._process_tokens(tokens, offsets)
+        document = MarkdownDocument(
+            raw_text=text,
+            nodes=nodes,
+            metadata={},
+            tokens=tokens,
+            line_offsets=offsets,
+        )
 
         # Extract metadata
-        metadata = {
+        node_types = {n.type for n in document.flat_nodes}
+        document.metadata = {
             "num_tokens": len(tokens),
-            "has_headings": any(
-                n.type == "heading" for n in self._flatten_nodes(nodes)
-            ),
-            "has_links": any(
-                n.type == "link" for n in self._flatten_nodes(nodes)
-            ),
-            "has_images": any(
-                n.type == "image" for n in self._flatten_nodes(nodes)
-            ),
-            "has_code": any(
-                n.type in ["code_inline", "code_block"]
-                for n in self._flatten_nodes(nodes)
-            ),
+            "has_headings": "heading" in node_types,
+            "has_links": "link" in node_types,
+            "has_images": "image" in node_types,
+            "has_code": bool(node_types & {"code_inline", "code_block"}),
         }
 
-        return ParsedDocument(raw_text=text, nodes=nodes, metadata=metadata)
+        return document
 
     def _process_tokens(
-        self, tokens: list[Token], text: str
+        self, tokens: list[Token], offsets: list[int]
     ) -> list[ParsedNode]:
         """Process a list of tokens into ParsedNodes."""
         nodes = []
@@ -68,14 +218,14 @@ class MarkdownParser(StructuredParser):
                 if closing_idx is not None:
                     # Process block with children
                     node = self._create_block_node(
-                        token, tokens[i + 1 : closing_idx], text
+                        token, tokens[i + 1 : closing_idx], offsets
                     )
                     if node:
                         nodes.append(node)
                     i = closing_idx + 1
                 else:
                     # No closing tag found, treat as self-closing
-                    node = self._token_to_node(token, text)
+                    node = self._token_to_node(token, offsets)
                     if node:
                         nodes.append(node)
                     i += 1
@@ -88,11 +238,11 @@ class MarkdownParser(StructuredParser):
                 ):
                     # Process inline children specially to detect images
                     inline_nodes = self._process_inline_tokens(
-                        token.children, text
+                        token.children, offsets, self._span(token, offsets)
                     )
                     nodes.extend(inline_nodes)
                 else:
-                    node = self._token_to_node(token, text)
+                    node = self._token_to_node(token, offsets)
                     if node:
                         nodes.append(node)
                 i += 1
@@ -102,9 +252,15 @@ class MarkdownParser(StructuredParser):
         return nodes
 
     def _process_inline_tokens(
-        self, tokens: list[Token], text: str
+        self, tokens: list[Token], offsets: list[int], span: Span | None
     ) -> list[ParsedNode]:
-        """Process inline tokens, detecting images and links."""
+        """
+        Process inline tokens, detecting images and links.
+
+        Inline tokens carry no source map, so images and links get the
+        span of the block they appear in.
+        """
+        line_no, start_pos, end_pos = span or (1, 0, 0)
         nodes = []
         i = 0
 
@@ -134,9 +290,9 @@ class MarkdownParser(StructuredParser):
                 image_node = ParsedNode(
                     type="image",
                     content=alt_text,
-                    start_pos=0,  # Will be set later
-                    end_pos=0,
-                    line_no=1,
+                    start_pos=start_pos,
+                    end_pos=end_pos,
+                    line_no=line_no,
                     col_no=0,
                     metadata={
                         "src": attrs_dict.get("href", ""),
@@ -161,7 +317,7 @@ class MarkdownParser(StructuredParser):
                     if tokens[j].type == "text":
                         link_text += tokens[j].content
                     # Process child node for link content
-                    child_node = self._token_to_node(tokens[j], text)
+                    child_node = self._token_to_node(tokens[j], offsets, span)
                     if child_node:
                         link_children.append(child_node)
                     j += 1
@@ -170,9 +326,9 @@ class MarkdownParser(StructuredParser):
                 link_node = ParsedNode(
                     type="link",
                     content=link_text,
-                    start_pos=0,  # Will be set later
-                    end_pos=0,
-                    line_no=1,
+                    start_pos=start_pos,
+                    end_pos=end_pos,
+                    line_no=line_no,
                     col_no=0,
                     metadata={
                         "href": attrs_dict.get("href", ""),
@@ -186,7 +342,7 @@ class MarkdownParser(StructuredParser):
                 i = j + 1
             else:
                 # Regular token processing
-                node = self._token_to_node(token, text)
+                node = self._token_to_node(token, offsets, span)
                 if node:
                     nodes.append(node)
                 i += 1
@@ -212,34 +368,56 @@ class MarkdownParser(StructuredParser):
         return None
 
     def _create_block_node(
-        self, opening_token: Token, inner_tokens: list[Token], text: str
+        self,
+        opening_token: Token,
+        inner_tokens: list[Token],
+        offsets: list[int],
     ) -> ParsedNode | None:
         """Create a block node with children."""
-        node = self._token_to_node(opening_token, text)
+        node = self._token_to_node(opening_token, offsets)
         if node:
-            # Process inner tokens as children
-            node.children = self._process_tokens(inner_tokens, text)
-
             # Special case for inline tokens inside blocks
             if len(inner_tokens) == 1 and inner_tokens[0].type == "inline":
                 inline_token = inner_tokens[0]
                 if hasattr(inline_token, "children") and inline_token.children:
-                    # Replace with processed inline children
+                    # Process the inline children directly
                     node.children = self._process_inline_tokens(
-                        inline_token.children, text
+                        inline_token.children,
+                        offsets,
+                        self._span(inline_token, offsets),
                     )
+                    return node
+
+            # Process inner tokens as children
+            node.children = self._process_tokens(inner_tokens, offsets)
         return node
 
     def _flatten_nodes(self, nodes: list[ParsedNode]) -> list[ParsedNode]:
         """Flatten nested nodes for easier searching."""
-        result = []
-        for node in nodes:
-            result.append(node)
-            result.extend(self._flatten_nodes(node.children))
-        return result
-
-    def _token_to_node(self, token: Token, text: str) -> ParsedNode | None:
-        """Convert markdown-it token to ParsedNode."""
+        return flatten_nodes(nodes)
+
+    @staticmethod
+    def _span(token: Token, offsets: list[int]) -> Span | None:
+        """Source span of a token with a line map."""
+        if not token.map:
+            return None
+        line_start, line_end = token.map
+        last = len(offsets) - 1
+        return (
+            line_start + 1,
+            offsets[min(line_start, last)],
+            offsets[min(line_end, last)],
+        )
+
+    def _token_to_node(
+        self, token: Token, offsets: list[int], span: Span | None = None
+    ) -> ParsedNode | None:
+        """
+        Convert markdown-it token to ParsedNode.
+
+        Positions come from the token's line map, or from span (the
+        enclosing block) for inline tokens.
+        """
         # Skip closing tokens (handled by nesting logic)
         if token.nesting == -1:
             return ParsedNode(
@@ -253,31 +431,13 @@ class MarkdownParser(StructuredParser):
                 children=[],
             )
 
-        # Map token types to our types
-        type_mapping = {
-            "heading_open": "heading",
-            "paragraph_open": "paragraph",
-            "link_open": "link",
-            "image": "image",
-            "code_inline": "code_inline",
-            "fence": "code_block",
-            "code_block": "code_block",
-            "blockquote_open": "blockquote",
-            "list_item_open": "list_item",
-            "bullet_list_open": "bullet_list",
-            "ordered_list_open": "ordered_list",
-            "text": "text",
-            "inline": "inline",
-            "softbreak": "softbreak",
-            "hardbreak": "hardbreak",
-        }
-
         # DEBUG: Log token info for debugging
-        logger.debug(
-            f"Token type: {token.type}, nesting: {token.nesting}, content: {token.content[:50] if token.content else 'None'}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Token type: {token.type}, nesting: {token.nesting}, content: {token.content[:50] if token.content else 'None'}"
+            )
 
-        node_type = type_mapping.get(token.type, token.type)
+        node_type = TOKEN_TYPES.get(token.type, token.type)
 
         # Extract content and metadata based on type
         content = token.content or ""
@@ -307,27 +467,24 @@ class MarkdownParser(StructuredParser):
                 attrs_dict = dict(token.attrs)
                 metadata["start"] = attrs_dict.get("start", "1")
 
-        # Calculate position
-        if hasattr(token, "map") and token.map:
-            line_start, line_end = token.map
-            line_no = line_start + 1
-            # Find actual position in text
-            lines = text.split("\n")
-            start_pos = sum(len(line) + 1 for line in lines[:line_start])
-            end_pos = sum(len(line) + 1 for line in lines[:line_end])
-            col_no = 0
+        # Calculate position from the line offsets
+        own_span = self._span(token, offsets)
+        if own_span:
+            span = own_span
+        if span:
+            line_no, start_pos, end_pos = span
         else:
             # Approximate position
             start_pos = 0
             end_pos = len(content)
             line_no = 1
-            col_no = 0
+        col_no = 0
 
         # Handle children for inline content
         children = []
         if hasattr(token, "children") and token.children:
             for child_token in token.children:
-                child_node = self._token_to_node(child_token, text)
+                child_node = self._token_to_node(child_token, offsets, span)
                 if child_node:
                     children.append(child_node)
 
@@ -368,9 +525,7 @@ class MarkdownParser(StructuredParser):
             # This would check that [ref]: definitions match [text][ref] usage
 
             # Check heading hierarchy
-            headings = [
-                n for n in self._flatten_nodes(doc.nodes) if n.type == "heading"
-            ]
+            headings = [n for n in doc.flat_nodes if n.type == "heading"]
             prev_level = 0
             for heading in headings:
                 level = heading.metadata.get("level", 1)
@@ -387,92 +542,20 @@ class MarkdownParser(StructuredParser):
 
     def extract_links(self, text: str) -> list[dict[str, Any]]:
         """Extract all links from Markdown text."""
-        doc = self.parse(text)
-        links = []
-
-        for node in self._flatten_nodes(doc.nodes):
-            if node.type == "link":
-                # Get link text from children
-                link_text = self._get_text_content(node)
-
-                link_info = {
-                    "text": link_text.strip(),
-                    "href": node.metadata.get("href", ""),
-                    "title": node.metadata.get("title", ""),
-                    "position": (node.start_pos, node.end_pos),
-                    "line": node.line_no,
-                    "column": node.col_no,
-                }
-                links.append(link_info)
-
-        return links
+        return self.parse(text).links
 
     def extract_headings(self, text: str) -> list[dict[str, Any]]:
         """Extract all headings from Markdown text."""
-        doc = self.parse(text)
-        headings = []
-
-        for node in self._flatten_nodes(doc.nodes):
-            if node.type == "heading":
-                # Get heading text from children
-                heading_text = self._get_text_content(node)
-
-                heading_info = {
-                    "level": node.metadata.get("level", 1),
-                    "text": heading_text.strip(),
-                    "position": (node.start_pos, node.end_pos),
-                    "line": node.line_no,
-                    "column": node.col_no,
-                }
-                headings.append(heading_info)
-
-        return headings
+        return self.parse(text).headings
 
     def _get_text_content(self, node: ParsedNode) -> str:
         """Recursively extract text content from a node and its children."""
-        text = ""
-        if node.type == "text":
-            text = node.content
-        elif node.type == "code_inline":
-            text = node.content
-
-        for child in node.children:
-            text += self._get_text_content(child)
-
-        return text
+        return text_content(node)
 
     def extract_code_blocks(self, text: str) -> list[dict[str, Any]]:
         """Extract all code blocks from Markdown text."""
-        doc = self.parse(text)
-        code_blocks = []
-
-        for node in self._flatten_nodes(doc.nodes):
-            if node.type == "code_block":
-                code_info = {
-                    "language": node.metadata.get("language", ""),
-                    "content": node.content,
-                    "position": (node.start_pos, node.end_pos),
-                    "line": node.line_no,
-                    "column": node.col_no,
-                }
-                code_blocks.append(code_info)
-
-        return code_blocks
+        return self.parse(text).code_blocks
 
     def extract_images(self, text: str) -> list[dict[str, Any]]:
         """Extract all images from Markdown text."""
-        doc = self.parse(text)
-        images = []
-
-        for node in self._flatten_nodes(doc.nodes):
-            if node.type == "image":
-                image_info = {
-                    "src": node.metadata.get("src", ""),
-                    "alt": node.metadata.get("alt", ""),
-                    "position": (node.start_pos, node.end_pos),
-                    "line": node.line_no,
-                    "column": node.col_no,
-                }
-                images.append(image_info)
-
-        return images
+        return self.parse(text).images
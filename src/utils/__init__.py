@@ -15,17 +15,46 @@ from .extractors import (
     extract_year_from_citation,
     is_academic_domain,
 )
+from .http_cache import (
+    CachedSession,
+    HTTPCache,
+    OfflineCacheMiss,
+    configure_http_cache,
+    get_http_session,
+)
+from .identifiers import (
+    CanonicalId,
+    canonical_id,
+    group_by_canonical_id,
+)
 from .mdpi_workaround import (
     MDPIWorkaround,
     extract_doi_from_mdpi_url,
     process_mdpi_link,
 )
+from .page_fetcher import FetchedPage, PageFetcher
 from .pdf_parser import PDFParser, extract_pdf_metadata, is_pdf_url
+from .rate_limiter import (
+    DomainRateLimiter,
+    get_rate_limiter,
+    parse_retry_after,
+)
+from .reference_index import (
+    ReferenceIndex,
+    configure_reference_index,
+    get_reference_index,
+)
 from .researchgate_workaround import (
     ResearchGateWorkaround,
     extract_title_from_researchgate_url,
     process_researchgate_link,
 )
+from .similarity import (
+    CandidateIndex,
+    normalize_text,
+    similarity,
+    token_overlap,
+)
 from .validators import (
     ValidationError,
     detect_potential_hallucination,
@@ -73,12 +102,38 @@ __all__ = [
     "ContentClassifier",
     "classify_url",
     "is_layperson_url",
+    # http_cache
+    "HTTPCache",
+    "CachedSession",
+    "OfflineCacheMiss",
+    "configure_http_cache",
+    "get_http_session",
+    # identifiers
+    "CanonicalId",
+    "canonical_id",
+    "group_by_canonical_id",
+    # reference_index
+    "ReferenceIndex",
+    "configure_reference_index",
+    "get_reference_index",
     # researchgate_workaround
     "ResearchGateWorkaround",
     "process_researchgate_link",
     "extract_title_from_researchgate_url",
+    # similarity
+    "CandidateIndex",
+    "normalize_text",
+    "similarity",
+    "token_overlap",
     # mdpi_workaround
     "MDPIWorkaround",
     "process_mdpi_link",
     "extract_doi_from_mdpi_url",
+    # page_fetcher
+    "FetchedPage",
+    "PageFetcher",
+    # rate_limiter
+    "DomainRateLimiter",
+    "get_rate_limiter",
+    "parse_retry_after",
 ]
@@ -7,13 +7,76 @@ Good scientific writing introduces abbreviations when first used, e.g.:
 Then subsequent uses of "LIME" are acceptable.
 """
 
+import io
 import logging
 
 # import re  # Banned - using string methods instead
+import string
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Characters stripped from both ends of a word before it is classified
+WORD_PUNCTUATION = ".,;:!?\"'()"
+
+# Substrings that mark a line as code rather than prose
+CODE_INDICATORS = (
+    "=",
+    "{",
+    "}",
+    "()",
+    "->",
+    "=>",
+    "function",
+    "def",
+    "class",
+    "var",
+    "let",
+    "const",
+)
+
+# ASCII characters that str.split() treats as whitespace
+ASCII_WHITESPACE = "".join(chr(i) for i in range(128) if chr(i).isspace())
+
+# Maps ASCII letters and digits to their class (A, a, 0) and whitespace to
+# a space, leaving every other character alone. A translated line has the
+# same length and splits into the same words as the line itself.
+CHAR_CLASSES = str.maketrans(
+    string.ascii_uppercase
+    + string.ascii_lowercase
+    + string.digits
+    + ASCII_WHITESPACE,
+    "A" * 26 + "a" * 26 + "0" * 10 + " " * len(ASCII_WHITESPACE),
+)
+
+# Definitions suggested for well-known undefined abbreviations
+KNOWN_DEFINITIONS = {
+    "LIME": "Local Interpretable Model-agnostic Explanations",
+    "SHAP": "SHapley Additive exPlanations",
+    "GAM": "Generalized Additive Model",
+    "AVM": "Automated Valuation Model",
+    "UAD": "Uniform Appraisal Dataset",
+    "MLS": "Multiple Listing Service",
+    "NeRF": "Neural Radiance Field",
+    "LSTM": "Long Short-Term Memory",
+    "GRU": "Gated Recurrent Unit",
+    "CNN": "Convolutional Neural Network",
+    "RNN": "Recurrent Neural Network",
+    "GAN": "Generative Adversarial Network",
+    "VAE": "Variational Autoencoder",
+    "SVM": "Support Vector Machine",
+    "KNN": "K-Nearest Neighbors",
+    "PCA": "Principal Component Analysis",
+    "API": "Application Programming Interface",
+    "REST": "Representational State Transfer",
+    "CRUD": "Create, Read, Update, Delete",
+    "SDK": "Software Development Kit",
+    "IDE": "Integrated Development Environment",
+    "CLI": "Command Line Interface",
+    "GUI": "Graphical User Interface",
+}
+
 
 @dataclass
 class AbbreviationIssue:
@@ -160,108 +223,186 @@ class AbbreviationChecker:
         Returns:
             Tuple of (list of issues, list of definitions found)
         """
-        lines = text.split("\n")
+        return self.check_lines(io.StringIO(text))
 
-        # First, find all definitions
-        definitions = self._find_definitions(lines)
-        defined_abbrs = {d.abbreviation: d for d in definitions}
+    def check_lines(
+        self, lines: Iterable[str]
+    ) -> tuple[list[AbbreviationIssue], list[AbbreviationDefinition]]:
+        """
+        Check a stream of lines, such as an open file.
 
-        # Then, find all abbreviation uses
-        issues = []
-        seen_abbrs = set()
+        Definitions and uses are collected in a single pass. Uses are resolved
+        once the stream ends, because an abbreviation may be defined after it
+        is first used.
+
+        Args:
+            lines: Lines of the document, with or without line endings
+
+        Returns:
+            Tuple of (list of issues, list of definitions found)
+        """
+        definitions = []
+        defined_abbrs: dict[str, AbbreviationDefinition] = {}
+        # (abbreviation, line number, position, context, on a code line)
+        uses: list[tuple[str, int, int, str, bool]] = []
 
         for line_num, line in enumerate(lines, 1):
+            if line.endswith("\n"):
+                line = line[:-1]
+
+            # Every pattern needs an uppercase letter, so most lowercase
+            # lines are ruled out by one translate and two C-level checks
+            classes = line.translate(CHAR_CLASSES)
+            if "A" not in classes and classes.isascii():
+                continue
+
+            # Look for patterns like "Full Name (ABBR)" or "ABBR (Full Name)"
+            if "(" in line:
+                for definition in self._find_definitions_in_line(
+                    line, line_num
+                ):
+                    definitions.append(definition)
+                    defined_abbrs[definition.abbreviation] = definition
+
             # Skip if line is likely a reference or bibliography entry
             if self._is_reference_line(line):
                 continue
 
-            # Find all potential abbreviations in this line
-            potential_abbrs = self._find_abbreviations_in_line(line)
-
-            for abbr, position in potential_abbrs:
+            is_code_line = None
+            for abbr, position in self._find_abbreviations_in_line(
+                line, classes
+            ):
                 # Skip if it's a common abbreviation
                 if abbr in self.common_abbreviations:
                     continue
+                if is_code_line is None:
+                    is_code_line = self._is_likely_code_or_variable(abbr, line)
+                uses.append(
+                    (
+                        abbr,
+                        line_num,
+                        position,
+                        self._get_context(line, position, position + len(abbr)),
+                        is_code_line,
+                    )
+                )
 
-                # Skip if it's already been defined
-                if abbr in defined_abbrs:
-                    # Check if this use comes before the definition
-                    if line_num < defined_abbrs[abbr].line_number:
-                        # Used before definition!
-                        issue = AbbreviationIssue(
+        issues = []
+        seen_abbrs = set()
+        for abbr, line_num, position, context, is_code_line in uses:
+            definition = defined_abbrs.get(abbr)
+            if definition is not None:
+                # Used before definition!
+                if line_num < definition.line_number:
+                    issues.append(
+                        AbbreviationIssue(
                             abbreviation=abbr,
                             line_number=line_num,
                             position=position,
-                            context=self._get_context(
-                                line, position, position + len(abbr)
-                            ),
-                            suggested_definition=defined_abbrs[abbr].full_form,
+                            context=context,
+                            suggested_definition=definition.full_form,
                         )
-                        issues.append(issue)
-                    continue
-
-                # Skip if we've already reported this abbreviation
-                if abbr in seen_abbrs:
-                    continue
-
-                # Check if it might be a variable name or code
-                if self._is_likely_code_or_variable(abbr, line):
-                    continue
+                    )
+                continue
 
-                # This is an undefined abbreviation
-                seen_abbrs.add(abbr)
-                issue = AbbreviationIssue(
+            # Report each undefined abbreviation once, unless it's likely
+            # a variable name or code
+            if abbr in seen_abbrs or is_code_line:
+                continue
+            seen_abbrs.add(abbr)
+            issues.append(
+                AbbreviationIssue(
                     abbreviation=abbr,
                     line_number=line_num,
                     position=position,
-                    context=self._get_context(
-                        line, position, position + len(abbr)
-                    ),
+                    context=context,
                     suggested_definition=self._suggest_definition(abbr),
                 )
-                issues.append(issue)
+            )
 
         return issues, definitions
 
-    def _find_abbreviations_in_line(self, line: str) -> list[tuple[str, int]]:
-        """Find potential abbreviations in a line using string methods."""
-        abbreviations = []
-        words = line.split()
-        current_pos = 0
-
-        for word in words:
-            # Find the actual position of this word in the line
-            word_pos = line.find(word, current_pos)
-            if word_pos == -1:
-                continue
-            current_pos = word_pos + len(word)
-
-            # Remove punctuation from word
-            clean_word = word.strip(".,;:!?\"'()")
+    def _find_abbreviations_in_line(
+        self, line: str, classes: str | None = None
+    ) -> list[tuple[str, int]]:
+        """
+        Find potential abbreviations in a line using string methods.
 
-            # Check different abbreviation patterns
+        Args:
+            line: The line to scan
+            classes: The line translated with CHAR_CLASSES, if already done
+        """
+        if classes is None:
+            classes = line.translate(CHAR_CLASSES)
 
-            # 1. All caps abbreviations (2+ letters): NASA, WHO, LSTM
-            if (
-                len(clean_word) >= 2
-                and clean_word.isupper()
-                and clean_word.isalpha()
+        abbreviations = []
+        for start, end in self._candidate_word_spans(line, classes):
+            clean_word = line[start:end].strip(WORD_PUNCTUATION)
+            if self._is_abbreviation(
+                clean_word, classes[start:end].strip(WORD_PUNCTUATION)
             ):
-                abbreviations.append((clean_word, word_pos))
+                abbreviations.append((clean_word, start))
 
-            # 2. Mixed case with dots: Ph.D., M.D.
-            elif "." in clean_word and self._is_dotted_abbreviation(clean_word):
-                abbreviations.append((clean_word, word_pos))
+        return abbreviations
+
+    def _candidate_word_spans(
+        self, line: str, classes: str
+    ) -> Iterator[tuple[int, int]]:
+        """Spans of the words of a line that could be abbreviations."""
+        if classes.isascii():
+            # Jump from one uppercase letter to the next and expand it to
+            # its word; words without one are never visited
+            pos = classes.find("A")
+            while pos != -1:
+                start = classes.rfind(" ", 0, pos) + 1
+                end = classes.find(" ", pos)
+                if end == -1:
+                    end = len(classes)
+                yield start, end
+                pos = classes.find("A", end)
+            return
+
+        # Other whitespace may separate words, so split like str.split()
+        current_pos = 0
+        for word in line.split():
+            start = line.find(word, current_pos)
+            current_pos = start + len(word)
+            # ASCII words without an uppercase letter can't be abbreviations
+            word_classes = classes[start:current_pos]
+            if "A" in word_classes or not word_classes.isascii():
+                yield start, current_pos
+
+    def _is_abbreviation(self, word: str, classes: str) -> bool:
+        """Classify a word by its character classes (see CHAR_CLASSES)."""
+        if not classes.isascii():
+            return (
+                (len(word) >= 2 and word.isupper() and word.isalpha())
+                or ("." in word and self._is_dotted_abbreviation(word))
+                or self._is_camelcase_abbreviation(word)
+                or self._is_special_pattern_abbreviation(word)
+            )
+
+        length = len(classes)
+
+        # 1. All caps abbreviations (2+ letters): NASA, WHO, LSTM
+        if length >= 2 and classes.count("A") == length:
+            return True
 
-            # 3. CamelCase abbreviations: CatBoost, NeRF
-            elif self._is_camelcase_abbreviation(clean_word):
-                abbreviations.append((clean_word, word_pos))
+        # 2. Mixed case with dots: Ph.D., M.D.
+        if "." in classes and self._is_dotted_abbreviation(word):
+            return True
 
-            # 4. Special patterns: 3D, 2FA, B2B
-            elif self._is_special_pattern_abbreviation(clean_word):
-                abbreviations.append((clean_word, word_pos))
+        # 3. CamelCase abbreviations: CatBoost, NeRF
+        if (
+            length >= 3
+            and classes[0] == "A"
+            and classes.find("A", 1) != -1
+            and classes.find("a", 1) != -1
+        ):
+            return True
 
-        return abbreviations
+        # 4. Special patterns: 3D, 2FA, B2B
+        return length >= 2 and "0" in classes and "A" in classes
 
     def _is_dotted_abbreviation(self, word: str) -> bool:
         """Check if word is a dotted abbreviation like Ph.D."""
@@ -316,18 +457,6 @@ class AbbreviationChecker:
 
         return has_digit and has_letter
 
-    def _find_definitions(
-        self, lines: list[str]
-    ) -> list[AbbreviationDefinition]:
-        """Find all abbreviation definitions in the text using string methods."""
-        definitions = []
-
-        for line_num, line in enumerate(lines, 1):
-            # Look for patterns like "Full Name (ABBR)" or "ABBR (Full Name)"
-            definitions.extend(self._find_definitions_in_line(line, line_num))
-
-        return definitions
-
     def _find_definitions_in_line(
         self, line: str, line_num: int
     ) -> list[AbbreviationDefinition]:
@@ -473,22 +602,7 @@ class AbbreviationChecker:
 
     def _is_likely_code_or_variable(self, abbr: str, line: str) -> bool:
         """Check if an abbreviation is likely a code variable or function name."""
-        # Check for code indicators
-        code_indicators = [
-            "=",
-            "{",
-            "}",
-            "()",
-            "->",
-            "=>",
-            "function",
-            "def",
-            "class",
-            "var",
-            "let",
-            "const",
-        ]
-        return any(indicator in line for indicator in code_indicators)
+        return any(indicator in line for indicator in CODE_INDICATORS)
 
     def _get_context(
         self, line: str, start: int, end: int, context_chars: int = 40
@@ -505,33 +619,7 @@ class AbbreviationChecker:
     def _suggest_definition(self, abbr: str) -> str | None:
         """Suggest a possible definition for an abbreviation."""
         # This could be enhanced with an LLM or a database of common abbreviations
-        known_abbreviations = {
-            "LIME": "Local Interpretable Model-agnostic Explanations",
-            "SHAP": "SHapley Additive exPlanations",
-            "GAM": "Generalized Additive Model",
-            "AVM": "Automated Valuation Model",
-            "UAD": "Uniform Appraisal Dataset",
-            "MLS": "Multiple Listing Service",
-            "NeRF": "Neural Radiance Field",
-            "LSTM": "Long Short-Term Memory",
-            "GRU": "Gated Recurrent Unit",
-            "CNN": "Convolutional Neural Network",
-            "RNN": "Recurrent Neural Network",
-            "GAN": "Generative Adversarial Network",
-            "VAE": "Variational Autoencoder",
-            "SVM": "Support Vector Machine",
-            "KNN": "K-Nearest Neighbors",
-            "PCA": "Principal Component Analysis",
-            "API": "Application Programming Interface",
-            "REST": "Representational State Transfer",
-            "CRUD": "Create, Read, Update, Delete",
-            "SDK": "Software Development Kit",
-            "IDE": "Integrated Development Environment",
-            "CLI": "Command Line Interface",
-            "GUI": "Graphical User Interface",
-        }
-
-        return known_abbreviations.get(abbr)
+        return KNOWN_DEFINITIONS.get(abbr)
 
 
 def check_abbreviations(
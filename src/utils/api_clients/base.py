@@ -1,11 +1,11 @@
 """Base API client with rate limiting and caching."""
 
-import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
 from ...utils.cache import get_cache_path, load_from_cache, save_to_cache
+from ...utils.rate_limiter import get_rate_limiter
 
 
 class APIClient(ABC):
@@ -15,8 +15,13 @@ class APIClient(ABC):
     - Rate limiting to respect API quotas
     - Response caching to reduce API calls
     - Error handling and retries
+
+    Subclasses should set ``base_url`` so the rate limit is shared with
+    every other client talking to the same host.
     """
 
+    base_url: str = ""
+
     def __init__(
         self,
         rate_limit: float = 1.0,
@@ -26,21 +31,23 @@ class APIClient(ABC):
         """Initialize API client.
 
         Args:
-            rate_limit: Minimum seconds between API calls
+            rate_limit: Minimum seconds between API calls to the same host
             cache_enabled: Whether to enable response caching
             cache_dir: Directory for cache files (uses default if None)
         """
         self.rate_limit = rate_limit
         self.cache_enabled = cache_enabled
         self.cache_dir = cache_dir or get_cache_path()
-        self._last_request = 0.0
+        self.rate_limiter = get_rate_limiter()
+
+    def _rate_limit_url(self) -> str:
+        """Get the URL whose host is used as the rate limiting key."""
+        # Fall back to a per-class pseudo host for clients without a base URL
+        return self.base_url or f"//{self.__class__.__name__}"
 
     def _rate_limit_wait(self) -> None:
         """Wait if necessary to respect rate limit."""
-        elapsed = time.time() - self._last_request
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request = time.time()
+        self.rate_limiter.wait(self._rate_limit_url(), delay=self.rate_limit)
 
     def _get_cache_key(self, endpoint: str, params: dict[str, Any]) -> str:
         """Generate cache key for request.
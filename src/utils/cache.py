@@ -13,15 +13,52 @@ import logging
 # import re  # Banned - using string methods instead
 import shutil
 import sqlite3
+import threading
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+from .identifiers import extract_doi
+
 logger = logging.getLogger(__name__)
 
+# SQLite limits the number of host parameters per statement (999 on older
+# builds); bulk lookups are chunked below that
+SQLITE_MAX_PARAMS = 900
+
+# Statements are kept as constants so sqlite3's per-connection statement
+# cache reuses the prepared statement on the long-lived connections
+_SELECT_BY_HASH = """
+    SELECT * FROM cache_entries
+    WHERE url_hash = ? AND timestamp > ?
+    ORDER BY timestamp DESC
+    LIMIT 1
+"""
+_SELECT_BY_DOI = """
+    SELECT * FROM cache_entries
+    WHERE doi = ? AND timestamp > ?
+    ORDER BY timestamp DESC
+    LIMIT 1
+"""
+# Automatic backups: a full copy every FULL_BACKUP_INTERVAL, otherwise a
+# changeset with the rows changed since the previous snapshot
+BACKUP_INTERVAL = 24 * 3600
+FULL_BACKUP_INTERVAL = 7 * 24 * 3600
+# Changesets overlap the previous snapshot slightly so rows committed while
+# it was being taken are not missed (re-applying a row is harmless)
+BACKUP_OVERLAP_SECONDS = 60.0
+
+_INSERT_ENTRY = """
+    INSERT OR REPLACE INTO cache_entries
+    (url, normalized_url, url_hash, doi, bibtex_data, error_message,
+     timestamp, response_headers)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 @dataclass
 class CacheEntry:
@@ -43,17 +80,25 @@ class BiblioCache:
     Features:
     - URL normalization and DOI extraction
     - Duplicate detection across different URL formats
-    - SQLite storage for persistence
+    - SQLite storage for persistence (WAL mode, one connection per thread)
     - Configurable cache expiry
+    - Bulk get_many/put_many for batch runs
     """
 
-    def __init__(self, cache_dir: Path | None = None, cache_ttl_days: int = 30):
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        cache_ttl_days: int = 30,
+        auto_backup: bool = True,
+    ):
         """
         Initialize the cache.
 
         Args:
             cache_dir: Directory to store cache database. Defaults to ~/.deep-biblio-cache
             cache_ttl_days: Number of days to keep cached entries
+            auto_backup: Take the daily automatic backup in a background
+                thread when one is due
         """
         if cache_dir is None:
             cache_dir = Path.home() / ".deep-biblio-cache"
@@ -65,12 +110,67 @@ class BiblioCache:
         self.backup_dir.mkdir(exist_ok=True)
         self.cache_ttl_seconds = cache_ttl_days * 24 * 3600
 
+        # Long-lived connections, one per thread (sqlite3 connections must
+        # not be used concurrently from several threads)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._backup_thread: threading.Thread | None = None
+
         self._init_database()
-        self._create_automatic_backup()
+        if auto_backup:
+            self._start_automatic_backup()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's persistent database connection.
+
+        The connection is opened on first use in WAL mode so readers in other
+        threads or processes are not blocked by writers. Use it as a context
+        manager to run statements in a transaction.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        # check_same_thread=False only so close() may close connections
+        # opened by worker threads; each connection is still used by one thread
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=30.0,
+            check_same_thread=False,
+            cached_statements=128,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Durable at checkpoints, no fsync per committed row
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        self._local.conn = conn
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close all database connections opened by this cache"""
+        self.wait_for_backup()
+
+        with self._connections_lock:
+            connections = self._connections
+            self._connections = []
+            # Connections of other threads are dropped lazily: a fresh
+            # thread-local namespace makes every thread reconnect
+            self._local = threading.local()
+
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.debug(f"Failed to close cache connection: {e}")
 
     def _init_database(self):
         """Initialize the SQLite database schema"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache_entries (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -102,6 +202,31 @@ class BiblioCache:
                 ON cache_entries(timestamp)
             """)
 
+            # Deletions are logged so incremental backups can replay them.
+            # INSERT OR REPLACE doesn't fire delete triggers (recursive
+            # triggers are off), only real deletions are recorded.
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_deletions (
+                    url_hash TEXT NOT NULL,
+                    deleted_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_deleted_at
+                ON cache_deletions(deleted_at)
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS log_cache_deletion
+                AFTER DELETE ON cache_entries
+                BEGIN
+                    INSERT INTO cache_deletions (url_hash, deleted_at)
+                    VALUES (
+                        OLD.url_hash,
+                        (julianday('now') - 2440587.5) * 86400.0
+                    );
+                END
+            """)
+
     def normalize_url(self, url: str) -> tuple[str, str | None]:
         """
         Normalize URL and extract DOI if present.
@@ -119,144 +244,48 @@ class BiblioCache:
         if doi:
             normalized_url = f"https://doi.org/{doi}"
         else:
-            # Normalize the URL by removing common tracking parameters
-            parsed = urlparse(url)
-            # Remove common tracking parameters
-            normalized_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-            if parsed.query:
-                # Keep query parameters but remove tracking ones
-                query_params = []
-                for param in parsed.query.split("&"):
-                    if not any(
-                        tracker in param.lower()
-                        for tracker in ["utm_", "fbclid", "gclid", "_ga", "ref"]
-                    ):
-                        query_params.append(param)
-                if query_params:
-                    normalized_url += "?" + "&".join(query_params)
+            normalized_url = self._strip_tracking_params(url)
 
         return normalized_url, doi
 
-    def _extract_doi_from_url(self, url: str) -> str | None:
-        """Extract DOI from various URL formats"""
-        # Direct DOI URLs - check using string methods
-        url_lower = url.lower()
-
-        # Check for doi.org URLs
-        if "doi.org/" in url_lower:
-            # Find position after doi.org/
-            doi_pos = url_lower.find("doi.org/") + 8
-            if doi_pos < len(url):
-                # Check for dx.doi.org redirect chains
-                if url[doi_pos : doi_pos + 11] == "dx.doi.org/":
-                    doi_pos += 11
-
-                # Extract DOI starting with 10.
-                if url[doi_pos : doi_pos + 3] == "10.":
-                    # Find end of DOI (ends at ?, #, or end of string)
-                    end_pos = len(url)
-                    for char in ["?", "#", " "]:
-                        pos = url.find(char, doi_pos)
-                        if pos != -1 and pos < end_pos:
-                            end_pos = pos
-
-                    doi = url[doi_pos:end_pos].rstrip("/")
-                    return doi
-
-        # Check for dx.doi.org URLs
-        if "dx.doi.org/" in url_lower:
-            doi_pos = url_lower.find("dx.doi.org/") + 11
-            if doi_pos < len(url) and url[doi_pos : doi_pos + 3] == "10.":
-                # Find end of DOI
-                end_pos = len(url)
-                for char in ["?", "#", " "]:
-                    pos = url.find(char, doi_pos)
-                    if pos != -1 and pos < end_pos:
-                        end_pos = pos
-
-                doi = url[doi_pos:end_pos].rstrip("/")
-                return doi
-
-        # Check for /doi/ paths
-        if "/doi/" in url_lower:
-            doi_pos = url_lower.find("/doi/") + 5
-            # Skip optional abs/ or full/
-            if url[doi_pos : doi_pos + 4] == "abs/":
-                doi_pos += 4
-            elif url[doi_pos : doi_pos + 5] == "full/":
-                doi_pos += 5
-
-            # Check if it starts with 10.
-            if doi_pos + 3 <= len(url) and url[doi_pos : doi_pos + 3] == "10.":
-                # Find end of DOI
-                end_pos = len(url)
-                for char in ["?", "#", " "]:
-                    pos = url.find(char, doi_pos)
-                    if pos != -1 and pos < end_pos:
-                        end_pos = pos
-
-                doi = url[doi_pos:end_pos].rstrip("/")
-                return doi
-
-        # Check for doi: or doi= in query parameters
-        for prefix in ["doi:", "doi="]:
-            if prefix in url_lower:
-                doi_pos = url_lower.find(prefix) + len(prefix)
-                if (
-                    doi_pos + 3 <= len(url)
-                    and url[doi_pos : doi_pos + 3] == "10."
+    def _strip_tracking_params(self, url: str) -> str:
+        """Normalize the URL by removing common tracking parameters"""
+        parsed = urlparse(url)
+        normalized_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        if parsed.query:
+            # Keep query parameters but remove tracking ones
+            query_params = []
+            for param in parsed.query.split("&"):
+                if not any(
+                    tracker in param.lower()
+                    for tracker in ["utm_", "fbclid", "gclid", "_ga", "ref"]
                 ):
-                    # Find end of DOI
-                    end_pos = len(url)
-                    for char in ["&", "?", "#", " "]:
-                        pos = url.find(char, doi_pos)
-                        if pos != -1 and pos < end_pos:
-                            end_pos = pos
-
-                    doi = url[doi_pos:end_pos].rstrip("/")
-                    return doi
-
-        # Check if URL belongs to known publishers using string methods
-        if "sciencedirect.com/science/article/" in url_lower:
-            # ScienceDirect PII format
-            return None
-
-        if "link.springer.com/" in url_lower and any(
-            x in url_lower for x in ["/article/", "/book/", "/chapter/"]
-        ):
-            # Springer content
-            return None
-
-        if "ieeexplore.ieee.org/document/" in url_lower:
-            # IEEE document
-            return None
-
-        if "nature.com/articles/" in url_lower:
-            # Nature articles
-            return None
-
-        if "wiley.com/doi/" in url_lower:
-            # Wiley might have DOI in URL
-            doi_pos = url_lower.find("/doi/") + 5
-            # Skip optional abs/ or full/
-            if url[doi_pos : doi_pos + 4] == "abs/":
-                doi_pos += 4
-            elif url[doi_pos : doi_pos + 5] == "full/":
-                doi_pos += 5
-
-            # Check if it starts with 10.
-            if doi_pos + 3 <= len(url) and url[doi_pos : doi_pos + 3] == "10.":
-                # Find end of DOI
-                end_pos = len(url)
-                for char in ["?", "#", " "]:
-                    pos = url.find(char, doi_pos)
-                    if pos != -1 and pos < end_pos:
-                        end_pos = pos
-
-                doi = url[doi_pos:end_pos].rstrip("/")
-                return doi
+                    query_params.append(param)
+            if query_params:
+                normalized_url += "?" + "&".join(query_params)
+        return normalized_url
 
-        return None
+    def _lookup_hashes(self, url: str) -> tuple[list[str], str | None]:
+        """
+        URL hashes an entry for the URL may be stored under, and its DOI.
+
+        Publisher PDF paths such as /doi/pdf/10... and /doi/epdf/10... were
+        not recognized as DOIs before identifiers.extract_doi was shared,
+        so their entries from then are keyed by the plain URL.
+        """
+        normalized_url, doi = self.normalize_url(url)
+        hashes = [self._generate_url_hash(normalized_url)]
+        if doi:
+            hashes.append(
+                self._generate_url_hash(
+                    self._strip_tracking_params(url.strip())
+                )
+            )
+        return hashes, doi
+
+    def _extract_doi_from_url(self, url: str) -> str | None:
+        """Extract DOI from various URL formats"""
+        return extract_doi(url)
 
     def _generate_url_hash(self, normalized_url: str) -> str:
         """Generate a hash for the normalized URL for efficient lookups"""
@@ -272,38 +301,27 @@ class BiblioCache:
         Returns:
             CacheEntry if found and not expired, None otherwise
         """
-        normalized_url, doi = self.normalize_url(url)
-        url_hash = self._generate_url_hash(normalized_url)
+        url_hashes, doi = self._lookup_hashes(url)
 
         current_time = time.time()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
+        conn = self._get_connection()
+        with conn:
             # First try exact URL hash match
-            cursor = conn.execute(
-                """
-                SELECT * FROM cache_entries
-                WHERE url_hash = ? AND timestamp > ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-            """,
-                (url_hash, current_time - self.cache_ttl_seconds),
-            )
+            for url_hash in url_hashes:
+                cursor = conn.execute(
+                    _SELECT_BY_HASH,
+                    (url_hash, current_time - self.cache_ttl_seconds),
+                )
 
-            row = cursor.fetchone()
-            if row:
-                return self._row_to_cache_entry(row)
+                row = cursor.fetchone()
+                if row:
+                    return self._row_to_cache_entry(row)
 
             # If we have a DOI, also try DOI-based lookup
             if doi:
                 cursor = conn.execute(
-                    """
-                    SELECT * FROM cache_entries
-                    WHERE doi = ? AND timestamp > ?
-                    ORDER BY timestamp DESC
-                    LIMIT 1
-                """,
+                    _SELECT_BY_DOI,
                     (doi, current_time - self.cache_ttl_seconds),
                 )
 
@@ -329,32 +347,137 @@ class BiblioCache:
             error_message: Error message (if failed)
             response_headers: HTTP response headers
         """
-        normalized_url, doi = self.normalize_url(url)
-        url_hash = self._generate_url_hash(normalized_url)
-        current_time = time.time()
+        row = self._entry_to_row(
+            url, bibtex_data, error_message, response_headers, time.time()
+        )
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             # Use INSERT OR REPLACE to handle duplicates
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO cache_entries
-                (url, normalized_url, url_hash, doi, bibtex_data, error_message,
-                 timestamp, response_headers)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    url,
-                    normalized_url,
-                    url_hash,
-                    doi,
-                    json.dumps(bibtex_data) if bibtex_data else None,
-                    error_message,
-                    current_time,
-                    json.dumps(response_headers) if response_headers else None,
-                ),
+            conn.execute(_INSERT_ENTRY, row)
+
+        logger.debug(f"Cached entry for {url} -> {row[1]} (DOI: {row[3]})")
+
+    def put_many(self, entries: Iterable[dict[str, Any]]) -> int:
+        """
+        Store several entries in a single transaction.
+
+        Args:
+            entries: Dicts with a "url" key and optionally "bibtex_data",
+                "error_message" and "response_headers" (same as put())
+
+        Returns:
+            Number of entries stored
+        """
+        current_time = time.time()
+        rows = [
+            self._entry_to_row(
+                entry["url"],
+                entry.get("bibtex_data"),
+                entry.get("error_message"),
+                entry.get("response_headers"),
+                current_time,
             )
+            for entry in entries
+        ]
+        if not rows:
+            return 0
+
+        with self._get_connection() as conn:
+            conn.executemany(_INSERT_ENTRY, rows)
 
-        logger.debug(f"Cached entry for {url} -> {normalized_url} (DOI: {doi})")
+        logger.debug(f"Cached {len(rows)} entries in one transaction")
+        return len(rows)
+
+    def get_many(self, urls: Iterable[str]) -> dict[str, CacheEntry]:
+        """
+        Look up several URLs at once.
+
+        Args:
+            urls: URLs to look up
+
+        Returns:
+            Dict mapping each URL found (and not expired) to its CacheEntry
+        """
+        # Same matching rules as get(): URL hash first, then DOI
+        lookups = {url: self._lookup_hashes(url) for url in dict.fromkeys(urls)}
+        if not lookups:
+            return {}
+
+        min_timestamp = time.time() - self.cache_ttl_seconds
+        conn = self._get_connection()
+        with conn:
+            by_hash = self._select_latest(
+                conn,
+                "url_hash",
+                [h for hashes, _ in lookups.values() for h in hashes],
+                min_timestamp,
+            )
+            missing_dois = [
+                doi
+                for hashes, doi in lookups.values()
+                if doi and not any(h in by_hash for h in hashes)
+            ]
+            by_doi = self._select_latest(
+                conn, "doi", missing_dois, min_timestamp
+            )
+
+        results = {}
+        for url, (hashes, doi) in lookups.items():
+            row = next((by_hash[h] for h in hashes if h in by_hash), None)
+            if row is None and doi:
+                row = by_doi.get(doi)
+            if row is not None:
+                results[url] = self._row_to_cache_entry(row)
+        return results
+
+    def _select_latest(
+        self,
+        conn: sqlite3.Connection,
+        column: str,
+        keys: list[str],
+        min_timestamp: float,
+    ) -> dict[str, sqlite3.Row]:
+        """Fetch the newest unexpired row for each key of an indexed column"""
+        latest: dict[str, sqlite3.Row] = {}
+        keys = list(dict.fromkeys(keys))
+        for start in range(0, len(keys), SQLITE_MAX_PARAMS):
+            chunk = keys[start : start + SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            # column is one of our own column names, never user input
+            cursor = conn.execute(
+                f"SELECT * FROM cache_entries "
+                f"WHERE {column} IN ({placeholders}) AND timestamp > ?",
+                (*chunk, min_timestamp),
+            )
+            for row in cursor:
+                key = row[column]
+                if (
+                    key not in latest
+                    or row["timestamp"] > latest[key]["timestamp"]
+                ):
+                    latest[key] = row
+        return latest
+
+    def _entry_to_row(
+        self,
+        url: str,
+        bibtex_data: dict | None,
+        error_message: str | None,
+        response_headers: dict | None,
+        timestamp: float,
+    ) -> tuple:
+        """Build the parameters for _INSERT_ENTRY"""
+        normalized_url, doi = self.normalize_url(url)
+        return (
+            url,
+            normalized_url,
+            self._generate_url_hash(normalized_url),
+            doi,
+            json.dumps(bibtex_data) if bibtex_data else None,
+            error_message,
+            timestamp,
+            json.dumps(response_headers) if response_headers else None,
+        )
 
     def _row_to_cache_entry(self, row: sqlite3.Row) -> CacheEntry:
         """Convert database row to CacheEntry"""
@@ -382,7 +505,7 @@ class BiblioCache:
         current_time = time.time()
         expired_threshold = current_time - self.cache_ttl_seconds
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute(
                 """
                 DELETE FROM cache_entries
@@ -400,7 +523,7 @@ class BiblioCache:
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute("SELECT COUNT(*) as total FROM cache_entries")
             total = cursor.fetchone()[0]
 
@@ -458,35 +581,68 @@ class BiblioCache:
                 f"Created backup before clearing cache: {backup_file}"
             )
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute("DELETE FROM cache_entries")
             removed_count = cursor.rowcount
 
         logger.info(f"Cleared all {removed_count} cache entries")
         return removed_count
 
+    def _start_automatic_backup(self) -> None:
+        """Take the automatic backup in a background thread if one is due"""
+        if not self._is_backup_due():
+            return
+
+        # Not a daemon thread: an interrupted copy would leave a broken
+        # backup, so the interpreter waits for it at exit instead
+        self._backup_thread = threading.Thread(
+            target=self._run_automatic_backup, name="biblio-cache-backup"
+        )
+        self._backup_thread.start()
+
+    def _run_automatic_backup(self) -> None:
+        """Background thread body, errors must not reach the caller"""
+        try:
+            self._create_automatic_backup()
+        except Exception as e:
+            logger.warning(f"Automatic cache backup failed: {e}")
+
+    def wait_for_backup(self, timeout: float | None = None) -> None:
+        """Wait for a running automatic backup to finish"""
+        thread = self._backup_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _is_backup_due(self) -> bool:
+        """Check whether the latest snapshot is older than BACKUP_INTERVAL"""
+        snapshots = self._list_snapshots()
+        if not snapshots:
+            return True
+        latest_time = self._read_backup_meta(snapshots[-1])["snapshot_time"]
+        return time.time() - latest_time > BACKUP_INTERVAL
+
     def _create_automatic_backup(self) -> None:
-        """Create automatic backup if database exists and was modified recently"""
-        if not self.db_path.exists():
+        """Create the automatic backup: a changeset, or a full copy weekly"""
+        if not self.db_path.exists() or not self._is_backup_due():
             return
 
-        # Get the most recent backup
-        backup_files = sorted(self.backup_dir.glob("cache_backup_*.db"))
-        if not backup_files:
-            # No backups exist, create one
+        full_backups = sorted(
+            self.backup_dir.glob("cache_backup_*.db"),
+            key=lambda x: x.stat().st_mtime,
+        )
+        if not full_backups:
             self.create_backup()
             return
 
-        latest_backup = backup_files[-1]
-        backup_time = datetime.fromtimestamp(latest_backup.stat().st_mtime)
-
-        # Create backup if latest is older than 24 hours
-        if (datetime.now() - backup_time).total_seconds() > 24 * 3600:
+        latest_full = self._read_backup_meta(full_backups[-1])
+        if time.time() - latest_full["snapshot_time"] > FULL_BACKUP_INTERVAL:
             self.create_backup()
+        else:
+            self.create_incremental_backup()
 
     def create_backup(self, backup_name: str | None = None) -> Path:
         """
-        Create a backup of the cache database.
+        Create a full backup of the cache database.
 
         Args:
             backup_name: Optional custom name for backup
@@ -502,19 +658,156 @@ class BiblioCache:
             backup_name = f"cache_backup_{timestamp}.db"
 
         backup_path = self.backup_dir / backup_name
+        snapshot_time = time.time()
 
-        # Use SQLite backup API for consistency
-        with sqlite3.connect(self.db_path) as source:
-            with sqlite3.connect(backup_path) as backup:
-                source.backup(backup)
+        # Use SQLite backup API for consistency (includes WAL contents)
+        backup = sqlite3.connect(backup_path)
+        try:
+            self._get_connection().backup(backup)
+            with backup:
+                self._write_backup_meta(
+                    backup, {"type": "full", "snapshot_time": snapshot_time}
+                )
+        finally:
+            backup.close()
 
         logger.info(f"Created cache backup: {backup_path}")
 
-        # Cleanup old backups (keep last 10)
+        # Cleanup old backups
         self._cleanup_old_backups()
 
         return backup_path
 
+    def create_incremental_backup(self) -> Path:
+        """
+        Create a changeset backup with the rows changed since the previous
+        snapshot (full backup or changeset).
+
+        Falls back to a full backup if there is none to build on.
+
+        Returns:
+            Path to the created backup file
+        """
+        full_backups = sorted(
+            self.backup_dir.glob("cache_backup_*.db"),
+            key=lambda x: x.stat().st_mtime,
+        )
+        if not full_backups:
+            return self.create_backup()
+
+        base = full_backups[-1]
+        chain = [base] + self._list_changesets(base.name)
+        since = (
+            self._read_backup_meta(chain[-1])["snapshot_time"]
+            - BACKUP_OVERLAP_SECONDS
+        )
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        backup_path = self.backup_dir / f"cache_changes_{timestamp}.db"
+        snapshot_time = time.time()
+
+        conn = self._get_connection()
+        conn.execute("ATTACH DATABASE ? AS changes", (str(backup_path),))
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE changes.cache_entries AS
+                    SELECT * FROM main.cache_entries WHERE timestamp > ?
+                """,
+                    (since,),
+                )
+                conn.execute(
+                    """
+                    CREATE TABLE changes.cache_deletions AS
+                    SELECT * FROM main.cache_deletions WHERE deleted_at > ?
+                """,
+                    (since,),
+                )
+                changed = conn.execute(
+                    "SELECT COUNT(*) FROM changes.cache_entries"
+                ).fetchone()[0]
+                conn.execute(
+                    "CREATE TABLE changes.backup_meta "
+                    "(key TEXT PRIMARY KEY, value TEXT)"
+                )
+                conn.executemany(
+                    "INSERT INTO changes.backup_meta VALUES (?, ?)",
+                    [
+                        ("type", "changes"),
+                        ("base", base.name),
+                        ("since", str(since)),
+                        ("snapshot_time", str(snapshot_time)),
+                    ],
+                )
+        finally:
+            conn.execute("DETACH DATABASE changes")
+
+        logger.info(
+            f"Created incremental cache backup: {backup_path} "
+            f"({changed} changed entries since {base.name})"
+        )
+        return backup_path
+
+    def _write_backup_meta(
+        self, conn: sqlite3.Connection, meta: dict[str, Any]
+    ) -> None:
+        """Store snapshot metadata inside a backup file"""
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS backup_meta "
+            "(key TEXT PRIMARY KEY, value TEXT)"
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO backup_meta VALUES (?, ?)",
+            [(key, str(value)) for key, value in meta.items()],
+        )
+
+    def _read_backup_meta(self, backup_path: Path) -> dict[str, Any]:
+        """
+        Read snapshot metadata from a backup file.
+
+        Backups made before metadata was recorded fall back to the file's
+        modification time as their snapshot time.
+        """
+        meta: dict[str, Any] = {}
+        try:
+            conn = sqlite3.connect(
+                f"{backup_path.resolve().as_uri()}?mode=ro", uri=True
+            )
+            try:
+                meta = dict(
+                    conn.execute(
+                        "SELECT key, value FROM backup_meta"
+                    ).fetchall()
+                )
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+        is_changes = backup_path.name.startswith("cache_changes_")
+        meta.setdefault("type", "changes" if is_changes else "full")
+        try:
+            meta["snapshot_time"] = float(meta["snapshot_time"])
+        except (KeyError, ValueError):
+            meta["snapshot_time"] = backup_path.stat().st_mtime
+        return meta
+
+    def _list_snapshots(self) -> list[Path]:
+        """List automatic full backups and changesets, oldest first"""
+        snapshots = list(self.backup_dir.glob("cache_backup_*.db"))
+        snapshots += list(self.backup_dir.glob("cache_changes_*.db"))
+        return sorted(snapshots, key=lambda x: x.stat().st_mtime)
+
+    def _list_changesets(self, base_name: str) -> list[Path]:
+        """List the changesets built on a full backup, oldest first"""
+        changesets = [
+            (meta["snapshot_time"], path)
+            for path in self.backup_dir.glob("cache_changes_*.db")
+            if (meta := self._read_backup_meta(path)).get("base") == base_name
+        ]
+        return [path for _, path in sorted(changesets)]
+
     def restore_backup(self, backup_path: Path) -> None:
         """
         Restore cache from backup.
@@ -525,20 +818,78 @@ class BiblioCache:
         if not backup_path.exists():
             raise ValueError(f"Backup file does not exist: {backup_path}")
 
+        # A changeset is restored by replaying its chain onto the full backup
+        changesets: list[Path] = []
+        meta = self._read_backup_meta(backup_path)
+        if meta["type"] == "changes":
+            base_path = self.backup_dir / meta.get("base", "")
+            if not base_path.is_file():
+                raise ValueError(
+                    f"Full backup for changeset is missing: {base_path}"
+                )
+            changesets = [
+                path
+                for path in self._list_changesets(base_path.name)
+                if self._read_backup_meta(path)["snapshot_time"]
+                <= meta["snapshot_time"]
+            ]
+            backup_path = base_path
+
         # Create safety backup of current state
         current_backup = self.create_backup("pre_restore_backup.db")
         logger.info(f"Created safety backup before restore: {current_backup}")
 
+        # Open connections and their WAL would shadow the copied file
+        self.close()
+        self._remove_wal_files()
+
         try:
             # Restore from backup
             shutil.copy2(backup_path, self.db_path)
+            with self._get_connection() as conn:
+                conn.execute("DROP TABLE IF EXISTS backup_meta")
+                for changeset in changesets:
+                    self._apply_changeset(conn, changeset)
             logger.info(f"Restored cache from backup: {backup_path}")
+            if changesets:
+                logger.info(f"Applied {len(changesets)} incremental backups")
         except Exception as e:
             # Restore the safety backup if restore failed
+            self.close()
+            self._remove_wal_files()
             shutil.copy2(current_backup, self.db_path)
             logger.error(f"Restore failed, rolled back to previous state: {e}")
             raise
 
+    def _apply_changeset(self, conn: sqlite3.Connection, path: Path) -> None:
+        """Replay one changeset onto the database"""
+        conn.execute("ATTACH DATABASE ? AS changes", (str(path),))
+        try:
+            # Deletions first: rows deleted and re-added in the same window
+            # are present in the changeset's entries
+            conn.execute("""
+                DELETE FROM main.cache_entries WHERE url_hash IN
+                (SELECT url_hash FROM changes.cache_deletions)
+            """)
+            conn.execute("""
+                INSERT OR REPLACE INTO main.cache_entries
+                (url, normalized_url, url_hash, doi, bibtex_data,
+                 error_message, timestamp, response_headers, created_at)
+                SELECT url, normalized_url, url_hash, doi, bibtex_data,
+                       error_message, timestamp, response_headers, created_at
+                FROM changes.cache_entries
+            """)
+            conn.commit()
+        finally:
+            conn.execute("DETACH DATABASE changes")
+
+    def _remove_wal_files(self) -> None:
+        """Remove leftover WAL/shared-memory files next to the database"""
+        for suffix in ("-wal", "-shm"):
+            wal_file = self.db_path.with_name(self.db_path.name + suffix)
+            if wal_file.exists():
+                wal_file.unlink()
+
     def list_backups(self) -> list[dict]:
         """
         List available backups.
@@ -556,28 +907,54 @@ class BiblioCache:
                     "size_mb": stat.st_size / (1024 * 1024),
                     "created": datetime.fromtimestamp(stat.st_mtime),
                     "is_automatic": backup_file.name.startswith(
-                        "cache_backup_"
+                        ("cache_backup_", "cache_changes_")
+                    ),
+                    "is_incremental": backup_file.name.startswith(
+                        "cache_changes_"
                     ),
                 }
             )
         return backups
 
-    def _cleanup_old_backups(self, keep_count: int = 10) -> None:
-        """Clean up old automatic backups, keeping the most recent ones"""
+    def _cleanup_old_backups(self, keep_count: int = 3) -> None:
+        """
+        Clean up old automatic backups.
+
+        Keeps the most recent full backups together with their changesets,
+        and prunes the deletion log that is no longer needed by any of them.
+        """
         automatic_backups = sorted(
             [f for f in self.backup_dir.glob("cache_backup_*.db")],
             key=lambda x: x.stat().st_mtime,
             reverse=True,
         )
+        kept = {backup.name for backup in automatic_backups[:keep_count]}
+
+        # Remove old backups beyond keep_count, and changesets without base
+        old_backups = automatic_backups[keep_count:]
+        for changeset in self.backup_dir.glob("cache_changes_*.db"):
+            if self._read_backup_meta(changeset).get("base") not in kept:
+                old_backups.append(changeset)
 
-        # Remove old backups beyond keep_count
-        for old_backup in automatic_backups[keep_count:]:
+        for old_backup in old_backups:
             try:
                 old_backup.unlink()
                 logger.debug(f"Removed old backup: {old_backup}")
             except Exception as e:
                 logger.warning(f"Failed to remove old backup {old_backup}: {e}")
 
+        if automatic_backups:
+            oldest = automatic_backups[: keep_count or 1][-1]
+            threshold = (
+                self._read_backup_meta(oldest)["snapshot_time"]
+                - BACKUP_OVERLAP_SECONDS
+            )
+            with self._get_connection() as conn:
+                conn.execute(
+                    "DELETE FROM cache_deletions WHERE deleted_at < ?",
+                    (threshold,),
+                )
+
     def add_manual_entry(
         self,
         url: str,
@@ -638,9 +1015,7 @@ class BiblioCache:
         """
         current_time = time.time()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
+        with self._get_connection() as conn:
             query = """
                 SELECT * FROM cache_entries
                 WHERE error_message IS NOT NULL
@@ -679,7 +1054,7 @@ class BiblioCache:
         normalized_url, doi = self.normalize_url(url)
         url_hash = hashlib.sha256(normalized_url.encode()).hexdigest()
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             # Remove by URL hash
             cursor = conn.execute(
                 "DELETE FROM cache_entries WHERE url_hash = ?", (url_hash,)
@@ -5,11 +5,15 @@ This module helps locate where specific URLs are cited in markdown documents,
 providing the surrounding context to help understand what citation is needed.
 """
 
+import hashlib
+import json
 import logging
 
 # import re  # Banned - using string methods instead
 from pathlib import Path
 
+from .storage import atomic_write
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,22 +40,52 @@ class CitationContext:
         return f"CitationContext(file={Path(self.file_path).name}, line={self.line_number}, citation='{self.citation_text}')"
 
 
+# Bump when the layout of the on-disk index changes
+INDEX_VERSION = 1
+
+
 class CitationContextFinder:
-    """Find where citations are used in markdown files."""
+    """Find where citations are used in markdown files.
 
-    def __init__(self, search_dirs: list[str] = None):
+    All markdown files are scanned once into an index from normalized URL to
+    the links citing it, so looking up many URLs costs one pass over the
+    corpus. The index is saved to disk and refreshed incrementally: only files
+    whose mtime or size changed are read again, and only those whose content
+    hash changed are rescanned.
+    """
+
+    def __init__(
+        self,
+        search_dirs: list[str] = None,
+        index_path: Path | str | None = None,
+    ):
         """
         Initialize the context finder.
 
         Args:
             search_dirs: List of directories to search for markdown files.
                         Defaults to ['data/', 'docs/']
+            index_path: File for the persisted link index.
+                        Defaults to ~/.deep-biblio-cache/citation_context_index.json
         """
         if search_dirs is None:
             search_dirs = ["data/", "docs/"]
 
         self.search_dirs = [Path(d) for d in search_dirs if Path(d).exists()]
 
+        if index_path is None:
+            index_path = (
+                Path.home()
+                / ".deep-biblio-cache"
+                / "citation_context_index.json"
+            )
+        self.index_path = Path(index_path)
+
+        # Absolute file path -> {"mtime_ns", "size", "hash", "links"}
+        self._files: dict[str, dict] | None = None
+        # Normalized URL -> [(display path, link record), ...]
+        self._url_index: dict[str, list[tuple[str, list]]] = {}
+
     def find_markdown_files(self) -> list[Path]:
         """Find all markdown files in search directories."""
         md_files = []
@@ -83,90 +117,203 @@ class CitationContextFinder:
         Returns:
             List of CitationContext objects
         """
-        contexts = []
-        md_files = self.find_markdown_files()
+        self.refresh_index()
+        return self._lookup(target_url, context_chars)
+
+    def refresh_index(self) -> int:
+        """
+        Bring the link index up to date with the markdown files.
+
+        Returns:
+            Number of files that were (re)scanned
+        """
+        if self._files is None:
+            self._files = self._load_index()
 
-        # Normalize the target URL for comparison
-        normalized_target = self._normalize_url(target_url)
+        md_files = self.find_markdown_files()
+        scanned = 0
+        changed = False
+        current = {}
 
         for md_file in md_files:
+            key = str(md_file.resolve())
+            current[key] = str(md_file)
+            entry = self._files.get(key)
             try:
-                with open(md_file, encoding="utf-8") as f:
-                    content = f.read()
-                    lines = content.split("\n")
-
-                # Find markdown links: [text](url) using string methods
-                for line_num, line in enumerate(lines, 1):
-                    # Find all markdown links in the line
-                    i = 0
-                    while i < len(line):
-                        # Look for opening [
-                        bracket_start = line.find("[", i)
-                        if bracket_start == -1:
-                            break
-
-                        # Find closing ]
-                        bracket_end = line.find("]", bracket_start + 1)
-                        if bracket_end == -1:
-                            i = bracket_start + 1
-                            continue
-
-                        # Check if followed by (
-                        if (
-                            bracket_end + 1 < len(line)
-                            and line[bracket_end + 1] == "("
-                        ):
-                            # Find closing )
-                            paren_end = line.find(")", bracket_end + 2)
-                            if paren_end == -1:
-                                i = bracket_end + 1
-                                continue
-
-                            # Extract text and URL
-                            citation_text = line[
-                                bracket_start + 1 : bracket_end
-                            ]
-                            url = line[bracket_end + 2 : paren_end]
-
-                            # Check if this URL matches our target
-                            if self._normalize_url(url) == normalized_target:
-                                # Extract context
-                                start_pos = max(
-                                    0, bracket_start - context_chars
-                                )
-                                end_pos = min(
-                                    len(line), paren_end + 1 + context_chars
-                                )
-
-                                text_before = line[start_pos:bracket_start]
-                                text_after = line[paren_end + 1 : end_pos]
-
-                                # Clean up context
-                                if start_pos > 0:
-                                    text_before = "..." + text_before.lstrip()
-                                if end_pos < len(line):
-                                    text_after = text_after.rstrip() + "..."
-
-                                context = CitationContext(
-                                    file_path=str(md_file),
-                                    line_number=line_num,
-                                    text_before=text_before,
-                                    citation_text=citation_text,
-                                    text_after=text_after,
-                                    full_line=line.strip(),
-                                )
-                                contexts.append(context)
-
-                            # Move past this link
-                            i = paren_end + 1
-                        else:
-                            i = bracket_end + 1
-
-            except Exception as e:
+                stat = md_file.stat()
+                if (
+                    entry is not None
+                    and entry["mtime_ns"] == stat.st_mtime_ns
+                    and entry["size"] == stat.st_size
+                ):
+                    continue
+
+                raw = md_file.read_bytes()
+                # Detects real changes behind a new mtime
+                digest = hashlib.sha256(raw).hexdigest()
+                if entry is None or entry["hash"] != digest:
+                    # Universal newlines, as when reading in text mode
+                    content = (
+                        raw.decode("utf-8")
+                        .replace("\r\n", "\n")
+                        .replace("\r", "\n")
+                    )
+                    links = self._scan_content(content)
+                    scanned += 1
+                else:
+                    links = entry["links"]
+            except (OSError, UnicodeDecodeError) as e:
                 logger.error(f"Error reading {md_file}: {e}")
+                # Its links from an earlier read are no longer known
+                if self._files.pop(key, None) is not None:
+                    changed = True
+                continue
+
+            self._files[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": digest,
+                "links": links,
+            }
+            changed = True
+
+        # Forget files that were deleted
+        for key in list(self._files):
+            if key not in current and not Path(key).exists():
+                del self._files[key]
+                changed = True
+
+        if changed:
+            self._save_index()
+        self._build_url_index(current)
+
+        if scanned:
+            logger.info(f"Indexed links of {scanned} changed markdown files")
+        return scanned
+
+    def _build_url_index(self, current: dict[str, str]) -> None:
+        """Group the links of the current files by URL, in file order."""
+        url_index: dict[str, list[tuple[str, list]]] = {}
+        for key, display_path in current.items():
+            entry = self._files.get(key)
+            if entry is None:
+                continue
+            for link in entry["links"]:
+                url_index.setdefault(link[0], []).append((display_path, link))
+        self._url_index = url_index
+
+    def _scan_content(self, content: str) -> list[list]:
+        """
+        Find all markdown links [text](url) in a document.
 
+        Returns:
+            Link records [normalized_url, line_number, bracket_start,
+            paren_end, citation_text, line]
+        """
+        links = []
+
+        for line_num, line in enumerate(content.split("\n"), 1):
+            # Find all markdown links in the line using string methods
+            i = 0
+            while i < len(line):
+                # Look for opening [
+                bracket_start = line.find("[", i)
+                if bracket_start == -1:
+                    break
+
+                # Find closing ]
+                bracket_end = line.find("]", bracket_start + 1)
+                if bracket_end == -1:
+                    i = bracket_start + 1
+                    continue
+
+                # Check if followed by (
+                if bracket_end + 1 < len(line) and line[bracket_end + 1] == "(":
+                    # Find closing )
+                    paren_end = line.find(")", bracket_end + 2)
+                    if paren_end == -1:
+                        i = bracket_end + 1
+                        continue
+
+                    url = line[bracket_end + 2 : paren_end]
+                    links.append(
+                        [
+                            self._normalize_url(url),
+                            line_num,
+                            bracket_start,
+                            paren_end,
+                            line[bracket_start + 1 : bracket_end],
+                            line,
+                        ]
+                    )
+
+                    # Move past this link
+                    i = paren_end + 1
+                else:
+                    i = bracket_end + 1
+
+        return links
+
+    def _lookup(
+        self, target_url: str, context_chars: int
+    ) -> list[CitationContext]:
+        """Build the contexts of a URL from the index."""
+        contexts = []
+        for file_path, link in self._url_index.get(
+            self._normalize_url(target_url), []
+        ):
+            _, line_num, bracket_start, paren_end, citation_text, line = link
+
+            # Extract context
+            start_pos = max(0, bracket_start - context_chars)
+            end_pos = min(len(line), paren_end + 1 + context_chars)
+
+            text_before = line[start_pos:bracket_start]
+            text_after = line[paren_end + 1 : end_pos]
+
+            # Clean up context
+            if start_pos > 0:
+                text_before = "..." + text_before.lstrip()
+            if end_pos < len(line):
+                text_after = text_after.rstrip() + "..."
+
+            contexts.append(
+                CitationContext(
+                    file_path=file_path,
+                    line_number=line_num,
+                    text_before=text_before,
+                    citation_text=citation_text,
+                    text_after=text_after,
+                    full_line=line.strip(),
+                )
+            )
         return contexts
 
+    def _load_index(self) -> dict[str, dict]:
+        """Load the persisted index, or start empty if it's unusable."""
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable index {self.index_path}: {e}")
+            return {}
+
+        if data.get("version") != INDEX_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def _save_index(self) -> None:
+        """Persist the index atomically."""
+        try:
+            atomic_write(
+                self.index_path,
+                json.dumps({"version": INDEX_VERSION, "files": self._files}),
+            )
+        except OSError as e:
+            logger.warning(f"Failed to save index {self.index_path}: {e}")
+
     def _normalize_url(self, url: str) -> str:
         """Normalize URL for comparison."""
         # Remove trailing slashes
@@ -184,16 +331,19 @@ class CitationContextFinder:
         """
         Find contexts for multiple URLs.
 
+        The index is refreshed once, then each URL is a dictionary lookup.
+
         Args:
             urls: List of URLs to search for
 
         Returns:
             Dictionary mapping URL to list of contexts
         """
+        self.refresh_index()
         results = {}
 
         for url in urls:
-            contexts = self.find_citation_contexts(url)
+            contexts = self._lookup(url, context_chars=100)
             if contexts:
                 results[url] = contexts
                 logger.info(f"Found {len(contexts)} context(s) for {url}")
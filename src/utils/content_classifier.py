@@ -8,8 +8,7 @@ Helps identify non-academic sources that should be tagged appropriately.
 import logging
 from urllib.parse import urlparse
 
-import requests
-from bs4 import BeautifulSoup
+from .page_fetcher import FetchedPage, PageFetcher
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +16,20 @@ logger = logging.getLogger(__name__)
 class ContentClassifier:
     """Classifier for determining content type and academic nature."""
 
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, fetcher: PageFetcher | None = None):
+        """
+        Initialize the classifier.
+
+        Args:
+            timeout: Request timeout in seconds for content classification
+            fetcher: Page fetcher to share downloaded pages with other
+                consumers (a private one by default)
+        """
         self.timeout = timeout
         self.headers = {
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
+        self.fetcher = fetcher or PageFetcher(timeout=timeout)
 
         # Define domain categories
         self.academic_domains = {
@@ -93,12 +101,16 @@ class ContentClassifier:
             "/press/",
         }
 
-    def classify_content(self, url: str) -> dict:
+    def classify_content(
+        self, url: str, page: FetchedPage | None = None
+    ) -> dict:
         """
         Classify content type from URL and page content.
 
         Args:
             url: URL to classify
+            page: Already fetched page for the URL (fetched on demand
+                through the fetcher if not given)
 
         Returns:
             Dictionary with classification results
@@ -125,7 +137,7 @@ class ContentClassifier:
 
         # Content-based classification
         try:
-            content_classification = self._classify_by_content(url)
+            content_classification = self._classify_by_content(url, page)
             if content_classification:
                 # Merge classifications
                 for key, value in content_classification.items():
@@ -248,15 +260,16 @@ class ContentClassifier:
             logger.debug(f"URL classification failed: {e}")
             return {"content_type": "unknown", "confidence": 0.0, "tags": []}
 
-    def _classify_by_content(self, url: str) -> dict | None:
+    def _classify_by_content(
+        self, url: str, page: FetchedPage | None = None
+    ) -> dict | None:
         """Classify content based on page content."""
         try:
-            response = requests.get(
-                url, headers=self.headers, timeout=self.timeout
-            )
-            response.raise_for_status()
+            if page is None:
+                page = self.fetcher.fetch(url, timeout=self.timeout)
+            page.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = page.soup
 
             result = {
                 "content_type": "unknown",
@@ -0,0 +1,434 @@
+"""
+Compiled lookup index for large CSL JSON exports (e.g. from Zotero).
+
+Matching a couple of hundred citations against a group library export used
+to json.load the whole file and rebuild URL and DOI dictionaries on every
+conversion, which for a 60k-item export takes seconds and about a gigabyte
+of memory. CSLJsonIndex compiles the export once into a small SQLite file
+beside it, mapping
+
+- the URL, lowercased DOI and arXiv ID of each entry
+- the canonical work ID (see identifiers.canonical_id) of its URL and DOI
+- its normalized title and first author surname + year
+
+to the byte span of the entry in the export. Lookups read the key from the
+index and decode just that entry from a memory map of the export. The index
+is rebuilt when the export's size or content changes; a changed mtime alone
+only triggers a hash check.
+"""
+
+# Standard library imports
+import hashlib
+import json
+import logging
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .identifiers import canonical_id, extract_arxiv_id
+from .similarity import normalize_text
+from .storage import ThreadLocalConnection, connect_sqlite, file_digest
+
+logger = logging.getLogger(__name__)
+
+# Bump when the keys or the schema change, so old indexes are rebuilt
+INDEX_VERSION = 1
+
+# Suffix of the index file written beside the export
+INDEX_SUFFIX = ".index.sqlite"
+
+# Characters read from the export per chunk while compiling
+READ_CHUNK_CHARS = 1 << 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS keys (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    entry_id INTEGER NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+"""
+
+
+def iter_entry_spans(path: Path) -> Iterator[tuple[int, int, dict[str, Any]]]:
+    """
+    Stream the items of a JSON array file with their byte spans.
+
+    The file is decoded in chunks and each item parsed on its own, so only
+    one chunk and one item are held in memory at a time.
+
+    Yields:
+        Tuples of (byte offset, byte length, decoded item)
+    """
+    decoder = json.JSONDecoder()
+    # newline="" keeps \r\n as two characters so byte offsets stay exact
+    with open(path, encoding="utf-8", newline="") as f:
+        buffer = f.read(READ_CHUNK_CHARS)
+        pos = 0
+        byte_pos = 0
+        if buffer.startswith("\ufeff"):
+            pos = 1
+            byte_pos = 3
+        in_array = False
+
+        while True:
+            # Skip whitespace and separators (all single-byte characters)
+            start = pos
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            byte_pos += pos - start
+
+            if pos == len(buffer):
+                more = f.read(READ_CHUNK_CHARS)
+                if not more:
+                    return
+                buffer = more
+                pos = 0
+                continue
+
+            if not in_array:
+                if buffer[pos] != "[":
+                    raise ValueError(f"{path} is not a JSON array")
+                in_array = True
+                pos += 1
+                byte_pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The item continues in the next chunk
+                more = f.read(READ_CHUNK_CHARS)
+                if not more:
+                    raise
+                buffer = buffer[pos:] + more
+                pos = 0
+                continue
+
+            length = len(buffer[pos:end].encode("utf-8"))
+            yield byte_pos, length, item
+            byte_pos += length
+            pos = end
+
+
+def _arxiv_id_of(entry: dict[str, Any]) -> str | None:
+    """arXiv ID of a CSL entry, from its DOI, URL or note"""
+    for field in ("DOI", "URL"):
+        value = entry.get(field)
+        if isinstance(value, str) and value:
+            work = canonical_id(value)
+            if work is not None and work.scheme == "arxiv":
+                return work.value
+
+    note = entry.get("note")
+    if isinstance(note, str) and "arxiv" in note.lower():
+        for word in note.split():
+            word = word.strip(".,;:()[]")
+            if word.lower().startswith("arxiv:"):
+                word = word[6:]
+            arxiv_id = extract_arxiv_id(f"arXiv:{word}")
+            if arxiv_id:
+                return arxiv_id
+    return None
+
+
+def entry_keys(entry: dict[str, Any]) -> list[tuple[str, str]]:
+    """Lookup keys of a CSL entry as (kind, key) pairs"""
+    keys = []
+    url = entry.get("URL")
+    if isinstance(url, str) and url:
+        keys.append(("url", url))
+        work = canonical_id(url)
+        if work is not None:
+            keys.append(("work", str(work)))
+
+    doi = entry.get("DOI")
+    if isinstance(doi, str) and doi:
+        keys.append(("doi", doi.lower()))
+        work = canonical_id(doi)
+        if work is not None:
+            keys.append(("work", str(work)))
+
+    arxiv_id = _arxiv_id_of(entry)
+    if arxiv_id:
+        keys.append(("arxiv", arxiv_id))
+
+    title = entry.get("title")
+    if isinstance(title, str) and title.strip():
+        keys.append(("title", normalize_text(title)))
+
+    authors = entry.get("author") or []
+    date_parts = (entry.get("issued") or {}).get("date-parts") or []
+    if authors and date_parts and date_parts[0]:
+        family = str(authors[0].get("family", "")).lower()
+        keys.append(("author_year", f"{family}{date_parts[0][0]}"))
+
+    return keys
+
+
+class CSLJsonIndex:
+    """Compiled, memory-mapped lookup index over a CSL JSON export"""
+
+    def __init__(self, json_path: Path, index_path: Path | None = None):
+        """
+        Open the index of an export, compiling it if missing or stale.
+
+        Args:
+            json_path: CSL JSON export (an array of items)
+            index_path: Index file. Defaults to the export path with
+                        INDEX_SUFFIX appended; falls back to
+                        ~/.deep-biblio-cache/csl-index/ if the export's
+                        directory isn't writable
+        """
+        self.json_path = Path(json_path)
+        self.index_path = (
+            Path(index_path) if index_path else self._default_index_path()
+        )
+        self._connection = ThreadLocalConnection(
+            lambda: connect_sqlite(self.index_path, _SCHEMA, wal=False)
+        )
+        self._map_lock = threading.Lock()
+        self._file: BinaryIO | None = None
+        self._map: mmap.mmap | None = None
+        self.ensure_current()
+
+    def _default_index_path(self) -> Path:
+        """Beside the export, or in the cache directory if that's read-only"""
+        if os.access(self.json_path.parent, os.W_OK):
+            return self.json_path.with_name(self.json_path.name + INDEX_SUFFIX)
+        path_hash = hashlib.sha256(
+            str(self.json_path.resolve()).encode()
+        ).hexdigest()[:16]
+        fallback = Path.home() / ".deep-biblio-cache" / "csl-index"
+        fallback.mkdir(parents=True, exist_ok=True)
+        return fallback / f"{path_hash}{INDEX_SUFFIX}"
+
+    # Compiling
+
+    def ensure_current(self) -> bool:
+        """
+        Compile the index unless it matches the export.
+
+        Returns:
+            True if the index was (re)built
+        """
+        stat = self.json_path.stat()
+        if self.index_path.exists():
+            try:
+                if self._is_current(stat):
+                    return False
+            except sqlite3.DatabaseError as e:
+                logger.warning(f"Rebuilding unreadable index: {e}")
+        self.build()
+        return True
+
+    def _is_current(self, stat: os.stat_result) -> bool:
+        """Check the stored export size, mtime and hash against the export"""
+        conn = self._get_connection()
+        meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        if meta.get("version") != str(INDEX_VERSION):
+            return False
+        if meta.get("size") != str(stat.st_size):
+            return False
+        if meta.get("mtime_ns") == str(stat.st_mtime_ns):
+            return True
+
+        # Touched (copied, re-synced...) but possibly unchanged
+        if meta.get("sha256") != file_digest(self.json_path):
+            return False
+        with conn:
+            conn.execute(
+                "UPDATE meta SET value = ? WHERE key = 'mtime_ns'",
+                (str(stat.st_mtime_ns),),
+            )
+        return True
+
+    def build(self) -> int:
+        """
+        Compile the index from the export.
+
+        Returns:
+            Number of entries indexed
+        """
+        started = time.time()
+        stat = self.json_path.stat()
+        digest = file_digest(self.json_path)
+        self.close()
+
+        tmp_path = self.index_path.with_name(
+            f"{self.index_path.name}.{os.getpid()}.tmp"
+        )
+        conn = sqlite3.connect(tmp_path)
+        count = 0
+        try:
+            conn.executescript(_SCHEMA)
+            with conn:
+                for entry_id, (offset, length, entry) in enumerate(
+                    iter_entry_spans(self.json_path)
+                ):
+                    conn.execute(
+                        "INSERT INTO entries (id, offset, length) "
+                        "VALUES (?, ?, ?)",
+                        (entry_id, offset, length),
+                    )
+                    if isinstance(entry, dict):
+                        # Later entries win, as with the dicts built before
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO keys (kind, key, entry_id) "
+                            "VALUES (?, ?, ?)",
+                            [
+                                (kind, key, entry_id)
+                                for kind, key in entry_keys(entry)
+                            ],
+                        )
+                    count += 1
+                conn.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("version", str(INDEX_VERSION)),
+                        ("size", str(stat.st_size)),
+                        ("mtime_ns", str(stat.st_mtime_ns)),
+                        ("sha256", digest),
+                        ("entries", str(count)),
+                    ],
+                )
+            conn.close()
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            conn.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        logger.info(
+            f"Indexed {count} entries of {self.json_path.name} "
+            f"in {time.time() - started:.1f}s"
+        )
+        return count
+
+    # Access
+
+    def _get_connection(self) -> sqlite3.Connection:
+        return self._connection.get()
+
+    def _get_map(self) -> mmap.mmap | None:
+        """Read-only memory map of the export (None if it's empty)"""
+        with self._map_lock:
+            if self._map is None and self.json_path.stat().st_size:
+                self._file = file = open(self.json_path, "rb")
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._map
+
+    def close(self) -> None:
+        """Close this thread's connection and the memory map"""
+        self._connection.close()
+        with self._map_lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "CSLJsonIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        row = (
+            self._get_connection()
+            .execute("SELECT COUNT(*) FROM entries")
+            .fetchone()
+        )
+        count: int = row[0]
+        return count
+
+    def _decode(self, entry_id: int) -> dict[str, Any] | None:
+        """Decode one entry from the memory map"""
+        row = (
+            self._get_connection()
+            .execute(
+                "SELECT offset, length FROM entries WHERE id = ?", (entry_id,)
+            )
+            .fetchone()
+        )
+        data = self._get_map()
+        if row is None or data is None:
+            return None
+        offset, length = row
+        entry = json.loads(data[offset : offset + length])
+        return entry if isinstance(entry, dict) else None
+
+    def get(self, kind: str, key: str) -> dict[str, Any] | None:
+        """
+        Look up an entry by one of its keys.
+
+        Args:
+            kind: "url", "doi", "arxiv", "work", "title" or "author_year"
+            key: Key in the form entry_keys() stores it
+        """
+        row = (
+            self._get_connection()
+            .execute(
+                "SELECT entry_id FROM keys WHERE kind = ? AND key = ?",
+                (kind, key),
+            )
+            .fetchone()
+        )
+        return self._decode(row[0]) if row else None
+
+    def find_by_url(self, url: str) -> dict[str, Any] | None:
+        """Entry with exactly this URL, or citing the same work"""
+        work = canonical_id(url)
+        entry = self.get("url", url)
+        if entry is None and work is not None:
+            entry = self.get("work", str(work))
+        return entry
+
+    def find_by_doi(self, doi: str) -> dict[str, Any] | None:
+        """Entry with this DOI (case-insensitive)"""
+        return self.get("doi", doi.lower())
+
+    def find_by_arxiv_id(self, arxiv_id: str) -> dict[str, Any] | None:
+        """Entry of this arXiv preprint (any version)"""
+        return self.get("arxiv", extract_arxiv_id(f"arXiv:{arxiv_id}") or "")
+
+    def find_by_title(self, title: str) -> dict[str, Any] | None:
+        """Entry with this title, ignoring case and punctuation"""
+        return self.get("title", normalize_text(title))
+
+    def find_by_author_year(
+        self, family_name: str, year: str | int
+    ) -> dict[str, Any] | None:
+        """Entry by first author surname and year"""
+        return self.get("author_year", f"{family_name.lower()}{year}")
+
+    def iter_entries(self) -> Iterator[dict[str, Any]]:
+        """Decode all entries in export order"""
+        ids = [
+            row[0]
+            for row in self._get_connection().execute(
+                "SELECT id FROM entries ORDER BY id"
+            )
+        ]
+        for entry_id in ids:
+            entry = self._decode(entry_id)
+            if entry is not None:
+                yield entry
@@ -0,0 +1,515 @@
+"""
+On-disk cache of raw HTTP responses.
+
+Only parsed BibTeX results used to be cached, so changing an extraction
+heuristic meant fetching every page again. HTTPCache keeps the raw bodies of
+successful GET responses, zlib-compressed and stored by content hash (pages
+with identical bodies share one file), together with their ETag and
+Last-Modified validators in a small SQLite index.
+
+CachedSession is a drop-in requests.Session on top of it:
+
+- A cached response with validators is revalidated with If-None-Match /
+  If-Modified-Since; a 304 answer is served from disk.
+- Within ``max_age`` seconds of the last validation, or in offline mode,
+  responses are served from disk without touching the network. Offline
+  misses raise OfflineCacheMiss (a requests.ConnectionError).
+- Once the stored bodies grow beyond ``max_size`` bytes, the least recently
+  validated ones are deleted together with their index rows.
+
+Most code should call get_http_session() so every client shares the cache
+configured for the process (see configure_http_cache()). The environment
+variables DEEP_BIBLIO_HTTP_CACHE=0 and DEEP_BIBLIO_OFFLINE=1 disable the
+cache and turn on offline replay respectively.
+"""
+
+# Standard library imports
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+# Third-party imports
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .storage import ThreadLocalConnection, atomic_write, connect_sqlite
+
+logger = logging.getLogger(__name__)
+
+# Response headers describing the wire encoding of the body, which no
+# longer apply to the decoded body we store
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# Default limit of the compressed bodies on disk
+DEFAULT_MAX_SIZE = 2 * 1024**3
+
+# Share of max_size left after a prune, so that pruning isn't needed again
+# after the next few stores
+PRUNE_TARGET = 0.8
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    final_url TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    reason TEXT,
+    headers TEXT NOT NULL,
+    body_hash TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    validated_at REAL NOT NULL
+)
+"""
+
+
+class OfflineCacheMiss(requests.ConnectionError):
+    """Raised in offline mode for a request that isn't cached"""
+
+
+class CachedResponse(requests.Response):
+    """Response served from the cache rather than the network"""
+
+    from_cache = True
+    # Set by requests.Response.__init__, but not declared by its stubs
+    _content_consumed: bool
+
+
+class HTTPCache:
+    """Content-addressed store of raw HTTP responses"""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        offline: bool = False,
+        max_age: float | None = None,
+        max_size: int | None = DEFAULT_MAX_SIZE,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the index and bodies.
+                       Defaults to ~/.deep-biblio-cache/http
+            offline: Serve only cached responses, never use the network
+            max_age: Seconds after a validation during which a response is
+                     served without revalidating (None = always revalidate)
+            max_size: Bytes of compressed bodies kept on disk (None = no
+                      limit)
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".deep-biblio-cache" / "http"
+        self.cache_dir = Path(cache_dir)
+        self.body_dir = self.cache_dir / "bodies"
+        self.db_path = self.cache_dir / "index.db"
+        self.offline = offline
+        self.max_age = max_age
+        self.max_size = max_size
+        self._connection = ThreadLocalConnection(
+            lambda: connect_sqlite(self.db_path, _SCHEMA)
+        )
+        # Bytes of stored bodies, counted on the first store
+        self._size: int | None = None
+        self._size_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(method: str, url: str, accept: str | None = None) -> str:
+        """Key of a request; Accept is included for content negotiation"""
+        raw = f"{method.upper()} {url}\n{accept or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        return self._connection.get()
+
+    def _body_path(self, body_hash: str) -> Path:
+        return self.body_dir / body_hash[:2] / f"{body_hash}.zlib"
+
+    def lookup(self, key: str) -> dict[str, Any] | None:
+        """Get the stored metadata of a request, if any"""
+        try:
+            row = (
+                self._get_connection()
+                .execute("SELECT * FROM responses WHERE key = ?", (key,))
+                .fetchone()
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"HTTP cache lookup failed: {e}")
+            return None
+        return dict(row) if row else None
+
+    def is_fresh(self, entry: dict[str, Any]) -> bool:
+        """Whether an entry may be served without asking the server"""
+        if self.offline:
+            return True
+        if self.max_age is None:
+            return False
+        validated_at: float = entry["validated_at"]
+        return time.time() - validated_at < self.max_age
+
+    def read_body(self, entry: dict[str, Any]) -> bytes | None:
+        """Read and decompress a stored body"""
+        try:
+            return zlib.decompress(
+                self._body_path(entry["body_hash"]).read_bytes()
+            )
+        except (OSError, zlib.error) as e:
+            logger.debug(f"Cached body of {entry['url']} unusable: {e}")
+            return None
+
+    def store(
+        self,
+        key: str,
+        url: str,
+        response: requests.Response,
+        body: bytes | None = None,
+    ) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Request key from make_key()
+            url: Requested URL
+            response: Response to store
+            body: Decoded body (defaults to response.content)
+        """
+        if body is None:
+            body = response.content
+        body_hash = hashlib.sha256(body).hexdigest()
+        path = self._body_path(body_hash)
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _HOP_HEADERS
+        }
+        now = time.time()
+
+        added = 0
+        try:
+            if not path.exists():
+                compressed = zlib.compress(body, 6)
+                atomic_write(path, compressed)
+                added = len(compressed)
+
+            conn = self._get_connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        url,
+                        response.url or url,
+                        response.status_code,
+                        response.reason,
+                        json.dumps(headers),
+                        body_hash,
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                        now,
+                        now,
+                    ),
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to cache response of {url}: {e}")
+            return
+
+        if added and self.max_size is not None:
+            with self._size_lock:
+                if self._size is None:
+                    self._size = self._stored_size()
+                else:
+                    self._size += added
+                over_limit = self._size > self.max_size
+            if over_limit:
+                self.prune(int(self.max_size * PRUNE_TARGET))
+
+    def _body_sizes(self) -> dict[str, int]:
+        """Size of each stored body file, by body hash"""
+        sizes = {}
+        for path in self.body_dir.glob("*/*.zlib"):
+            try:
+                sizes[path.stem] = path.stat().st_size
+            except OSError:
+                continue
+        return sizes
+
+    def _stored_size(self) -> int:
+        return sum(self._body_sizes().values())
+
+    def prune(self, max_size: int) -> int:
+        """
+        Delete the least recently validated bodies until the rest fit.
+
+        Responses whose body is deleted are removed from the index, so they
+        are fetched again when next requested.
+
+        Args:
+            max_size: Bytes of compressed bodies to keep at most
+
+        Returns:
+            Number of body files deleted
+        """
+        sizes = self._body_sizes()
+        try:
+            conn = self._get_connection()
+            rows = conn.execute(
+                "SELECT body_hash, MAX(validated_at) AS last_used "
+                "FROM responses GROUP BY body_hash ORDER BY last_used"
+            ).fetchall()
+            # Body files without a response are left alone: their response
+            # may be being stored right now
+            used = [
+                row["body_hash"] for row in rows if row["body_hash"] in sizes
+            ]
+            total = sum(sizes[body_hash] for body_hash in used)
+            doomed = []
+            for body_hash in used:
+                if total <= max_size:
+                    break
+                doomed.append(body_hash)
+                total -= sizes[body_hash]
+            with conn:
+                conn.executemany(
+                    "DELETE FROM responses WHERE body_hash = ?",
+                    [(body_hash,) for body_hash in doomed],
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to prune the HTTP cache: {e}")
+            return 0
+
+        for body_hash in doomed:
+            self._body_path(body_hash).unlink(missing_ok=True)
+        with self._size_lock:
+            self._size = total
+        if doomed:
+            logger.info(
+                f"Pruned {len(doomed)} cached responses, "
+                f"{total / 1024**2:.1f} MB left"
+            )
+        return len(doomed)
+
+    def mark_validated(self, key: str) -> None:
+        """Record that the server confirmed a stored response (304)"""
+        try:
+            conn = self._get_connection()
+            with conn:
+                conn.execute(
+                    "UPDATE responses SET validated_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"HTTP cache update failed: {e}")
+
+    def build_response(
+        self, entry: dict[str, Any], body: bytes
+    ) -> CachedResponse:
+        """Recreate a response from a stored entry"""
+        response = CachedResponse()
+        response.status_code = entry["status_code"]
+        response.reason = entry["reason"]
+        response.url = entry["final_url"]
+        response.headers = CaseInsensitiveDict(json.loads(entry["headers"]))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response._content_consumed = True
+        return response
+
+    def iter_responses(
+        self, url_prefixes: tuple[str, ...]
+    ) -> Iterator[tuple[dict[str, Any], bytes]]:
+        """
+        Iterate over stored 200 responses whose URL has one of the prefixes.
+
+        Yields:
+            (entry, body) pairs
+        """
+        conditions = " OR ".join("url LIKE ?" for _ in url_prefixes)
+        try:
+            rows = (
+                self._get_connection()
+                .execute(
+                    f"SELECT * FROM responses "
+                    f"WHERE status_code = 200 AND ({conditions})",
+                    [f"{prefix}%" for prefix in url_prefixes],
+                )
+                .fetchall()
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"HTTP cache scan failed: {e}")
+            return
+        for row in rows:
+            entry = dict(row)
+            body = self.read_body(entry)
+            if body is not None:
+                yield entry, body
+
+    def close(self) -> None:
+        """Close this thread's connection"""
+        self._connection.close()
+
+
+class CachedSession(requests.Session):
+    """requests.Session that stores and revalidates GET responses"""
+
+    def __init__(self, http_cache: HTTPCache):
+        super().__init__()
+        self.http_cache = http_cache
+
+    def _request_key(self, method: str, url: str, headers: Any) -> str:
+        accept = (headers or {}).get("Accept") or self.headers.get("Accept")
+        if isinstance(accept, bytes):
+            accept = accept.decode("latin-1")
+        return self.http_cache.make_key(method, url, accept)
+
+    def serves_locally(self, url: str, headers: Any = None) -> bool:
+        """Whether a GET of the URL would be answered without the network"""
+        entry = self.http_cache.lookup(self._request_key("GET", url, headers))
+        if entry is None:
+            return self.http_cache.offline
+        return self.http_cache.is_fresh(entry)
+
+    def store_response(
+        self,
+        url: str,
+        response: requests.Response,
+        body: bytes,
+        headers: Any = None,
+    ) -> None:
+        """Store a 200 response to a GET whose body the caller streamed"""
+        self.http_cache.store(
+            self._request_key("GET", url, headers), url, response, body
+        )
+
+    # Takes requests' arguments as *args/**kwargs and passes them on
+    def request(  # type: ignore[override]
+        self, method: str, url: str, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        if method.upper() != "GET" or args:
+            return super().request(method, url, *args, **kwargs)
+
+        cache = self.http_cache
+        key_url = url
+        if kwargs.get("params"):
+            prepared = requests.Request(
+                "GET", url, params=kwargs["params"]
+            ).prepare()
+            key_url = prepared.url or url
+        key = self._request_key(method, key_url, kwargs.get("headers"))
+        entry = cache.lookup(key)
+        body = cache.read_body(entry) if entry else None
+        if body is None:
+            entry = None
+
+        if entry is not None and body is not None and cache.is_fresh(entry):
+            return cache.build_response(entry, body)
+        if cache.offline:
+            raise OfflineCacheMiss(f"Offline: no cached response for {url}")
+
+        if entry is not None:
+            headers = dict(kwargs.get("headers") or {})
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+            kwargs["headers"] = headers
+
+        response = super().request(method, url, **kwargs)
+
+        if (
+            response.status_code == 304
+            and entry is not None
+            and body is not None
+        ):
+            cache.mark_validated(key)
+            return cache.build_response(entry, body)
+        if response.status_code == 200 and not kwargs.get("stream"):
+            cache.store(key, url, response)
+        return response
+
+
+def serves_locally(session: Any, url: str, headers: Any = None) -> bool:
+    """
+    Check whether a session answers a GET without the network.
+
+    Callers use this to skip politeness delays for cached responses.
+    """
+    return isinstance(session, CachedSession) and session.serves_locally(
+        url, headers
+    )
+
+
+_settings: dict[str, Any] = {
+    "enabled": os.environ.get("DEEP_BIBLIO_HTTP_CACHE", "1") != "0",
+    "offline": os.environ.get("DEEP_BIBLIO_OFFLINE", "0") == "1",
+    "cache_dir": None,
+    "max_age": None,
+    "max_size": DEFAULT_MAX_SIZE,
+}
+_shared_cache: HTTPCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def configure_http_cache(
+    enabled: bool | None = None,
+    offline: bool | None = None,
+    cache_dir: Path | None = None,
+    max_age: float | None = None,
+    max_size: int | None = None,
+) -> None:
+    """
+    Configure the process-wide HTTP cache (before sessions are created).
+
+    Args:
+        enabled: Whether get_http_session() returns caching sessions
+        offline: Serve only cached responses
+        cache_dir: Cache directory
+        max_age: Seconds a validated response is served without revalidation
+        max_size: Bytes of compressed bodies kept on disk
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if enabled is not None:
+            _settings["enabled"] = enabled
+        if offline is not None:
+            _settings["offline"] = offline
+        if cache_dir is not None:
+            _settings["cache_dir"] = cache_dir
+        if max_age is not None:
+            _settings["max_age"] = max_age
+        if max_size is not None:
+            _settings["max_size"] = max_size
+        _shared_cache = None
+
+
+def get_http_cache() -> HTTPCache | None:
+    """Get the process-wide HTTP cache, or None if caching is disabled"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if not _settings["enabled"]:
+            return None
+        if _shared_cache is None:
+            _shared_cache = HTTPCache(
+                cache_dir=_settings["cache_dir"],
+                offline=_settings["offline"],
+                max_age=_settings["max_age"],
+                max_size=_settings["max_size"],
+            )
+        return _shared_cache
+
+
+def get_http_session() -> requests.Session:
+    """Create a session backed by the process-wide HTTP cache"""
+    http_cache = get_http_cache()
+    if http_cache is None:
+        return requests.Session()
+    return CachedSession(http_cache)
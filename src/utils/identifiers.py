@@ -0,0 +1,281 @@
+"""
+Canonical identifiers of cited works.
+
+The same paper is often cited through several URLs: a DOI resolver link,
+a publisher landing page carrying the DOI, the arXiv abstract page, a
+versioned arXiv PDF, or the DataCite DOI arXiv assigns to every preprint.
+canonical_id() maps all of these to one CanonicalId so that a run can
+fetch each work once and share the result between its aliases.
+
+Identifiers are tried from most to least specific: DOI, arXiv ID (with
+the version stripped), PubMed ID, PubMed Central ID, and finally the URL
+itself with its cosmetic differences (scheme, www., tracking parameters,
+trailing slash, fragment) normalized away.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import unquote, urlsplit
+
+# DataCite DOIs that arXiv mints for its preprints, e.g. 10.48550/arXiv.X
+ARXIV_DOI_PREFIX = "10.48550/arxiv."
+
+# Path prefixes under which arxiv.org serves a paper
+ARXIV_PATHS = ("/abs/", "/pdf/", "/html/", "/format/")
+
+# Query parameters that only track the visitor
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "_ga",
+    "ref",
+    "ref_src",
+    "mc_cid",
+    "mc_eid",
+}
+
+# Characters that end a DOI embedded in a URL
+DOI_TERMINATORS = ("?", "#", " ", "&")
+
+
+@dataclass(frozen=True)
+class CanonicalId:
+    """Identifier of a cited work, e.g. doi:10.1000/abc or arxiv:2301.12345"""
+
+    scheme: str
+    value: str
+
+    def __str__(self) -> str:
+        return f"{self.scheme}:{self.value}"
+
+
+def _cut_doi(
+    url: str, start: int, terminators: tuple[str, ...] = DOI_TERMINATORS
+) -> str | None:
+    """Read a DOI starting at position start, if one starts there"""
+    if url[start : start + 3] != "10.":
+        return None
+    end = len(url)
+    for char in terminators:
+        pos = url.find(char, start)
+        if pos != -1 and pos < end:
+            end = pos
+    return url[start:end].rstrip("/")
+
+
+def extract_doi(url: str) -> str | None:
+    """Extract a DOI from resolver, publisher or doi:-prefixed references
+
+    The DOI is returned as written; compare DOIs case-insensitively.
+    """
+    url = url.strip()
+    url_lower = url.lower()
+
+    # doi.org and dx.doi.org resolvers, including redirect chains
+    if "doi.org/" in url_lower:
+        doi_pos = url_lower.find("doi.org/") + 8
+        if url_lower[doi_pos : doi_pos + 11] == "dx.doi.org/":
+            doi_pos += 11
+        doi = _cut_doi(url, doi_pos, ("?", "#", " "))
+        if doi:
+            return doi
+
+    # Publisher paths such as /doi/10..., /doi/abs/10... or /doi/pdf/10...
+    if "/doi/" in url_lower:
+        doi_pos = url_lower.find("/doi/") + 5
+        for section in ("abs/", "full/", "pdf/", "epdf/"):
+            if url_lower[doi_pos : doi_pos + len(section)] == section:
+                doi_pos += len(section)
+                break
+        doi = _cut_doi(url, doi_pos, ("?", "#", " "))
+        if doi:
+            return doi
+
+    # doi: prefixes and doi= query parameters
+    for prefix in ("doi:", "doi="):
+        if prefix in url_lower:
+            doi = _cut_doi(url, url_lower.find(prefix) + len(prefix))
+            if doi:
+                return doi
+
+    return None
+
+
+def strip_arxiv_version(arxiv_id: str) -> str:
+    """Drop a trailing version such as v2 from an arXiv ID"""
+    v_pos = arxiv_id.rfind("v")
+    if v_pos > 0 and arxiv_id[v_pos + 1 :].isdigit():
+        return arxiv_id[:v_pos]
+    return arxiv_id
+
+
+def _is_arxiv_id(candidate: str) -> bool:
+    """Check the shape of new (2301.12345) and old (hep-th/9901001) IDs"""
+    if "/" in candidate:
+        archive, _, number = candidate.partition("/")
+        return bool(archive) and number.isdigit() and len(number) == 7
+    year_month, _, number = candidate.partition(".")
+    return (
+        len(year_month) == 4
+        and year_month.isdigit()
+        and 4 <= len(number) <= 5
+        and number.isdigit()
+    )
+
+
+def extract_arxiv_id(url: str) -> str | None:
+    """Extract an unversioned arXiv ID from arxiv.org URLs or arXiv: refs"""
+    text = url.strip()
+    lowered = text.lower()
+
+    if lowered.startswith("arxiv:"):
+        candidate = text[6:].strip()
+    elif "arxiv.org/" in lowered:
+        path = lowered.split("arxiv.org", 1)[1]
+        for marker in ARXIV_PATHS:
+            if path.startswith(marker):
+                candidate = text[len(text) - len(path) + len(marker) :]
+                break
+        else:
+            return None
+        for char in ("?", "#"):
+            candidate = candidate.split(char, 1)[0]
+        candidate = candidate.strip("/")
+        if candidate.lower().endswith(".pdf"):
+            candidate = candidate[:-4]
+    else:
+        return None
+
+    candidate = strip_arxiv_version(candidate)
+    return candidate if _is_arxiv_id(candidate) else None
+
+
+def _path_after(url_lower: str, marker: str) -> str | None:
+    """First path segment after marker, if marker occurs in the URL"""
+    if marker not in url_lower:
+        return None
+    rest = url_lower.split(marker, 1)[1]
+    for char in ("/", "?", "#"):
+        rest = rest.split(char, 1)[0]
+    return rest
+
+
+def extract_pmid(url: str) -> str | None:
+    """Extract a PubMed ID from PubMed URLs or pmid: references"""
+    lowered = url.strip().lower()
+    candidate: str | None
+    if lowered.startswith("pmid:"):
+        candidate = lowered[5:].strip()
+    else:
+        candidate = _path_after(
+            lowered, "pubmed.ncbi.nlm.nih.gov/"
+        ) or _path_after(lowered, "ncbi.nlm.nih.gov/pubmed/")
+    return candidate if candidate and candidate.isdigit() else None
+
+
+def extract_pmcid(url: str) -> str | None:
+    """Extract a PubMed Central ID (PMC1234567) from PMC URLs or refs"""
+    lowered = url.strip().lower()
+    candidate: str | None
+    if lowered.startswith("pmcid:"):
+        candidate = lowered[6:].strip()
+    elif lowered.startswith("pmc") and "/" not in lowered:
+        candidate = lowered
+    else:
+        candidate = _path_after(
+            lowered, "ncbi.nlm.nih.gov/pmc/articles/"
+        ) or _path_after(lowered, "pmc.ncbi.nlm.nih.gov/articles/")
+    if candidate and candidate.startswith("pmc") and candidate[3:].isdigit():
+        return candidate.upper()
+    return None
+
+
+def normalize_url(url: str) -> str:
+    """Normalize cosmetic URL differences that don't change the resource
+
+    Lowercases the scheme and host, treats http as https, drops www.,
+    default ports, the fragment, a trailing slash and tracking parameters,
+    and sorts the remaining query parameters. The path keeps its case.
+    """
+    url = url.strip()
+    if "://" not in url:
+        return url
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    for default_port in (":80", ":443"):
+        if host.endswith(default_port):
+            host = host[: -len(default_port)]
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+
+    params = sorted(
+        param
+        for param in parts.query.split("&")
+        if param
+        and not param.lower().startswith("utm_")
+        and param.split("=", 1)[0].lower() not in TRACKING_PARAMS
+    )
+    normalized = f"{scheme}://{host}{parts.path.rstrip('/')}"
+    if params:
+        normalized += "?" + "&".join(params)
+    return normalized
+
+
+@lru_cache(maxsize=4096)
+def canonical_id(url: str) -> CanonicalId | None:
+    """Resolve a URL or identifier to the canonical ID of the cited work
+
+    Returns None for an empty URL, which identifies no work: citations
+    without a URL must not be merged into one.
+
+    Examples:
+        https://arxiv.org/abs/2301.12345, https://arxiv.org/pdf/2301.12345v2
+        and https://doi.org/10.48550/arXiv.2301.12345 all resolve to
+        arxiv:2301.12345.
+    """
+    text = url.strip()
+    if not text:
+        return None
+
+    doi = extract_doi(text)
+    if doi is None and text.startswith("10.") and "/" in text:
+        doi = text
+    if doi:
+        doi = unquote(doi).lower()
+        if doi.startswith(ARXIV_DOI_PREFIX):
+            arxiv_id = strip_arxiv_version(doi[len(ARXIV_DOI_PREFIX) :])
+            if _is_arxiv_id(arxiv_id):
+                return CanonicalId("arxiv", arxiv_id)
+        return CanonicalId("doi", doi)
+
+    arxiv_ref = extract_arxiv_id(text)
+    if arxiv_ref:
+        return CanonicalId("arxiv", arxiv_ref)
+
+    pmid = extract_pmid(text)
+    if pmid:
+        return CanonicalId("pmid", pmid)
+
+    pmcid = extract_pmcid(text)
+    if pmcid:
+        return CanonicalId("pmcid", pmcid)
+
+    return CanonicalId("url", normalize_url(text))
+
+
+def group_by_canonical_id(
+    urls: Iterable[str],
+) -> dict[CanonicalId, list[str]]:
+    """Group distinct URLs by the work they cite, in first-seen order
+
+    An empty URL cites no known work and gets a group of its own.
+    """
+    groups: dict[CanonicalId, list[str]] = {}
+    for url in dict.fromkeys(urls):
+        work = canonical_id(url) or CanonicalId("url", url)
+        groups.setdefault(work, []).append(url)
+    return groups
@@ -0,0 +1,161 @@
+"""
+Fetch web pages once and share them between consumers.
+
+Resolving a citation used to download the same page twice: once for content
+classification and once for BibTeX extraction, each with its own HTML parse.
+PageFetcher keeps recently fetched pages in memory and hands out FetchedPage
+objects whose BeautifulSoup tree is parsed on first use, so every consumer of
+a URL shares one download and one parse.
+"""
+
+# Standard library imports
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+# Third-party imports
+import requests
+from bs4 import BeautifulSoup
+
+# Local imports
+from .http_cache import get_http_session, serves_locally
+from .rate_limiter import DomainRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+
+class FetchedPage:
+    """A downloaded page: status, headers, body and a lazily parsed soup"""
+
+    def __init__(self, url: str, response: requests.Response):
+        self.url = url
+        self.final_url = response.url or url
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.content = response.content
+        self.encoding = response.encoding
+        self._response = response
+        self._soup: BeautifulSoup | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def text(self) -> str:
+        """Body decoded like requests.Response.text"""
+        return self._response.text
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """HTML parse tree, built on first access and then shared"""
+        if self._soup is None:
+            with self._lock:
+                if self._soup is None:
+                    self._soup = BeautifulSoup(self.content, "html.parser")
+        return self._soup
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def raise_for_status(self) -> None:
+        """Raise requests.HTTPError for 4xx/5xx pages"""
+        self._response.raise_for_status()
+
+
+class PageFetcher:
+    """
+    Download pages through a session, throttled per host, and keep the
+    most recent ones in memory.
+
+    Example:
+        fetcher = PageFetcher(rate_limiter=get_rate_limiter())
+        page = fetcher.fetch(url)
+        page.raise_for_status()
+        title = page.soup.find("title")
+    """
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        rate_limiter: DomainRateLimiter | None = None,
+        delay: float | None = None,
+        timeout: float = 15,
+        max_pages: int = 64,
+        max_retries: int = 2,
+    ):
+        """
+        Initialize the fetcher.
+
+        Args:
+            session: Session used for requests (by default one backed by
+                the process-wide HTTP cache)
+            rate_limiter: Per-host limiter; None disables throttling
+            delay: Seconds between requests to one host (limiter default
+                if None)
+            timeout: Default request timeout in seconds
+            max_pages: Number of pages kept in memory
+            max_retries: Retries after a rate-limit response
+        """
+        if session is None:
+            session = get_http_session()
+            session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.delay = delay
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.max_retries = max_retries
+        self._pages: OrderedDict[str, FetchedPage] = OrderedDict()
+        self._url_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, url: str, timeout: float | None = None) -> FetchedPage:
+        """
+        Get a page, downloading it only if it isn't held in memory.
+
+        Error pages (4xx/5xx) are returned like any other page; network
+        failures raise requests.RequestException and are not remembered.
+        """
+        with self._lock:
+            page = self._pages.get(url)
+            if page is not None:
+                self._pages.move_to_end(url)
+                return page
+            url_lock = self._url_locks.setdefault(url, threading.Lock())
+
+        # Concurrent callers asking for the same URL wait for one download
+        with url_lock:
+            with self._lock:
+                page = self._pages.get(url)
+            if page is not None:
+                return page
+
+            page = FetchedPage(url, self._get(url, timeout or self.timeout))
+            with self._lock:
+                self._pages[url] = page
+                while len(self._pages) > self.max_pages:
+                    evicted, _ = self._pages.popitem(last=False)
+                    self._url_locks.pop(evicted, None)
+            return page
+
+    def _get(
+        self, url: str, timeout: float, **kwargs: Any
+    ) -> requests.Response:
+        """GET a URL, waiting for the host's rate limit and retrying on 429"""
+        if self.rate_limiter is None or serves_locally(self.session, url):
+            return self.session.get(url, timeout=timeout, **kwargs)
+
+        for _ in range(self.max_retries + 1):
+            self.rate_limiter.wait(url, delay=self.delay)
+            response = self.session.get(url, timeout=timeout, **kwargs)
+            if not self.rate_limiter.update_from_response(url, response):
+                break
+        return response
+
+    def clear(self) -> None:
+        """Forget all pages held in memory"""
+        with self._lock:
+            self._pages.clear()
+            self._url_locks.clear()
@@ -3,27 +3,172 @@ PDF parsing utilities for extracting bibliographic information.
 
 Handles PDF metadata extraction, text parsing, and author/date detection
 from various PDF formats including research papers and reports.
+
+PDFs are never downloaded whole. When the server supports HTTP Range
+requests the document is read through a seekable view that fetches only the
+blocks the parsers touch (the trailer, the cross-reference table and the
+first pages); otherwise the download is streamed and cut off at
+``max_bytes``. Either way a large supplementary PDF costs at most
+``max_bytes`` of memory and bandwidth.
 """
 
 import io
+import itertools
 import logging
+from collections.abc import Callable
 
 # import re  # Banned - using string methods instead
 import pdfplumber
 import requests
+from pdfminer.pdfpage import PDFPage
+from pdfplumber.page import Page
 from PyPDF2 import PdfReader
 
+from .http_cache import CachedResponse, CachedSession, get_http_session
+
 logger = logging.getLogger(__name__)
 
+# Most bytes fetched for one PDF
+MAX_PDF_BYTES = 8 * 1024 * 1024
+
+# Size of the blocks fetched with Range requests
+RANGE_BLOCK_SIZE = 128 * 1024
+
+# Pages whose text is used for title/author/year detection
+TEXT_PAGES = 3
+
+
+class PDFSizeLimitError(OSError):
+    """Raised when parsing a PDF would need more than the byte budget"""
+
+
+def _parse_content_range(value: str | None) -> int | None:
+    """Get the full size from a 'bytes start-end/size' Content-Range"""
+    if not value or not value.startswith("bytes "):
+        return None
+    size = value.rpartition("/")[2].strip()
+    return int(size) if size.isdigit() else None
+
+
+class _RangeFile(io.RawIOBase):
+    """
+    Seekable read-only view of a remote file.
+
+    Blocks are fetched on first read through ``fetch_range(start, end)``
+    (inclusive offsets) and kept, so the parsers can seek freely while
+    only the parts they read are downloaded.
+    """
+
+    def __init__(
+        self,
+        fetch_range: Callable[[int, int], bytes],
+        size: int,
+        block_size: int = RANGE_BLOCK_SIZE,
+        max_bytes: int = MAX_PDF_BYTES,
+    ):
+        super().__init__()
+        self._fetch_range = fetch_range
+        self.size = size
+        self.block_size = block_size
+        self.max_bytes = max_bytes
+        self.bytes_fetched = 0
+        self._blocks: dict[int, bytes] = {}
+        self._pos = 0
+
+    def add_data(self, offset: int, data: bytes) -> None:
+        """Register bytes already downloaded, starting at a block boundary"""
+        block = offset // self.block_size
+        for start in range(0, len(data), self.block_size):
+            chunk = data[start : start + self.block_size]
+            if len(chunk) == self._block_length(block):
+                self._blocks[block] = chunk
+            block += 1
+        self.bytes_fetched += len(data)
+
+    def _block_length(self, block: int) -> int:
+        return min(self.block_size, self.size - block * self.block_size)
+
+    def _load(self, first: int, last: int) -> None:
+        """Make sure blocks first..last are present, one request per gap"""
+        block = first
+        while block <= last:
+            if block in self._blocks:
+                block += 1
+                continue
+            gap_end = block
+            while gap_end + 1 <= last and gap_end + 1 not in self._blocks:
+                gap_end += 1
+            start = block * self.block_size
+            end = min(self.size, (gap_end + 1) * self.block_size) - 1
+            if self.bytes_fetched + end - start + 1 > self.max_bytes:
+                raise PDFSizeLimitError(
+                    f"Reading the PDF needs more than {self.max_bytes} bytes"
+                )
+            data = self._fetch_range(start, end)
+            if len(data) != end - start + 1:
+                raise OSError(f"Range {start}-{end} returned {len(data)} bytes")
+            self.add_data(start, data)
+            block = gap_end + 1
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError("Negative seek position")
+        self._pos = offset
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        end = min(self.size, self._pos + len(buffer))
+        if end <= self._pos:
+            return 0
+        first = self._pos // self.block_size
+        last = (end - 1) // self.block_size
+        self._load(first, last)
+
+        data = b"".join(self._blocks[b] for b in range(first, last + 1))
+        offset = self._pos - first * self.block_size
+        n = end - self._pos
+        buffer[:n] = data[offset : offset + n]
+        self._pos = end
+        return n
+
 
 class PDFParser:
     """Parser for extracting bibliographic information from PDFs."""
 
-    def __init__(self, timeout: int = 15):
+    def __init__(
+        self,
+        timeout: int = 15,
+        max_bytes: int = MAX_PDF_BYTES,
+        block_size: int = RANGE_BLOCK_SIZE,
+    ):
+        """
+        Initialize the parser.
+
+        Args:
+            timeout: Request timeout in seconds
+            max_bytes: Most bytes downloaded for one PDF
+            block_size: Size of the blocks fetched with Range requests
+        """
         self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.block_size = block_size
         self.headers = {
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
+        self.session = get_http_session()
 
     def extract_pdf_info(self, url: str) -> dict | None:
         """
@@ -37,25 +182,18 @@ class PDFParser:
         """
         try:
             logger.debug(f"Downloading PDF from: {url}")
-            response = requests.get(
-                url, headers=self.headers, timeout=self.timeout
-            )
-            response.raise_for_status()
-
-            # Check if it's actually a PDF
-            content_type = response.headers.get("content-type", "").lower()
-            if "pdf" not in content_type and not url.lower().endswith(".pdf"):
-                logger.warning(f"URL does not appear to be a PDF: {url}")
+            pdf_file = self._open_remote_pdf(url)
+            if pdf_file is None:
                 return None
 
-            pdf_content = io.BytesIO(response.content)
-
-            # Try multiple extraction methods
-            info = (
-                self._extract_with_pdfplumber(pdf_content)
-                or self._extract_with_pypdf2(pdf_content)
-                or self._extract_from_url_patterns(url)
-            )
+            # Text of the first pages is extracted once and shared by the
+            # fallbacks, which only parse what pdfplumber couldn't
+            with pdf_file:
+                text = self._extract_text_with_pdfplumber(pdf_file)
+                info = (
+                    self._parse_text_for_info(text) if text else None
+                ) or self._extract_with_pypdf2(pdf_file, need_text=not text)
+            info = info or self._extract_from_url_patterns(url)
 
             if info:
                 info["source_url"] = url
@@ -72,34 +210,130 @@ class PDFParser:
             logger.error(f"Error processing PDF from {url}: {e}")
             return None
 
-    def _extract_with_pdfplumber(self, pdf_content: io.BytesIO) -> dict | None:
-        """Extract info using pdfplumber."""
+    def _open_remote_pdf(self, url: str) -> io.BufferedIOBase | None:
+        """
+        Open a PDF URL as a seekable file without downloading all of it.
+
+        The first block is requested with a Range header. A 206 answer
+        means the rest can be fetched on demand; a 200 answer (no Range
+        support, or a cached copy) is streamed up to max_bytes.
+
+        Returns:
+            Seekable binary file, or None if the URL isn't a PDF
+        """
+        headers = {**self.headers, "Range": f"bytes=0-{self.block_size - 1}"}
+        response = self.session.get(
+            url, headers=headers, timeout=self.timeout, stream=True
+        )
         try:
-            pdf_content.seek(0)
-            with pdfplumber.open(pdf_content) as pdf:
-                if not pdf.pages:
-                    return None
+            response.raise_for_status()
 
-                # Extract text from first few pages
+            # Check if it's actually a PDF
+            content_type = response.headers.get("content-type", "").lower()
+            if "pdf" not in content_type and not url.lower().endswith(".pdf"):
+                logger.warning(f"URL does not appear to be a PDF: {url}")
+                return None
+
+            size = _parse_content_range(response.headers.get("Content-Range"))
+            if response.status_code == 206 and size is not None:
+                raw = _RangeFile(
+                    lambda start, end: self._fetch_range(url, start, end),
+                    size,
+                    block_size=self.block_size,
+                    max_bytes=self.max_bytes,
+                )
+                raw.add_data(0, response.content[: self.block_size])
+                return io.BufferedReader(raw, buffer_size=self.block_size)
+
+            body, complete = self._read_capped(response)
+            if not complete:
+                logger.info(
+                    f"PDF larger than {self.max_bytes} bytes and no Range "
+                    f"support, parsing the first part only: {url}"
+                )
+            elif isinstance(self.session, CachedSession) and not isinstance(
+                response, CachedResponse
+            ):
+                self.session.store_response(url, response, body, headers)
+            return io.BytesIO(body)
+        finally:
+            response.close()
+
+    def _fetch_range(self, url: str, start: int, end: int) -> bytes:
+        """Download bytes start..end (inclusive) of a URL"""
+        headers = {**self.headers, "Range": f"bytes={start}-{end}"}
+        response = self.session.get(
+            url, headers=headers, timeout=self.timeout, stream=True
+        )
+        try:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise OSError(f"Server stopped honouring Range for {url}")
+            body, _ = self._read_capped(response, end - start + 1)
+            return body
+        finally:
+            response.close()
+
+    def _read_capped(
+        self, response: requests.Response, limit: int | None = None
+    ) -> tuple[bytes, bool]:
+        """
+        Read a streamed body, stopping after limit bytes.
+
+        Returns:
+            The body (at most limit bytes) and whether it is complete
+        """
+        limit = self.max_bytes if limit is None else limit
+        chunks = []
+        received = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            received += len(chunk)
+            if received > limit:
+                return b"".join(chunks)[:limit], False
+        return b"".join(chunks), True
+
+    def _extract_text_with_pdfplumber(self, pdf_file: io.IOBase) -> str:
+        """Extract the text of the first pages using pdfplumber."""
+        try:
+            pdf_file.seek(0)
+            with pdfplumber.open(pdf_file) as pdf:
+                # pdf.pages would walk the whole page tree, so only the
+                # first pages are created here
                 text = ""
-                for i, page in enumerate(pdf.pages[:3]):  # First 3 pages
+                doctop = 0
+                pages = PDFPage.create_pages(pdf.doc)
+                for i, pdf_page in enumerate(
+                    itertools.islice(pages, TEXT_PAGES)
+                ):
+                    page = Page(
+                        pdf, pdf_page, page_number=i + 1, initial_doctop=doctop
+                    )
+                    doctop += page.height
                     page_text = page.extract_text()
                     if page_text:
                         text += page_text + "\n"
-
-                if text.strip():
-                    return self._parse_text_for_info(text)
+                return text if text.strip() else ""
 
         except Exception as e:
             logger.debug(f"PDFPlumber extraction failed: {e}")
 
-        return None
+        return ""
+
+    def _extract_with_pypdf2(
+        self, pdf_file: io.IOBase, need_text: bool = True
+    ) -> dict | None:
+        """
+        Extract info using PyPDF2.
 
-    def _extract_with_pypdf2(self, pdf_content: io.BytesIO) -> dict | None:
-        """Extract info using PyPDF2."""
+        Args:
+            pdf_file: Seekable PDF file
+            need_text: Whether to parse page text if the metadata is empty
+                (False when pdfplumber already extracted the text)
+        """
         try:
-            pdf_content.seek(0)
-            reader = PdfReader(pdf_content)
+            pdf_file.seek(0)
+            reader = PdfReader(pdf_file)
 
             # Try metadata first
             metadata = reader.metadata
@@ -115,9 +349,12 @@ class PDFParser:
                 if info:
                     return info
 
+            if not need_text:
+                return None
+
             # Extract text from first few pages
             text = ""
-            for i, page in enumerate(reader.pages[:3]):
+            for i, page in enumerate(reader.pages[:TEXT_PAGES]):
                 try:
                     page_text = page.extract_text()
                     if page_text:
@@ -0,0 +1,327 @@
+"""
+Per-host request rate limiting.
+
+A token bucket is kept for every host (api.crossref.org, export.arxiv.org,
+doi.org, ...). Requests to the same host are spaced out while requests to
+different hosts proceed in parallel. The limiter is safe to share between
+threads and asyncio tasks: callers reserve a time slot under a short lock and
+then sleep outside of it.
+
+Most code should use the process-wide instance from get_rate_limiter() so
+that every client talking to the same host draws from the same bucket.
+Worker processes can draw from the buckets of their parent: the parent
+moves its buckets into a multiprocessing manager with share(), and each
+worker attaches to them with use_shared_state().
+"""
+
+# Standard library imports
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Iterator, MutableMapping
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between requests for hosts with published usage limits.
+# Callers may ask for a longer delay, never a shorter one.
+DEFAULT_DOMAIN_DELAYS = {
+    "export.arxiv.org": 3.0,  # arXiv API terms: one request every 3 seconds
+}
+
+# Status codes that signal the host wants us to slow down
+RATE_LIMIT_STATUS_CODES = {429, 503}
+
+
+def get_request_host(url: str) -> str:
+    """Return the normalized host used as the throttling key for a URL"""
+    try:
+        host = urlparse(url).netloc.lower()
+    except (AttributeError, TypeError, ValueError):
+        return ""
+
+    # Strip credentials and port, they don't change the politeness target
+    if "@" in host:
+        host = host.rsplit("@", 1)[1]
+    if ":" in host:
+        host = host.split(":", 1)[0]
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Either a number of seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the value is missing or malformed
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class _TokenBucket:
+    """Token bucket state for one host (guarded by the limiter lock)"""
+
+    def __init__(self, interval: float, capacity: int, now: float):
+        self.interval = interval  # Seconds to earn one token
+        self.capacity = capacity  # Burst size
+        self.tokens = float(capacity)
+        # Time at which `tokens` is valid; lies in the future while the
+        # host is backing off
+        self.updated = now
+        self.strikes = 0  # Consecutive rate-limit responses
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return the seconds until it may be used"""
+        if self.interval <= 0:
+            return max(0.0, self.updated - now)
+
+        if now > self.updated:
+            earned = (now - self.updated) / self.interval
+            self.tokens = min(self.capacity, self.tokens + earned)
+            self.updated = now
+
+        # Tokens may go negative: every reservation queues behind the
+        # previous one instead of racing for the same slot
+        self.tokens -= 1
+        ready_at = self.updated
+        if self.tokens < 0:
+            ready_at += -self.tokens * self.interval
+        return max(0.0, ready_at - now)
+
+    def block(self, until: float) -> None:
+        """Refuse requests until the given time, then resume without burst"""
+        if until > self.updated:
+            self.updated = until
+            self.tokens = 1.0
+
+
+class DomainRateLimiter:
+    """
+    Token-bucket rate limiter keyed by host.
+
+    Example:
+        limiter = get_rate_limiter()
+        limiter.wait("https://arxiv.org/abs/2301.00001", delay=1.0)
+        response = session.get(url)
+        if limiter.update_from_response(url, response):
+            ...  # 429 received, later requests to the host will wait
+    """
+
+    def __init__(
+        self,
+        delay: float = 1.0,
+        domain_delays: dict[str, float] | None = None,
+        burst: int = 1,
+        max_backoff: float = 300.0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            delay: Default seconds between requests to one host
+            domain_delays: Per-host minimum delays, e.g. {"arxiv.org": 3.0};
+                subdomains match too, the most specific entry wins
+            burst: Number of requests a host may receive back to back
+            max_backoff: Upper bound in seconds for rate-limit backoff
+        """
+        self.delay = delay
+        self.domain_delays = dict(domain_delays or {})
+        self.burst = max(1, burst)
+        self.max_backoff = max_backoff
+        # Replaced by manager proxies while shared between processes; a
+        # bucket is written back after every change so proxies see it
+        self._buckets: MutableMapping[str, _TokenBucket] = {}
+        self._lock: Any = threading.Lock()
+
+    def get_delay(self, host: str) -> float | None:
+        """Get the configured minimum delay for a host, if any"""
+        best_match = None
+        for domain in self.domain_delays:
+            if host == domain or host.endswith("." + domain):
+                if best_match is None or len(domain) > len(best_match):
+                    best_match = domain
+        return self.domain_delays[best_match] if best_match else None
+
+    def _get_bucket(
+        self, host: str, delay: float | None, now: float
+    ) -> _TokenBucket:
+        """Get or create the bucket for a host
+
+        The caller holds the lock and stores the bucket back after use.
+        """
+        interval = self.delay if delay is None else delay
+        configured = self.get_delay(host)
+        if configured is not None:
+            interval = max(interval, configured)
+
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = _TokenBucket(interval, self.burst, now)
+        elif interval > bucket.interval:
+            # Clients sharing a host get the most conservative delay
+            bucket.interval = interval
+        return bucket
+
+    def reserve(self, url: str, delay: float | None = None) -> float:
+        """
+        Reserve the next free request slot for the URL's host.
+
+        Args:
+            url: URL about to be requested
+            delay: Seconds between requests wanted by the caller
+                (defaults to the limiter's delay)
+
+        Returns:
+            Number of seconds the caller has to wait before sending
+        """
+        host = get_request_host(url)
+        with self._lock:
+            # CLOCK_MONOTONIC is system-wide, so shared buckets stay valid
+            now = time.monotonic()
+            bucket = self._get_bucket(host, delay, now)
+            wait_time = bucket.reserve(now)
+            self._buckets[host] = bucket
+            return wait_time
+
+    def wait(self, url: str, delay: float | None = None) -> float:
+        """
+        Block until a request to the URL's host is allowed.
+
+        Returns:
+            Number of seconds actually slept
+        """
+        wait_time = self.reserve(url, delay)
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    async def wait_async(self, url: str, delay: float | None = None) -> float:
+        """Asyncio version of wait() that doesn't block the event loop"""
+        wait_time = self.reserve(url, delay)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+    def backoff(self, url: str, retry_after: float | None = None) -> float:
+        """
+        Pause all requests to the URL's host after a rate-limit response.
+
+        Args:
+            url: URL that was rate limited
+            retry_after: Seconds requested by the server; without it the
+                backoff doubles with every consecutive rate-limit response
+
+        Returns:
+            Number of seconds the host is paused
+        """
+        host = get_request_host(url)
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._get_bucket(host, None, now)
+            if retry_after is None:
+                retry_after = max(bucket.interval, 1.0) * 2**bucket.strikes
+            retry_after = min(retry_after, self.max_backoff)
+            bucket.strikes += 1
+            bucket.block(now + retry_after)
+            self._buckets[host] = bucket
+
+        logger.warning(
+            f"Rate limited by {host}, pausing for {retry_after:.1f}s"
+        )
+        return retry_after
+
+    def update_from_response(self, url: str, response: Any) -> bool:
+        """
+        Record the outcome of a request.
+
+        Args:
+            url: URL that was requested
+            response: requests.Response (or anything with status_code and
+                headers)
+
+        Returns:
+            True if the host rate limited us and the request should be
+            retried after waiting again
+        """
+        status_code = getattr(response, "status_code", None)
+        if status_code in RATE_LIMIT_STATUS_CODES:
+            headers = getattr(response, "headers", None) or {}
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            # A 503 without Retry-After is an outage, not a rate limit
+            if status_code == 429 or retry_after is not None:
+                self.backoff(url, retry_after)
+                return True
+
+        host = get_request_host(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is not None and bucket.strikes:
+                bucket.strikes = 0
+                self._buckets[host] = bucket
+        return False
+
+    @contextmanager
+    def share(self, manager: Any) -> Iterator[tuple[Any, Any]]:
+        """
+        Keep the buckets in a multiprocessing manager while in the block.
+
+        Args:
+            manager: Started multiprocessing manager
+
+        Yields:
+            Shared state to pass to use_shared_state() in worker processes
+        """
+        with self._lock:
+            buckets = manager.dict(dict(self._buckets))
+            lock = manager.Lock()
+            local_lock = self._lock
+            self._buckets, self._lock = buckets, lock
+        try:
+            yield buckets, lock
+        finally:
+            with lock:
+                # Keep the state earned while shared
+                self._buckets, self._lock = dict(buckets), local_lock
+
+    def use_shared_state(self, state: tuple[Any, Any]) -> None:
+        """Draw from buckets shared by another process's share()."""
+        with self._lock:
+            self._buckets, self._lock = state
+
+
+_shared_limiter: DomainRateLimiter | None = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> DomainRateLimiter:
+    """Get the process-wide limiter shared by all HTTP clients"""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = DomainRateLimiter(
+                delay=1.0, domain_delays=DEFAULT_DOMAIN_DELAYS
+            )
+        return _shared_limiter
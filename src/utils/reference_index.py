@@ -0,0 +1,798 @@
+"""
+Local index of bibliographic records for offline DOI and title lookups.
+
+Validators resolve titles to DOIs and DOIs to metadata by querying CrossRef
+and arXiv live, even for works they have looked up many times before.
+ReferenceIndex keeps every record they get back, and records imported from
+our caches or from bulk metadata dumps, in a SQLite database with:
+
+- the records themselves, keyed by DOI and arXiv ID
+- an inverted index of normalized title words with document frequencies,
+  so a title query only reads the postings of its rarest words
+- an author surname index for narrowing title matches
+- the sources that contributed to each merged record, so lookups limited
+  to a source still find a record whose fields another source won
+
+Candidates sharing the most rare title words are reranked with the shared
+fuzzy matcher, so title -> DOI and DOI -> metadata queries are answered in
+milliseconds and only real misses go to the network.
+
+Records use the dictionary format of the API clients (see
+CrossRefClient._parse_work), with a "source" key naming where they came
+from. Most code should call get_reference_index() for the index configured
+for the process. DEEP_BIBLIO_REFERENCE_INDEX=0 disables it.
+"""
+
+# Standard library imports
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+from .similarity import CandidateIndex, normalize_text
+from .storage import ThreadLocalConnection, connect_sqlite
+
+if TYPE_CHECKING:
+    from .cache import BiblioCache
+    from .http_cache import HTTPCache
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS works (
+    id INTEGER PRIMARY KEY,
+    doi TEXT UNIQUE,
+    arxiv_id TEXT UNIQUE,
+    title TEXT,
+    year INTEGER,
+    source TEXT,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS title_terms (
+    term TEXT NOT NULL,
+    work_id INTEGER NOT NULL,
+    PRIMARY KEY (term, work_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS term_stats (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS surnames (
+    surname TEXT NOT NULL,
+    work_id INTEGER NOT NULL,
+    PRIMARY KEY (surname, work_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS work_sources (
+    work_id INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    PRIMARY KEY (work_id, source)
+) WITHOUT ROWID;
+"""
+
+# Version of the schema in PRAGMA user_version
+_SCHEMA_VERSION = 1
+
+# Condition on works rows for lookups limited to a source
+_FROM_SOURCE = (
+    "EXISTS (SELECT 1 FROM work_sources "
+    "WHERE work_id = works.id AND source = ?)"
+)
+
+# Words too common in titles to find anything with
+STOPWORDS = frozenset(
+    "a an and as at by for from in into is of on or the to via with".split()
+)
+
+# Rarest title words used to collect candidates for a query
+MAX_QUERY_TERMS = 6
+
+# Postings read per query word
+MAX_POSTINGS = 5000
+
+# Candidates reranked by title similarity per query
+MAX_CANDIDATES = 200
+
+# Title similarity at which a local record answers a search
+LOCAL_MATCH_THRESHOLD = 0.95
+
+# When records of the same work are merged, fields from the more
+# authoritative source win
+SOURCE_PRIORITY = {"crossref": 3, "arxiv": 2, "cache": 1}
+
+
+def _priority(source: str | None) -> int:
+    return SOURCE_PRIORITY.get(source or "", 0)
+
+
+def normalize_doi(doi: str) -> str:
+    """Lowercase a DOI and strip doi: and resolver URL prefixes"""
+    doi = doi.strip()
+    lowered = doi.lower()
+    for prefix in (
+        "https://doi.org/",
+        "http://doi.org/",
+        "https://dx.doi.org/",
+        "http://dx.doi.org/",
+        "doi:",
+    ):
+        if lowered.startswith(prefix):
+            lowered = lowered[len(prefix) :]
+            break
+    return lowered.strip()
+
+
+def normalize_arxiv_id(arxiv_id: str) -> str:
+    """Strip arxiv: and abs URL prefixes and the version suffix"""
+    arxiv_id = arxiv_id.strip()
+    if arxiv_id.lower().startswith("arxiv:"):
+        arxiv_id = arxiv_id[6:]
+    if "arxiv.org/abs/" in arxiv_id:
+        arxiv_id = arxiv_id.split("arxiv.org/abs/")[-1]
+    v_pos = arxiv_id.rfind("v")
+    if v_pos > 0 and arxiv_id[v_pos + 1 :].isdigit():
+        arxiv_id = arxiv_id[:v_pos]
+    return arxiv_id.strip("/")
+
+
+def title_terms(title: str) -> list[str]:
+    """Distinct indexable words of a title"""
+    terms = []
+    for word in normalize_text(title).split():
+        if len(word) > 1 and word not in STOPWORDS and word not in terms:
+            terms.append(word)
+    return terms
+
+
+def author_surname(author: dict[str, Any] | str) -> str | None:
+    """Normalized surname of an author dict or "Family, Given" string"""
+    if isinstance(author, dict):
+        name = author.get("family") or author.get("name") or ""
+        if not author.get("family"):
+            parts = name.split()
+            name = parts[-1] if parts else ""
+    else:
+        name = author.strip()
+        if "," in name:
+            name = name.split(",")[0]
+        else:
+            parts = name.split()
+            name = parts[-1] if parts else ""
+    surname = normalize_text(name)
+    return surname or None
+
+
+def _open_text(path: Path) -> TextIO:
+    """Open a dump file, transparently decompressing .gz"""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def _dump_files(path: Path) -> list[Path]:
+    """JSON / JSON-lines files of a dump (a file or a directory)"""
+    path = Path(path)
+    if path.is_file():
+        return [path]
+    return sorted(
+        p
+        for p in path.rglob("*")
+        if p.is_file()
+        and p.name.endswith((".json", ".json.gz", ".jsonl", ".jsonl.gz"))
+    )
+
+
+def _iter_json_documents(path: Path) -> Iterator[Any]:
+    """Documents of a JSON file or of each line of a JSON-lines file"""
+    with _open_text(path) as f:
+        if ".jsonl" in path.name:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.debug(f"Skipping bad line in {path}")
+        else:
+            yield json.load(f)
+
+
+class ReferenceIndex:
+    """SQLite index of bibliographic records"""
+
+    def __init__(self, db_path: Path | None = None):
+        """
+        Initialize the index.
+
+        Args:
+            db_path: Database file.
+                     Defaults to ~/.deep-biblio-cache/reference_index.db
+        """
+        if db_path is None:
+            db_path = Path.home() / ".deep-biblio-cache" / "reference_index.db"
+        self.db_path = Path(db_path)
+        self._connection = ThreadLocalConnection(self._connect)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = connect_sqlite(self.db_path, _SCHEMA)
+        version: int = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < _SCHEMA_VERSION:
+            # Indexes written before work_sources knew only the winning
+            # source of each record
+            with conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO work_sources (work_id, source) "
+                    "SELECT id, source FROM works WHERE source IS NOT NULL"
+                )
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        return conn
+
+    def _get_connection(self) -> sqlite3.Connection:
+        return self._connection.get()
+
+    def close(self) -> None:
+        """Close this thread's connection"""
+        self._connection.close()
+
+    # Writing
+
+    def add(self, record: dict[str, Any], source: str | None = None) -> bool:
+        """
+        Add or update one record.
+
+        Args:
+            record: Record in the API client format
+            source: Where the record came from (e.g. "crossref")
+
+        Returns:
+            True if the record had a DOI or arXiv ID and was stored
+        """
+        return self.add_many([record], source) == 1
+
+    def add_many(
+        self, records: Iterable[dict[str, Any]], source: str | None = None
+    ) -> int:
+        """
+        Add or update records in one transaction.
+
+        A record replaces the stored one with the same DOI or arXiv ID;
+        fields it lacks are kept from the stored record.
+
+        Returns:
+            Number of records stored
+        """
+        conn = self._get_connection()
+        stored = 0
+        with conn:
+            for record in records:
+                if self._store(conn, record, source):
+                    stored += 1
+        return stored
+
+    def _store(
+        self,
+        conn: sqlite3.Connection,
+        record: dict[str, Any],
+        source: str | None,
+    ) -> bool:
+        doi = normalize_doi(record["doi"]) if record.get("doi") else None
+        arxiv_id = (
+            normalize_arxiv_id(record["arxiv_id"])
+            if record.get("arxiv_id")
+            else None
+        )
+        if not doi and not arxiv_id:
+            return False
+
+        data = {k: v for k, v in record.items() if v not in (None, "", [])}
+        data.pop("match_score", None)
+        if source:
+            data["source"] = source
+        sources = {data["source"]} if data.get("source") else set()
+
+        # A record may join a DOI entry and an arXiv entry into one
+        for existing in self._find(conn, doi, arxiv_id):
+            old = json.loads(existing["data"])
+            sources.update(
+                row["source"]
+                for row in conn.execute(
+                    "SELECT source FROM work_sources WHERE work_id = ?",
+                    (existing["id"],),
+                )
+            )
+            if _priority(old.get("source")) > _priority(data.get("source")):
+                data = {**data, **old}
+            else:
+                data = {**old, **data}
+            doi = doi or existing["doi"]
+            arxiv_id = arxiv_id or existing["arxiv_id"]
+            self._unindex(conn, existing["id"], old)
+            conn.execute("DELETE FROM works WHERE id = ?", (existing["id"],))
+
+        year = data.get("year")
+        cursor = conn.execute(
+            "INSERT INTO works "
+            "(doi, arxiv_id, title, year, source, data, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                doi,
+                arxiv_id,
+                data.get("title"),
+                int(str(year)) if str(year or "").isdigit() else None,
+                data.get("source"),
+                json.dumps(data, ensure_ascii=False),
+                time.time(),
+            ),
+        )
+        work_id = cursor.lastrowid
+        if work_id is None:
+            raise sqlite3.DatabaseError("INSERT INTO works set no row id")
+        self._index(conn, work_id, data)
+        conn.executemany(
+            "INSERT INTO work_sources (work_id, source) VALUES (?, ?)",
+            [(work_id, name) for name in sorted(sources)],
+        )
+        return True
+
+    @staticmethod
+    def _find(
+        conn: sqlite3.Connection, doi: str | None, arxiv_id: str | None
+    ) -> list[sqlite3.Row]:
+        """Stored entries with the DOI or the arXiv ID"""
+        return conn.execute(
+            "SELECT * FROM works WHERE doi = ? OR arxiv_id = ?",
+            (doi, arxiv_id),
+        ).fetchall()
+
+    @staticmethod
+    def _surnames(data: dict[str, Any]) -> set[str]:
+        return {
+            surname
+            for surname in map(author_surname, data.get("authors") or [])
+            if surname
+        }
+
+    def _index(
+        self, conn: sqlite3.Connection, work_id: int, data: dict[str, Any]
+    ) -> None:
+        terms = title_terms(data.get("title") or "")
+        conn.executemany(
+            "INSERT OR IGNORE INTO title_terms (term, work_id) VALUES (?, ?)",
+            [(term, work_id) for term in terms],
+        )
+        conn.executemany(
+            "INSERT INTO term_stats (term, df) VALUES (?, 1) "
+            "ON CONFLICT(term) DO UPDATE SET df = df + 1",
+            [(term,) for term in terms],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO surnames (surname, work_id) VALUES (?, ?)",
+            [(surname, work_id) for surname in self._surnames(data)],
+        )
+
+    def _unindex(
+        self, conn: sqlite3.Connection, work_id: int, data: dict[str, Any]
+    ) -> None:
+        terms = title_terms(data.get("title") or "")
+        conn.execute("DELETE FROM title_terms WHERE work_id = ?", (work_id,))
+        conn.executemany(
+            "UPDATE term_stats SET df = df - 1 WHERE term = ?",
+            [(term,) for term in terms],
+        )
+        conn.execute("DELETE FROM surnames WHERE work_id = ?", (work_id,))
+        conn.execute("DELETE FROM work_sources WHERE work_id = ?", (work_id,))
+
+    # Reading
+
+    def get_by_doi(
+        self, doi: str, source: str | None = None
+    ) -> dict[str, Any] | None:
+        """Get the record of a DOI (optionally one a source added to), or None"""
+        return self._get_one("doi", normalize_doi(doi), source)
+
+    def get_by_arxiv_id(
+        self, arxiv_id: str, source: str | None = None
+    ) -> dict[str, Any] | None:
+        """Get the record of an arXiv ID (any version), or None"""
+        return self._get_one("arxiv_id", normalize_arxiv_id(arxiv_id), source)
+
+    def _get_one(
+        self, column: str, value: str, source: str | None
+    ) -> dict[str, Any] | None:
+        query = f"SELECT data FROM works WHERE {column} = ?"
+        params = [value]
+        if source:
+            query += f" AND {_FROM_SOURCE}"
+            params.append(source)
+        try:
+            row = self._get_connection().execute(query, params).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"Reference index lookup failed: {e}")
+            return None
+        return json.loads(row["data"]) if row else None
+
+    def search_by_title(
+        self,
+        title: str,
+        author: str | None = None,
+        limit: int = 5,
+        min_similarity: float = 0.8,
+        source: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Find records by title and optionally author.
+
+        Args:
+            title: Title to search for
+            author: Author name; records with this surname are preferred
+            limit: Maximum number of results
+            min_similarity: Lowest title similarity of a result
+            source: Only return records this source contributed to
+
+        Returns:
+            Records, best first, each with a "match_score" key
+        """
+        terms = title_terms(title)
+        if not terms:
+            return []
+        try:
+            rows = self._title_candidates(terms, author, source)
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"Reference index search failed: {e}")
+            return []
+        if not rows:
+            return []
+
+        index = CandidateIndex(row["title"] or "" for row in rows)
+        results = []
+        for position, score in index.search(
+            title, limit=limit, cutoff=min_similarity
+        ):
+            record = json.loads(rows[position]["data"])
+            record["match_score"] = round(score, 4)
+            results.append(record)
+        return results
+
+    def _title_candidates(
+        self, terms: list[str], author: str | None, source: str | None
+    ) -> list[sqlite3.Row]:
+        """Records sharing the most rare title words with a query"""
+        conn = self._get_connection()
+        placeholders = ", ".join("?" * len(terms))
+        stats = conn.execute(
+            f"SELECT term FROM term_stats "
+            f"WHERE term IN ({placeholders}) AND df > 0 ORDER BY df",
+            terms,
+        ).fetchall()
+
+        hits: Counter[int] = Counter()
+        for (term,) in stats[:MAX_QUERY_TERMS]:
+            for (work_id,) in conn.execute(
+                "SELECT work_id FROM title_terms WHERE term = ? LIMIT ?",
+                (term, MAX_POSTINGS),
+            ):
+                hits[work_id] += 1
+        if not hits:
+            return []
+        candidates = [
+            work_id for work_id, _ in hits.most_common(MAX_CANDIDATES)
+        ]
+
+        surname = author_surname(author) if author else None
+        if surname:
+            placeholders = ", ".join("?" * len(candidates))
+            by_author = [
+                work_id
+                for (work_id,) in conn.execute(
+                    f"SELECT work_id FROM surnames WHERE surname = ? "
+                    f"AND work_id IN ({placeholders})",
+                    [surname, *candidates],
+                )
+            ]
+            if by_author:
+                candidates = by_author
+
+        placeholders = ", ".join("?" * len(candidates))
+        query = f"SELECT title, data FROM works WHERE id IN ({placeholders})"
+        params: list[int | str] = [*candidates]
+        if source:
+            query += f" AND {_FROM_SOURCE}"
+            params.append(source)
+        return conn.execute(query, params).fetchall()
+
+    def find_by_author(
+        self, author: str, limit: int = 50
+    ) -> list[dict[str, Any]]:
+        """Get records with an author of this surname"""
+        surname = author_surname(author)
+        if not surname:
+            return []
+        rows = (
+            self._get_connection()
+            .execute(
+                "SELECT w.data FROM surnames s JOIN works w ON w.id = s.work_id "
+                "WHERE s.surname = ? LIMIT ?",
+                (surname, limit),
+            )
+            .fetchall()
+        )
+        return [json.loads(row["data"]) for row in rows]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Count records per source"""
+        conn = self._get_connection()
+        by_source = {
+            row["source"] or "unknown": row["n"]
+            for row in conn.execute(
+                "SELECT source, COUNT(*) AS n FROM works GROUP BY source"
+            )
+        }
+        return {
+            "db_path": str(self.db_path),
+            "total_records": sum(by_source.values()),
+            "by_source": by_source,
+        }
+
+    def __len__(self) -> int:
+        count: int = (
+            self._get_connection()
+            .execute("SELECT COUNT(*) FROM works")
+            .fetchone()[0]
+        )
+        return count
+
+    # Importing
+
+    def import_crossref_dump(self, path: Path, batch_size: int = 5000) -> int:
+        """
+        Import a CrossRef metadata snapshot.
+
+        Args:
+            path: A file or directory of .json(.gz) files holding {"items":
+                  [...]} (the public data file layout) or API responses, or
+                  .jsonl(.gz) files with one work per line
+            batch_size: Records per transaction
+
+        Returns:
+            Number of records stored
+        """
+        from ..api_clients.crossref import CrossRefClient
+
+        parser = CrossRefClient()
+
+        def works() -> Iterator[dict[str, Any]]:
+            for file_path in _dump_files(path):
+                for document in _iter_json_documents(file_path):
+                    if isinstance(document, dict) and "message" in document:
+                        document = document["message"]
+                    if isinstance(document, dict) and "items" in document:
+                        items = document["items"]
+                    else:
+                        items = [document]
+                    for item in items:
+                        if isinstance(item, dict) and item.get("DOI"):
+                            yield parser._parse_work(item)
+
+        return self._import_batched(works(), "crossref", batch_size)
+
+    def import_arxiv_dump(self, path: Path, batch_size: int = 5000) -> int:
+        """
+        Import an arXiv metadata snapshot (the JSON-lines file with one
+        paper per line, as distributed on Kaggle).
+
+        Returns:
+            Number of records stored
+        """
+
+        def papers() -> Iterator[dict[str, Any]]:
+            for file_path in _dump_files(path):
+                for paper in _iter_json_documents(file_path):
+                    if isinstance(paper, dict) and paper.get("id"):
+                        yield _parse_arxiv_snapshot_paper(paper)
+
+        return self._import_batched(papers(), "arxiv", batch_size)
+
+    def import_biblio_cache(self, cache: "BiblioCache") -> int:
+        """
+        Import the BibTeX entries of a BiblioCache.
+
+        Args:
+            cache: BiblioCache to read
+
+        Returns:
+            Number of records stored
+        """
+        conn = cache._get_connection()
+        rows = conn.execute(
+            "SELECT url, doi, bibtex_data FROM cache_entries "
+            "WHERE bibtex_data IS NOT NULL"
+        )
+
+        def records() -> Iterator[dict[str, Any]]:
+            for row in rows:
+                try:
+                    entry = json.loads(row["bibtex_data"])
+                except (TypeError, json.JSONDecodeError):
+                    continue
+                record = _parse_bibtex_entry(entry, row["doi"], row["url"])
+                if record:
+                    yield record
+
+        return self._import_batched(records(), "cache", 5000)
+
+    def import_http_cache(self, http_cache: "HTTPCache") -> int:
+        """
+        Import the CrossRef and arXiv API responses stored in an HTTPCache.
+
+        Args:
+            http_cache: HTTPCache to read
+
+        Returns:
+            Number of records stored
+        """
+        from ..api_clients.arxiv import ArXivClient
+        from ..api_clients.crossref import CrossRefClient
+
+        crossref = CrossRefClient()
+        arxiv = ArXivClient()
+
+        def records() -> Iterator[tuple[dict[str, Any], str]]:
+            for entry, body in http_cache.iter_responses(
+                (
+                    "https://api.crossref.org/works",
+                    "http://export.arxiv.org/api/",
+                    "https://export.arxiv.org/api/",
+                )
+            ):
+                text = body.decode("utf-8", errors="replace")
+                if "arxiv.org" in entry["url"]:
+                    for paper in arxiv._parse_arxiv_response(text):
+                        yield paper, "arxiv"
+                    continue
+                try:
+                    message = json.loads(text).get("message", {})
+                except (ValueError, AttributeError):
+                    continue
+                items = message.get("items", [message])
+                for item in items:
+                    if isinstance(item, dict) and item.get("DOI"):
+                        yield crossref._parse_work(item), "crossref"
+
+        stored = 0
+        for record, source in records():
+            stored += self.add(record, source)
+        return stored
+
+    def _import_batched(
+        self, records: Iterable[dict[str, Any]], source: str, batch_size: int
+    ) -> int:
+        stored = 0
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                stored += self.add_many(batch, source)
+                batch = []
+                logger.info(f"Imported {stored} {source} records")
+        if batch:
+            stored += self.add_many(batch, source)
+        return stored
+
+
+def _parse_arxiv_snapshot_paper(paper: dict[str, Any]) -> dict[str, Any]:
+    """Convert an arXiv snapshot paper to the API client format"""
+    arxiv_id = paper["id"]
+    authors = []
+    for parts in paper.get("authors_parsed") or []:
+        family = parts[0] if parts else ""
+        given = parts[1] if len(parts) > 1 else ""
+        authors.append(
+            {"family": family, "given": given, "name": f"{given} {family}"}
+        )
+
+    year = None
+    versions = paper.get("versions") or []
+    if versions:
+        # "Mon, 2 Apr 2007 19:18:42 GMT"
+        date_parts = versions[0].get("created", "").split()
+        if len(date_parts) > 3 and date_parts[3].isdigit():
+            year = int(date_parts[3])
+    if year is None and (paper.get("update_date") or "")[:4].isdigit():
+        year = int(paper["update_date"][:4])
+
+    return {
+        "arxiv_id": arxiv_id,
+        "doi": paper.get("doi"),
+        "title": " ".join((paper.get("title") or "").split()),
+        "authors": authors,
+        "year": year,
+        "journal_ref": paper.get("journal-ref"),
+        "categories": (paper.get("categories") or "").split(),
+        "url": f"https://arxiv.org/abs/{arxiv_id}",
+    }
+
+
+def _parse_bibtex_entry(
+    entry: dict[str, Any], doi: str | None, url: str
+) -> dict[str, Any] | None:
+    """Convert a cached BibtexEntry to the API client format"""
+    fields = entry.get("fields") or {}
+    title = fields.get("title", "").replace("{", "").replace("}", "")
+    title = " ".join(title.split())
+    if not title:
+        return None
+
+    authors = []
+    for name in fields.get("author", "").split(" and "):
+        name = name.strip()
+        if not name:
+            continue
+        if "," in name:
+            family, given = (part.strip() for part in name.split(",", 1))
+        else:
+            parts = name.split()
+            family, given = parts[-1], " ".join(parts[:-1])
+        authors.append({"family": family, "given": given, "name": name})
+
+    arxiv_id = fields.get("eprint") if "arxiv" in url.lower() else None
+    if not arxiv_id and "arxiv.org/abs/" in url:
+        arxiv_id = url
+    year = fields.get("year", "")
+
+    return {
+        "doi": doi or entry.get("doi") or fields.get("doi"),
+        "arxiv_id": arxiv_id,
+        "title": title,
+        "authors": authors,
+        "year": int(year) if year.isdigit() else None,
+        "journal": fields.get("journal") or fields.get("booktitle"),
+        "volume": fields.get("volume"),
+        "pages": fields.get("pages"),
+        "publisher": fields.get("publisher"),
+        "url": url,
+    }
+
+
+_settings: dict[str, Any] = {
+    "enabled": os.environ.get("DEEP_BIBLIO_REFERENCE_INDEX", "1") != "0",
+    "db_path": None,
+}
+_shared_index: ReferenceIndex | None = None
+_shared_index_lock = threading.Lock()
+
+
+def configure_reference_index(
+    enabled: bool | None = None, db_path: Path | None = None
+) -> None:
+    """
+    Configure the process-wide reference index (before clients are created).
+
+    Args:
+        enabled: Whether get_reference_index() returns an index
+        db_path: Database file
+    """
+    global _shared_index
+    with _shared_index_lock:
+        if enabled is not None:
+            _settings["enabled"] = enabled
+        if db_path is not None:
+            _settings["db_path"] = db_path
+        _shared_index = None
+
+
+def get_reference_index() -> ReferenceIndex | None:
+    """Get the process-wide reference index, or None if it is disabled"""
+    global _shared_index
+    with _shared_index_lock:
+        if not _settings["enabled"]:
+            return None
+        if _shared_index is None:
+            _shared_index = ReferenceIndex(_settings["db_path"])
+        return _shared_index
@@ -10,12 +10,14 @@ Handles ResearchGate links that are blocked from robotic crawling by:
 import logging
 
 # import re  # Banned - using string methods instead
-import time
 from urllib.parse import quote_plus, unquote, urlparse
 
 import requests
 from bs4 import BeautifulSoup
 
+from src.utils.http_cache import get_http_session, serves_locally
+from src.utils.rate_limiter import get_rate_limiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,8 +29,9 @@ class ResearchGateWorkaround:
         self.headers = {
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
-        self.session = requests.Session()
+        self.session = get_http_session()
         self.session.headers.update(self.headers)
+        self.rate_limiter = get_rate_limiter()
 
     def process_researchgate_url(self, url: str) -> dict | None:
         """
@@ -147,16 +150,17 @@ class ResearchGateWorkaround:
             Dictionary with paper information or None
         """
         try:
-            # Be respectful with delays
-            time.sleep(self.delay)
-
             # Construct Google Scholar search URL
             query = quote_plus(title)
             scholar_url = f"https://scholar.google.com/scholar?q={query}"
 
             logger.debug(f"Searching Google Scholar: {scholar_url}")
 
+            # Be respectful with delays (limiter is shared per host)
+            if not serves_locally(self.session, scholar_url):
+                self.rate_limiter.wait(scholar_url, delay=self.delay)
             response = self.session.get(scholar_url, timeout=10)
+            self.rate_limiter.update_from_response(scholar_url, response)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, "html.parser")
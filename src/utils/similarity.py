@@ -0,0 +1,237 @@
+"""
+Shared fuzzy string matching for citation validation.
+
+Validators used to compare titles, author lists and journal names with a
+fresh difflib.SequenceMatcher per pair, re-normalizing both strings every
+time. Checking an LLM-generated bibliography against search results is
+many-to-many, so that cost is paid n * m times. This module does the work
+once per distinct string and scores in bulk:
+
+- get_profile() caches a string's normalized form, token set and
+  character n-gram counts.
+- similarity() is the SequenceMatcher ratio of two profiles, skipping the
+  full comparison when difflib's cheap upper bounds already fall below a
+  cutoff.
+- CandidateIndex holds an inverted n-gram index over candidate strings.
+  One query is scored against all candidates in a single pass over the
+  postings (a sparse vector product), and only the best-scoring shortlist
+  gets the exact ratio.
+
+Scores are always difflib ratios, so they match the validators' previous
+pairwise SequenceMatcher scores.
+"""
+
+# Standard library imports
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+# Length of the character n-grams used for candidate search
+NGRAM_SIZE = 3
+
+# Number of distinct strings whose profiles are kept
+PROFILE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def normalize_text(text: str) -> str:
+    """Lowercase, turn punctuation into spaces and collapse whitespace"""
+    chars = []
+    for char in text.lower():
+        if char.isalnum() or char.isspace() or char == "_":
+            chars.append(char)
+        else:
+            chars.append(" ")
+    return " ".join("".join(chars).split())
+
+
+class TextProfile:
+    """Precomputed forms of a string used for matching"""
+
+    __slots__ = ("text", "normalized", "tokens", "ngrams", "ngram_total")
+
+    def __init__(self, text: str, normalize: bool = True):
+        self.text = text
+        self.normalized = normalize_text(text) if normalize else text
+        self.tokens = frozenset(self.normalized.split())
+        padded = f" {self.normalized} "
+        self.ngrams = Counter(
+            padded[i : i + NGRAM_SIZE]
+            for i in range(len(padded) - NGRAM_SIZE + 1)
+        )
+        self.ngram_total = sum(self.ngrams.values())
+
+
+@lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def get_profile(text: str, normalize: bool = True) -> TextProfile:
+    """
+    Get the (cached) profile of a string.
+
+    Args:
+        text: String to profile
+        normalize: Compare the normalized form (see normalize_text) rather
+                   than the string itself
+    """
+    return TextProfile(text, normalize)
+
+
+def _ratio(a: str, b: str, cutoff: float = 0.0) -> float:
+    """Ratio of two prepared strings; values below cutoff may be bounds"""
+    if a == b:
+        return 1.0
+
+    matcher = SequenceMatcher(None, a, b)
+    if cutoff > 0.0:
+        bound = matcher.real_quick_ratio()
+        if bound < cutoff:
+            return bound
+        bound = matcher.quick_ratio()
+        if bound < cutoff:
+            return bound
+    return matcher.ratio()
+
+
+def similarity(
+    a: str, b: str, normalize: bool = True, cutoff: float = 0.0
+) -> float:
+    """
+    Similarity of two strings, from 0 (nothing shared) to 1 (equal).
+
+    Args:
+        a: First string
+        b: Second string
+        normalize: Compare normalized forms (see normalize_text)
+        cutoff: Scores below this only need to be known as "below": the
+                result is then an upper bound, which is cheaper to get
+
+    Returns:
+        SequenceMatcher-style ratio
+    """
+    return _ratio(
+        get_profile(a, normalize).normalized,
+        get_profile(b, normalize).normalized,
+        cutoff,
+    )
+
+
+def token_overlap(a: str, b: str) -> float:
+    """Jaccard overlap of the normalized word sets of two strings"""
+    tokens_a = get_profile(a).tokens
+    tokens_b = get_profile(b).tokens
+    if not tokens_a or not tokens_b:
+        return 0.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
+
+class CandidateIndex:
+    """
+    Candidate strings indexed for one-to-many matching.
+
+    Example:
+        index = CandidateIndex(search_result_titles)
+        for title in llm_titles:
+            match = index.best(title, cutoff=0.8)
+    """
+
+    def __init__(
+        self,
+        choices: Iterable[str],
+        normalize: bool = True,
+        shortlist_size: int = 20,
+    ):
+        """
+        Build the index.
+
+        Args:
+            choices: Candidate strings
+            normalize: Compare normalized forms
+            shortlist_size: Candidates per query that get an exact score
+        """
+        self.normalize = normalize
+        self.shortlist_size = shortlist_size
+        self.profiles = [get_profile(choice, normalize) for choice in choices]
+        self._normalized = [profile.normalized for profile in self.profiles]
+        self._postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for i, profile in enumerate(self.profiles):
+            for gram, count in profile.ngrams.items():
+                self._postings[gram].append((i, count))
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def ngram_scores(self, query: str) -> list[float]:
+        """
+        Dice coefficient of the query's n-grams with every candidate.
+
+        Only the postings of the query's n-grams are visited, so
+        candidates sharing nothing with the query cost nothing.
+        """
+        profile = get_profile(query, self.normalize)
+        shared = [0] * len(self.profiles)
+        for gram, count in profile.ngrams.items():
+            for i, candidate_count in self._postings.get(gram, ()):
+                shared[i] += min(count, candidate_count)
+        return [
+            2.0 * common / (profile.ngram_total + candidate.ngram_total)
+            if common
+            else 0.0
+            for common, candidate in zip(shared, self.profiles)
+        ]
+
+    def search(
+        self, query: str, limit: int = 5, cutoff: float = 0.0
+    ) -> list[tuple[int, float]]:
+        """
+        Find the candidates most similar to a query.
+
+        Only the n-gram shortlist is scored exactly, so a candidate
+        sharing almost no n-grams with the query is not
+        considered even if difflib would rate it higher.
+
+        Args:
+            query: String to match
+            limit: Maximum number of matches
+            cutoff: Minimum similarity of a match
+
+        Returns:
+            (candidate index, similarity) pairs, best first
+        """
+        if not self.profiles:
+            return []
+        target = get_profile(query, self.normalize).normalized
+
+        scores = self.ngram_scores(query)
+        order = sorted(
+            (i for i, score in enumerate(scores) if score > 0.0),
+            key=scores.__getitem__,
+            reverse=True,
+        )[: max(self.shortlist_size, limit)]
+        if not order and not target:
+            order = [i for i, text in enumerate(self._normalized) if not text]
+
+        # The query is the second sequence, whose analysis difflib caches
+        # across set_seq1 calls
+        matcher = SequenceMatcher(None, "", target)
+        results: list[tuple[int, float]] = []
+        for i in order:
+            floor = cutoff
+            if len(results) >= limit:
+                floor = max(floor, results[-1][1])
+            matcher.set_seq1(self._normalized[i])
+            if matcher.real_quick_ratio() < floor:
+                continue
+            if matcher.quick_ratio() < floor:
+                continue
+            score = matcher.ratio()
+            if score < cutoff:
+                continue
+            results.append((i, score))
+            results.sort(key=lambda item: item[1], reverse=True)
+            del results[limit:]
+        return results
+
+    def best(self, query: str, cutoff: float = 0.0) -> tuple[int, float] | None:
+        """Get the best (candidate index, similarity), or None"""
+        matches = self.search(query, limit=1, cutoff=cutoff)
+        return matches[0] if matches else None
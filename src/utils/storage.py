@@ -0,0 +1,104 @@
+"""
+File and SQLite helpers shared by the on-disk caches and indexes.
+
+- ThreadLocalConnection hands each thread its own SQLite connection and
+  reopens it in a forked child, which must not reuse its parent's.
+- connect_sqlite() opens a database the way the caches expect.
+- atomic_write() replaces a file so readers never see a partial write.
+- file_digest() hashes a file without reading it into memory at once.
+"""
+
+# Standard library imports
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+
+def connect_sqlite(
+    db_path: Path, schema: str | None = None, wal: bool = True
+) -> sqlite3.Connection:
+    """
+    Open a SQLite database, creating its directory and schema.
+
+    Args:
+        db_path: Database file
+        schema: SQL script run on every connect (use IF NOT EXISTS)
+        wal: Use WAL mode, so readers in other threads or processes aren't
+             blocked by a writer
+
+    Returns:
+        Connection returning sqlite3.Row rows
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn.row_factory = sqlite3.Row
+    if wal:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    if schema:
+        conn.executescript(schema)
+    return conn
+
+
+class ThreadLocalConnection:
+    """Per-thread connection, reopened after a fork"""
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection]):
+        """
+        Initialize the holder; nothing is opened yet.
+
+        Args:
+            connect: Opens a new connection
+        """
+        self._connect = connect
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use"""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = self._connect()
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def atomic_write(path: Path, data: bytes | str) -> None:
+    """
+    Write a file through a temporary file and a rename.
+
+    Concurrent readers, and the next run after an interrupted one, see
+    either the old or the new content. Strings are written as UTF-8.
+
+    Raises:
+        OSError: If the file can't be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file, read in blocks"""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
@@ -15,3 +15,20 @@ def pytest_collection_modifyitems(config, items):
             # Skip tex2lyx related tests
             if "tex2lyx" in item.nodeid.lower() or "lyx" in item.nodeid.lower():
                 item.add_marker(skip_tex2lyx)
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Keep caches out of the real ~/.deep-biblio-cache.
+
+    The result cache, reference index and citation context index default
+    to the home directory, and the process-wide HTTP cache is configured
+    once per process.
+    """
+    from src.utils import http_cache
+
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setitem(http_cache._settings, "cache_dir", tmp_path / "http")
+    monkeypatch.setattr(http_cache, "_shared_cache", None)
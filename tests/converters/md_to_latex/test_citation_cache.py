@@ -0,0 +1,71 @@
+"""Tests for the SQLite citation cache."""
+
+import sqlite3
+
+import pytest
+from src.converters.md_to_latex.citation_cache import CitationCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    return CitationCache(cache_dir=tmp_path)
+
+
+class TestCitationCacheBulk:
+    """Test bulk lookups."""
+
+    def test_get_many(self, cache):
+        """Test that cached URLs are returned and misses are absent."""
+        cache.put("https://example.com/a", {"title": "A"}, "web")
+        cache.put("https://example.com/b", {"title": "B"}, "web")
+
+        results = cache.get_many(
+            ["https://example.com/a", "https://example.com/b", "missing"]
+        )
+
+        assert set(results) == {
+            "https://example.com/a",
+            "https://example.com/b",
+        }
+        assert results["https://example.com/a"]["title"] == "A"
+        assert results["https://example.com/a"] == cache.get(
+            "https://example.com/a"
+        )
+
+    def test_get_many_large_batch(self, cache):
+        """Test lookups beyond SQLite's parameter limit."""
+        urls = [f"https://example.com/{i}" for i in range(1500)]
+        for url in urls[::100]:
+            cache.put(url, {"title": url}, "web")
+
+        results = cache.get_many(urls)
+
+        assert set(results) == set(urls[::100])
+
+    def test_get_many_by_doi_returns_newest(self, cache):
+        """Test DOI lookups pick the most recently fetched entry."""
+        cache.put("https://old.example/a", {"title": "Old", "doi": "10.1/a"})
+        cache.put("https://new.example/a", {"title": "New", "doi": "10.1/a"})
+        with sqlite3.connect(cache.db_path) as conn:
+            conn.execute(
+                "UPDATE citations SET fetched_at = datetime('now', '-1 day') "
+                "WHERE url = 'https://old.example/a'"
+            )
+
+        results = cache.get_many_by_doi(["10.1/a", "10.1/missing", ""])
+
+        assert set(results) == {"10.1/a"}
+        assert results["10.1/a"]["title"] == "New"
+        assert results["10.1/a"] == cache.get_by_doi("10.1/a")
+
+    def test_expired_entries_are_skipped(self, cache):
+        """Test that the TTL applies to bulk lookups."""
+        cache.put("https://example.com/a", {"title": "A", "doi": "10.1/a"})
+        with sqlite3.connect(cache.db_path) as conn:
+            conn.execute(
+                "UPDATE citations SET fetched_at = datetime('now', '-60 days')"
+            )
+
+        assert cache.get_many(["https://example.com/a"]) == {}
+        assert cache.get_many_by_doi(["10.1/a"]) == {}
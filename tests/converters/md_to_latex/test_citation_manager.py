@@ -107,6 +107,24 @@ class TestCitationManager:
         assert citations[0].key == "smith2023"
         assert citations[1].key == "smith2023a"
 
+    def test_aliases_share_one_citation(self, temp_cache_dir):
+        """Test that URLs of the same work map to one citation and key."""
+        manager = CitationManager(cache_dir=temp_cache_dir)
+        first = (
+            "[Smith (2023)](https://arxiv.org/abs/2301.12345) and "
+            "[Smith (2023)](https://arxiv.org/pdf/2301.12345v2)."
+        )
+        second = "[Smith (2023)](https://doi.org/10.48550/arXiv.2301.12345)"
+
+        citations = manager.extract_citations(first)
+        assert len(citations) == 1
+        assert manager.extract_citations(second) == citations
+        assert list(manager.citations) == ["smith2023"]
+
+        assert manager.replace_citations_in_text(first + " " + second) == (
+            "\\citep{smith2023} and \\citep{smith2023}. \\citep{smith2023}"
+        )
+
     def test_replace_citations_in_text(self, temp_cache_dir):
         """Test replacement of citations with LaTeX commands."""
         manager = CitationManager(cache_dir=temp_cache_dir)
@@ -121,6 +139,46 @@ class TestCitationManager:
         latex_content = manager.replace_citations_in_text(content)
         assert latex_content == "Text with \\citep{smith2023} citation."
 
+    def test_replace_citations_single_pass_cases(self, temp_cache_dir):
+        """Test repeated URLs, brackets in link text and parens in URLs."""
+        manager = CitationManager(cache_dir=temp_cache_dir)
+        paren_url = "https://en.wikipedia.org/wiki/Foo_(bar)"
+        manager.citations = {
+            "smith2023": Citation("Smith", "2023", "https://example.com/a"),
+            "doe2020": Citation("Doe", "2020", paren_url),
+        }
+        content = (
+            "[Smith [2023]](https://example.com/a) and "
+            f"[Doe (2020)]({paren_url}), again "
+            "[Smith (2023)](https://example.com/a); "
+            "[other](https://example.com/unknown) stays."
+        )
+
+        assert manager.replace_citations_in_text(content) == (
+            "\\citep{smith2023} and \\citep{doe2020}, again "
+            "\\citep{smith2023}; [other](https://example.com/unknown) stays."
+        )
+
+    def test_replace_citations_large_document(self, temp_cache_dir):
+        """Test a document with many citations is replaced in order."""
+        manager = CitationManager(cache_dir=temp_cache_dir)
+        manager.citations = {
+            f"key{i}": Citation("Author", "2020", f"https://example.com/{i}")
+            for i in range(300)
+        }
+        content = "\n".join(
+            f"Para {i} [Author (2020)](https://example.com/{i % 300})."
+            for i in range(3000)
+        )
+
+        result = manager.replace_citations_in_text(content)
+
+        lines = result.split("\n")
+        assert len(lines) == 3000
+        assert lines[0] == "Para 0 \\citep{key0}."
+        assert lines[2999] == "Para 2999 \\citep{key299}."
+        assert "](" not in result
+
     @patch("requests.get")
     def test_fetch_from_crossref(self, mock_get, temp_cache_dir):
         """Test fetching metadata from CrossRef."""
@@ -205,3 +263,90 @@ class TestCitationManager:
         # Check that both citations are present (with Better BibTeX keys after metadata fetch)
         assert "smith" in content.lower() and "2023" in content
         assert "jones" in content.lower() and "2022" in content
+
+    def test_prefetch_uses_bulk_cache(self, temp_cache_dir):
+        """Test that cached citations are resolved without fetching."""
+        manager = CitationManager(cache_dir=temp_cache_dir)
+        manager.cache.put(
+            "https://example.com/cached",
+            {"authors": "Smith", "year": "2023", "title": "Cached Paper"},
+            "web",
+        )
+        citation = Citation("Smith", "2023", "https://example.com/cached")
+
+        with patch.object(manager, "_fetch_remote_metadata") as mock_fetch:
+            stats = manager.prefetch_metadata([citation])
+
+        mock_fetch.assert_not_called()
+        assert stats == {"cached": 1}
+        assert citation.title == "Cached Paper"
+        assert citation.metadata_fetched
+
+    def test_prefetch_groups_misses_by_backend(self, temp_cache_dir):
+        """Test that cache misses are dispatched per backend."""
+        manager = CitationManager(cache_dir=temp_cache_dir)
+        citations = [
+            Citation("Smith", "2023", "https://doi.org/10.1234/a"),
+            Citation("Jones", "2022", "https://arxiv.org/abs/2301.00001"),
+            Citation("Brown", "2021", "https://example.com/page"),
+            Citation("Green", "2020", "https://doi.org/10.1234/b"),
+        ]
+        fetched = []
+
+        def fake_fetch(citation):
+            fetched.append(citation.url)
+            citation.metadata_fetched = True
+
+        with patch.object(
+            manager, "_fetch_remote_metadata", side_effect=fake_fetch
+        ):
+            stats = manager.prefetch_metadata(
+                citations, backend_concurrency={"crossref": 2}
+            )
+
+        assert stats == {"cached": 0, "crossref": 2, "arxiv": 1, "web": 1}
+        assert sorted(fetched) == sorted(c.url for c in citations)
+
+        # Already resolved citations are not fetched again
+        with patch.object(manager, "_fetch_remote_metadata") as mock_fetch:
+            manager.prefetch_metadata(citations)
+        mock_fetch.assert_not_called()
+
+    def test_prefetch_fetches_aliases_once(self, temp_cache_dir):
+        """Test that citations of one work are fetched once."""
+        manager = CitationManager(cache_dir=temp_cache_dir)
+        citations = [
+            Citation("Smith", "2023", "https://doi.org/10.1234/A"),
+            Citation("Smith", "2023", "https://dx.doi.org/10.1234/a"),
+        ]
+
+        def fake_fetch(citation):
+            citation.title = "Fetched"
+            citation.metadata_fetched = True
+
+        with patch.object(
+            manager, "_fetch_remote_metadata", side_effect=fake_fetch
+        ) as mock_fetch:
+            stats = manager.prefetch_metadata(citations)
+
+        assert mock_fetch.call_count == 1
+        assert stats == {"cached": 0, "crossref": 1, "aliases": 1}
+        assert [c.title for c in citations] == ["Fetched", "Fetched"]
+
+    def test_prefetch_falls_back_to_doi(self, temp_cache_dir):
+        """Test that a work cached under another URL form is reused."""
+        manager = CitationManager(cache_dir=temp_cache_dir)
+        manager.cache.put(
+            "https://dx.doi.org/10.1234/a",
+            {"authors": "Smith", "title": "By DOI", "doi": "10.1234/a"},
+            "crossref",
+        )
+        citation = Citation("Smith", "2023", "https://doi.org/10.1234/a")
+
+        with patch.object(manager, "_fetch_remote_metadata") as mock_fetch:
+            stats = manager.prefetch_metadata([citation])
+
+        mock_fetch.assert_not_called()
+        assert stats == {"cached": 1}
+        assert citation.title == "By DOI"
+        assert citation.url == "https://doi.org/10.1234/a"
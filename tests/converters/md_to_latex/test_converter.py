@@ -202,3 +202,85 @@ The end.
         with pytest.raises(Exception) as exc_info:
             converter.convert(sample_markdown_file, verbose=False)
         assert "Pandoc error" in str(exc_info.value)
+
+
+class TestIncrementalConversion:
+    """Test the section-level build cache."""
+
+    @staticmethod
+    def fake_pandoc(content, to, format, extra_args):
+        """Echo markdown as LaTeX, keeping section break markers."""
+        return content.replace("# ", "\\section{") + "\n"
+
+    def test_unchanged_sections_skip_pandoc(self, tmp_path):
+        """Test that only edited sections are sent to pandoc again."""
+        md_file = tmp_path / "doc.md"
+        sections = [f"# Section {i}\n\nParagraph {i}.\n\n" for i in range(5)]
+        md_file.write_text("".join(sections))
+
+        converter = MarkdownToLatexConverter(
+            output_dir=tmp_path / "out", use_cache=False
+        )
+        with (
+            patch("pypandoc.get_pandoc_version", return_value="3.1"),
+            patch(
+                "pypandoc.convert_text", side_effect=self.fake_pandoc
+            ) as mock_pandoc,
+            patch.object(converter, "_compile_pdf", return_value=None),
+        ):
+            first = converter.convert(md_file, verbose=False).read_text()
+            assert mock_pandoc.call_count == 1
+            assert "Paragraph 4." in first
+
+            # Rerun without changes: nothing reaches pandoc
+            mock_pandoc.reset_mock()
+            assert (
+                converter.convert(md_file, verbose=False).read_text() == first
+            )
+            mock_pandoc.assert_not_called()
+
+            # Edit one section: only that section is converted
+            sections[2] = "# Section 2\n\nEdited paragraph.\n\n"
+            md_file.write_text("".join(sections))
+            mock_pandoc.reset_mock()
+            third = converter.convert(md_file, verbose=False).read_text()
+
+        assert mock_pandoc.call_count == 1
+        converted = mock_pandoc.call_args.args[0]
+        assert "Edited paragraph." in converted
+        assert "Paragraph 1." not in converted
+        assert "Edited paragraph." in third
+        assert "Paragraph 1." in third
+
+    def test_footnotes_convert_whole_document(self, tmp_path):
+        """Test that cross-section constructs disable splitting."""
+        converter = MarkdownToLatexConverter(output_dir=tmp_path)
+        assert converter._can_split_sections("# A\n\nText\n\n# B\n")
+        assert not converter._can_split_sections("# A\n\nNote[^1]\n\n[^1]: x\n")
+        assert not converter._can_split_sections("# A\n\n# A\n")
+
+    def test_documents_sharing_output_dir_keep_their_caches(self, tmp_path):
+        """Test that converting one document doesn't prune another's cache."""
+        first = tmp_path / "first.md"
+        second = tmp_path / "second.md"
+        first.write_text("# First\n\nOne.\n\n# More\n\nTwo.\n")
+        second.write_text("# Second\n\nThree.\n")
+
+        converter = MarkdownToLatexConverter(
+            output_dir=tmp_path / "out", use_cache=False
+        )
+        with (
+            patch("pypandoc.get_pandoc_version", return_value="3.1"),
+            patch(
+                "pypandoc.convert_text", side_effect=self.fake_pandoc
+            ) as mock_pandoc,
+            patch.object(converter, "_compile_pdf", return_value=None),
+        ):
+            converter.convert(first, verbose=False)
+            converter.convert(second, verbose=False)
+
+            mock_pandoc.reset_mock()
+            converter.convert(first, verbose=False)
+            converter.convert(second, verbose=False)
+
+        mock_pandoc.assert_not_called()
@@ -123,6 +123,23 @@ Some content here.
         assert "\\hypertarget" not in processed
         assert "Some content here." in processed
 
+    def test_process_pandoc_output_currency(self):
+        """Test that missed currency dollars are escaped, not math."""
+        builder = LatexBuilder()
+        pandoc_output = """\\begin{document}
+\\begin{itemize}
+\\item Costs $50 and \\$20, about $\\pm$ 5 per unit
+\\end{itemize}
+\\begin{lstlisting}
+echo $1
+\\end{lstlisting}
+\\end{document}"""
+
+        processed = builder.process_pandoc_output(pandoc_output)
+
+        assert "Costs \\$50 and \\$20, about $\\pm$ 5 per unit" in processed
+        assert "echo $1" in processed
+
     def test_create_makefile(self, tmp_path):
         """Test Makefile creation."""
         builder = LatexBuilder()
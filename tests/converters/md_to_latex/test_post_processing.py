@@ -129,3 +129,53 @@ class TestLatexPostProcessor:
         assert r"\passthrough" not in result
         assert r"\caption{~}" in result
         assert len(processor.fixes_applied) > 0
+
+    def test_fix_deeply_nested_emphasis(self):
+        """Test nested emphasis at several depths and positions."""
+        processor = LatexPostProcessor()
+
+        content = r"a \emph{\emph{\emph{deep}}} b \emph{x \emph{\emph{y}}}"
+        result = processor._fix_nested_emphasis(content)
+        assert result == r"a \emph{deep} b \emph{x \emph{y}}"
+
+        # Unclosed groups are left alone
+        content = r"\emph{\emph{unclosed"
+        assert processor._fix_nested_emphasis(content) == content
+
+    def test_unterminated_passthrough(self):
+        """Test that an unterminated passthrough does not stop later fixes."""
+        processor = LatexPostProcessor()
+
+        content = (
+            r"\passthrough{\lstinline!open and \passthrough{\lstinline!ok!}"
+        )
+        result = processor._fix_passthrough_commands(content)
+        assert result.endswith(r"\texttt{ok}")
+        assert result.startswith(r"\passthrough{\lstinline!open")
+
+
+class TestPostProcessingRules:
+    """Test the post-processing rule pipeline."""
+
+    def test_rules_skipped_without_triggers(self):
+        """Test that rules only run when their trigger text is present."""
+        processor = LatexPostProcessor()
+
+        result = processor.process("Plain text.\n\n\n\n\n\nMore text.")
+
+        assert result == "Plain text.\n\n\n\nMore text."
+        assert list(processor.rule_timings) == ["excessive_line_breaks"]
+
+    def test_register_rule(self):
+        """Test that registered rules run after the built-in ones."""
+        processor = LatexPostProcessor()
+        processor.register_rule(
+            "shout", lambda text: text.replace("TODO", "FIXME"), ("TODO",)
+        )
+
+        assert processor.process(r"\emph{\emph{TODO}}") == r"\emph{FIXME}"
+        assert list(processor.rule_timings) == [
+            "nested_emphasis",
+            "excessive_line_breaks",
+            "shout",
+        ]
@@ -1,7 +1,10 @@
 """Tests for markdown to LaTeX utility functions."""
 
+import pytest
 from src.converters.md_to_latex.utils import (
+    DollarKind,
     clean_pandoc_output,
+    escape_dollar_signs,
     extract_abstract_from_markdown,
     extract_doi_from_url,
     extract_title_from_markdown,
@@ -9,6 +12,8 @@ from src.converters.md_to_latex.utils import (
     generate_citation_key,
     parse_citation_text,
     sanitize_latex,
+    scan_dollar_signs,
+    split_markdown_sections,
 )
 
 
@@ -187,3 +192,93 @@ This is the abstract.
         content = "# Title\n\n## Introduction\n\nNo abstract here."
         abstract = extract_abstract_from_markdown(content)
         assert abstract is None
+
+
+class TestSplitMarkdownSections:
+    """Test splitting markdown at headings."""
+
+    def test_split_at_headings(self):
+        """Test that chunks start at headings and rejoin losslessly."""
+        content = "Intro\n\n# One\n\nText\n\n## Two\n\nMore\n"
+        sections = split_markdown_sections(content)
+        assert sections == [
+            "Intro\n\n",
+            "# One\n\nText\n\n",
+            "## Two\n\nMore\n",
+        ]
+        assert "".join(sections) == content
+
+    def test_ignores_code_fences_and_hashtags(self):
+        """Test that # lines in code blocks and #tags are not headings."""
+        content = "# Code\n\n```bash\n# comment\n```\n\n#hashtag\n"
+        assert split_markdown_sections(content) == [content]
+
+    def test_empty_content(self):
+        """Test empty input."""
+        assert split_markdown_sections("") == []
+
+
+@pytest.fixture
+def heavy_math():
+    """Paragraphs with thousands of inline formulas mixed with prices."""
+    return "\n\n".join(
+        f"Step {i}: $x_{{{i}}} + \\alpha^2$ costs $5,000 or $ {i}, "
+        f"and $\\pm$ 3 with \\$4 left."
+        for i in range(2000)
+    )
+
+
+class TestScanDollarSigns:
+    """Test classifying dollar signs as math, currency or escaped."""
+
+    def kinds(self, text):
+        return [kind for _, kind in scan_dollar_signs(text)]
+
+    def test_math_and_currency(self):
+        """Test pandoc's inline math rules against currency amounts."""
+        assert self.kinds("$x$ and $5 and \\$6") == [
+            DollarKind.MATH_OPEN,
+            DollarKind.MATH_CLOSE,
+            DollarKind.CURRENCY,
+            DollarKind.ESCAPED,
+        ]
+        # Neither amount can open or close math
+        assert self.kinds("$20,000 and $30,000") == [DollarKind.CURRENCY] * 2
+        # A closing $ followed by a space and a digit still closes math
+        assert self.kinds("$\\pm$ 5") == [
+            DollarKind.MATH_OPEN,
+            DollarKind.MATH_CLOSE,
+        ]
+
+    def test_unpaired_dollars(self):
+        """Test dollars that neither close math nor read as currency."""
+        assert self.kinds("a $ b") == [DollarKind.UNPAIRED]
+        assert self.kinds("$x\n\ny$") == [
+            DollarKind.UNPAIRED,
+            DollarKind.UNPAIRED,
+        ]
+        # A line break before $ is not an escape
+        assert self.kinds("\\\\$5") == [DollarKind.CURRENCY]
+
+    def test_verbatim_environments(self):
+        """Test that dollars in skipped environments are left alone."""
+        text = "\\begin{verbatim}\necho $5\n\\end{verbatim}\n$5"
+        result = escape_dollar_signs(text, {DollarKind.CURRENCY}, ["verbatim"])
+        assert result == text[:-2] + "\\$5"
+
+    def test_heavy_math(self, heavy_math):
+        """Test that only currency is escaped in math-heavy text."""
+        result = escape_dollar_signs(heavy_math, {DollarKind.CURRENCY})
+
+        assert result.count("\\$") == 3 * 2000
+        assert "$x_{1999} + \\alpha^2$ costs \\$5,000 or \\$ 1999" in result
+        assert "and $\\pm$ 3 with \\$4 left." in result
+        counts = {}
+        for _, kind in scan_dollar_signs(heavy_math):
+            counts[kind] = counts.get(kind, 0) + 1
+        assert counts == {
+            DollarKind.MATH_OPEN: 4000,
+            DollarKind.MATH_CLOSE: 4000,
+            DollarKind.CURRENCY: 4000,
+            DollarKind.ESCAPED: 2000,
+        }
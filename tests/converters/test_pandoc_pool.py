@@ -0,0 +1,168 @@
+"""Tests for the shared pandoc worker pool."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.converters.md_to_latex.converter import (
+    PANDOC_EXTRA_ARGS,
+    MarkdownToLatexConverter,
+)
+from src.converters.pandoc_pool import PandocPool, _args_to_server_options
+
+
+class TestServerOptions:
+    """Test translation of CLI options to server options."""
+
+    def test_converter_args(self):
+        """Test the options used by the markdown to LaTeX converter."""
+        options = _args_to_server_options(["--standalone", *PANDOC_EXTRA_ARGS])
+        assert options == {
+            "standalone": True,
+            "wrap": "preserve",
+            "columns": 80,
+            "listings": True,
+            "highlight-style": None,
+            "variables": {
+                "documentclass": "article",
+                "geometry": "margin=1in",
+                "tables": "true",
+            },
+        }
+
+    def test_unsupported_args(self):
+        """Test that unknown options disable server mode."""
+        assert _args_to_server_options(["--citeproc"]) is None
+        assert _args_to_server_options(["-V"]) is None
+        assert _args_to_server_options(None) == {}
+
+
+class TestPandocPoolFallback:
+    """Test the pypandoc fallback used without server mode."""
+
+    @patch("pypandoc.convert_text")
+    def test_convert_many_keeps_order(self, mock_convert):
+        """Test results come back in input order."""
+        mock_convert.side_effect = lambda text, to, **kwargs: text.upper()
+        with PandocPool(max_workers=3, use_server=False) as pool:
+            results = pool.convert_many(["a", "b", "c", "d"], "latex")
+        assert results == ["A", "B", "C", "D"]
+
+    @patch("pypandoc.convert_text")
+    def test_concurrency_is_bounded(self, mock_convert):
+        """Test that no more than max_workers pandoc processes run."""
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_convert(text, to, **kwargs):
+            with lock:
+                running.append(text)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(text)
+            return text
+
+        mock_convert.side_effect = fake_convert
+        with PandocPool(max_workers=2, use_server=False) as pool:
+            pool.convert_many([str(i) for i in range(10)], "latex")
+        assert max(peak) <= 2
+
+    @patch("pypandoc.convert_text")
+    def test_errors(self, mock_convert):
+        """Test error reporting with and without return_exceptions."""
+
+        def fake_convert(text, to, **kwargs):
+            if text == "bad":
+                raise RuntimeError("bad input")
+            return text
+
+        mock_convert.side_effect = fake_convert
+        with PandocPool(max_workers=2, use_server=False) as pool:
+            with pytest.raises(RuntimeError, match="bad input"):
+                pool.convert_many(["ok", "bad"], "latex")
+
+            results = pool.convert_many(
+                ["ok", "bad"], "latex", return_exceptions=True
+            )
+        assert results[0] == "ok"
+        assert isinstance(results[1], RuntimeError)
+
+
+class TestPandocPoolServer:
+    """Test batching through a (mocked) pandoc server."""
+
+    def _make_pool(self, responses):
+        pool = PandocPool(max_workers=1)
+        pool._server_available = True
+        server = MagicMock()
+        server.url = "http://127.0.0.1:1"
+        server.process.poll.return_value = None
+        pool._servers.append(server)
+        pool._idle.put(server)
+        pool._session = MagicMock()
+        pool._session.post.side_effect = responses
+        return pool
+
+    @staticmethod
+    def _response(status_code, payload=None, text=""):
+        response = MagicMock()
+        response.status_code = status_code
+        response.json.return_value = payload
+        response.text = text
+        return response
+
+    def test_batch_request(self):
+        """Test that all documents go to the server in one request."""
+        pool = self._make_pool(
+            [
+                self._response(
+                    200,
+                    [{"output": "A", "base64": False}, {"output": "B\n"}],
+                )
+            ]
+        )
+        assert pool.convert_many(["a", "b"], "latex") == ["A\n", "B\n"]
+
+        assert pool._session.post.call_count == 1
+        url = pool._session.post.call_args.args[0]
+        params = pool._session.post.call_args.kwargs["json"]
+        assert url.endswith("/batch")
+        assert [p["text"] for p in params] == ["a", "b"]
+        assert params[0]["from"] == "markdown"
+        assert params[0]["to"] == "latex"
+
+    def test_failed_batch_is_retried_per_document(self):
+        """Test that one broken document doesn't fail the others."""
+        pool = self._make_pool(
+            [
+                self._response(500, text="batch failed"),
+                self._response(200, [{"output": "A\n"}]),
+                self._response(500, text="Unknown extension"),
+            ]
+        )
+        results = pool.convert_many(["a", "b"], "latex", return_exceptions=True)
+        assert results[0] == "A\n"
+        assert isinstance(results[1], RuntimeError)
+        assert "Unknown extension" in str(results[1])
+
+
+class TestConverterUsesPool:
+    """Test that MarkdownToLatexConverter routes pandoc through a pool."""
+
+    def test_fragment_conversion_uses_pool(self, tmp_path):
+        """Test that a given pool replaces direct pypandoc calls."""
+        pool = MagicMock()
+        pool.convert_text.return_value = "converted"
+        converter = MarkdownToLatexConverter(
+            output_dir=tmp_path, pandoc_pool=pool
+        )
+
+        with patch("pypandoc.convert_text") as mock_convert:
+            assert converter._convert_fragment("# Title") == "converted"
+        mock_convert.assert_not_called()
+        assert pool.convert_text.call_args.kwargs["extra_args"] == (
+            PANDOC_EXTRA_ARGS
+        )
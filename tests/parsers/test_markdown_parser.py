@@ -189,3 +189,35 @@ More regular text
 
         # Should parse without errors
         assert "parse_error" not in doc.metadata
+
+
+class TestMarkdownDocument:
+    """Test the document shared by parse-once consumers."""
+
+    def test_tables_and_positions(self):
+        """Test link, heading and image tables with source positions."""
+        text = (
+            "# Title\n\n"
+            "First [a](https://a.org) line\n"
+            "continues ![img](fig.png).\n\n"
+            "## Section\n\n"
+            "See [b](https://b.org)."
+        )
+        doc = MarkdownParser().parse(text)
+
+        assert doc.links is doc.links
+        assert [(link["href"], link["line"]) for link in doc.links] == [
+            ("https://a.org", 3),
+            ("https://b.org", 8),
+        ]
+        start, end = doc.links[0]["position"]
+        assert text[start:end].startswith("First [a]")
+        assert text[start:end].endswith("(fig.png).\n")
+        assert [(h["level"], h["text"]) for h in doc.headings] == [
+            (1, "Title"),
+            (2, "Section"),
+        ]
+        assert doc.images[0]["line"] == 3
+        assert doc.lines[7] == "See [b](https://b.org)."
+        assert doc.line_at(text.index("See")) == 8
+        assert doc.metadata["has_links"] and doc.metadata["has_images"]
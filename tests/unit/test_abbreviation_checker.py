@@ -0,0 +1,66 @@
+"""Unit tests for the single-pass abbreviation checker."""
+
+from src.utils.abbreviation_checker import AbbreviationChecker
+
+DOCUMENT = """# Introduction
+
+We compare LSTM and GRU models on 3D data.
+It uses Long Short-Term Memory (LSTM) cells. LSTM works well.
+Our CatBoost baseline and the M.Sc. thesis use GRU again.
+score = predict(XGB)
+[1] Smith, J. (2020). WXYZ in practice.
+"""
+
+
+class TestAbbreviationChecker:
+    """Test finding definitions and undefined uses in one pass."""
+
+    def test_issues_and_definitions(self):
+        """Test uses before a definition and undefined abbreviations."""
+        issues, definitions = AbbreviationChecker().check_document(DOCUMENT)
+
+        assert [(d.abbreviation, d.full_form) for d in definitions] == [
+            ("LSTM", "Long Short-Term Memory")
+        ]
+        assert [(i.abbreviation, i.line_number) for i in issues] == [
+            ("LSTM", 3),
+            ("GRU", 3),
+            ("3D", 3),
+            ("Short-Term", 4),
+            ("CatBoost", 5),
+            ("M.Sc", 5),
+        ]
+        assert issues[0].suggested_definition == "Long Short-Term Memory"
+        assert issues[0].position == DOCUMENT.split("\n")[2].find("LSTM")
+        assert issues[1].context == "We compare LSTM and GRU models on 3D data."
+
+    def test_lines_from_a_file(self, tmp_path):
+        """Test that a file can be checked as a stream of lines."""
+        path = tmp_path / "paper.md"
+        path.write_text(DOCUMENT, encoding="utf-8")
+        checker = AbbreviationChecker()
+
+        with open(path, encoding="utf-8") as f:
+            assert checker.check_lines(f) == checker.check_document(DOCUMENT)
+
+    def test_word_positions(self):
+        """Test positions with repeated words, tabs and non-ASCII text."""
+        checker = AbbreviationChecker()
+        assert checker._find_abbreviations_in_line("SVM, SVM\tand NeRF.") == [
+            ("SVM", 0),
+            ("SVM", 5),
+            ("NeRF", 13),
+        ]
+        assert checker._find_abbreviations_in_line("Über ÉTÉ and KNN") == [
+            ("ÉTÉ", 5),
+            ("KNN", 13),
+        ]
+
+    def test_common_abbreviations(self):
+        """Test that common and custom allowed abbreviations pass."""
+        text = "The NASA API is used in the USA."
+        issues, _ = AbbreviationChecker().check_document(text)
+        assert [i.abbreviation for i in issues] == ["NASA"]
+
+        issues, _ = AbbreviationChecker({"NASA"}).check_document(text)
+        assert [i.abbreviation for i in issues] == ["API", "USA"]
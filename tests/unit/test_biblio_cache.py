@@ -0,0 +1,224 @@
+"""Unit tests for the SQLite-backed BiblioCache."""
+
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+from src.utils.cache import BACKUP_INTERVAL, SQLITE_MAX_PARAMS, BiblioCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    cache = BiblioCache(cache_dir=tmp_path / "cache", auto_backup=False)
+    yield cache
+    cache.close()
+
+
+class TestBiblioCacheConnections:
+    """Test connection handling."""
+
+    def test_wal_mode(self, cache):
+        """Test that the database runs in WAL mode."""
+        conn = cache._get_connection()
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_connection_reused_per_thread(self, cache):
+        """Test that a thread keeps its connection and others get their own."""
+        assert cache._get_connection() is cache._get_connection()
+
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(cache._get_connection())
+        )
+        thread.start()
+        thread.join()
+        assert other[0] is not cache._get_connection()
+
+    def test_threads_share_data(self, cache):
+        """Test that entries written by worker threads are visible."""
+
+        def worker(index):
+            cache.put(f"https://example.com/{index}", bibtex_data={"i": index})
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.get("https://example.com/5").bibtex_data == {"i": 5}
+        assert cache.get_stats()["total_entries"] == 8
+
+    def test_close_reconnects(self, cache):
+        """Test that the cache keeps working after close()."""
+        cache.put("https://example.com/a", bibtex_data={"a": 1})
+        cache.close()
+        assert cache.get("https://example.com/a").bibtex_data == {"a": 1}
+
+
+class TestBiblioCacheBulk:
+    """Test put_many/get_many."""
+
+    def test_put_many_and_get_many(self, cache):
+        """Test round trip of a batch."""
+        stored = cache.put_many(
+            [
+                {"url": "https://example.com/a", "bibtex_data": {"a": 1}},
+                {"url": "https://example.com/b", "error_message": "HTTP 404"},
+            ]
+        )
+        assert stored == 2
+
+        results = cache.get_many(
+            [
+                "https://example.com/a",
+                "https://example.com/b",
+                "https://example.com/missing",
+            ]
+        )
+        assert set(results) == {
+            "https://example.com/a",
+            "https://example.com/b",
+        }
+        assert results["https://example.com/a"].bibtex_data == {"a": 1}
+        assert results["https://example.com/b"].error_message == "HTTP 404"
+
+    def test_get_many_matches_like_get(self, cache):
+        """Test that normalized URLs and DOIs resolve like get()."""
+        cache.put_many(
+            [
+                {
+                    "url": "https://doi.org/10.1000/xyz",
+                    "bibtex_data": {"doi": 1},
+                },
+                {"url": "https://example.com/page", "bibtex_data": {"p": 1}},
+            ]
+        )
+        urls = [
+            "https://dx.doi.org/10.1000/xyz",
+            "https://example.com/page?utm_source=feed",
+        ]
+        results = cache.get_many(urls)
+        for url in urls:
+            assert results[url].bibtex_data == cache.get(url).bibtex_data
+
+    def test_get_many_chunks_large_batches(self, cache):
+        """Test lookups with more URLs than SQLite parameters."""
+        urls = [
+            f"https://example.com/{i}" for i in range(SQLITE_MAX_PARAMS + 50)
+        ]
+        cache.put_many({"url": url, "bibtex_data": {"u": url}} for url in urls)
+
+        results = cache.get_many(urls)
+        assert len(results) == len(urls)
+
+    def test_empty_batches(self, cache):
+        """Test that empty input is a no-op."""
+        assert cache.put_many([]) == 0
+        assert cache.get_many([]) == {}
+
+
+class TestBiblioCacheBackups:
+    """Test backups with the persistent connection."""
+
+    def test_backup_and_restore(self, cache):
+        """Test that a restore replaces the live database."""
+        cache.put("https://example.com/a", bibtex_data={"a": 1})
+        backup = cache.create_backup("manual.db")
+
+        cache.put("https://example.com/b", bibtex_data={"b": 1})
+        cache.restore_backup(backup)
+
+        assert cache.get("https://example.com/a") is not None
+        assert cache.get("https://example.com/b") is None
+
+    def test_startup_backup_runs_in_background(self, tmp_path):
+        """Test that the first automatic backup is taken off the caller."""
+        cache = BiblioCache(cache_dir=tmp_path / "bg")
+        cache.wait_for_backup()
+        try:
+            assert len(list(cache.backup_dir.glob("cache_backup_*.db"))) == 1
+
+            # Not due again within the backup interval
+            again = BiblioCache(cache_dir=tmp_path / "bg")
+            assert again._backup_thread is None
+            again.close()
+        finally:
+            cache.close()
+
+    def test_incremental_backup_stores_only_changes(self, cache):
+        """Test that a changeset holds rows changed since the last snapshot."""
+        cache.put_many(
+            {"url": f"https://example.com/{i}", "bibtex_data": {"i": i}}
+            for i in range(20)
+        )
+        with cache._get_connection() as conn:
+            conn.execute(
+                "UPDATE cache_entries SET timestamp = timestamp - 7200"
+            )
+        full = cache.create_backup()
+        # Pretend the full backup is an hour old
+        self._age_snapshot(cache, full, 3600)
+
+        cache.put("https://example.com/new", bibtex_data={"new": 1})
+        changes = cache.create_incremental_backup()
+
+        assert changes.name.startswith("cache_changes_")
+        backups = {b["name"]: b for b in cache.list_backups()}
+        assert backups[changes.name]["is_incremental"]
+        conn = sqlite3.connect(changes)
+        try:
+            urls = [r[0] for r in conn.execute("SELECT url FROM cache_entries")]
+        finally:
+            conn.close()
+        assert urls == ["https://example.com/new"]
+
+    def test_restore_replays_changesets(self, cache):
+        """Test restoring a changeset applies additions and deletions."""
+        cache.put("https://example.com/a", bibtex_data={"a": 1})
+        cache.put("https://example.com/b", bibtex_data={"b": 1})
+        full = cache.create_backup()
+        self._age_snapshot(cache, full, 3600)
+
+        cache.put("https://example.com/c", bibtex_data={"c": 1})
+        with cache._get_connection() as conn:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE url = ?",
+                ("https://example.com/b",),
+            )
+        changes = cache.create_incremental_backup()
+
+        cache.put("https://example.com/d", bibtex_data={"d": 1})
+        cache.restore_backup(changes)
+
+        assert cache.get("https://example.com/a") is not None
+        assert cache.get("https://example.com/b") is None
+        assert cache.get("https://example.com/c") is not None
+        assert cache.get("https://example.com/d") is None
+
+    def test_automatic_backup_prefers_changesets(self, cache):
+        """Test that a due automatic backup is incremental after a full one."""
+        cache.put("https://example.com/a", bibtex_data={"a": 1})
+        full = cache.create_backup()
+        self._age_snapshot(cache, full, BACKUP_INTERVAL + 60)
+
+        cache._create_automatic_backup()
+
+        assert len(list(cache.backup_dir.glob("cache_backup_*.db"))) == 1
+        assert len(list(cache.backup_dir.glob("cache_changes_*.db"))) == 1
+
+    @staticmethod
+    def _age_snapshot(cache, backup_path, seconds):
+        """Move a backup's snapshot time into the past."""
+        snapshot_time = time.time() - seconds
+        conn = sqlite3.connect(backup_path)
+        try:
+            with conn:
+                cache._write_backup_meta(conn, {"snapshot_time": snapshot_time})
+        finally:
+            conn.close()
+        os.utime(backup_path, (snapshot_time, snapshot_time))
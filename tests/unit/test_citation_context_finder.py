@@ -69,7 +69,10 @@ And here's the same paper again: [Smith and colleagues (2023)](https://example.c
 """)
 
             # Create finder with temp directory
-            finder = CitationContextFinder(search_dirs=[str(tmpdir_path)])
+            finder = CitationContextFinder(
+                search_dirs=[str(tmpdir_path)],
+                index_path=tmpdir_path / "index.json",
+            )
 
             # Find contexts for paper1
             contexts = finder.find_citation_contexts(
@@ -96,7 +99,10 @@ Citation to [Paper B](https://example.com/b).
 Another [Paper A](https://example.com/a) reference.
 """)
 
-            finder = CitationContextFinder(search_dirs=[str(tmpdir_path)])
+            finder = CitationContextFinder(
+                search_dirs=[str(tmpdir_path)],
+                index_path=tmpdir_path / "index.json",
+            )
 
             # Find contexts for multiple URLs
             urls = [
@@ -120,7 +126,10 @@ Another [Paper A](https://example.com/a) reference.
             long_text = "A" * 150
             test_md.write_text(f"{long_text}[Citation]({long_text}){long_text}")
 
-            finder = CitationContextFinder(search_dirs=[str(tmpdir_path)])
+            finder = CitationContextFinder(
+                search_dirs=[str(tmpdir_path)],
+                index_path=tmpdir_path / "index.json",
+            )
             contexts = finder.find_citation_contexts(
                 long_text, context_chars=50
             )
@@ -147,7 +156,10 @@ Another [Paper A](https://example.com/a) reference.
             (tmpdir_path / "dir2" / "file3.md").touch()
             (tmpdir_path / "root.md").touch()
 
-            finder = CitationContextFinder(search_dirs=[str(tmpdir_path)])
+            finder = CitationContextFinder(
+                search_dirs=[str(tmpdir_path)],
+                index_path=tmpdir_path / "index.json",
+            )
             md_files = finder.find_markdown_files()
 
             # Filter to only files in our temp directory
@@ -175,3 +187,98 @@ Another [Paper A](https://example.com/a) reference.
         assert "document.md" in display
         assert "line 10" in display
         assert "Before text [Citation]( after text)" in display
+
+
+class TestCitationIndex:
+    """Test the persisted URL index."""
+
+    def _write_corpus(self, root: Path, count: int) -> None:
+        for i in range(count):
+            (root / f"note{i}.md").write_text(
+                f"# Note {i}\n\nSee [Shared (2020)](https://example.com/shared/) "
+                f"and [Own {i}](https://example.com/{i}).\n",
+                encoding="utf-8",
+            )
+
+    def test_index_lookup_matches_scan(self, tmp_path):
+        """Test contexts for many URLs come from a single scan."""
+        corpus = tmp_path / "notes"
+        corpus.mkdir()
+        self._write_corpus(corpus, 20)
+        finder = CitationContextFinder(
+            search_dirs=[str(corpus)], index_path=tmp_path / "index.json"
+        )
+
+        urls = ["https://EXAMPLE.com/shared"] + [
+            f"https://example.com/{i}" for i in range(20)
+        ]
+        results = finder.find_all_citation_contexts(urls)
+
+        assert len(results["https://EXAMPLE.com/shared"]) == 20
+        ctx = results["https://example.com/7"][0]
+        assert Path(ctx.file_path).name == "note7.md"
+        assert ctx.line_number == 3
+        assert ctx.citation_text == "Own 7"
+        assert ctx.text_after == "."
+
+    def test_index_refreshes_incrementally(self, tmp_path, monkeypatch):
+        """Test that only changed files are rescanned, across instances."""
+        # The finder also indexes markdown files of the working directory
+        monkeypatch.chdir(tmp_path)
+        corpus = tmp_path / "notes"
+        corpus.mkdir()
+        self._write_corpus(corpus, 5)
+        index_path = tmp_path / "index.json"
+
+        finder = CitationContextFinder(
+            search_dirs=[str(corpus)], index_path=index_path
+        )
+        assert finder.refresh_index() == 5
+        assert index_path.exists()
+
+        # A new instance reuses the persisted index
+        finder = CitationContextFinder(
+            search_dirs=[str(corpus)], index_path=index_path
+        )
+        assert finder.refresh_index() == 0
+
+        # Touching a file without changing it only updates its mtime
+        note = corpus / "note1.md"
+        note.write_text(note.read_text(encoding="utf-8"), encoding="utf-8")
+        assert finder.refresh_index() == 0
+
+        note.write_text("[New](https://example.com/new)\n", encoding="utf-8")
+        (corpus / "note2.md").unlink()
+        assert finder.refresh_index() == 1
+
+        assert (
+            len(finder.find_citation_contexts("https://example.com/new")) == 1
+        )
+        assert finder.find_citation_contexts("https://example.com/1") == []
+        assert finder.find_citation_contexts("https://example.com/2") == []
+        assert (
+            len(finder.find_citation_contexts("https://example.com/shared"))
+            == 3
+        )
+
+    def test_unreadable_file_drops_its_links(self, tmp_path, monkeypatch):
+        """Test that a file that can no longer be read yields no contexts."""
+        monkeypatch.chdir(tmp_path)
+        corpus = tmp_path / "notes"
+        corpus.mkdir()
+        self._write_corpus(corpus, 2)
+        finder = CitationContextFinder(
+            search_dirs=[str(corpus)], index_path=tmp_path / "index.json"
+        )
+        assert len(finder.find_citation_contexts("https://example.com/1")) == 1
+
+        (corpus / "note1.md").write_bytes(
+            b"\xff[Own 1](https://example.com/1)\n"
+        )
+        finder.refresh_index()
+
+        assert finder.find_citation_contexts("https://example.com/1") == []
+        assert (
+            len(finder.find_citation_contexts("https://example.com/shared"))
+            == 1
+        )
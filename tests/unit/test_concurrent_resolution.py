@@ -0,0 +1,397 @@
+"""Unit tests for per-host rate limiting and concurrent citation resolution."""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from click.testing import CliRunner
+from src.core.biblio_checker import BiblioChecker, BibtexEntry, Citation
+from src.main import main as click_main
+from src.utils.rate_limiter import (
+    DomainRateLimiter,
+    get_rate_limiter,
+    get_request_host,
+    parse_retry_after,
+)
+
+
+def make_citation(url: str, index: int) -> Citation:
+    """Create a minimal citation for testing."""
+    return Citation(
+        text=f"Author{index} (2023)",
+        url=url,
+        line_number=index + 1,
+        start_pos=index * 10,
+        end_pos=index * 10 + 5,
+        file_path="test.md",
+    )
+
+
+class TestDomainRateLimiter:
+    """Test per-host throttling."""
+
+    def test_request_host_normalization(self):
+        """Test host key extraction."""
+        assert get_request_host("https://www.Nature.com/articles/x") == (
+            "nature.com"
+        )
+        assert get_request_host("http://user@arxiv.org:8080/abs/1") == (
+            "arxiv.org"
+        )
+        assert get_request_host("not a url") == ""
+
+    def test_same_host_is_delayed(self):
+        """Test that consecutive requests to one host are spaced out."""
+        limiter = DomainRateLimiter(delay=0.2)
+        assert limiter.reserve("https://arxiv.org/abs/1") == 0
+        assert limiter.reserve("https://arxiv.org/abs/2") == pytest.approx(
+            0.2, abs=0.05
+        )
+        assert limiter.reserve("https://arxiv.org/abs/3") == pytest.approx(
+            0.4, abs=0.05
+        )
+
+    def test_different_hosts_are_independent(self):
+        """Test that other hosts are not held back."""
+        limiter = DomainRateLimiter(delay=10.0)
+        assert limiter.reserve("https://arxiv.org/abs/1") == 0
+        assert limiter.reserve("https://doi.org/10.1000/1") == 0
+
+    def test_buckets_shared_between_processes(self):
+        """Test that limiters on shared state queue behind each other."""
+        limiter = DomainRateLimiter(delay=0.2)
+        limiter.reserve("https://arxiv.org/abs/1")
+
+        with multiprocessing.Manager() as manager:
+            with limiter.share(manager) as state:
+                worker = DomainRateLimiter(delay=0.2)
+                worker.use_shared_state(state)
+                assert worker.reserve(
+                    "https://arxiv.org/abs/2"
+                ) == pytest.approx(0.2, abs=0.05)
+                assert limiter.reserve(
+                    "https://arxiv.org/abs/3"
+                ) == pytest.approx(0.4, abs=0.05)
+
+        # The parent keeps the slots reserved while shared
+        assert limiter.reserve("https://arxiv.org/abs/4") == pytest.approx(
+            0.6, abs=0.05
+        )
+
+    def test_domain_override(self):
+        """Test per-domain delay overrides, including subdomains."""
+        limiter = DomainRateLimiter(
+            delay=1.0,
+            domain_delays={"arxiv.org": 3.0, "export.arxiv.org": 5.0},
+        )
+        assert limiter.get_delay("export.arxiv.org") == 5.0
+        assert limiter.get_delay("static.arxiv.org") == 3.0
+        assert limiter.get_delay("doi.org") is None
+
+    def test_domain_override_is_a_floor(self):
+        """Test that callers can't go below the configured host delay."""
+        limiter = DomainRateLimiter(delay=0.0, domain_delays={"arxiv.org": 0.3})
+        limiter.reserve("https://arxiv.org/abs/1", delay=0.0)
+        assert limiter.reserve(
+            "https://arxiv.org/abs/2", delay=0.0
+        ) == pytest.approx(0.3, abs=0.05)
+
+    def test_burst(self):
+        """Test that a bucket allows a burst before throttling."""
+        limiter = DomainRateLimiter(delay=0.2, burst=3)
+        waits = [limiter.reserve("https://doi.org/x") for _ in range(4)]
+        assert waits[:3] == [0, 0, 0]
+        assert waits[3] == pytest.approx(0.2, abs=0.05)
+
+    def test_concurrent_reservations_get_distinct_slots(self):
+        """Test that threads reserving at once are queued, not collided."""
+        limiter = DomainRateLimiter(delay=0.1)
+        waits = []
+        lock = threading.Lock()
+
+        def reserve():
+            wait = limiter.reserve("https://api.crossref.org/works")
+            with lock:
+                waits.append(round(wait, 1))
+
+        threads = [threading.Thread(target=reserve) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(waits) == [0.0, 0.1, 0.2, 0.3, 0.4]
+
+
+class TestRateLimitResponses:
+    """Test Retry-After and 429 handling."""
+
+    def test_parse_retry_after(self):
+        """Test seconds and HTTP-date forms."""
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_429_pauses_host(self):
+        """Test that a 429 with Retry-After blocks only that host."""
+        limiter = DomainRateLimiter(delay=0.0)
+        response = SimpleNamespace(
+            status_code=429, headers={"Retry-After": "5"}
+        )
+
+        assert limiter.update_from_response("https://doi.org/a", response)
+        assert limiter.reserve("https://doi.org/b") == pytest.approx(
+            5.0, abs=0.1
+        )
+        assert limiter.reserve("https://arxiv.org/abs/1") == 0
+
+    def test_exponential_backoff_without_retry_after(self):
+        """Test that repeated 429s back off exponentially."""
+        limiter = DomainRateLimiter(delay=0.0, max_backoff=3.0)
+        assert limiter.backoff("https://doi.org/a") == 1.0
+        assert limiter.backoff("https://doi.org/a") == 2.0
+        assert limiter.backoff("https://doi.org/a") == 3.0
+
+    def test_ok_response_is_not_rate_limited(self):
+        """Test that normal and plain 503 responses don't back off."""
+        limiter = DomainRateLimiter(delay=0.0)
+        ok = SimpleNamespace(status_code=200, headers={})
+        outage = SimpleNamespace(status_code=503, headers={})
+        assert not limiter.update_from_response("https://doi.org/a", ok)
+        assert not limiter.update_from_response("https://doi.org/a", outage)
+        assert limiter.reserve("https://doi.org/a") == 0
+
+    def test_wait_async(self):
+        """Test the asyncio wait path."""
+        limiter = DomainRateLimiter(delay=0.05)
+
+        async def run():
+            return [
+                await limiter.wait_async("https://doi.org/a") for _ in range(2)
+            ]
+
+        waits = asyncio.run(run())
+        assert waits[0] == 0
+        assert waits[1] == pytest.approx(0.05, abs=0.03)
+
+    def test_shared_limiter_is_process_wide(self):
+        """Test that all clients get the same limiter instance."""
+        assert get_rate_limiter() is get_rate_limiter()
+
+
+class TestConcurrentValidation:
+    """Test BiblioChecker.validate_citations."""
+
+    @pytest.fixture
+    def checker(self):
+        """Create a checker with concurrent resolution enabled."""
+        return BiblioChecker(
+            use_cache=False, max_workers=4, delay=0.0, log_file=None
+        )
+
+    def test_results_in_document_order(self, checker, monkeypatch):
+        """Test that results keep document order and duplicates fetch once."""
+        urls = [
+            "https://arxiv.org/abs/2301.00001",
+            "https://doi.org/10.1000/a",
+            "https://arxiv.org/abs/2301.00001",
+            "https://nature.com/articles/b",
+        ]
+        calls = []
+        lock = threading.Lock()
+
+        def fake_extract(url):
+            with lock:
+                calls.append(url)
+            # Finish out of order
+            time.sleep(0.05 if "arxiv" in url else 0.0)
+            entry = BibtexEntry(
+                entry_type="article",
+                key="key",
+                fields={"author": "Smith, John", "year": "2023"},
+                raw_bibtex="",
+                source_url=url,
+            )
+            return entry, [], 0.9
+
+        monkeypatch.setattr(checker, "extract_bibtex_from_url", fake_extract)
+
+        citations = [make_citation(url, i) for i, url in enumerate(urls)]
+        results = checker.validate_citations(citations)
+
+        assert [r.citation.url for r in results] == urls
+        assert [r.citation.line_number for r in results] == [1, 2, 3, 4]
+        assert sorted(calls) == sorted(set(urls))
+        assert all(r.corrected_text == "Smith (2023)" for r in results)
+
+    def test_aliases_fetched_once_per_run(self, checker, monkeypatch):
+        """Test that URLs of one work share a single fetch across calls."""
+        calls = []
+
+        def fake_extract(url):
+            calls.append(url)
+            entry = BibtexEntry(
+                entry_type="article",
+                key="key",
+                fields={"author": "Smith, John", "year": "2023"},
+                raw_bibtex="",
+                source_url=url,
+            )
+            return entry, [], 0.9
+
+        monkeypatch.setattr(checker, "extract_bibtex_from_url", fake_extract)
+
+        first = [
+            "https://arxiv.org/abs/2301.00001",
+            "https://arxiv.org/pdf/2301.00001v2",
+            "https://doi.org/10.1000/a",
+        ]
+        results = checker.validate_citations(
+            [make_citation(url, i) for i, url in enumerate(first)]
+        )
+        assert sorted(calls) == sorted([first[0], first[2]])
+        assert [r.citation.url for r in results] == first
+        assert all(r.bibtex_entry for r in results)
+
+        # A later document citing the same works fetches nothing
+        checker.max_workers = 1
+        result = checker.validate_citation(
+            make_citation("https://doi.org/10.48550/arXiv.2301.00001", 0)
+        )
+        assert result.bibtex_entry.source_url == first[0]
+        assert len(calls) == 2
+
+    def test_interleave_by_domain(self, checker):
+        """Test round-robin ordering across hosts."""
+        urls = [
+            "https://arxiv.org/abs/1",
+            "https://arxiv.org/abs/2",
+            "https://arxiv.org/abs/3",
+            "https://doi.org/10.1000/a",
+            "https://nature.com/b",
+        ]
+        assert checker._interleave_by_domain(urls) == [
+            "https://arxiv.org/abs/1",
+            "https://doi.org/10.1000/a",
+            "https://nature.com/b",
+            "https://arxiv.org/abs/2",
+            "https://arxiv.org/abs/3",
+        ]
+
+
+# File the patched resolver logs its calls to (set by the test)
+class OfflineChecker(BiblioChecker):
+    """Checker resolving URLs without network access.
+
+    Worker processes import it from this module, so the URLs they resolve
+    are logged to the file named by the FETCH_LOG environment variable.
+    """
+
+    def extract_bibtex_from_url(self, url):
+        with open(os.environ["FETCH_LOG"], "a", encoding="utf-8") as f:
+            f.write(url + "\n")
+        entry = BibtexEntry(
+            entry_type="article",
+            key="key",
+            fields={"author": "Smith, John", "year": "2023"},
+            raw_bibtex="",
+            source_url=url,
+        )
+        return entry, [], 0.9
+
+
+class TestParallelFiles:
+    """Test BiblioChecker.process_files with worker processes."""
+
+    @pytest.fixture
+    def notes(self, tmp_path):
+        """Create a small notes tree citing shared URLs."""
+        notes = tmp_path / "notes"
+        (notes / "sub").mkdir(parents=True)
+        shared = "https://doi.org/10.1000/shared"
+        for i in range(4):
+            folder = notes / "sub" if i % 2 else notes
+            (folder / f"note{i}.md").write_text(
+                f"See [Smith (2023)]({shared}) and "
+                f"[Jones (2020)](https://arxiv.org/abs/2301.0000{i}).\n",
+                encoding="utf-8",
+            )
+        return notes
+
+    def test_group_urls_by_host(self):
+        """Test that each host's URLs form a single group."""
+        checker = BiblioChecker(use_cache=False, delay=0.0, log_file=None)
+        groups = checker._group_urls_by_host(
+            [
+                "https://doi.org/10.1000/a",
+                "https://arxiv.org/abs/1",
+                "https://www.doi.org/10.1000/b",
+            ]
+        )
+        assert groups == [
+            ["https://doi.org/10.1000/a", "https://www.doi.org/10.1000/b"],
+            ["https://arxiv.org/abs/1"],
+        ]
+
+    def test_urls_resolved_once_across_files(
+        self, notes, tmp_path, monkeypatch
+    ):
+        """Test that a URL cited in several files is fetched once."""
+        fetch_log = tmp_path / "fetches.txt"
+        monkeypatch.setenv("FETCH_LOG", str(fetch_log))
+        summary_path = tmp_path / "summary.json"
+
+        log_file = tmp_path / "biblio_checker.log"
+
+        checker = OfflineChecker(
+            use_cache=False, delay=0.0, log_file=str(log_file)
+        )
+        summary = checker.process_files(
+            [str(notes)], jobs=2, summary_path=str(summary_path)
+        )
+
+        fetched = fetch_log.read_text(encoding="utf-8").split()
+        assert sorted(fetched) == sorted(set(fetched))
+        assert len(fetched) == 5
+
+        assert summary["files_processed"] == 4
+        assert summary["total_citations"] == 8
+        assert summary["unique_urls"] == 5
+        assert json.loads(summary_path.read_text()) == summary
+
+        # Per-file logs and corrected files are written as before
+        for note in notes.rglob("note?.md"):
+            log = json.loads(note.with_suffix(".json").read_text())
+            assert log["total_citations"] == 2
+            assert log["results"][0]["citation"]["file_path"] == str(note)
+            corrected = note.with_name(f"{note.stem}_corrected.md")
+            assert corrected.exists()
+
+        # Workers log to the checker's log file, not the working directory
+        assert "Extracting citations from" in log_file.read_text()
+
+    def test_click_cli_routes_directories(self, notes, tmp_path, monkeypatch):
+        """Test that the click CLI processes directories via process_files."""
+        calls = []
+        monkeypatch.setattr(
+            BiblioChecker,
+            "process_files",
+            lambda self, paths, jobs, summary_path: calls.append(
+                (paths, jobs, summary_path)
+            ),
+        )
+        summary_path = tmp_path / "summary.json"
+
+        result = CliRunner().invoke(
+            click_main,
+            [str(notes), "--jobs", "3", "--summary", str(summary_path)],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert calls == [([str(notes)], 3, str(summary_path))]
@@ -0,0 +1,138 @@
+"""Unit tests for the compiled CSL JSON index."""
+
+import json
+import os
+
+import pytest
+from src.converters.md_to_latex.citation_manager import Citation
+from src.converters.md_to_latex.converter import MarkdownToLatexConverter
+from src.utils import csl_json_index
+from src.utils.csl_json_index import CSLJsonIndex, iter_entry_spans
+
+ENTRIES = [
+    {
+        "id": "he2016",
+        "type": "paper-conference",
+        "title": "Deep Residual Learning for Image Recognition",
+        "author": [{"family": "He", "given": "Kaiming"}],
+        "issued": {"date-parts": [[2016]]},
+        "DOI": "10.1109/CVPR.2016.90",
+        "URL": "https://ieeexplore.ieee.org/document/7780459",
+    },
+    {
+        "id": "vaswani2017",
+        "type": "article",
+        "title": "Attention Is All You Need — Ünïcode",
+        "author": [{"family": "Vaswani", "given": "Ashish"}],
+        "issued": {"date-parts": [[2017]]},
+        "URL": "https://arxiv.org/abs/1706.03762",
+    },
+    {
+        "id": "smith2020",
+        "type": "webpage",
+        "title": "A Note",
+        "note": "Preprint arXiv:2001.00001v2.",
+    },
+]
+
+
+def write_export(path, entries, newline="\n", bom=False):
+    """Write entries as a pretty-printed CSL JSON array."""
+    text = json.dumps(entries, indent=2, ensure_ascii=False)
+    text = text.replace("\n", newline)
+    path.write_bytes(("\ufeff" if bom else "").encode() + text.encode())
+    return path
+
+
+class TestEntrySpans:
+    """Test streaming items with their byte spans."""
+
+    @pytest.mark.parametrize("newline,bom", [("\n", False), ("\r\n", True)])
+    def test_spans_decode_to_entries(self, tmp_path, monkeypatch, newline, bom):
+        """Test spans across chunk boundaries, CRLF, a BOM and UTF-8."""
+        monkeypatch.setattr(csl_json_index, "READ_CHUNK_CHARS", 64)
+        path = write_export(tmp_path / "lib.json", ENTRIES, newline, bom)
+        data = path.read_bytes()
+
+        spans = list(iter_entry_spans(path))
+
+        assert [entry for _, _, entry in spans] == ENTRIES
+        for offset, length, entry in spans:
+            assert json.loads(data[offset : offset + length]) == entry
+
+    def test_not_an_array(self, tmp_path):
+        """Test that other JSON documents are rejected."""
+        path = tmp_path / "lib.json"
+        path.write_text('{"items": []}')
+        with pytest.raises(ValueError):
+            list(iter_entry_spans(path))
+
+
+class TestCSLJsonIndex:
+    """Test lookups and rebuilding."""
+
+    def test_lookups(self, tmp_path):
+        """Test each kind of key."""
+        path = write_export(tmp_path / "lib.json", ENTRIES)
+        with CSLJsonIndex(path) as index:
+            assert len(index) == 3
+            assert index.find_by_doi("10.1109/cvpr.2016.90")["id"] == "he2016"
+            alias = index.find_by_url("https://arxiv.org/pdf/1706.03762v5")
+            assert alias == ENTRIES[1]
+            assert index.find_by_arxiv_id("2001.00001")["id"] == "smith2020"
+            assert index.find_by_title("attention is all you need ünïcode")
+            assert index.find_by_author_year("He", 2016)["id"] == "he2016"
+            assert index.find_by_doi("10.1000/missing") is None
+            assert [e["id"] for e in index.iter_entries()] == [
+                "he2016",
+                "vaswani2017",
+                "smith2020",
+            ]
+        assert (tmp_path / "lib.json.index.sqlite").exists()
+
+    def test_later_entries_win(self, tmp_path):
+        """Test that duplicate keys resolve like the dicts they replace."""
+        duplicate = dict(ENTRIES[0], id="he2016b")
+        path = write_export(tmp_path / "lib.json", [ENTRIES[0], duplicate])
+        with CSLJsonIndex(path) as index:
+            assert index.get("url", ENTRIES[0]["URL"])["id"] == "he2016b"
+
+    def test_rebuilt_only_when_content_changes(self, tmp_path):
+        """Test the size, mtime and hash checks."""
+        path = write_export(tmp_path / "lib.json", ENTRIES)
+        CSLJsonIndex(path).close()
+
+        index = CSLJsonIndex(path)
+        assert index.ensure_current() is False
+
+        # Touched but unchanged: hash check, no rebuild
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert index.ensure_current() is False
+
+        # Changed content: rebuilt
+        index.close()
+        write_export(path, ENTRIES[:1])
+        assert index.ensure_current() is True
+        assert len(index) == 1
+        index.close()
+
+
+class TestConverterUsesIndex:
+    """Test matching citations against a Zotero export."""
+
+    def test_populate_from_zotero_json(self, tmp_path):
+        """Test URL, DOI and alias matches."""
+        path = write_export(tmp_path / "lib.json", ENTRIES)
+        converter = MarkdownToLatexConverter(
+            output_dir=tmp_path, zotero_json_path=path, use_cache=False
+        )
+        citations = [
+            Citation("He", "2016", "https://doi.org/10.1109/cvpr.2016.90"),
+            Citation("Vaswani", "2017", "https://arxiv.org/pdf/1706.03762"),
+            Citation("Doe", "2021", "https://example.com/unknown"),
+        ]
+
+        assert converter._populate_from_zotero_json(citations) == (2, 1)
+        assert citations[0].title.startswith("Deep Residual")
+        assert citations[1].full_authors == "Vaswani, Ashish"
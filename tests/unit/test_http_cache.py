@@ -0,0 +1,139 @@
+"""Unit tests for the on-disk HTTP response cache."""
+
+import os
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from src.utils.http_cache import (
+    CachedSession,
+    HTTPCache,
+    OfflineCacheMiss,
+    serves_locally,
+)
+
+
+class FakeAdapter(BaseAdapter):
+    """Transport adapter answering from a script instead of the network."""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+        self.body = b"<html>page</html>"
+        self.etag = '"v1"'
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        if request.headers.get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = self.body
+            response.headers["ETag"] = self.etag
+            response.headers["Content-Type"] = "text/html; charset=utf-8"
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def adapter():
+    """Scripted transport."""
+    return FakeAdapter()
+
+
+def make_session(tmp_path, adapter, **kwargs):
+    """Create a cached session using the fake transport."""
+    session = CachedSession(HTTPCache(cache_dir=tmp_path / "http", **kwargs))
+    session.mount("https://", adapter)
+    return session
+
+
+class TestCachedSession:
+    """Test storing, revalidation and offline replay."""
+
+    def test_revalidates_with_etag(self, tmp_path, adapter):
+        """Test that a stored response is revalidated and reused on 304."""
+        session = make_session(tmp_path, adapter)
+        first = session.get("https://example.com/a")
+        assert first.text == "<html>page</html>"
+        assert not getattr(first, "from_cache", False)
+
+        second = session.get("https://example.com/a")
+        assert adapter.requests[1].headers["If-None-Match"] == '"v1"'
+        assert second.status_code == 200
+        assert second.from_cache
+        assert second.text == "<html>page</html>"
+        assert second.headers["Content-Type"].startswith("text/html")
+
+    def test_changed_page_is_replaced(self, tmp_path, adapter):
+        """Test that a new ETag stores the new body."""
+        session = make_session(tmp_path, adapter)
+        session.get("https://example.com/a")
+        adapter.body, adapter.etag = b"new", '"v2"'
+
+        assert session.get("https://example.com/a").content == b"new"
+        assert session.get("https://example.com/a").content == b"new"
+
+    def test_offline_replay(self, tmp_path, adapter):
+        """Test that offline mode serves cached pages and fails on misses."""
+        make_session(tmp_path, adapter).get("https://example.com/a")
+
+        offline = make_session(tmp_path, adapter, offline=True)
+        assert offline.get("https://example.com/a").from_cache
+        with pytest.raises(OfflineCacheMiss):
+            offline.get("https://example.com/missing")
+        assert len(adapter.requests) == 1
+        assert serves_locally(offline, "https://example.com/missing")
+
+    def test_max_age_skips_network(self, tmp_path, adapter):
+        """Test that recently validated responses skip revalidation."""
+        session = make_session(tmp_path, adapter, max_age=3600)
+        session.get("https://example.com/a")
+        assert serves_locally(session, "https://example.com/a")
+        assert session.get("https://example.com/a").from_cache
+        assert len(adapter.requests) == 1
+
+    def test_accept_header_is_part_of_key(self, tmp_path, adapter):
+        """Test that content-negotiated responses are cached separately."""
+        session = make_session(tmp_path, adapter, max_age=3600)
+        session.get("https://doi.org/10.1000/a")
+        session.get(
+            "https://doi.org/10.1000/a",
+            headers={"Accept": "application/x-bibtex"},
+        )
+        assert len(adapter.requests) == 2
+
+    def test_identical_bodies_share_storage(self, tmp_path, adapter):
+        """Test content addressing of compressed bodies."""
+        session = make_session(tmp_path, adapter)
+        session.get("https://example.com/a")
+        session.get("https://example.com/b")
+
+        bodies = list((tmp_path / "http" / "bodies").rglob("*.zlib"))
+        assert len(bodies) == 1
+
+    def test_bodies_are_pruned_beyond_max_size(self, tmp_path, adapter):
+        """Test that the least recently validated bodies are deleted."""
+        session = make_session(tmp_path, adapter, max_age=3600, max_size=2900)
+        for page in "abc":
+            # Random bytes don't compress, so each body takes 1000 bytes
+            adapter.body = os.urandom(1000)
+            session.get(f"https://example.com/{page}")
+
+        bodies = list((tmp_path / "http" / "bodies").rglob("*.zlib"))
+        assert len(bodies) == 2
+        assert session.get("https://example.com/c").from_cache
+        assert not getattr(
+            session.get("https://example.com/a"), "from_cache", False
+        )
+        assert len(adapter.requests) == 4
+
+    def test_plain_sessions_use_network(self):
+        """Test that serves_locally is False for ordinary sessions."""
+        assert not serves_locally(requests.Session(), "https://example.com")
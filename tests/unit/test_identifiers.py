@@ -0,0 +1,140 @@
+"""Unit tests for canonical identifiers of cited works."""
+
+from src.utils.cache import BiblioCache
+from src.utils.identifiers import (
+    CanonicalId,
+    canonical_id,
+    extract_doi,
+    group_by_canonical_id,
+    normalize_url,
+)
+
+
+class TestCanonicalId:
+    """Test resolving URLs to the work they cite."""
+
+    def test_arxiv_aliases(self):
+        """Test that abs, versioned PDF and DataCite DOI forms collapse."""
+        expected = CanonicalId("arxiv", "2301.12345")
+        for url in (
+            "https://arxiv.org/abs/2301.12345",
+            "http://www.arxiv.org/pdf/2301.12345v2",
+            "https://arxiv.org/pdf/2301.12345v3.pdf",
+            "https://export.arxiv.org/abs/2301.12345?context=cs",
+            "https://doi.org/10.48550/arXiv.2301.12345",
+            "arXiv:2301.12345v1",
+        ):
+            assert canonical_id(url) == expected, url
+        assert str(expected) == "arxiv:2301.12345"
+
+    def test_old_style_arxiv_id(self):
+        """Test IDs with an archive prefix."""
+        assert canonical_id("https://arxiv.org/abs/hep-th/9901001v2") == (
+            CanonicalId("arxiv", "hep-th/9901001")
+        )
+        assert canonical_id("https://arxiv.org/list/cs.AI/recent").scheme == (
+            "url"
+        )
+
+    def test_doi_aliases(self):
+        """Test resolver, publisher and prefixed DOI forms."""
+        expected = CanonicalId("doi", "10.1000/abc.def")
+        for url in (
+            "https://doi.org/10.1000/ABC.def",
+            "http://dx.doi.org/10.1000/abc.def/",
+            "https://onlinelibrary.wiley.com/doi/pdf/10.1000/abc.def",
+            "https://www.tandfonline.com/doi/abs/10.1000/abc.def?src=x",
+            "doi:10.1000/abc.def",
+            "10.1000/abc.def",
+            "https://doi.org/10.1000%2Fabc.def",
+        ):
+            assert canonical_id(url) == expected, url
+
+    def test_pubmed_ids(self):
+        """Test PMID and PMCID URL forms."""
+        assert canonical_id("https://pubmed.ncbi.nlm.nih.gov/12345/") == (
+            CanonicalId("pmid", "12345")
+        )
+        assert canonical_id("https://www.ncbi.nlm.nih.gov/pubmed/12345") == (
+            CanonicalId("pmid", "12345")
+        )
+        assert canonical_id(
+            "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC7654321/"
+        ) == CanonicalId("pmcid", "PMC7654321")
+        assert canonical_id(
+            "https://pmc.ncbi.nlm.nih.gov/articles/pmc7654321"
+        ) == CanonicalId("pmcid", "PMC7654321")
+
+    def test_normalized_urls(self):
+        """Test that cosmetic URL differences are ignored."""
+        assert normalize_url(
+            "HTTP://WWW.Example.com:80/Paper/?utm_source=x&b=2&a=1#top"
+        ) == ("https://example.com/Paper?a=1&b=2")
+        assert canonical_id("https://example.com/paper?ref=feed") == (
+            canonical_id("https://www.example.com/paper/")
+        )
+        assert canonical_id("https://example.com/Paper") != (
+            canonical_id("https://example.com/paper")
+        )
+
+    def test_empty_url_has_no_canonical_id(self):
+        """Test that citations without a URL don't share a work ID."""
+        assert canonical_id("") is None
+        assert canonical_id("   ") is None
+        assert list(group_by_canonical_id(["", "https://a.org/x"])) == [
+            CanonicalId("url", ""),
+            CanonicalId("url", "https://a.org/x"),
+        ]
+
+    def test_group_by_canonical_id(self):
+        """Test grouping distinct URLs in first-seen order."""
+        groups = group_by_canonical_id(
+            [
+                "https://arxiv.org/pdf/2301.12345v2",
+                "https://doi.org/10.1000/a",
+                "https://arxiv.org/abs/2301.12345",
+                "https://arxiv.org/pdf/2301.12345v2",
+            ]
+        )
+        assert list(groups.values()) == [
+            [
+                "https://arxiv.org/pdf/2301.12345v2",
+                "https://arxiv.org/abs/2301.12345",
+            ],
+            ["https://doi.org/10.1000/a"],
+        ]
+
+
+class TestExtractDoi:
+    """Test the DOI extraction shared with the result cache."""
+
+    def test_cache_normalization_uses_shared_extraction(self, tmp_path):
+        """Test that the cache keys DOI URLs as before."""
+        cache = BiblioCache(cache_dir=tmp_path, auto_backup=False)
+        assert cache.normalize_url(
+            "https://dx.doi.org/10.1000/Abc?utm_source=x"
+        ) == ("https://doi.org/10.1000/Abc", "10.1000/Abc")
+        cache.close()
+
+    def test_cache_finds_entries_keyed_before_pdf_dois(self, tmp_path):
+        """Test that entries stored under the plain PDF URL are still found."""
+        url = "https://dl.acm.org/doi/pdf/10.1145/3442188.3445922"
+        cache = BiblioCache(cache_dir=tmp_path, auto_backup=False)
+        cache.put(url, {"title": "Stochastic Parrots"})
+        # Key the row as it was before /doi/pdf/ paths resolved to a DOI
+        with cache._get_connection() as conn:
+            conn.execute(
+                "UPDATE cache_entries SET url_hash = ?, doi = NULL",
+                (cache._generate_url_hash(url),),
+            )
+
+        assert cache.get(url).bibtex_data == {"title": "Stochastic Parrots"}
+        assert list(cache.get_many([url])) == [url]
+        cache.close()
+
+    def test_doi_query_parameter(self):
+        """Test DOIs passed as query parameters."""
+        assert extract_doi("https://example.com/view?doi=10.1000/x&y=1") == (
+            "10.1000/x"
+        )
+        assert extract_doi("https://example.com/article/123") is None
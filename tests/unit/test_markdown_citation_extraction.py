@@ -0,0 +1,54 @@
+"""Unit tests for extracting citations from a parsed markdown document."""
+
+import tempfile
+
+from src.core.biblio_checker import BiblioChecker
+
+DOCUMENT = """# Results
+
+Deep residual networks [He et al., 2016](https://arxiv.org/abs/1512.03385)
+and [a blog](https://example.com/post) are cited.
+
+Transformers[Vaswani et al., 2017](https://doi.org/10.5555/3295222).
+"""
+
+
+class TestPrepareMarkdownFile:
+    """Test that a file is preprocessed and parsed in memory."""
+
+    def test_citations_from_preprocessed_text(self, tmp_path, monkeypatch):
+        """Test citations, their lines and that no temp file is written."""
+        path = tmp_path / "paper.md"
+        path.write_text(DOCUMENT, encoding="utf-8")
+        checker = BiblioChecker()
+
+        def no_temp_files(*args, **kwargs):
+            raise AssertionError("temporary file written")
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_temp_files)
+        content, citations = checker._prepare_markdown_file(str(path))
+
+        # Preprocessing adds the missing space before the second link
+        assert "Transformers [Vaswani" in content
+        assert [(c.url, c.line_number) for c in citations] == [
+            ("https://arxiv.org/abs/1512.03385", 3),
+            ("https://doi.org/10.5555/3295222", 6),
+        ]
+        assert all(c.file_path == str(path) for c in citations)
+        assert citations[1].full_line.startswith("Transformers [Vaswani")
+
+    def test_file_and_document_extraction_agree(self, tmp_path):
+        """Test the file entry point against a parsed document."""
+        path = tmp_path / "paper.md"
+        path.write_text(DOCUMENT, encoding="utf-8")
+        checker = BiblioChecker()
+
+        document = checker.markdown_parser.parse(DOCUMENT)
+        from_document = checker.extract_citations_from_document(
+            document, str(path)
+        )
+
+        assert from_document == checker.extract_citations_from_markdown(
+            str(path)
+        )
+        assert len(from_document) == 2
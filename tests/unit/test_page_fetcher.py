@@ -0,0 +1,108 @@
+"""Unit tests for the shared page fetcher."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from src.core.biblio_checker import BiblioChecker
+from src.utils.content_classifier import ContentClassifier
+from src.utils.page_fetcher import PageFetcher
+
+PAGE_HTML = b"""<html><head><title>Example Paper</title>
+<meta name="description" content="Abstract of a journal article">
+</head><body>Abstract. References. Journal of Examples. doi:</body></html>"""
+
+
+def make_response(url, content=PAGE_HTML, status_code=200):
+    """Create a real requests.Response without network access."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response._content = content
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture
+def session():
+    """Session stub serving PAGE_HTML for every URL."""
+    session = MagicMock()
+    session.get.side_effect = lambda url, **kwargs: make_response(url)
+    return session
+
+
+class TestPageFetcher:
+    """Test page reuse and lazy parsing."""
+
+    def test_page_is_fetched_once(self, session):
+        """Test that repeated fetches of a URL reuse the page."""
+        fetcher = PageFetcher(session=session)
+        first = fetcher.fetch("https://example.com/a")
+        second = fetcher.fetch("https://example.com/a")
+
+        assert first is second
+        assert session.get.call_count == 1
+
+    def test_soup_is_parsed_lazily_once(self, session):
+        """Test that the soup is built on first access and shared."""
+        page = PageFetcher(session=session).fetch("https://example.com/a")
+        assert page._soup is None
+        assert page.soup is page.soup
+        assert page.soup.find("title").text == "Example Paper"
+
+    def test_pages_are_evicted(self, session):
+        """Test that only max_pages pages stay in memory."""
+        fetcher = PageFetcher(session=session, max_pages=2)
+        for name in "abc":
+            fetcher.fetch(f"https://example.com/{name}")
+        fetcher.fetch("https://example.com/a")
+        assert session.get.call_count == 4
+
+    def test_network_errors_are_not_remembered(self, session):
+        """Test that a failed download is retried on the next fetch."""
+        session.get.side_effect = [
+            requests.ConnectionError("down"),
+            make_response("https://example.com/a"),
+        ]
+        fetcher = PageFetcher(session=session)
+        with pytest.raises(requests.ConnectionError):
+            fetcher.fetch("https://example.com/a")
+        assert fetcher.fetch("https://example.com/a").ok
+
+    def test_error_pages_raise_for_status(self, session):
+        """Test that HTTP errors surface like requests.Response."""
+        session.get.side_effect = lambda url, **kwargs: make_response(
+            url, b"gone", 404
+        )
+        page = PageFetcher(session=session).fetch("https://example.com/a")
+        assert not page.ok
+        with pytest.raises(requests.HTTPError):
+            page.raise_for_status()
+
+
+class TestSharedPagePipeline:
+    """Test that classification and extraction share one download."""
+
+    def test_classifier_uses_given_page(self, session):
+        """Test that a passed page is classified without fetching."""
+        fetcher = PageFetcher(session=session)
+        page = fetcher.fetch("https://example.com/paper")
+        classifier = ContentClassifier(fetcher=MagicMock())
+
+        result = classifier.classify_content("https://example.com/paper", page)
+
+        classifier.fetcher.fetch.assert_not_called()
+        assert result["is_academic"]
+
+    def test_checker_fetches_each_page_once(self, session):
+        """Test one GET per URL for classification plus extraction."""
+        checker = BiblioChecker(use_cache=False, delay=0.0)
+        checker.page_fetcher.session = session
+
+        entry, tags, _ = checker.extract_bibtex_from_url(
+            "https://example.com/paper"
+        )
+
+        assert entry.fields["title"] == "Example Paper"
+        assert "#GUESSED" in tags
+        assert session.get.call_count == 1
@@ -0,0 +1,212 @@
+"""Unit tests for streaming, size-capped PDF extraction."""
+
+import io
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from src.utils.http_cache import CachedSession, HTTPCache
+from src.utils.pdf_parser import PDFParser, _RangeFile
+
+PDF_URL = "https://example.org/files/report.pdf"
+
+
+def make_pdf(
+    title="Streaming Downloads of Large Documents", padding=0, info=False
+):
+    """Build a one-page PDF, optionally followed by a large unused object."""
+    content = f"BT /F1 18 Tf 72 720 Td ({title}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+        b"<< /Length %d >>\nstream\n" % padding
+        + b"0" * padding
+        + b"\nendstream",
+    ]
+    if info:
+        objects.append(b"<< /Title (Metadata Title) /Author (Ann Author) >>")
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    trailer = b"<< /Size %d /Root 1 0 R" % (len(objects) + 1)
+    if info:
+        trailer += b" /Info %d 0 R" % len(objects)
+    out.write(b"trailer\n" + trailer + b" >>\nstartxref\n%d\n%%%%EOF\n" % xref)
+    return out.getvalue()
+
+
+class FakePDFServer(BaseAdapter):
+    """Transport serving one PDF, with or without Range support."""
+
+    def __init__(self, body, ranges=True, content_type="application/pdf"):
+        super().__init__()
+        self.body = body
+        self.ranges = ranges
+        self.content_type = content_type
+        self.requests = []
+        self.bytes_sent = 0
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.headers["Content-Type"] = self.content_type
+        body = self.body
+        range_header = request.headers.get("Range")
+        if self.ranges and range_header:
+            start, _, end = range_header[len("bytes=") :].partition("-")
+            end = min(int(end), len(body) - 1)
+            response.status_code = 206
+            response.headers["Content-Range"] = (
+                f"bytes {start}-{end}/{len(body)}"
+            )
+            body = body[int(start) : end + 1]
+        else:
+            response.status_code = 200
+        response.raw = _CountingStream(self, body)
+        return response
+
+    def close(self):
+        pass
+
+
+class _CountingStream(io.BytesIO):
+    """Response body recording how many bytes the client read."""
+
+    def __init__(self, server, body):
+        super().__init__(body)
+        self.server = server
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.server.bytes_sent += len(data)
+        return data
+
+
+def make_parser(server, tmp_path=None, **kwargs):
+    """Create a parser whose session talks to the fake server."""
+    parser = PDFParser(**kwargs)
+    if tmp_path is not None:
+        parser.session = CachedSession(HTTPCache(cache_dir=tmp_path / "http"))
+    else:
+        parser.session = requests.Session()
+    parser.session.mount("https://", server)
+    return parser
+
+
+class TestRangeFile:
+    """Test the on-demand view of a remote file."""
+
+    def test_reads_only_touched_blocks(self):
+        """Test that seeking to the end fetches just the last block."""
+        data = bytes(range(256)) * 40
+        fetched = []
+
+        def fetch_range(start, end):
+            fetched.append((start, end))
+            return data[start : end + 1]
+
+        raw = _RangeFile(fetch_range, len(data), block_size=1024)
+        raw.seek(-10, io.SEEK_END)
+        assert raw.read(10) == data[-10:]
+        raw.seek(1000)
+        assert raw.read(100) == data[1000:1100]
+        assert fetched == [(9216, 10239), (0, 2047)]
+
+    def test_byte_budget(self):
+        """Test that reading past max_bytes raises instead of fetching."""
+        raw = _RangeFile(
+            lambda start, end: b"x" * (end - start + 1),
+            size=10_000,
+            block_size=1000,
+            max_bytes=3000,
+        )
+        raw.read(3000)
+        with pytest.raises(OSError, match="more than 3000 bytes"):
+            raw.read(1)
+
+
+class TestPDFParserStreaming:
+    """Test that large PDFs are never downloaded whole."""
+
+    def test_small_pdf(self):
+        """Test text extraction from a PDF smaller than one block."""
+        server = FakePDFServer(make_pdf())
+        info = make_parser(server).extract_pdf_info(PDF_URL)
+
+        assert info["title"] == "Streaming Downloads of Large Documents"
+        assert info["source_url"] == PDF_URL
+
+    def test_large_pdf_uses_ranges(self):
+        """Test that only the needed parts of a large PDF are fetched."""
+        server = FakePDFServer(make_pdf(padding=5_000_000))
+        parser = make_parser(server, max_bytes=1_000_000, block_size=65_536)
+
+        info = parser.extract_pdf_info(PDF_URL)
+
+        assert info["title"] == "Streaming Downloads of Large Documents"
+        assert server.bytes_sent < 300_000
+        assert all("Range" in r.headers for r in server.requests)
+
+    def test_cap_without_range_support(self):
+        """Test that a download without Range support stops at max_bytes."""
+        server = FakePDFServer(make_pdf(padding=5_000_000), ranges=False)
+        parser = make_parser(server, max_bytes=1_000_000)
+
+        parser.extract_pdf_info(PDF_URL)
+
+        assert len(server.requests) == 1
+        assert server.bytes_sent <= 1_000_000 + 64 * 1024
+
+    def test_text_is_extracted_once(self):
+        """Test that PyPDF2 doesn't re-extract text pdfplumber found."""
+        server = FakePDFServer(make_pdf(title="x"))
+        parser = make_parser(server)
+
+        with patch(
+            "PyPDF2._page.PageObject.extract_text", return_value="never"
+        ) as pypdf2_text:
+            info = parser.extract_pdf_info(PDF_URL)
+
+        pypdf2_text.assert_not_called()
+        assert info is None or "title" not in info
+
+    def test_metadata_fallback(self):
+        """Test that document metadata is used when the text has no title."""
+        server = FakePDFServer(make_pdf(title="x", info=True))
+        info = make_parser(server).extract_pdf_info(PDF_URL)
+
+        assert info["title"] == "Metadata Title"
+        assert info["authors"] == ["Ann Author"]
+
+    def test_complete_download_is_cached(self, tmp_path):
+        """Test that a full 200 download is stored for later replays."""
+        server = FakePDFServer(make_pdf(), ranges=False)
+        parser = make_parser(server, tmp_path=tmp_path)
+
+        parser.extract_pdf_info(PDF_URL)
+        parser.session.http_cache.offline = True
+        info = parser.extract_pdf_info(PDF_URL)
+
+        assert len(server.requests) == 1
+        assert info["title"] == "Streaming Downloads of Large Documents"
+
+    def test_not_a_pdf(self):
+        """Test that non-PDF responses are rejected."""
+        server = FakePDFServer(b"<html></html>", content_type="text/html")
+        parser = make_parser(server)
+        assert parser.extract_pdf_info("https://example.org/page") is None
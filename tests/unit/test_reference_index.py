@@ -0,0 +1,273 @@
+"""Unit tests for the local reference index."""
+
+import gzip
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from src.api_clients.crossref import CrossRefClient
+from src.citations.validator import DeterministicValidator
+from src.utils.cache import BiblioCache
+from src.utils.http_cache import HTTPCache
+from src.utils.reference_index import ReferenceIndex
+
+CROSSREF_WORK = {
+    "DOI": "10.1000/ResNet",
+    "title": ["Deep Residual Learning for Image Recognition"],
+    "author": [
+        {"given": "Kaiming", "family": "He"},
+        {"given": "Xiangyu", "family": "Zhang"},
+    ],
+    "published-print": {"date-parts": [[2016]]},
+    "container-title": ["CVPR"],
+}
+
+
+def make_record(doi, title, surname="Smith", **fields):
+    """Create a record in the API client format."""
+    return {
+        "doi": doi,
+        "title": title,
+        "authors": [{"given": "Ann", "family": surname}],
+        "year": 2020,
+        **fields,
+    }
+
+
+@pytest.fixture
+def reference_index(tmp_path):
+    """Empty index in a temporary directory."""
+    return ReferenceIndex(tmp_path / "index.db")
+
+
+class TestReferenceIndex:
+    """Test storing and querying records."""
+
+    def test_doi_lookup_is_normalized(self, reference_index):
+        """Test that DOI spellings find the same record."""
+        reference_index.add(
+            make_record("10.1000/ABC", "Some Title Here"), "crossref"
+        )
+
+        record = reference_index.get_by_doi("https://doi.org/10.1000/abc")
+        assert record["title"] == "Some Title Here"
+        assert record["source"] == "crossref"
+        assert reference_index.get_by_doi("10.1000/abc", source="arxiv") is None
+        assert reference_index.get_by_doi("10.1000/missing") is None
+
+    def test_arxiv_lookup_ignores_version(self, reference_index):
+        """Test that versioned IDs resolve to the same paper."""
+        reference_index.add(
+            {"arxiv_id": "2301.12345v2", "title": "A Preprint"}, "arxiv"
+        )
+
+        assert reference_index.get_by_arxiv_id("arXiv:2301.12345")
+        assert reference_index.get_by_arxiv_id("2301.12345v1")
+
+    def test_title_search_tolerates_typos(self, reference_index):
+        """Test that near-miss titles find the record with a score."""
+        reference_index.add_many(
+            [
+                make_record("10.1/a", "Attention Is All You Need"),
+                make_record("10.1/b", "Deep Residual Learning for Images"),
+                make_record("10.1/c", "Generative Adversarial Networks"),
+            ],
+            "crossref",
+        )
+
+        results = reference_index.search_by_title("Atention is all you need")
+        assert [r["doi"] for r in results] == ["10.1/a"]
+        assert 0.9 < results[0]["match_score"] < 1.0
+        assert reference_index.search_by_title("Unrelated topic") == []
+
+    def test_author_narrows_matches(self, reference_index):
+        """Test that records by the given author are preferred."""
+        reference_index.add_many(
+            [
+                make_record("10.1/a", "Neural Citation Graphs", "Smith"),
+                make_record("10.1/b", "Neural Citation Graphs", "Jones"),
+            ],
+            "crossref",
+        )
+
+        results = reference_index.search_by_title(
+            "Neural citation graphs", author="Jones, B."
+        )
+        assert [r["doi"] for r in results] == ["10.1/b"]
+
+    def test_authoritative_source_wins(self, reference_index):
+        """Test that cached BibTeX doesn't override CrossRef metadata."""
+        reference_index.add(make_record("10.1/a", "Real Title"), "crossref")
+        reference_index.add(
+            make_record("10.1/a", "Misspelt Titel", volume="7"), "cache"
+        )
+
+        record = reference_index.get_by_doi("10.1/a")
+        assert record["title"] == "Real Title"
+        assert record["volume"] == "7"
+        assert record["source"] == "crossref"
+        assert reference_index.search_by_title("Misspelt Titel") == []
+        assert len(reference_index) == 1
+
+    def test_source_filter_finds_merged_records(self, reference_index):
+        """Test that a source finds records whose fields another won."""
+        reference_index.add(
+            make_record("10.1/a", "Merged Paper Title"), "crossref"
+        )
+        reference_index.add(
+            {"doi": "10.1/a", "arxiv_id": "2001.00001", "title": "Preprint"},
+            "arxiv",
+        )
+
+        record = reference_index.get_by_arxiv_id("2001.00001", source="arxiv")
+        assert record["title"] == "Merged Paper Title"
+        assert record["source"] == "crossref"
+        assert reference_index.get_by_doi("10.1/a", source="crossref")
+        assert reference_index.get_by_doi("10.1/a", source="cache") is None
+        results = reference_index.search_by_title(
+            "Merged Paper Title", source="arxiv"
+        )
+        assert [r["doi"] for r in results] == ["10.1/a"]
+
+    def test_sources_of_older_index_are_kept(self, tmp_path):
+        """Test that an index without work_sources is migrated."""
+        db_path = tmp_path / "old.db"
+        old = ReferenceIndex(db_path)
+        old.add(make_record("10.1/a", "Older Index Paper"), "crossref")
+        conn = old._get_connection()
+        conn.execute("DELETE FROM work_sources")
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+        old.close()
+
+        reopened = ReferenceIndex(db_path)
+        assert reopened.get_by_doi("10.1/a", source="crossref")
+
+    def test_merges_doi_and_arxiv_entries(self, reference_index):
+        """Test that a record joining two entries leaves one."""
+        reference_index.add({"doi": "10.1/a", "title": "Paper"}, "crossref")
+        reference_index.add({"arxiv_id": "2001.00001", "title": "Paper"})
+        reference_index.add(
+            {"doi": "10.1/a", "arxiv_id": "2001.00001", "title": "Paper"},
+            "arxiv",
+        )
+
+        assert len(reference_index) == 1
+        assert reference_index.get_by_arxiv_id("2001.00001")["doi"] == "10.1/a"
+
+
+class TestImports:
+    """Test building the index from dumps and caches."""
+
+    def test_crossref_dump(self, reference_index, tmp_path):
+        """Test importing a gzipped CrossRef data file."""
+        dump = tmp_path / "crossref" / "0.json.gz"
+        dump.parent.mkdir()
+        with gzip.open(dump, "wt", encoding="utf-8") as f:
+            json.dump({"items": [CROSSREF_WORK, {"title": ["No DOI"]}]}, f)
+
+        assert reference_index.import_crossref_dump(dump.parent) == 1
+        record = reference_index.get_by_doi("10.1000/resnet")
+        assert record["year"] == 2016
+        assert record["authors"][0]["family"] == "He"
+
+    def test_arxiv_dump(self, reference_index, tmp_path):
+        """Test importing the arXiv JSON-lines snapshot."""
+        paper = {
+            "id": "1706.03762",
+            "title": "Attention Is All\n  You Need",
+            "authors_parsed": [["Vaswani", "Ashish", ""]],
+            "doi": None,
+            "versions": [{"created": "Mon, 12 Jun 2017 17:57:34 GMT"}],
+        }
+        dump = tmp_path / "arxiv-metadata.jsonl"
+        dump.write_text(json.dumps(paper) + "\n{broken\n")
+
+        assert reference_index.import_arxiv_dump(dump) == 1
+        record = reference_index.get_by_arxiv_id("1706.03762")
+        assert record["title"] == "Attention Is All You Need"
+        assert record["year"] == 2017
+        assert reference_index.find_by_author("Ashish Vaswani")
+
+    def test_http_cache(self, reference_index, tmp_path):
+        """Test importing cached CrossRef API responses."""
+        http_cache = HTTPCache(cache_dir=tmp_path / "http")
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"message": CROSSREF_WORK}).encode()
+        url = "https://api.crossref.org/works/10.1000%2FResNet"
+        http_cache.store(http_cache.make_key("GET", url), url, response)
+
+        assert reference_index.import_http_cache(http_cache) == 1
+        assert reference_index.get_by_doi("10.1000/resnet")
+
+    def test_biblio_cache(self, reference_index, tmp_path):
+        """Test importing BibTeX entries of the result cache."""
+        cache = BiblioCache(cache_dir=tmp_path / "cache", auto_backup=False)
+        cache.put(
+            url="https://doi.org/10.1/x",
+            bibtex_data={
+                "entry_type": "article",
+                "key": "smith2020",
+                "fields": {
+                    "title": "{Cached} Title of a Paper",
+                    "author": "Smith, Ann and Bob Jones",
+                    "year": "2020",
+                },
+                "raw_bibtex": "",
+                "source_url": "https://doi.org/10.1/x",
+            },
+        )
+
+        assert reference_index.import_biblio_cache(cache) == 1
+        cache.close()
+        record = reference_index.search_by_title("Cached title of a paper")[0]
+        assert record["doi"] == "10.1/x"
+        assert record["source"] == "cache"
+        assert record["authors"][1]["family"] == "Jones"
+
+
+class TestClientsUseIndex:
+    """Test that API clients answer from the index first."""
+
+    def test_crossref_client(self, reference_index):
+        """Test that fetched works are remembered and served locally."""
+        client = CrossRefClient(reference_index=reference_index)
+        client._make_request = MagicMock(
+            return_value={"message": CROSSREF_WORK}
+        )
+
+        assert client.get_by_doi("10.1000/ResNet")["year"] == 2016
+        assert client.get_by_doi("doi:10.1000/resnet")["year"] == 2016
+        assert client._make_request.call_count == 1
+
+        results = client.search_by_title(
+            "Deep residual learning for image recognition"
+        )
+        assert results[0]["doi"] == "10.1000/ResNet"
+        assert client._make_request.call_count == 1
+
+    def test_validator_resolves_title(self, reference_index):
+        """Test that a citation without identifiers gets its DOI."""
+        reference_index.add(
+            CrossRefClient(reference_index=reference_index)._parse_work(
+                CROSSREF_WORK
+            ),
+            "crossref",
+        )
+        crossref = CrossRefClient(reference_index=reference_index)
+        crossref._make_request = MagicMock(side_effect=AssertionError)
+        validator = DeterministicValidator(
+            crossref_client=crossref, reference_index=reference_index
+        )
+
+        citation = validator.validate_citation(
+            {
+                "title": "Deep Residual Learning for Image Recognition.",
+                "author": "He, K. and Zhang, X.",
+            }
+        )
+
+        assert citation.doi == "10.1000/ResNet"
+        assert citation.confidence == 1.0
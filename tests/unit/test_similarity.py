@@ -0,0 +1,87 @@
+"""Unit tests for the shared fuzzy matching engine."""
+
+from difflib import SequenceMatcher
+
+from src.utils.similarity import (
+    CandidateIndex,
+    get_profile,
+    normalize_text,
+    similarity,
+    token_overlap,
+)
+
+TITLES = [
+    "Attention Is All You Need",
+    "BERT: Pre-training of Deep Bidirectional Transformers",
+    "Deep Residual Learning for Image Recognition",
+    "Generative Adversarial Networks",
+    "Language Models are Few-Shot Learners",
+]
+
+
+class TestSimilarity:
+    """Test pairwise scoring against difflib."""
+
+    def test_normalize_text(self):
+        """Test punctuation handling matches the detector's old rules."""
+        assert normalize_text("Test-Case_Example") == "test case_example"
+        assert normalize_text("  Deep   Learning!  ") == "deep learning"
+
+    def test_profiles_are_cached(self):
+        """Test that a string is only profiled once."""
+        assert get_profile("Deep Learning") is get_profile("Deep Learning")
+        assert get_profile("Deep Learning").tokens == {"deep", "learning"}
+
+    def test_matches_sequence_matcher(self):
+        """Test that scores equal difflib's ratio of normalized text."""
+        a, b = TITLES[2], "Deep residual learning for image classification"
+        expected = SequenceMatcher(
+            None, normalize_text(a), normalize_text(b)
+        ).ratio()
+        assert similarity(a, b) == expected
+        assert similarity(a, a.upper()) == 1.0
+
+    def test_cutoff_returns_bound(self):
+        """Test that scores under the cutoff stay under it."""
+        score = similarity("abc", "xyz completely different", cutoff=0.5)
+        assert score < 0.5
+
+    def test_token_overlap(self):
+        """Test word-set Jaccard overlap."""
+        assert token_overlap("deep learning", "Deep-Learning") == 1.0
+        assert token_overlap("deep learning", "deep nets") == 1 / 3
+        assert token_overlap("", "deep") == 0.0
+
+
+class TestCandidateIndex:
+    """Test one-to-many matching."""
+
+    def test_best_finds_near_miss(self):
+        """Test that a perturbed title finds its original."""
+        index = CandidateIndex(TITLES)
+        position, score = index.best("Deep residual learning for images")
+        assert position == 2
+        assert score > 0.8
+
+    def test_search_orders_and_limits(self):
+        """Test that results are sorted, limited and above the cutoff."""
+        index = CandidateIndex(TITLES)
+        results = index.search("language models few shot", limit=2)
+        assert len(results) == 2
+        assert results[0][0] == 4
+        assert results[0][1] >= results[1][1]
+        assert index.search("zzzz qqqq", cutoff=0.9) == []
+
+    def test_agrees_with_exhaustive_search(self):
+        """Test that the shortlist keeps the exhaustive best match."""
+        index = CandidateIndex(TITLES)
+        for query in ("attention you need", "adversarial generative nets"):
+            exhaustive = max(
+                range(len(TITLES)),
+                key=lambda i: similarity(query, TITLES[i]),
+            )
+            assert index.best(query)[0] == exhaustive
+
+    def test_empty_index(self):
+        """Test that an empty index finds nothing."""
+        assert CandidateIndex([]).best("anything") is None
@@ -0,0 +1,62 @@
+"""Unit tests for the file and SQLite helpers of the on-disk caches."""
+
+import hashlib
+import threading
+
+from src.utils.storage import (
+    ThreadLocalConnection,
+    atomic_write,
+    connect_sqlite,
+    file_digest,
+)
+
+
+class TestAtomicWrite:
+    """Test replacing files through a rename."""
+
+    def test_writes_text_and_bytes(self, tmp_path):
+        """Test that parents are created and no temporary file is left."""
+        path = tmp_path / "a" / "b.txt"
+        atomic_write(path, "first")
+        atomic_write(path, "säkö".encode())
+
+        assert path.read_text(encoding="utf-8") == "säkö"
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_file_digest(self, tmp_path):
+        """Test hashing a file in blocks."""
+        path = tmp_path / "data.bin"
+        atomic_write(path, b"x" * 100_000)
+        assert file_digest(path) == hashlib.sha256(b"x" * 100_000).hexdigest()
+
+
+class TestThreadLocalConnection:
+    """Test per-thread SQLite connections."""
+
+    def test_one_connection_per_thread(self, tmp_path):
+        """Test that a thread reuses its connection and others get theirs."""
+        connection = ThreadLocalConnection(
+            lambda: connect_sqlite(
+                tmp_path / "db" / "test.db",
+                "CREATE TABLE IF NOT EXISTS t (x INTEGER)",
+            )
+        )
+        conn = connection.get()
+        assert connection.get() is conn
+
+        with conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+
+        def read_in_thread():
+            other = connection.get()
+            seen.append(other is not conn)
+            seen.append(other.execute("SELECT x FROM t").fetchone()["x"])
+
+        seen = []
+        thread = threading.Thread(target=read_in_thread)
+        thread.start()
+        thread.join()
+        assert seen == [True, 1]
+
+        connection.close()
+        assert connection.get() is not conn
@@ -1,6 +1,7 @@
 """API endpoints for biblio-assistant."""
 
 from .conversion import router as conversion_router
+from .jobs import router as jobs_router
 from .processing import router as processing_router
 from .review import router as review_router
 from .validation import router as validation_router
@@ -10,4 +11,5 @@ __all__ = [
     "processing_router",
     "conversion_router",
     "review_router",
+    "jobs_router",
 ]
@@ -1,10 +1,14 @@
 """Format conversion API endpoints."""
 
-import tempfile
+import base64
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+
+from ..core.jobs import JobManager
+from ..utils.uploads import save_uploads
+from .jobs import get_job_manager, run_or_submit
 
 # Import from other tools
 try:
@@ -15,12 +19,86 @@ except ImportError:
 router = APIRouter()
 
 
+def _convert(
+    path: Path,
+    filename: str,
+    to_format: str,
+    citation_style: str,
+    template: str | None,
+) -> dict[str, Any]:
+    """Convert a document (blocking, runs pandoc)."""
+    # Create output file
+    output_ext = {
+        "markdown": ".md",
+        "latex": ".tex",
+        "html": ".html",
+        "docx": ".docx",
+        "rst": ".rst",
+    }.get(to_format, f".{to_format}")
+
+    output_path = path.parent / f"{path.stem}.converted{output_ext}"
+
+    # Convert file
+    converter = FormatConverter()
+    converter.convert_file(
+        path,
+        output_path,
+        to_format,
+        template=template,
+        citation_style=citation_style,
+    )
+
+    result = {
+        "original_format": converter.analyzer.detect_format(path),
+        "target_format": to_format,
+        "filename": f"{Path(filename).stem}{output_ext}",
+    }
+
+    # Read converted content
+    if to_format == "docx":
+        # Binary format, base64 encoded so it fits in JSON
+        result["content"] = base64.b64encode(output_path.read_bytes()).decode(
+            "ascii"
+        )
+        result["content_encoding"] = "base64"
+        result["content_type"] = (
+            "application/vnd.openxmlformats-officedocument"
+            ".wordprocessingml.document"
+        )
+    else:
+        # Text format
+        result["content"] = output_path.read_text(encoding="utf-8")
+        result["content_type"] = "text/plain"
+
+    return result
+
+
+def _extract_bibliography(path: Path, format: str) -> dict[str, Any]:
+    """Extract the bibliography of a document (blocking)."""
+    converter = FormatConverter()
+    references = converter.extract_bibliography(path)
+
+    # Format bibliography
+    if format == "json":
+        output = references
+    else:
+        output = converter.format_bibliography(references, format)
+
+    return {
+        "reference_count": len(references),
+        "format": format,
+        "bibliography": output,
+    }
+
+
 @router.post("/convert")
 async def convert_format(
     file: UploadFile = File(...),
     to_format: str = Query(..., description="Target format"),
     citation_style: str = Query("author-year", description="Citation style"),
     template: str | None = Query(None, description="Template to use"),
+    background: bool = Query(False, description="Return a job id at once"),
+    jobs: JobManager = Depends(get_job_manager),
 ) -> dict[str, Any]:
     """Convert document between formats."""
     if not FormatConverter:
@@ -28,64 +106,27 @@ async def convert_format(
             status_code=503, detail="Format converter not available"
         )
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file.filename) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
-
-    # Create output file
-    output_ext = {
-        "markdown": ".md",
-        "latex": ".tex",
-        "html": ".html",
-        "docx": ".docx",
-        "rst": ".rst",
-    }.get(to_format, f".{to_format}")
-
-    output_path = tmp_path.with_suffix(output_ext)
-
-    try:
-        # Convert file
-        converter = FormatConverter()
-        converter.convert_file(
-            tmp_path,
-            output_path,
-            to_format,
-            template=template,
-            citation_style=citation_style,
-        )
-
-        # Read converted content
-        if to_format == "docx":
-            # Binary format
-            with open(output_path, "rb") as f:
-                converted_content = f.read()
-            content_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        else:
-            # Text format
-            converted_content = output_path.read_text(encoding="utf-8")
-            content_type = "text/plain"
-
-        return {
-            "original_format": converter.analyzer.detect_format(tmp_path),
-            "target_format": to_format,
-            "content": converted_content,
-            "content_type": content_type,
-            "filename": f"{tmp_path.stem}{output_ext}",
-        }
-
-    finally:
-        # Cleanup
-        tmp_path.unlink()
-        if output_path.exists():
-            output_path.unlink()
+    workdir, (path,) = await save_uploads([file])
+    return await run_or_submit(
+        jobs,
+        background,
+        "convert",
+        _convert,
+        path,
+        file.filename or path.name,
+        to_format,
+        citation_style,
+        template,
+        workdir=workdir,
+    )
 
 
 @router.post("/convert/extract-bib")
 async def extract_bibliography(
     file: UploadFile = File(...),
     format: str = Query("bibtex", description="Bibliography format"),
+    background: bool = Query(False, description="Return a job id at once"),
+    jobs: JobManager = Depends(get_job_manager),
 ) -> dict[str, Any]:
     """Extract bibliography from document."""
     if not FormatConverter:
@@ -93,32 +134,16 @@ async def extract_bibliography(
             status_code=503, detail="Format converter not available"
         )
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file.filename) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
-
-    try:
-        # Extract bibliography
-        converter = FormatConverter()
-        references = converter.extract_bibliography(tmp_path)
-
-        # Format bibliography
-        if format == "json":
-            output = references
-        else:
-            output = converter.format_bibliography(references, format)
-
-        return {
-            "reference_count": len(references),
-            "format": format,
-            "bibliography": output,
-        }
-
-    finally:
-        # Cleanup
-        tmp_path.unlink()
+    workdir, (path,) = await save_uploads([file])
+    return await run_or_submit(
+        jobs,
+        background,
+        "convert.extract-bib",
+        _extract_bibliography,
+        path,
+        format,
+        workdir=workdir,
+    )
 
 
 @router.get("/convert/formats")
@@ -0,0 +1,130 @@
+"""Background job API endpoints."""
+
+import asyncio
+import json
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from ..core.jobs import FINISHED_STATUSES, JobManager
+
+router = APIRouter()
+
+# Seconds between progress checks of a streamed job
+EVENT_POLL_INTERVAL = 0.5
+
+
+def get_job_manager(request: Request) -> JobManager:
+    """Dependency returning the application's job manager."""
+    return request.app.state.job_manager
+
+
+async def run_or_submit(
+    jobs: JobManager,
+    background: bool,
+    kind: str,
+    func: Callable[..., Any],
+    *args: Any,
+    workdir: Path | None = None,
+) -> Any:
+    """Run blocking work without stalling the event loop.
+
+    With background=True the work becomes a job and the response (202)
+    only carries its id; otherwise the request waits for the result while
+    the work runs on a thread.
+
+    Args:
+        jobs: Job manager of the application
+        background: Whether to return a job id instead of the result
+        kind: Job type, e.g. "process.extract"
+        func: Blocking function returning a JSON-friendly result
+        workdir: Upload directory, removed when the work is done
+    """
+    if background:
+        job_id = jobs.submit(kind, func, *args, cleanup=workdir)
+        return JSONResponse(
+            status_code=202,
+            content={
+                "job_id": job_id,
+                "status": "queued",
+                "status_url": f"/api/jobs/{job_id}",
+                "events_url": f"/api/jobs/{job_id}/events",
+            },
+        )
+
+    try:
+        return await run_in_threadpool(func, *args)
+    finally:
+        if workdir is not None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+@router.get("/jobs")
+async def list_jobs(
+    status: str | None = Query(None, description="Only jobs in this state"),
+    kind: str | None = Query(None, description="Only jobs of this type"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum jobs"),
+    jobs: JobManager = Depends(get_job_manager),
+) -> dict[str, Any]:
+    """List recent jobs (without results)."""
+    return {"jobs": jobs.store.list(status=status, kind=kind, limit=limit)}
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(
+    job_id: str, jobs: JobManager = Depends(get_job_manager)
+) -> dict[str, Any]:
+    """Get the status, progress and (when done) result of a job."""
+    job = jobs.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job(
+    request: Request,
+    job_id: str,
+    jobs: JobManager = Depends(get_job_manager),
+) -> StreamingResponse:
+    """Stream job updates as server-sent events until the job finishes."""
+    store = jobs.store
+    if store.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        last = None
+        while True:
+            job = store.get(job_id)
+            state = (job["status"], job["progress"], job["message"])
+            finished = job["status"] in FINISHED_STATUSES
+            if state != last or finished:
+                if not finished:
+                    job.pop("result")
+                yield f"data: {json.dumps(job, default=str)}\n\n"
+                last = state
+            if finished or await request.is_disconnected():
+                break
+            await asyncio.sleep(EVENT_POLL_INTERVAL)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@router.delete("/jobs/{job_id}")
+async def cancel_job(
+    job_id: str, jobs: JobManager = Depends(get_job_manager)
+) -> dict[str, Any]:
+    """Cancel a job that hasn't started yet."""
+    job = jobs.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not jobs.cancel(job_id):
+        raise HTTPException(
+            status_code=409, detail=f"Job is {job['status']}, can't cancel"
+        )
+    return {"job_id": job_id, "status": "cancelled"}
@@ -1,89 +1,104 @@
 """Paper processing API endpoints."""
 
-import tempfile
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+
+from ..core.jobs import JobManager, report_progress
+from ..utils.uploads import save_uploads
+from .jobs import get_job_manager, run_or_submit
 
 # Import from other tools
 try:
-    from paper_processor import PaperProcessor
+    from paper_processor import BatchProcessor, PaperProcessor
 except ImportError:
+    BatchProcessor = None
     PaperProcessor = None
 
 router = APIRouter()
 
 
-@router.post("/process/extract")
-async def extract_paper(
-    file: UploadFile = File(...),
-    format: str = Query("markdown", description="Output format"),
-    sections: list[str] | None = Query(None, description="Sections to extract"),
+def _extract(
+    path: Path, format: str, sections: list[str] | None
 ) -> dict[str, Any]:
-    """Extract content from a paper."""
-    if not PaperProcessor:
-        raise HTTPException(
-            status_code=503, detail="Paper processor not available"
-        )
+    """Extract one paper (blocking)."""
+    processor = PaperProcessor()
+    paper = processor.process_file(path, sections=sections)
+
+    # Format output
+    if format == "markdown":
+        output = paper.to_markdown()
+    elif format == "json":
+        output = paper.to_dict()
+    elif format == "latex":
+        output = paper.to_latex()
+    else:
+        output = paper.to_text()
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file.filename) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
-
-    try:
-        # Process paper
-        processor = PaperProcessor()
-        paper = processor.process_file(tmp_path, sections=sections)
-
-        # Format output
-        if format == "markdown":
-            output = paper.to_markdown()
-        elif format == "json":
-            output = paper.to_dict()
-        elif format == "latex":
-            output = paper.to_latex()
-        else:
-            output = paper.to_text()
+    return {
+        "title": paper.title,
+        "authors": paper.authors,
+        "word_count": paper.word_count,
+        "sections": len(paper.sections),
+        "references": len(paper.references),
+        "content": output,
+        "format": format,
+    }
 
-        return {
-            "title": paper.title,
-            "authors": paper.authors,
-            "word_count": paper.word_count,
-            "sections": len(paper.sections),
-            "references": len(paper.references),
-            "content": output,
-            "format": format,
-        }
 
-    finally:
-        # Cleanup
-        tmp_path.unlink()
+def _batch(
+    paths: list[Path],
+    filenames: list[str],
+    format: str,
+    workers: int | None,
+    timeout: float,
+    memory_limit_mb: int | None,
+) -> dict[str, Any]:
+    """Extract papers in parallel worker processes (blocking)."""
+    batch = BatchProcessor(
+        max_workers=workers,
+        timeout=timeout,
+        memory_limit_mb=memory_limit_mb,
+        output_format=format,
+    )
+    done = []
+
+    def on_result(file_result):
+        done.append(file_result)
+        report_progress(
+            len(done) / len(paths), f"{len(done)}/{len(paths)} papers"
+        )
 
+    file_results = batch.process_files(
+        paths, include_content=True, on_result=on_result
+    )
 
-@router.post("/process/batch")
-async def batch_process(
-    files: list[UploadFile] = File(...),
-    format: str = Query("markdown", description="Output format"),
-) -> dict[str, Any]:
-    """Process multiple papers."""
     results = []
-
-    for file in files:
-        try:
-            result = await extract_paper(file, format)
+    for filename, file_result in zip(filenames, file_results):
+        if file_result.ok:
             results.append(
                 {
-                    "filename": file.filename,
+                    "filename": filename,
                     "status": "success",
-                    "result": result,
+                    "result": {
+                        "title": file_result.title,
+                        "authors": file_result.authors,
+                        "word_count": file_result.word_count,
+                        "sections": file_result.sections,
+                        "references": file_result.references,
+                        "content": file_result.content,
+                        "format": format,
+                    },
                 }
             )
-        except Exception as e:
+        else:
             results.append(
-                {"filename": file.filename, "status": "error", "error": str(e)}
+                {
+                    "filename": filename,
+                    "status": "error",
+                    "error": file_result.error,
+                }
             )
 
     return {
@@ -93,6 +108,69 @@ async def batch_process(
     }
 
 
+@router.post("/process/extract")
+async def extract_paper(
+    file: UploadFile = File(...),
+    format: str = Query("markdown", description="Output format"),
+    sections: list[str] | None = Query(None, description="Sections to extract"),
+    background: bool = Query(False, description="Return a job id at once"),
+    jobs: JobManager = Depends(get_job_manager),
+) -> dict[str, Any]:
+    """Extract content from a paper."""
+    if not PaperProcessor:
+        raise HTTPException(
+            status_code=503, detail="Paper processor not available"
+        )
+
+    workdir, (path,) = await save_uploads([file])
+    return await run_or_submit(
+        jobs,
+        background,
+        "process.extract",
+        _extract,
+        path,
+        format,
+        sections,
+        workdir=workdir,
+    )
+
+
+@router.post("/process/batch")
+async def batch_process(
+    files: list[UploadFile] = File(...),
+    format: str = Query("markdown", description="Output format"),
+    workers: int | None = Query(
+        None, description="Worker processes (default: CPU count)"
+    ),
+    timeout: float = Query(300.0, description="Seconds allowed per paper"),
+    memory_limit_mb: int | None = Query(
+        None, description="Memory limit per worker process in MB"
+    ),
+    background: bool = Query(False, description="Return a job id at once"),
+    jobs: JobManager = Depends(get_job_manager),
+) -> dict[str, Any]:
+    """Process multiple papers in parallel worker processes."""
+    if not BatchProcessor:
+        raise HTTPException(
+            status_code=503, detail="Paper processor not available"
+        )
+
+    workdir, paths = await save_uploads(files)
+    return await run_or_submit(
+        jobs,
+        background,
+        "process.batch",
+        _batch,
+        paths,
+        [file.filename for file in files],
+        format,
+        workers,
+        timeout,
+        memory_limit_mb,
+        workdir=workdir,
+    )
+
+
 @router.get("/process/info")
 async def get_processor_info() -> dict[str, Any]:
     """Get information about the paper processor."""
@@ -1,10 +1,22 @@
 """Literature review API endpoints."""
 
-import tempfile
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    UploadFile,
+)
+from fastapi.concurrency import run_in_threadpool
+
+from ..core.jobs import JobManager
+from ..utils.uploads import save_uploads
+from .jobs import get_job_manager, run_or_submit
 
 # Import from other tools
 try:
@@ -16,51 +28,78 @@ except ImportError:
 router = APIRouter()
 
 
+def _summarize(path: Path, compression: float, format: str) -> dict[str, Any]:
+    """Summarize one paper (blocking, may call an AI service)."""
+    summarizer = Summarizer()
+    summary = summarizer.summarize_file(path, compression_ratio=compression)
+
+    # Format output
+    if format == "markdown":
+        output = summary.to_markdown()
+    elif format == "json":
+        output = summary.to_dict()
+    else:
+        output = summary.to_latex()
+
+    return {
+        "title": summary.title,
+        "authors": summary.authors,
+        "original_word_count": summary.word_count_original,
+        "summary_word_count": summary.word_count_summary,
+        "compression_achieved": summary.actual_compression,
+        "citation_count": len(summary.citations),
+        "content": output,
+        "format": format,
+    }
+
+
+def _create_review(
+    paths: list[Path], theme: str, context: str, format: str
+) -> dict[str, Any]:
+    """Create a literature review from papers (blocking)."""
+    reviewer = LiteratureReviewer()
+    review = reviewer.create_review(paths, theme=theme, context=context)
+
+    # Format output
+    if format == "markdown":
+        output = review.to_markdown()
+    else:
+        output = review.to_dict()
+
+    return {
+        "theme": review.theme,
+        "paper_count": review.paper_count,
+        "total_citations": review.total_citations,
+        "key_findings": len(review.key_findings),
+        "research_gaps": len(review.research_gaps),
+        "content": output,
+        "format": format,
+    }
+
+
 @router.post("/review/summarize")
 async def summarize_paper(
     file: UploadFile = File(...),
     compression: float = Query(0.25, description="Compression ratio"),
     format: str = Query("markdown", description="Output format"),
+    background: bool = Query(False, description="Return a job id at once"),
+    jobs: JobManager = Depends(get_job_manager),
 ) -> dict[str, Any]:
     """Create a summary of a paper."""
     if not Summarizer:
         raise HTTPException(status_code=503, detail="Summarizer not available")
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file.filename) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
-
-    try:
-        # Create summary
-        summarizer = Summarizer()
-        summary = summarizer.summarize_file(
-            tmp_path, compression_ratio=compression
-        )
-
-        # Format output
-        if format == "markdown":
-            output = summary.to_markdown()
-        elif format == "json":
-            output = summary.to_dict()
-        else:
-            output = summary.to_latex()
-
-        return {
-            "title": summary.title,
-            "authors": summary.authors,
-            "original_word_count": summary.word_count_original,
-            "summary_word_count": summary.word_count_summary,
-            "compression_achieved": summary.actual_compression,
-            "citation_count": len(summary.citations),
-            "content": output,
-            "format": format,
-        }
-
-    finally:
-        # Cleanup
-        tmp_path.unlink()
+    workdir, (path,) = await save_uploads([file])
+    return await run_or_submit(
+        jobs,
+        background,
+        "review.summarize",
+        _summarize,
+        path,
+        compression,
+        format,
+        workdir=workdir,
+    )
 
 
 @router.post("/review/create")
@@ -69,6 +108,8 @@ async def create_literature_review(
     theme: str = Form(...),
     context: str = Form(...),
     format: str = Query("markdown", description="Output format"),
+    background: bool = Query(False, description="Return a job id at once"),
+    jobs: JobManager = Depends(get_job_manager),
 ) -> dict[str, Any]:
     """Create a literature review from multiple papers."""
     if not LiteratureReviewer:
@@ -76,44 +117,18 @@ async def create_literature_review(
             status_code=503, detail="Literature reviewer not available"
         )
 
-    # Save uploaded files temporarily
-    temp_files = []
-
-    try:
-        for file in files:
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=file.filename
-            ) as tmp:
-                content = await file.read()
-                tmp.write(content)
-                temp_files.append(Path(tmp.name))
-
-        # Create literature review
-        reviewer = LiteratureReviewer()
-        review = reviewer.create_review(
-            temp_files, theme=theme, context=context
-        )
-
-        # Format output
-        if format == "markdown":
-            output = review.to_markdown()
-        else:
-            output = review.to_dict()
-
-        return {
-            "theme": review.theme,
-            "paper_count": review.paper_count,
-            "total_citations": review.total_citations,
-            "key_findings": len(review.key_findings),
-            "research_gaps": len(review.research_gaps),
-            "content": output,
-            "format": format,
-        }
-
-    finally:
-        # Cleanup
-        for tmp_file in temp_files:
-            tmp_file.unlink()
+    workdir, paths = await save_uploads(files)
+    return await run_or_submit(
+        jobs,
+        background,
+        "review.create",
+        _create_review,
+        paths,
+        theme,
+        context,
+        format,
+        workdir=workdir,
+    )
 
 
 @router.post("/review/analyze")
@@ -128,7 +143,7 @@ async def analyze_summary(file: UploadFile = File(...)) -> dict[str, Any]:
 
     # Analyze
     summarizer = Summarizer()
-    metrics = summarizer.analyze_summary(text)
+    metrics = await run_in_threadpool(summarizer.analyze_summary, text)
 
     return metrics
 
@@ -1,10 +1,13 @@
 """Validation API endpoints."""
 
-import tempfile
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+
+from ..core.jobs import JobManager
+from ..utils.uploads import save_uploads
+from .jobs import get_job_manager, run_or_submit
 
 # Import from other tools (would be installed as dependencies)
 try:
@@ -16,71 +19,79 @@ except ImportError:
 router = APIRouter()
 
 
+def _validate_citations(path: Path) -> dict[str, Any]:
+    """Validate the citations of a document (blocking, uses the network)."""
+    validator = CitationValidator()
+    results = validator.validate_document(path)
+
+    # Format results
+    return {
+        "total": len(results),
+        "valid": sum(1 for r in results if r.is_valid),
+        "invalid": sum(1 for r in results if not r.is_valid),
+        "results": [r.to_dict() for r in results],
+    }
+
+
+def _validate_bibliography(path: Path) -> dict[str, Any]:
+    """Validate a bibliography file (blocking, uses the network)."""
+    validator = BibliographyValidator()
+    report = validator.validate_file(path, check_dois=True, check_urls=True)
+
+    # Format results
+    return {
+        "total_entries": report.total_entries,
+        "valid_entries": report.valid_entries,
+        "invalid_entries": report.invalid_entries,
+        "issues": report.issues,
+        "warnings": report.warnings,
+    }
+
+
 @router.post("/validate/citations")
-async def validate_citations(file: UploadFile = File(...)) -> dict[str, Any]:
+async def validate_citations(
+    file: UploadFile = File(...),
+    background: bool = Query(False, description="Return a job id at once"),
+    jobs: JobManager = Depends(get_job_manager),
+) -> dict[str, Any]:
     """Validate citations in a document."""
     if not CitationValidator:
         raise HTTPException(
             status_code=503, detail="Citation validator not available"
         )
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file.filename) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
-
-    try:
-        # Validate citations
-        validator = CitationValidator()
-        results = validator.validate_document(tmp_path)
-
-        # Format results
-        return {
-            "total": len(results),
-            "valid": sum(1 for r in results if r.is_valid),
-            "invalid": sum(1 for r in results if not r.is_valid),
-            "results": [r.to_dict() for r in results],
-        }
-
-    finally:
-        # Cleanup
-        tmp_path.unlink()
+    workdir, (path,) = await save_uploads([file])
+    return await run_or_submit(
+        jobs,
+        background,
+        "validate.citations",
+        _validate_citations,
+        path,
+        workdir=workdir,
+    )
 
 
 @router.post("/validate/bibliography")
-async def validate_bibliography(file: UploadFile = File(...)) -> dict[str, Any]:
+async def validate_bibliography(
+    file: UploadFile = File(...),
+    background: bool = Query(False, description="Return a job id at once"),
+    jobs: JobManager = Depends(get_job_manager),
+) -> dict[str, Any]:
     """Validate a bibliography file."""
     if not BibliographyValidator:
         raise HTTPException(
             status_code=503, detail="Bibliography validator not available"
         )
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file.filename) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
-
-    try:
-        # Validate bibliography
-        validator = BibliographyValidator()
-        report = validator.validate_file(
-            tmp_path, check_dois=True, check_urls=True
-        )
-
-        # Format results
-        return {
-            "total_entries": report.total_entries,
-            "valid_entries": report.valid_entries,
-            "invalid_entries": report.invalid_entries,
-            "issues": report.issues,
-            "warnings": report.warnings,
-        }
-
-    finally:
-        # Cleanup
-        tmp_path.unlink()
+    workdir, (path,) = await save_uploads([file])
+    return await run_or_submit(
+        jobs,
+        background,
+        "validate.bibliography",
+        _validate_bibliography,
+        path,
+        workdir=workdir,
+    )
 
 
 @router.post("/validate/match")
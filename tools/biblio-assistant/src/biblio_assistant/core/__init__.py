@@ -1,6 +1,13 @@
 """Core functionality for biblio-assistant."""
 
 from .app import create_app
+from .jobs import JobManager, JobStore, report_progress
 from .server import BiblioServer
 
-__all__ = ["create_app", "BiblioServer"]
+__all__ = [
+    "create_app",
+    "BiblioServer",
+    "JobManager",
+    "JobStore",
+    "report_progress",
+]
@@ -9,11 +9,14 @@ from fastapi.staticfiles import StaticFiles
 
 from ..api import (
     conversion_router,
+    jobs_router,
     processing_router,
     review_router,
     validation_router,
 )
+from ..utils.config import get_default_config
 from ..web import web_router
+from .jobs import JobManager, JobStore
 
 
 def create_app(config: dict[str, Any] = None) -> FastAPI:
@@ -49,16 +52,36 @@ def create_app(config: dict[str, Any] = None) -> FastAPI:
     app.include_router(processing_router, prefix="/api", tags=["processing"])
     app.include_router(conversion_router, prefix="/api", tags=["conversion"])
     app.include_router(review_router, prefix="/api", tags=["review"])
+    app.include_router(jobs_router, prefix="/api", tags=["jobs"])
 
     # Store config in app state
     app.state.config = config
 
+    # Long-running requests run as background jobs recorded in SQLite
+    defaults = get_default_config()
+    storage_path = config.get("storage", {}).get(
+        "path", defaults["storage"]["path"]
+    )
+    jobs_config = {**defaults["jobs"], **config.get("jobs", {})}
+    app.state.job_manager = JobManager(
+        JobStore(
+            Path(storage_path).expanduser() / "jobs.db",
+            keep_finished=jobs_config["keep_finished"],
+        ),
+        max_workers=jobs_config["max_workers"],
+    )
+
     # Add startup event
     @app.on_event("startup")
     async def startup_event():
         """Initialize application on startup."""
         print("Biblio Assistant started successfully")
 
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """Stop the job workers."""
+        app.state.job_manager.shutdown()
+
     # Add health check
     @app.get("/health")
     async def health_check():
@@ -0,0 +1,303 @@
+"""Background jobs for long-running requests.
+
+The API handlers are async, but the tools behind them (PDF extraction,
+CrossRef/arXiv validation, pandoc, summarization) block for seconds or
+minutes. JobManager runs such work on a pool of worker threads and records
+each job's status, progress and result in a local SQLite database, so a
+client can submit work, get a job id back immediately and poll or stream
+its progress while the server keeps answering other requests.
+
+Work functions don't need to know they run as a job; they may call
+report_progress() to publish progress, which is a no-op outside a job.
+"""
+
+import json
+import logging
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATUSES = {SUCCEEDED, FAILED, CANCELLED}
+
+# Finished jobs kept (with their results) before the oldest are deleted
+DEFAULT_KEEP_FINISHED = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    message TEXT,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+)
+"""
+
+_current = threading.local()
+
+
+def report_progress(fraction: float, message: str | None = None) -> None:
+    """Publish the progress of the job running in this thread, if any.
+
+    Args:
+        fraction: Completed share of the work, from 0 to 1
+        message: Short description of the current step
+    """
+    job = getattr(_current, "job", None)
+    if job is not None:
+        store, job_id = job
+        store.update(
+            job_id, progress=max(0.0, min(1.0, fraction)), message=message
+        )
+
+
+class JobStore:
+    """SQLite table of jobs, shared by the worker threads."""
+
+    def __init__(
+        self, db_path: Path, keep_finished: int = DEFAULT_KEEP_FINISHED
+    ):
+        """Open (or create) the job table.
+
+        Args:
+            db_path: SQLite database file
+            keep_finished: Finished jobs kept by prune(); results such as
+                           converted documents can be large
+        """
+        self.db_path = Path(db_path)
+        self.keep_finished = keep_finished
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._get_connection().execute(_SCHEMA)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def create(self, kind: str) -> str:
+        """Add a queued job and return its id."""
+        job_id = uuid.uuid4().hex
+        conn = self._get_connection()
+        with conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, status, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (job_id, kind, QUEUED, time.time()),
+            )
+        return job_id
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Set columns of a job; a result is stored as JSON."""
+        if "result" in fields:
+            fields["result"] = json.dumps(fields["result"], default=str)
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        conn = self._get_connection()
+        with conn:
+            conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ?",
+                (*fields.values(), job_id),
+            )
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """Get a job, or None if the id is unknown."""
+        row = (
+            self._get_connection()
+            .execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+            .fetchone()
+        )
+        return self._to_dict(row) if row else None
+
+    def list(
+        self,
+        status: str | None = None,
+        kind: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Get the most recent jobs, without their results."""
+        query = "SELECT * FROM jobs"
+        conditions, params = [], []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if kind:
+            conditions.append("kind = ?")
+            params.append(kind)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+
+        rows = self._get_connection().execute(query, params).fetchall()
+        jobs = []
+        for row in rows:
+            job = self._to_dict(row)
+            job.pop("result")
+            jobs.append(job)
+        return jobs
+
+    def mark_interrupted(self) -> int:
+        """Fail jobs left unfinished by a previous server process."""
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? "
+                "WHERE status IN (?, ?)",
+                (
+                    FAILED,
+                    "Interrupted by server restart",
+                    time.time(),
+                    QUEUED,
+                    RUNNING,
+                ),
+            )
+        return cursor.rowcount
+
+    def prune(self) -> int:
+        """Delete all but the keep_finished most recently finished jobs."""
+        finished = tuple(sorted(FINISHED_STATUSES))
+        placeholders = ", ".join("?" for _ in finished)
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.execute(
+                f"DELETE FROM jobs WHERE status IN ({placeholders}) "
+                "AND id NOT IN ("
+                f"SELECT id FROM jobs WHERE status IN ({placeholders}) "
+                "ORDER BY finished_at DESC LIMIT ?)",
+                (*finished, *finished, self.keep_finished),
+            )
+        return cursor.rowcount
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> dict[str, Any]:
+        job = dict(row)
+        if job["result"] is not None:
+            job["result"] = json.loads(job["result"])
+        return job
+
+
+class JobManager:
+    """Run blocking work on worker threads and track it in a JobStore."""
+
+    def __init__(self, store: JobStore, max_workers: int = 4):
+        """Initialize the manager.
+
+        Args:
+            store: Where jobs are recorded
+            max_workers: Number of jobs that run at the same time
+        """
+        self.store = store
+        interrupted = store.mark_interrupted()
+        if interrupted:
+            logger.warning(f"Marked {interrupted} interrupted jobs as failed")
+        store.prune()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="biblio-job"
+        )
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        kind: str,
+        func: Callable[..., Any],
+        *args: Any,
+        cleanup: Path | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Queue func(*args, **kwargs) and return the job id.
+
+        Args:
+            kind: Job type, e.g. "process.batch"
+            func: Blocking function; its return value must be JSON-friendly
+            cleanup: Directory removed once the job has finished
+        """
+        job_id = self.store.create(kind)
+        future = self._executor.submit(
+            self._run, job_id, func, args, kwargs, cleanup
+        )
+        with self._lock:
+            if not future.done():
+                self._futures[job_id] = future
+        future.add_done_callback(
+            lambda done: self._finished(job_id, done, cleanup)
+        )
+        return job_id
+
+    def _finished(
+        self, job_id: str, future: Future, cleanup: Path | None
+    ) -> None:
+        with self._lock:
+            self._futures.pop(job_id, None)
+        # Jobs that ran clean up after themselves in _run
+        if future.cancelled():
+            self.store.update(job_id, status=CANCELLED, finished_at=time.time())
+            self.store.prune()
+            if cleanup is not None:
+                shutil.rmtree(cleanup, ignore_errors=True)
+
+    def _run(
+        self,
+        job_id: str,
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: dict[str, Any],
+        cleanup: Path | None,
+    ) -> None:
+        self.store.update(job_id, status=RUNNING, started_at=time.time())
+        _current.job = (self.store, job_id)
+        try:
+            result = func(*args, **kwargs)
+            self.store.update(
+                job_id,
+                status=SUCCEEDED,
+                progress=1.0,
+                result=result,
+                finished_at=time.time(),
+            )
+        except Exception as e:
+            logger.exception(f"Job {job_id} failed")
+            self.store.update(
+                job_id,
+                status=FAILED,
+                error=f"{type(e).__name__}: {e}",
+                finished_at=time.time(),
+            )
+        finally:
+            _current.job = None
+            self.store.prune()
+            if cleanup is not None:
+                shutil.rmtree(cleanup, ignore_errors=True)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that hasn't started; False if it has."""
+        with self._lock:
+            future = self._futures.get(job_id)
+        return future is not None and future.cancel()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting jobs; queued jobs are cancelled."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
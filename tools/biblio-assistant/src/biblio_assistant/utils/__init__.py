@@ -1,5 +1,6 @@
 """Utilities for biblio-assistant."""
 
 from .config import get_default_config, load_config
+from .uploads import save_uploads
 
-__all__ = ["load_config", "get_default_config"]
+__all__ = ["load_config", "get_default_config", "save_uploads"]
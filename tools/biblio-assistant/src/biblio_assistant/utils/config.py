@@ -39,4 +39,5 @@ def get_default_config() -> dict[str, Any]:
         "ui": {"theme": "light", "language": "en"},
         "features": {"enable_ai": True, "enable_collaboration": False},
         "storage": {"type": "local", "path": "~/.biblio-assistant/data"},
+        "jobs": {"max_workers": 4, "keep_finished": 200},
     }
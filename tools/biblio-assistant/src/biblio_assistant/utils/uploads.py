@@ -0,0 +1,26 @@
+"""Storage of uploaded files for processing."""
+
+import tempfile
+from pathlib import Path
+
+from fastapi import UploadFile
+
+
+async def save_uploads(files: list[UploadFile]) -> tuple[Path, list[Path]]:
+    """Save uploads to a new temporary directory.
+
+    Files keep their extension, which selects the extractor or parser, and
+    get a numeric prefix so uploads with the same name don't collide. The
+    caller removes the directory when done (or hands it to a job).
+
+    Returns:
+        The directory and the saved files, in upload order
+    """
+    directory = Path(tempfile.mkdtemp(prefix="biblio-assistant-"))
+    paths = []
+    for i, file in enumerate(files):
+        name = Path(file.filename or "upload").name
+        path = directory / f"{i:04d}_{name}"
+        path.write_bytes(await file.read())
+        paths.append(path)
+    return directory, paths
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for background jobs: the SQLite job store, the thread-pool job
+manager and the run_or_submit helper of the API handlers.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# The package imports the FastAPI app on import
+pytest.importorskip("fastapi")
+
+from biblio_assistant.api.jobs import run_or_submit
+from biblio_assistant.core.jobs import (
+    CANCELLED,
+    FAILED,
+    FINISHED_STATUSES,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    JobManager,
+    JobStore,
+    report_progress,
+)
+
+# Seconds a test waits for a job before giving up
+TIMEOUT = 10
+
+
+def finished(job):
+    return job["status"] in FINISHED_STATUSES
+
+
+def wait_for(store, job_id, condition=finished):
+    """Poll a job until condition(job) holds."""
+    deadline = time.monotonic() + TIMEOUT
+    while time.monotonic() < deadline:
+        job = store.get(job_id)
+        if condition(job):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} stuck in {store.get(job_id)}")
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(tmp_path / "jobs.db")
+
+
+@pytest.fixture
+def manager(store):
+    manager = JobManager(store, max_workers=1)
+    yield manager
+    manager.shutdown(wait=True)
+
+
+def fail():
+    raise ValueError("boom")
+
+
+def test_job_succeeds(manager, store):
+    job_id = manager.submit("test.add", lambda a, b: {"sum": a + b}, 1, b=2)
+
+    job = wait_for(store, job_id)
+    assert job["status"] == SUCCEEDED
+    assert job["kind"] == "test.add"
+    assert job["result"] == {"sum": 3}
+    assert job["progress"] == 1.0
+    assert job["started_at"] and job["finished_at"]
+
+
+def test_job_fails(manager, store):
+    job_id = manager.submit("test.fail", fail)
+
+    job = wait_for(store, job_id)
+    assert job["status"] == FAILED
+    assert job["error"] == "ValueError: boom"
+    assert job["result"] is None
+
+
+def test_cancel_queued_job(manager, store, tmp_path):
+    release = threading.Event()
+    workdir = tmp_path / "upload"
+    workdir.mkdir()
+
+    # The only worker is busy, so the second job stays queued
+    running = manager.submit("test.block", release.wait, TIMEOUT)
+    wait_for(store, running, lambda job: job["status"] == RUNNING)
+    queued = manager.submit("test.queued", dict, cleanup=workdir)
+    assert store.get(queued)["status"] == QUEUED
+
+    assert manager.cancel(queued)
+    assert not manager.cancel(running)
+    release.set()
+
+    assert wait_for(store, queued)["status"] == CANCELLED
+    assert wait_for(store, running)["status"] == SUCCEEDED
+    assert not workdir.exists()
+
+
+def test_mark_interrupted_on_restart(store):
+    queued = store.create("test.queued")
+    running = store.create("test.running")
+    store.update(running, status=RUNNING)
+    done = store.create("test.done")
+    store.update(done, status=SUCCEEDED)
+
+    # A new manager on the same database fails what the last one left
+    manager = JobManager(store)
+    manager.shutdown()
+
+    for job_id in (queued, running):
+        job = store.get(job_id)
+        assert job["status"] == FAILED
+        assert job["error"] == "Interrupted by server restart"
+    assert store.get(done)["status"] == SUCCEEDED
+
+
+def test_report_progress(manager, store):
+    release = threading.Event()
+
+    def work():
+        report_progress(0.5, "half way")
+        release.wait(TIMEOUT)
+        report_progress(2.0)
+        return "done"
+
+    # Outside a job it does nothing
+    report_progress(0.3, "ignored")
+
+    job_id = manager.submit("test.progress", work)
+    job = wait_for(store, job_id, lambda job: job["progress"] == 0.5)
+    assert job["status"] == RUNNING
+    assert job["message"] == "half way"
+    release.set()
+
+    job = wait_for(store, job_id)
+    assert job["status"] == SUCCEEDED
+    assert job["progress"] == 1.0
+
+
+def test_finished_jobs_are_pruned(tmp_path):
+    store = JobStore(tmp_path / "jobs.db", keep_finished=2)
+    manager = JobManager(store, max_workers=1)
+    job_ids = [manager.submit("test.n", int, str(n)) for n in range(4)]
+    for job_id in job_ids:
+        # Older jobs may already be gone
+        wait_for(store, job_id, lambda job: job is None or finished(job))
+    manager.shutdown(wait=True)
+
+    assert [job["id"] for job in store.list()] == job_ids[:1:-1]
+    assert store.get(job_ids[0]) is None
+
+
+def test_run_or_submit_waits_for_result(manager, tmp_path):
+    workdir = tmp_path / "upload"
+    workdir.mkdir()
+
+    result = asyncio.run(
+        run_or_submit(
+            manager, False, "test.sync", lambda x: x * 2, 21, workdir=workdir
+        )
+    )
+
+    assert result == 42
+    assert not workdir.exists()
+    assert manager.store.list() == []
+
+
+def test_run_or_submit_cleans_up_after_failure(manager, tmp_path):
+    workdir = tmp_path / "upload"
+    workdir.mkdir()
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            run_or_submit(manager, False, "test.sync", fail, workdir=workdir)
+        )
+    assert not workdir.exists()
+
+
+def test_run_or_submit_in_background(manager, store, tmp_path):
+    workdir = tmp_path / "upload"
+    workdir.mkdir()
+
+    response = asyncio.run(
+        run_or_submit(
+            manager, True, "test.async", lambda x: x * 2, 21, workdir=workdir
+        )
+    )
+
+    assert response.status_code == 202
+    body = json.loads(response.body)
+    assert body["status"] == "queued"
+    assert body["status_url"] == f"/api/jobs/{body['job_id']}"
+    job = wait_for(store, body["job_id"])
+    assert job["status"] == SUCCEEDED
+    assert job["result"] == 42
+    assert not workdir.exists()
@@ -73,17 +73,31 @@ class ArxivValidator(BaseValidator):
                 )
 
             # Find best match
+            entries_data = [
+                self._extract_entry_data(entry, ns) for entry in entries
+            ]
             best_match = self._find_best_match(
-                citation, entries, author, year, ns
+                citation,
+                [
+                    (
+                        data["title"] or "",
+                        data["year"],
+                        [name.split()[-1] for name in data["authors"] if name],
+                    )
+                    for data in entries_data
+                ],
+                author,
+                year,
             )
 
             if best_match:
+                index, confidence = best_match
                 return ValidationResult(
                     citation=citation,
                     is_valid=True,
-                    confidence=best_match["confidence"],
+                    confidence=confidence,
                     source=self.get_source_name(),
-                    matched_entry=best_match["entry"],
+                    matched_entry=entries_data[index],
                 )
             else:
                 return ValidationResult(
@@ -143,55 +157,6 @@ class ArxivValidator(BaseValidator):
                 issues=[f"arXiv API error: {str(e)}"],
             )
 
-    def _find_best_match(
-        self,
-        citation: Citation,
-        entries: list,
-        author: str,
-        year: str,
-        ns: dict,
-    ) -> dict[str, Any]:
-        """Find the best matching entry from arXiv results."""
-        best_score = 0
-        best_entry = None
-
-        for entry in entries:
-            score = 0
-            entry_data = self._extract_entry_data(entry, ns)
-
-            # Check year match
-            if year and entry_data["year"] == year:
-                score += 0.5
-
-            # Check author match
-            if author and entry_data["authors"]:
-                # Check if search author matches any entry author
-                for entry_author in entry_data["authors"]:
-                    last_name = entry_author.split()[-1]
-                    if (
-                        author.lower() in last_name.lower()
-                        or last_name.lower() in author.lower()
-                    ):
-                        score += 0.4
-                        break
-
-            # Check title similarity
-            title = entry_data["title"].lower()
-            citation_words = set(citation.text.lower().split())
-            title_words = set(title.split())
-            common_words = citation_words & title_words
-            if len(common_words) > 2:
-                score += 0.1 * min(len(common_words) / 10, 0.1)
-
-            if score > best_score:
-                best_score = score
-                best_entry = entry_data
-
-        if best_score >= 0.7:
-            return {"confidence": best_score, "entry": best_entry}
-
-        return None
-
     def _extract_entry_data(self, entry, ns: dict) -> dict[str, Any]:
         """Extract relevant data from arXiv entry XML."""
         # Extract title
@@ -1,12 +1,21 @@
 """Base validator class."""
 
 from abc import ABC, abstractmethod
+from difflib import SequenceMatcher
 from typing import Any
 
 import requests
 
 from ..models.citation import Citation, ValidationResult
 
+# Score weights of a search result's year, author and title agreement
+YEAR_WEIGHT = 0.5
+AUTHOR_WEIGHT = 0.4
+TITLE_WEIGHT = 0.1
+
+# Minimum score of a search result accepted as the cited work
+MATCH_THRESHOLD = 0.7
+
 
 class BaseValidator(ABC):
     """Abstract base class for citation validators."""
@@ -45,3 +54,60 @@ class BaseValidator(ABC):
             raise Exception(f"Request failed: {str(e)}")
         except ValueError as e:
             raise Exception(f"Invalid JSON response: {str(e)}")
+
+    def _find_best_match(
+        self,
+        citation: Citation,
+        candidates: list[tuple[str, str, list[str]]],
+        author: str,
+        year: str,
+    ) -> tuple[int, float] | None:
+        """
+        Find the search result that best matches a citation.
+
+        Titles are scored against the citation text with difflib.
+
+        Args:
+            citation: Citation being validated
+            candidates: (title, year, author last names) of each result
+            author: Author name from the citation key
+            year: Year from the citation key
+
+        Returns:
+            (index of the best result, its score), or None if no result
+            reaches MATCH_THRESHOLD
+        """
+        text = _normalize(citation.text)
+        author = (author or "").lower()
+        best = None
+        best_score = 0.0
+        for i, (title, candidate_year, last_names) in enumerate(candidates):
+            score = TITLE_WEIGHT * _title_similarity(text, _normalize(title))
+            if year and candidate_year == year:
+                score += YEAR_WEIGHT
+            if author and any(
+                name and (author in name.lower() or name.lower() in author)
+                for name in last_names
+            ):
+                score += AUTHOR_WEIGHT
+            if score > best_score:
+                best, best_score = i, score
+
+        if best is None or best_score < MATCH_THRESHOLD:
+            return None
+        return best, best_score
+
+
+def _normalize(text: str) -> str:
+    """Lowercase text and collapse its whitespace."""
+    return " ".join((text or "").lower().split())
+
+
+def _title_similarity(text: str, title: str) -> float:
+    """Similarity (0-1) of two normalized strings."""
+    if not text or not title:
+        return 0.0
+    matcher = SequenceMatcher(None, text, title, autojunk=False)
+    if matcher.real_quick_ratio() < 0.1:
+        return 0.0
+    return matcher.ratio()
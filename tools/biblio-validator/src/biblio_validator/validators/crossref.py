@@ -55,15 +55,31 @@ class CrossRefValidator(BaseValidator):
                 )
 
             # Find best match
-            best_match = self._find_best_match(citation, items, author, year)
+            best_match = self._find_best_match(
+                citation,
+                [
+                    (
+                        (item.get("title") or [""])[0],
+                        self._extract_year(item),
+                        # First author's family name
+                        [item["author"][0].get("family", "")]
+                        if item.get("author")
+                        else [],
+                    )
+                    for item in items
+                ],
+                author,
+                year,
+            )
 
             if best_match:
+                index, confidence = best_match
                 return ValidationResult(
                     citation=citation,
                     is_valid=True,
-                    confidence=best_match["confidence"],
+                    confidence=confidence,
                     source=self.get_source_name(),
-                    matched_entry=best_match["entry"],
+                    matched_entry=self._format_entry(items[index]),
                 )
             else:
                 return ValidationResult(
@@ -82,56 +98,6 @@ class CrossRefValidator(BaseValidator):
                 issues=[f"CrossRef API error: {str(e)}"],
             )
 
-    def _find_best_match(
-        self, citation: Citation, items: list, author: str, year: str
-    ) -> dict[str, Any]:
-        """Find the best matching entry from search results."""
-        best_score = 0
-        best_entry = None
-
-        for item in items:
-            score = 0
-
-            # Check year match
-            published = item.get("published-print") or item.get(
-                "published-online"
-            )
-            if published and year:
-                item_year = str(published.get("date-parts", [[None]])[0][0])
-                if item_year == year:
-                    score += 0.5
-
-            # Check author match
-            authors = item.get("author", [])
-            if authors and author:
-                first_author = authors[0]
-                family_name = first_author.get("family", "").lower()
-                if (
-                    author.lower() in family_name
-                    or family_name in author.lower()
-                ):
-                    score += 0.4
-
-            # Check title similarity (basic keyword matching)
-            title = item.get("title", [""])[0].lower()
-            citation_words = set(citation.text.lower().split())
-            title_words = set(title.split())
-            common_words = citation_words & title_words
-            if len(common_words) > 2:
-                score += 0.1 * min(len(common_words) / 10, 0.1)
-
-            if score > best_score:
-                best_score = score
-                best_entry = item
-
-        if best_score >= 0.7:  # Confidence threshold
-            return {
-                "confidence": best_score,
-                "entry": self._format_entry(best_entry),
-            }
-
-        return None
-
     def _format_entry(self, item: dict[str, Any]) -> dict[str, Any]:
         """Format CrossRef entry for storage."""
         authors = item.get("author", [])
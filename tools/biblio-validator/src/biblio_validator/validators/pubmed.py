@@ -72,15 +72,34 @@ class PubMedValidator(BaseValidator):
             articles = root.findall(".//PubmedArticle")
 
             # Find best match
-            best_match = self._find_best_match(citation, articles, author, year)
+            articles_data = [
+                self._extract_article_data(article) for article in articles
+            ]
+            best_match = self._find_best_match(
+                citation,
+                [
+                    (
+                        data["title"] or "",
+                        data["year"],
+                        # First author's last name
+                        [data["authors"][0].split()[-1]]
+                        if data["authors"]
+                        else [],
+                    )
+                    for data in articles_data
+                ],
+                author,
+                year,
+            )
 
             if best_match:
+                index, confidence = best_match
                 return ValidationResult(
                     citation=citation,
                     is_valid=True,
-                    confidence=best_match["confidence"],
+                    confidence=confidence,
                     source=self.get_source_name(),
-                    matched_entry=best_match["entry"],
+                    matched_entry=articles_data[index],
                 )
             else:
                 return ValidationResult(
@@ -99,49 +118,6 @@ class PubMedValidator(BaseValidator):
                 issues=[f"PubMed API error: {str(e)}"],
             )
 
-    def _find_best_match(
-        self, citation: Citation, articles: list, author: str, year: str
-    ) -> dict[str, Any]:
-        """Find the best matching article from PubMed results."""
-        best_score = 0
-        best_entry = None
-
-        for article in articles:
-            score = 0
-            article_data = self._extract_article_data(article)
-
-            # Check year match
-            if year and article_data["year"] == year:
-                score += 0.5
-
-            # Check author match
-            if author and article_data["authors"]:
-                first_author = article_data["authors"][0].split()[
-                    -1
-                ]  # Last name
-                if (
-                    author.lower() in first_author.lower()
-                    or first_author.lower() in author.lower()
-                ):
-                    score += 0.4
-
-            # Check title similarity
-            title = article_data["title"].lower()
-            citation_words = set(citation.text.lower().split())
-            title_words = set(title.split())
-            common_words = citation_words & title_words
-            if len(common_words) > 2:
-                score += 0.1 * min(len(common_words) / 10, 0.1)
-
-            if score > best_score:
-                best_score = score
-                best_entry = article_data
-
-        if best_score >= 0.7:
-            return {"confidence": best_score, "entry": best_entry}
-
-        return None
-
     def _extract_article_data(self, article) -> dict[str, Any]:
         """Extract relevant data from PubMed article XML."""
         # Extract title
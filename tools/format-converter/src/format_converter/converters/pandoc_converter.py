@@ -9,17 +9,25 @@ from typing import Any
 class PandocConverter:
     """Use pandoc for general format conversions."""
 
+    # Result of the pandoc availability check, shared by all instances so
+    # batch jobs creating a converter per file don't start pandoc for it
+    _pandoc_available: bool | None = None
+
     def __init__(self, config: dict[str, Any] = None):
         self.config = config or {}
         self._check_pandoc()
 
     def _check_pandoc(self):
         """Check if pandoc is available."""
-        try:
-            subprocess.run(
-                ["pandoc", "--version"], capture_output=True, check=True
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if PandocConverter._pandoc_available is None:
+            try:
+                subprocess.run(
+                    ["pandoc", "--version"], capture_output=True, check=True
+                )
+                PandocConverter._pandoc_available = True
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                PandocConverter._pandoc_available = False
+        if not PandocConverter._pandoc_available:
             raise RuntimeError(
                 "Pandoc is not installed. Please install pandoc to use this converter."
             )
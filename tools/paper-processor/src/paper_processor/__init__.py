@@ -7,11 +7,14 @@ paper formats and converting them to clean, structured output.
 
 __version__ = "1.0.0"
 
+from .core.batch import BatchProcessor, FileResult
 from .core.processor import PaperProcessor
 from .models.paper import Paper, Reference, Section
 
 __all__ = [
     "PaperProcessor",
+    "BatchProcessor",
+    "FileResult",
     "Paper",
     "Section",
     "Reference",
@@ -1,13 +1,14 @@
 """CLI interface for paper-processor."""
 
 import concurrent.futures
-import threading
+import os
 from pathlib import Path
 
 import click
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from .core.batch import MANIFEST_NAME, BatchProcessor
 from .core.processor import PaperProcessor
 from .utils.config import load_config
 
@@ -112,7 +113,17 @@ def extract(ctx, input_file, output, format, sections):
     help="Output format",
 )
 @click.option(
-    "--parallel", "-P", is_flag=True, help="Process files in parallel"
+    "--parallel",
+    "-P",
+    is_flag=True,
+    help="Process files in parallel, one worker process per CPU core",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Number of worker processes (implies --parallel)",
 )
 @click.option(
     "--retry-failed",
@@ -128,9 +139,31 @@ def extract(ctx, input_file, output, format, sections):
     default=30,
     help="Timeout per file in seconds (default: 30)",
 )
+@click.option(
+    "--memory-limit",
+    "-m",
+    type=int,
+    default=None,
+    help="Memory limit per worker process in MB (Unix only)",
+)
+@click.option(
+    "--resume/--no-resume",
+    default=True,
+    help="Skip files the batch manifest records as done (default: resume)",
+)
 @click.pass_context
 def batch_extract(
-    ctx, input_dir, output_dir, pattern, format, parallel, retry_failed, timeout
+    ctx,
+    input_dir,
+    output_dir,
+    pattern,
+    format,
+    parallel,
+    workers,
+    retry_failed,
+    timeout,
+    memory_limit,
+    resume,
 ):
     """Extract content from multiple papers."""
     input_path = Path(input_dir)
@@ -151,96 +184,50 @@ def batch_extract(
         console.print("[yellow]No files found matching the pattern![/yellow]")
         return
 
-    processor = PaperProcessor(config=ctx.obj.get("config", {}))
-
-    def process_single_file(file_path, timeout_seconds=None):
-        """Process a single file with optional timeout."""
-
-        result = [None, None, None]  # file_path, success, error
-
-        def process():
-            try:
-                paper = processor.process_file(file_path)
-
-                # Determine output filename
-                output_name = file_path.stem
-                if format == "markdown":
-                    output_file = output_path / f"{output_name}.md"
-                    content = paper.to_markdown()
-                elif format == "json":
-                    output_file = output_path / f"{output_name}.json"
-                    import json
-
-                    content = json.dumps(paper.to_dict(), indent=2)
-                else:
-                    output_file = output_path / f"{output_name}.txt"
-                    content = paper.to_text()
-
-                output_file.write_text(content, encoding="utf-8")
-                result[0], result[1], result[2] = file_path, True, None
-            except Exception as e:
-                result[0], result[1], result[2] = file_path, False, str(e)
-
-        if timeout_seconds:
-            thread = threading.Thread(target=process)
-            thread.start()
-            thread.join(timeout=timeout_seconds)
-
-            if thread.is_alive():
-                # Timeout occurred
-                return (
-                    file_path,
-                    False,
-                    f"Timeout after {timeout_seconds} seconds",
-                )
-            else:
-                return result[0], result[1], result[2]
-        else:
-            process()
-            return result[0], result[1], result[2]
+    # Files are extracted in worker processes, which can be killed on
+    # timeout; progress is recorded in a manifest for resuming
+    manifest_path = output_path / MANIFEST_NAME
+    if not resume and manifest_path.exists():
+        manifest_path.unlink()
+    if workers is None:
+        workers = (os.cpu_count() or 1) if parallel else 1
+
+    def make_batch(max_workers, timeout_seconds):
+        return BatchProcessor(
+            config=ctx.obj.get("config", {}),
+            max_workers=max_workers,
+            timeout=timeout_seconds,
+            memory_limit_mb=memory_limit,
+            output_format=format,
+        )
 
     # Process files - First pass
-    failed_files = []
-    success_count = 0
-
     with Progress(console=console) as progress:
         task = progress.add_task(
             "[cyan]Processing papers (Pass 1)...", total=len(files)
         )
 
-        if parallel:
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=4
-            ) as executor:
-                futures = {
-                    executor.submit(process_single_file, f, timeout): f
-                    for f in files
-                }
-                for future in concurrent.futures.as_completed(futures):
-                    file_path, success, error = future.result()
-                    if success:
-                        console.print(f"[green][/green] {file_path.name}")
-                        success_count += 1
-                    else:
-                        console.print(
-                            f"[yellow][/yellow] {file_path.name}: {error}"
-                        )
-                        failed_files.append((file_path, error))
-                    progress.advance(task)
-        else:
-            for file_path in files:
-                file_path, success, error = process_single_file(
-                    file_path, timeout
-                )
-                if success:
-                    console.print(f"[green][/green] {file_path.name}")
-                    success_count += 1
-                else:
-                    console.print(
-                        f"[yellow][/yellow] {file_path.name}: {error}"
-                    )
-                    failed_files.append((file_path, error))
-                progress.advance(task)
+        def report(result):
+            name = Path(result.path).name
+            if result.status == "skipped":
+                console.print(f"[dim]{name} (already extracted)[/dim]")
+            elif result.ok:
+                console.print(f"[green][/green] {name}")
+            else:
+                console.print(f"[yellow][/yellow] {name}: {result.error}")
+            progress.advance(task)
+
+        results = make_batch(workers, timeout).process_files(
+            files, output_dir=output_path, on_result=report
+        )
+
+    failed_files = [result for result in results if not result.ok]
+    skipped_count = sum(1 for result in results if result.status == "skipped")
+    success_count = len(files) - len(failed_files)
+    if skipped_count:
+        console.print(
+            f"[dim]{skipped_count} files were already extracted[/dim]"
+        )
 
     # Second pass - retry failed files with longer timeout and no parallelism
     if failed_files and retry_failed:
@@ -260,20 +247,23 @@ def batch_extract(
                 total=len(failed_files),
             )
 
-            for file_path, first_error in failed_files:
-                file_path, success, error = process_single_file(
-                    file_path, retry_timeout
-                )
-                if success:
-                    console.print(
-                        f"[green][/green] {file_path.name} (retry successful)"
-                    )
+            def report_retry(result):
+                nonlocal retry_success
+                name = Path(result.path).name
+                if result.ok:
+                    console.print(f"[green][/green] {name} (retry successful)")
                     retry_success += 1
-                    success_count += 1
                 else:
-                    console.print(f"[red][/red] {file_path.name}: {error}")
+                    console.print(f"[red][/red] {name}: {result.error}")
                 progress.advance(task)
 
+            make_batch(1, retry_timeout).process_files(
+                [Path(result.path) for result in failed_files],
+                output_dir=output_path,
+                on_result=report_retry,
+            )
+        success_count += retry_success
+
         if retry_success > 0:
             console.print(
                 f"\n[green]Retry pass recovered {retry_success} additional files[/green]"
@@ -293,6 +283,7 @@ def batch_extract(
             console.print(
                 f"[red]{total_failed} files could not be processed[/red]"
             )
+        console.print(f"[dim]Manifest: {manifest_path}[/dim]")
 
 
 @cli.command()
@@ -1,5 +1,6 @@
 """Core functionality for paper-processor."""
 
+from .batch import BatchProcessor, FileResult
 from .processor import PaperProcessor
 
-__all__ = ["PaperProcessor"]
+__all__ = ["PaperProcessor", "BatchProcessor", "FileResult"]
@@ -0,0 +1,462 @@
+"""Process-pool batch extraction of many papers.
+
+PDF to markdown conversion is CPU-bound, so a thread pool never uses more
+than one core for it. BatchProcessor runs extraction in worker processes,
+one per core by default:
+
+- Each worker process is supervised by a thread. A file that exceeds the
+  timeout gets its worker killed and replaced, so one pathological PDF
+  can't stall the batch.
+- Workers run under an address-space limit (Unix only), so a runaway
+  extraction fails with MemoryError instead of exhausting the machine.
+- Every finished file is appended to a JSON-lines manifest. A rerun with
+  the same manifest skips files that succeeded before and haven't changed,
+  as long as the output format and section filter are the same.
+"""
+
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MANIFEST_NAME = ".batch-manifest.jsonl"
+
+OUTPUT_SUFFIXES = {
+    "markdown": ".md",
+    "json": ".json",
+    "text": ".txt",
+    "latex": ".tex",
+}
+
+# Seconds a new worker may take to import and set up its processor
+WORKER_STARTUP_TIMEOUT = 120.0
+
+
+@dataclass
+class FileResult:
+    """Outcome of processing one file in a batch."""
+
+    path: str
+    status: str  # "success", "error", "timeout" or "skipped"
+    output: str | None = None
+    error: str | None = None
+    duration: float = 0.0
+    title: str | None = None
+    authors: list[str] | None = None
+    word_count: int = 0
+    sections: int = 0
+    references: int = 0
+    size: int = 0
+    mtime_ns: int = 0
+    output_format: str | None = None
+    section_filter: list[str] | None = None
+    content: Any = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file has a usable extraction."""
+        return self.status in ("success", "skipped")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a manifest entry (without the content)."""
+        data = asdict(self)
+        data.pop("content")
+        return data
+
+
+class BatchManifest:
+    """Append-only JSON-lines record of processed files."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.entries: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line cut short by a crash
+                    continue
+                self.entries[entry["path"]] = entry
+
+    def completed(
+        self,
+        file_path: Path,
+        output_format: str = "markdown",
+        sections: list[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Get the entry of a file that succeeded and is unchanged.
+
+        Args:
+            file_path: Input file
+            output_format: Output format of the current run
+            sections: Section filter of the current run
+
+        Returns:
+            The entry, or None if the file must be processed again
+        """
+        entry = self.entries.get(str(file_path))
+        if not entry or entry.get("status") != "success":
+            return None
+        if (entry.get("output_format"), entry.get("section_filter")) != (
+            output_format,
+            section_filter(sections),
+        ):
+            return None
+        stat = file_path.stat()
+        if (entry.get("size"), entry.get("mtime_ns")) != (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return None
+        if entry.get("output") and not Path(entry["output"]).exists():
+            return None
+        return entry
+
+    def record(self, result: FileResult) -> None:
+        """Append the outcome of a file."""
+        entry = result.to_dict()
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self.entries[result.path] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+def section_filter(sections: list[str] | None) -> list[str] | None:
+    """Normalize a section filter for comparing runs (order is irrelevant)."""
+    return sorted(sections) if sections else None
+
+
+def render_paper(paper, output_format: str) -> Any:
+    """Render an extracted paper in an output format.
+
+    JSON is returned as a dictionary; the other formats as text.
+    """
+    if output_format == "json":
+        return paper.to_dict()
+    if output_format == "latex":
+        return paper.to_latex()
+    if output_format == "text":
+        return paper.to_text()
+    return paper.to_markdown()
+
+
+def _apply_memory_limit(memory_limit_mb: int | None) -> None:
+    """Cap the address space of the current process."""
+    if not memory_limit_mb or resource is None:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
+
+
+def _run_task(processor, task: dict[str, Any]) -> dict[str, Any]:
+    """Extract one file inside a worker process."""
+    file_path = Path(task["path"])
+    try:
+        paper = processor.process_file(file_path, sections=task["sections"])
+        rendered = render_paper(paper, task["output_format"])
+
+        output = None
+        if task["output_dir"]:
+            suffix = OUTPUT_SUFFIXES.get(task["output_format"], ".md")
+            output_file = Path(task["output_dir"]) / f"{file_path.stem}{suffix}"
+            text = (
+                json.dumps(rendered, indent=2)
+                if isinstance(rendered, dict)
+                else rendered
+            )
+            output_file.write_text(text, encoding="utf-8")
+            output = str(output_file)
+
+        return {
+            "status": "success",
+            "output": output,
+            "title": paper.title,
+            "authors": paper.authors,
+            "word_count": paper.word_count,
+            "sections": len(paper.sections),
+            "references": len(paper.references),
+            "content": rendered if task["include_content"] else None,
+        }
+    except MemoryError:
+        return {"status": "error", "error": "Memory limit exceeded"}
+    except Exception as e:
+        return {"status": "error", "error": f"{type(e).__name__}: {e}"}
+
+
+def _worker_main(conn, config: dict[str, Any], memory_limit_mb: int | None):
+    """Entry point of a worker process: serve tasks until told to stop."""
+    _apply_memory_limit(memory_limit_mb)
+
+    from .processor import PaperProcessor
+
+    processor = PaperProcessor(config=config)
+    conn.send("ready")
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        conn.send(_run_task(processor, task))
+
+
+class _Worker:
+    """One worker process and the pipe to it."""
+
+    def __init__(self, ctx, config: dict[str, Any], memory_limit_mb):
+        self._ctx = ctx
+        self._config = config
+        self._memory_limit_mb = memory_limit_mb
+        self.process = None
+        self.conn = None
+
+    def _start(self) -> None:
+        parent_conn, child_conn = self._ctx.Pipe()
+        self.process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self._config, self._memory_limit_mb),
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        if not self.conn.poll(WORKER_STARTUP_TIMEOUT) or (
+            self.conn.recv() != "ready"
+        ):
+            self.kill()
+            raise RuntimeError("Worker process failed to start")
+
+    def run(self, task: dict[str, Any], timeout: float | None) -> dict:
+        """Run a task, restarting the process after a crash or timeout."""
+        try:
+            if self.process is None or not self.process.is_alive():
+                self._start()
+            self.conn.send(task)
+        except (EOFError, OSError, RuntimeError) as e:
+            self.kill()
+            return {"status": "error", "error": f"Worker unavailable: {e}"}
+
+        if not self.conn.poll(timeout):
+            self.kill()
+            return {
+                "status": "timeout",
+                "error": f"Timeout after {timeout} seconds",
+            }
+        try:
+            return self.conn.recv()
+        except (EOFError, OSError):
+            exitcode = self.process.exitcode
+            self.kill()
+            return {
+                "status": "error",
+                "error": f"Worker process died (exit code {exitcode})",
+            }
+
+    def kill(self) -> None:
+        if self.process is not None:
+            if self.process.is_alive():
+                self.process.kill()
+            self.process.join()
+            self.process = None
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def stop(self) -> None:
+        """Ask the process to exit, killing it if it doesn't."""
+        if self.process is not None and self.process.is_alive():
+            try:
+                self.conn.send(None)
+                self.process.join(timeout=5)
+            except (OSError, ValueError):
+                pass
+        self.kill()
+
+
+class BatchProcessor:
+    """Extract many papers in parallel worker processes.
+
+    Example:
+        batch = BatchProcessor(max_workers=8, timeout=300)
+        results = batch.process_files(pdfs, output_dir=Path("extracted"))
+    """
+
+    def __init__(
+        self,
+        config: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+        timeout: float | None = 300.0,
+        memory_limit_mb: int | None = None,
+        output_format: str = "markdown",
+        start_method: str | None = None,
+    ):
+        """Initialize the batch processor.
+
+        Args:
+            config: PaperProcessor configuration
+            max_workers: Number of worker processes (defaults to CPU count)
+            timeout: Seconds one file may take (None = no limit)
+            memory_limit_mb: Address-space limit per worker (Unix only)
+            output_format: markdown, json, text or latex
+            start_method: multiprocessing start method (default "spawn",
+                which is safe in threaded servers)
+        """
+        self.config = config or {}
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.output_format = output_format
+        self._ctx = multiprocessing.get_context(start_method or "spawn")
+
+    def process_files(
+        self,
+        files: list[Path],
+        output_dir: Path | None = None,
+        manifest_path: Path | None = None,
+        sections: list[str] | None = None,
+        include_content: bool = False,
+        on_result: Callable[[FileResult], None] | None = None,
+    ) -> list[FileResult]:
+        """Extract files, skipping those the manifest records as done.
+
+        Args:
+            files: Papers to process
+            output_dir: Where to write one output file per paper (None =
+                don't write files)
+            manifest_path: Manifest to resume from and append to (defaults
+                to MANIFEST_NAME in output_dir; None without output_dir)
+            sections: Only keep sections matching these names
+            include_content: Return the rendered papers in the results
+            on_result: Called with each result as it completes
+
+        Returns:
+            Results in input order
+        """
+        if output_dir is not None:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            if manifest_path is None:
+                manifest_path = output_dir / MANIFEST_NAME
+        manifest = BatchManifest(manifest_path) if manifest_path else None
+
+        results: list[FileResult | None] = [None] * len(files)
+        pending: queue.Queue = queue.Queue()
+        callback_lock = threading.Lock()
+
+        def finish(index: int, result: FileResult) -> None:
+            results[index] = result
+            if manifest is not None and result.status != "skipped":
+                manifest.record(result)
+            if on_result is not None:
+                with callback_lock:
+                    on_result(result)
+
+        for index, file_path in enumerate(files):
+            file_path = Path(file_path)
+            entry = (
+                manifest.completed(file_path, self.output_format, sections)
+                if manifest
+                else None
+            )
+            if entry is not None and not include_content:
+                finish(
+                    index,
+                    FileResult(
+                        **{
+                            **entry,
+                            "status": "skipped",
+                            "duration": 0.0,
+                        }
+                    ),
+                )
+            else:
+                pending.put((index, file_path))
+
+        task_count = pending.qsize()
+        if task_count:
+            threads = [
+                threading.Thread(
+                    target=self._supervise,
+                    args=(
+                        pending,
+                        output_dir,
+                        sections,
+                        include_content,
+                        finish,
+                    ),
+                )
+                for _ in range(min(self.max_workers, task_count))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        return results
+
+    def _supervise(
+        self,
+        pending: queue.Queue,
+        output_dir: Path | None,
+        sections: list[str] | None,
+        include_content: bool,
+        finish: Callable[[int, FileResult], None],
+    ) -> None:
+        """Feed files to one worker process until the queue is empty."""
+        worker = _Worker(self._ctx, self.config, self.memory_limit_mb)
+        try:
+            while True:
+                try:
+                    index, file_path = pending.get_nowait()
+                except queue.Empty:
+                    break
+
+                stat = file_path.stat()
+                task = {
+                    "path": str(file_path),
+                    "output_dir": str(output_dir) if output_dir else None,
+                    "output_format": self.output_format,
+                    "sections": sections,
+                    "include_content": include_content,
+                }
+                started = time.monotonic()
+                outcome = worker.run(task, self.timeout)
+                finish(
+                    index,
+                    FileResult(
+                        path=str(file_path),
+                        duration=round(time.monotonic() - started, 3),
+                        size=stat.st_size,
+                        mtime_ns=stat.st_mtime_ns,
+                        output_format=self.output_format,
+                        section_filter=section_filter(sections),
+                        **outcome,
+                    ),
+                )
+        finally:
+            worker.stop()
@@ -1,5 +1,6 @@
 """Core paper processing functionality."""
 
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +10,7 @@ from ..extractors.pdf_extractor import PDFExtractor
 from ..extractors.xml_extractor import XMLExtractor
 from ..models.paper import Paper
 from ..utils.config import get_default_config
+from .batch import BatchProcessor, FileResult
 
 # Import summarization from literature-reviewer
 try:
@@ -38,11 +40,16 @@ class PaperProcessor:
             ".xml": XMLExtractor(config),
         }
 
-        # Initialize summarizer if available
-        if SUMMARIZATION_AVAILABLE:
-            self.ai_summarizer = AISummarizer(config)
-        else:
-            self.ai_summarizer = None
+        # The summarizer is created on first use, so extraction never
+        # needs a configured AI provider
+        self._summarizer_config = config
+
+    @cached_property
+    def ai_summarizer(self) -> "AISummarizer | None":
+        """AI summarizer, or None if literature-reviewer is not installed."""
+        if not SUMMARIZATION_AVAILABLE:
+            return None
+        return AISummarizer(self._summarizer_config)
 
     def process_file(
         self, file_path: Path, sections: list[str] | None = None
@@ -72,6 +79,29 @@ class PaperProcessor:
 
         return paper
 
+    def process_files(
+        self,
+        files: list[Path],
+        output_dir: Path | None = None,
+        max_workers: int | None = None,
+        timeout: float | None = 300.0,
+        memory_limit_mb: int | None = None,
+        output_format: str = "markdown",
+        **kwargs: Any,
+    ) -> list[FileResult]:
+        """Process many files in parallel worker processes.
+
+        See BatchProcessor.process_files for the remaining arguments.
+        """
+        batch = BatchProcessor(
+            config=self.config,
+            max_workers=max_workers,
+            timeout=timeout,
+            memory_limit_mb=memory_limit_mb,
+            output_format=output_format,
+        )
+        return batch.process_files(files, output_dir=output_dir, **kwargs)
+
     def _clean_paper(self, paper: Paper) -> Paper:
         """Clean and normalize paper content."""
         # Clean abstract
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Tests for process-pool batch extraction with timeouts and a resumable
+manifest.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from paper_processor.core import processor as processor_module
+from paper_processor.core.batch import (
+    MANIFEST_NAME,
+    BatchManifest,
+    BatchProcessor,
+    FileResult,
+)
+from paper_processor.core.processor import PaperProcessor
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+TOOLS_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+@pytest.fixture(autouse=True)
+def isolated_sys_path(monkeypatch):
+    """Keep other tools' packages (added by other test modules) off the
+    sys.path that spawned workers inherit."""
+    own = str(SRC_DIR)
+    monkeypatch.setattr(
+        sys,
+        "path",
+        [
+            entry
+            for entry in sys.path
+            if not str(Path(entry).resolve()).startswith(str(TOOLS_DIR))
+            or str(Path(entry).resolve()) == own
+        ],
+    )
+
+
+PAPER_HTML = """<html><head><title>{title}</title></head><body>
+<h1>{title}</h1>
+<h2>Introduction</h2>
+{body}
+</body></html>"""
+
+
+def write_paper(directory, name, title, paragraphs=3):
+    """Write a small HTML paper."""
+    body = "\n".join(
+        f"<p>Paragraph {i} of {title} about batch extraction.</p>"
+        for i in range(paragraphs)
+    )
+    path = directory / name
+    path.write_text(PAPER_HTML.format(title=title, body=body), encoding="utf-8")
+    return path
+
+
+def test_batch_extracts_all_files(tmp_path):
+    """Test that every file is extracted and results keep input order."""
+    files = [
+        write_paper(tmp_path, f"paper{i}.html", f"Paper Number {i}")
+        for i in range(4)
+    ]
+    output_dir = tmp_path / "extracted"
+
+    results = BatchProcessor(max_workers=2, timeout=60).process_files(
+        files, output_dir=output_dir
+    )
+
+    assert [Path(r.path).name for r in results] == [f.name for f in files]
+    assert all(r.status == "success" for r in results)
+    for i in range(4):
+        assert "Paper Number" in (output_dir / f"paper{i}.md").read_text()
+
+
+def test_resume_skips_completed_files(tmp_path):
+    """Test that a second run only processes new or changed files."""
+    first = write_paper(tmp_path, "first.html", "First Paper Title")
+    output_dir = tmp_path / "extracted"
+    batch = BatchProcessor(max_workers=1, timeout=60)
+    batch.process_files([first], output_dir=output_dir)
+
+    second = write_paper(tmp_path, "second.html", "Second Paper Title")
+    seen = []
+    results = batch.process_files(
+        [first, second], output_dir=output_dir, on_result=seen.append
+    )
+
+    assert [r.status for r in results] == ["skipped", "success"]
+    assert len(seen) == 2
+
+    # Changing a file makes it eligible again
+    write_paper(tmp_path, "first.html", "First Paper Revised", paragraphs=5)
+    results = batch.process_files([first, second], output_dir=output_dir)
+    assert [r.status for r in results] == ["success", "skipped"]
+
+
+def test_resume_reprocesses_other_format_or_sections(tmp_path):
+    """Test that changing the output format or sections redoes a file."""
+    paper = write_paper(tmp_path, "paper.html", "Format Paper Title")
+    output_dir = tmp_path / "extracted"
+    BatchProcessor(max_workers=1, timeout=60).process_files(
+        [paper], output_dir=output_dir
+    )
+
+    batch = BatchProcessor(max_workers=1, timeout=60, output_format="json")
+    results = batch.process_files([paper], output_dir=output_dir)
+    assert results[0].status == "success"
+    assert (output_dir / "paper.json").exists()
+
+    results = batch.process_files(
+        [paper], output_dir=output_dir, sections=["Introduction"]
+    )
+    assert results[0].status == "success"
+
+    results = batch.process_files(
+        [paper], output_dir=output_dir, sections=["Introduction"]
+    )
+    assert results[0].status == "skipped"
+
+
+def test_timeout_kills_worker(tmp_path):
+    """Test that a slow file times out and can be retried later."""
+    slow = write_paper(tmp_path, "slow.html", "Slow Paper", paragraphs=20000)
+    output_dir = tmp_path / "extracted"
+
+    results = BatchProcessor(max_workers=1, timeout=0.001).process_files(
+        [slow], output_dir=output_dir
+    )
+    assert results[0].status == "timeout"
+    assert not results[0].ok
+
+    results = BatchProcessor(max_workers=1, timeout=120).process_files(
+        [slow], output_dir=output_dir
+    )
+    assert results[0].status == "success"
+
+
+def test_errors_are_reported(tmp_path):
+    """Test that an unsupported file fails without stopping the batch."""
+    good = write_paper(tmp_path, "good.html", "A Good Paper Title")
+    bad = tmp_path / "notes.docx"
+    bad.write_text("not a paper")
+
+    results = BatchProcessor(max_workers=2, timeout=60).process_files(
+        [bad, good], include_content=True
+    )
+
+    assert results[0].status == "error"
+    assert "Unsupported file type" in results[0].error
+    assert results[1].status == "success"
+    assert "A Good Paper Title" in results[1].content
+
+
+def test_manifest_ignores_truncated_lines(tmp_path):
+    """Test that a line cut short by a crash doesn't break resuming."""
+    paper = write_paper(tmp_path, "paper.html", "Manifest Paper Title")
+    stat = paper.stat()
+    manifest_path = tmp_path / MANIFEST_NAME
+    entry = FileResult(
+        path=str(paper),
+        status="success",
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        output_format="markdown",
+    ).to_dict()
+    manifest_path.write_text(json.dumps(entry) + '\n{"path": "trunc')
+
+    manifest = BatchManifest(manifest_path)
+
+    assert manifest.completed(paper) is not None
+
+
+def test_extraction_does_not_need_ai_provider(tmp_path, monkeypatch):
+    """Test that extracting never builds the AI summarizer."""
+
+    def unavailable(config):
+        raise RuntimeError("AI provider not configured")
+
+    monkeypatch.setattr(processor_module, "SUMMARIZATION_AVAILABLE", True)
+    monkeypatch.setattr(processor_module, "AISummarizer", unavailable)
+    paper = write_paper(tmp_path, "paper.html", "Extraction Only Paper")
+
+    processor = PaperProcessor(config={})
+
+    assert processor.process_file(paper).title == "Extraction Only Paper"